@@ -2,7 +2,7 @@
 
 Translates a sequence of sign language glosses (e.g., ["EU", "GOSTAR", "ESCOLA"])
 into fluent text in the corresponding spoken language using an LLM via the ChatLLM port.
-Includes caching for common phrase patterns.
+Repeated gloss sequences are served from the LLM response cache.
 
 Supports international sign languages via the sign_language parameter.
 Default: Libras (Brazilian Sign Language) for backward compatibility.
@@ -11,14 +11,16 @@ Default: Libras (Brazilian Sign Language) for backward compatibility.
 from __future__ import annotations
 
 import time
-from collections import OrderedDict
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 import structlog
 
 from ..domain.ports.llm import ChatLLM
 from .sign_language_registry import SignLanguageCode
 
+if TYPE_CHECKING:
+    from ..adapters.llm.cached_llm import MemoryLLMCache
+
 logger = structlog.get_logger(__name__)
 
 # -- System prompts per sign language -----------------------------------------
@@ -195,8 +197,10 @@ def _get_system_prompt(sign_language: SignLanguageCode) -> str:
 class GlossToTextTranslator:
     """Translates sign language glosses to fluent text via LLM.
 
-    Maintains a simple LRU cache for recently translated gloss sequences
-    to reduce LLM calls for repeated phrases.
+    Translations are cached through ``CachedChatLLM``: when *llm* is
+    already cached (``AILINE_LLM_RESPONSE_CACHE``) its shared backend is
+    reused, so every captioning session benefits; otherwise the translator
+    wraps *llm* with a private LRU of ``cache_size`` entries.
 
     Supports multiple sign languages via the ``sign_language`` parameter.
     Default: Libras (backward compatible).
@@ -208,9 +212,14 @@ class GlossToTextTranslator:
         cache_size: int = 128,
         sign_language: SignLanguageCode = SignLanguageCode.LIBRAS,
     ) -> None:
-        self._llm = llm
-        self._cache: OrderedDict[str, str] = OrderedDict()
-        self._cache_size = cache_size
+        from ..adapters.llm.cached_llm import CachedChatLLM, MemoryLLMCache
+
+        self._own_cache: MemoryLLMCache | None = None
+        if isinstance(llm, CachedChatLLM):
+            self._llm = llm
+        else:
+            self._own_cache = MemoryLLMCache(max_entries=cache_size)
+            self._llm = CachedChatLLM(llm, backend=self._own_cache)
         self._sign_language = sign_language
 
     @property
@@ -236,26 +245,12 @@ class GlossToTextTranslator:
             return ""
 
         sl = sign_language or self._sign_language
-        cache_key = f"{sl.value}:" + " ".join(glosses)
-
-        # Check cache
-        if cache_key in self._cache:
-            self._cache.move_to_end(cache_key)
-            logger.debug("gloss_translator.cache_hit", glosses=cache_key)
-            return self._cache[cache_key]
-
-        # Call LLM
-        system_prompt = _get_system_prompt(sl)
-        messages: list[dict[str, Any]] = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": " ".join(glosses)},
-        ]
-
         start = time.monotonic()
         translation = await self._llm.generate(
-            messages,
+            _messages(glosses, sl),
             temperature=0.3,
             max_tokens=256,
+            use_cache=True,
         )
         elapsed = time.monotonic() - start
 
@@ -267,12 +262,6 @@ class GlossToTextTranslator:
             translation=translation,
             elapsed_ms=round(elapsed * 1000),
         )
-
-        # Update cache
-        self._cache[cache_key] = translation
-        if len(self._cache) > self._cache_size:
-            self._cache.popitem(last=False)
-
         return translation
 
     async def translate_streaming(
@@ -282,38 +271,32 @@ class GlossToTextTranslator:
     ):
         """Translate glosses with streaming response.
 
-        Yields translation chunks as they arrive from the LLM.
+        Yields translation chunks as they arrive from the LLM (a cached
+        translation is replayed as a single chunk).
         """
         if not glosses:
             return
 
         sl = sign_language or self._sign_language
-        cache_key = f"{sl.value}:" + " ".join(glosses)
-        if cache_key in self._cache:
-            self._cache.move_to_end(cache_key)
-            yield self._cache[cache_key]
-            return
-
-        system_prompt = _get_system_prompt(sl)
-        messages: list[dict[str, Any]] = [
-            {"role": "system", "content": system_prompt},
-            {"role": "user", "content": " ".join(glosses)},
-        ]
-
-        full_text = ""
         async for chunk in self._llm.stream(
-            messages,
+            _messages(glosses, sl),
             temperature=0.3,
             max_tokens=256,
+            use_cache=True,
         ):
-            full_text += chunk
             yield chunk
 
-        full_text = full_text.strip()
-        self._cache[cache_key] = full_text
-        if len(self._cache) > self._cache_size:
-            self._cache.popitem(last=False)
-
     def clear_cache(self) -> None:
-        """Clear the translation cache."""
-        self._cache.clear()
+        """Clear the translator's private translation cache.
+
+        A shared response cache (passed in as *llm*) is left untouched.
+        """
+        if self._own_cache is not None:
+            self._own_cache.clear_sync()
+
+
+def _messages(glosses: list[str], sign_language: SignLanguageCode) -> list[dict[str, Any]]:
+    return [
+        {"role": "system", "content": _get_system_prompt(sign_language)},
+        {"role": "user", "content": " ".join(glosses)},
+    ]
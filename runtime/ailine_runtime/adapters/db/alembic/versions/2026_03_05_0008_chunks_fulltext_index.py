@@ -0,0 +1,34 @@
+"""Add a full-text GIN index on chunk content for hybrid retrieval.
+
+Lexical (BM25-style) search in ``PgVectorStore.lexical_search`` matches
+``to_tsvector('simple', content)``; this expression index serves it.
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-03-05
+"""
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "0008"
+down_revision: str = "0007"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            "CREATE INDEX IF NOT EXISTS ix_chunks_content_fts "
+            "ON chunks USING gin (to_tsvector('simple', content))"
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute("DROP INDEX IF EXISTS ix_chunks_content_fts")
@@ -0,0 +1,73 @@
+"""Durable pipeline traces: run_traces, node_traces.
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-03-06
+
+Backs ``SqlTraceStore`` so /traces and /runs survive restarts:
+- run_traces: one row per run, listed by (teacher_id, updated_at)
+- node_traces: per-node traces as JSON, ordered by UUID v7 id
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0009"
+down_revision: str = "0008"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "run_traces",
+        sa.Column("run_id", sa.String(128), primary_key=True),
+        sa.Column("teacher_id", sa.String(128), nullable=False, server_default=""),
+        sa.Column("status", sa.String(20), server_default="running"),
+        sa.Column("user_prompt", sa.Text(), server_default=""),
+        sa.Column("subject", sa.Text(), server_default=""),
+        sa.Column("total_time_ms", sa.Float(), server_default="0.0"),
+        sa.Column("final_score", sa.Integer(), nullable=True),
+        sa.Column("model_used", sa.Text(), server_default=""),
+        sa.Column("refinement_count", sa.Integer(), server_default="0"),
+        sa.Column("scorecard_json", sa.JSON(), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+        sa.Column(
+            "updated_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+    )
+    op.create_index(
+        "ix_run_traces_teacher_updated", "run_traces", ["teacher_id", "updated_at"]
+    )
+    op.create_index("ix_run_traces_updated", "run_traces", ["updated_at"])
+
+    op.create_table(
+        "node_traces",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column(
+            "run_id",
+            sa.String(128),
+            sa.ForeignKey("run_traces.run_id", ondelete="CASCADE"),
+            nullable=False,
+        ),
+        sa.Column("data_json", sa.JSON(), server_default="{}"),
+    )
+    op.create_index("ix_node_traces_run", "node_traces", ["run_id", "id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_node_traces_run", table_name="node_traces")
+    op.drop_table("node_traces")
+    op.drop_index("ix_run_traces_updated", table_name="run_traces")
+    op.drop_index("ix_run_traces_teacher_updated", table_name="run_traces")
+    op.drop_table("run_traces")
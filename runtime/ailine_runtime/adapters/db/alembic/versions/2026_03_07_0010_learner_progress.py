@@ -0,0 +1,56 @@
+"""Durable learner progress: learner_progress.
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-03-07
+
+Backs ``SqlProgressStore`` (parent links use the existing parent_students):
+- unique (teacher_id, student_id, standard_code): upsert key and
+  per-teacher dashboard aggregation
+- ix_learner_progress_student: student/parent views across teachers
+"""
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from alembic import op
+
+revision: str = "0010"
+down_revision: str = "0009"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "learner_progress",
+        sa.Column("id", sa.String(36), primary_key=True),
+        sa.Column("teacher_id", sa.String(128), nullable=False),
+        sa.Column("student_id", sa.String(128), nullable=False),
+        sa.Column("student_name", sa.String(200), server_default=""),
+        sa.Column("standard_code", sa.String(100), nullable=False),
+        sa.Column("standard_description", sa.Text(), server_default=""),
+        sa.Column("mastery_level", sa.String(20), server_default="not_started"),
+        sa.Column("session_count", sa.Integer(), server_default="0"),
+        sa.Column("notes", sa.Text(), server_default=""),
+        sa.Column("last_activity", sa.DateTime(timezone=True), nullable=True),
+        sa.Column(
+            "created_at",
+            sa.DateTime(timezone=True),
+            server_default=sa.func.now(),
+        ),
+        sa.UniqueConstraint(
+            "teacher_id",
+            "student_id",
+            "standard_code",
+            name="uq_learner_progress_teacher_student_standard",
+        ),
+    )
+    op.create_index("ix_learner_progress_student", "learner_progress", ["student_id"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_learner_progress_student", table_name="learner_progress")
+    op.drop_table("learner_progress")
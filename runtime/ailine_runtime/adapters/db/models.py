@@ -369,6 +369,54 @@ class RunEventRow(Base):
     )
 
 
+# ---------------------------------------------------------------------------
+# Run Traces (observability: /traces, /runs)
+# ---------------------------------------------------------------------------
+
+
+class RunTraceRow(Base):
+    """Top-level trace of a pipeline run (``RunTrace`` without its nodes).
+
+    Keyed by the client-supplied run_id and not tied to ``pipeline_runs``
+    or ``teachers``: traces are recorded for every run, including dev/test
+    tenants that have no teacher row.  Rows expire by ``updated_at``.
+    """
+
+    __tablename__ = "run_traces"
+    __table_args__ = (
+        Index("ix_run_traces_teacher_updated", "teacher_id", "updated_at"),
+        Index("ix_run_traces_updated", "updated_at"),
+    )
+
+    run_id: Mapped[str] = mapped_column(String(128), primary_key=True)
+    teacher_id: Mapped[str] = mapped_column(String(128), nullable=False, default="")
+    status: Mapped[str] = mapped_column(String(20), default="running")
+    user_prompt: Mapped[str] = mapped_column(Text, default="")
+    subject: Mapped[str] = mapped_column(Text, default="")
+    total_time_ms: Mapped[float] = mapped_column(Float, default=0.0)
+    final_score: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    model_used: Mapped[str] = mapped_column(Text, default="")
+    refinement_count: Mapped[int] = mapped_column(Integer, default=0)
+    scorecard_json: Mapped[dict | None] = mapped_column(JSON, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+
+
+class NodeTraceRow(Base):
+    """One ``NodeTrace`` of a run, stored as JSON; ordered by its UUID v7 id."""
+
+    __tablename__ = "node_traces"
+    __table_args__ = (Index("ix_node_traces_run", "run_id", "id"),)
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid7_str)
+    run_id: Mapped[str] = mapped_column(
+        String(128),
+        ForeignKey("run_traces.run_id", ondelete="CASCADE"),
+        nullable=False,
+    )
+    data_json: Mapped[dict] = mapped_column(JSON, default=dict)
+
+
 # ---------------------------------------------------------------------------
 # Accessibility Profiles
 # ---------------------------------------------------------------------------
@@ -512,6 +560,46 @@ class ParentStudentRow(Base):
     )
 
 
+# ---------------------------------------------------------------------------
+# Learner Progress (mastery tracking)
+# ---------------------------------------------------------------------------
+
+
+class LearnerProgressRow(Base):
+    """A student's mastery of one standard, as recorded by one teacher.
+
+    The unique (teacher_id, student_id, standard_code) constraint is the
+    upsert key and serves per-teacher dashboards; ``ix_learner_progress_student``
+    serves the student/parent views across teachers.  Student ids may be
+    anonymous, so they are not tied to ``users``.
+    """
+
+    __tablename__ = "learner_progress"
+    __table_args__ = (
+        UniqueConstraint(
+            "teacher_id",
+            "student_id",
+            "standard_code",
+            name="uq_learner_progress_teacher_student_standard",
+        ),
+        Index("ix_learner_progress_student", "student_id"),
+    )
+
+    id: Mapped[str] = mapped_column(String(36), primary_key=True, default=_uuid7_str)
+    teacher_id: Mapped[str] = mapped_column(String(128), nullable=False)
+    student_id: Mapped[str] = mapped_column(String(128), nullable=False)
+    student_name: Mapped[str] = mapped_column(String(200), default="")
+    standard_code: Mapped[str] = mapped_column(String(100), nullable=False)
+    standard_description: Mapped[str] = mapped_column(Text, default="")
+    mastery_level: Mapped[str] = mapped_column(String(20), default="not_started")
+    session_count: Mapped[int] = mapped_column(Integer, default=0)
+    notes: Mapped[str] = mapped_column(Text, default="")
+    last_activity: Mapped[datetime | None] = mapped_column(
+        DateTime(timezone=True), nullable=True
+    )
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), default=_utcnow)
+
+
 # ---------------------------------------------------------------------------
 # Skills System (F-175)
 # ---------------------------------------------------------------------------
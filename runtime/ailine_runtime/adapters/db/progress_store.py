@@ -0,0 +1,352 @@
+"""Database-backed progress store (Postgres or SQLite).
+
+Persists learner mastery in ``learner_progress`` and parent links in the
+existing ``parent_students`` table, so ``/progress`` survives restarts
+and is shared across replicas.  Same contract as
+``shared.progress_store.ProgressStore``; returned ``LearnerProgress``
+objects are snapshots.
+
+Recording is a single ``INSERT ... ON CONFLICT DO UPDATE`` on the
+(teacher_id, student_id, standard_code) unique index, so concurrent
+records of the same key neither race on the insert nor lose session
+counts.  Dashboards are computed with GROUP BY queries over that index
+rather than kept in counter tables, so there is no second write per
+record to keep in sync.  Like the in-memory store, a dashboard shows
+the latest non-empty student name / standard description.
+Tables are created on first use when missing (Postgres deployments get
+them from migration 0010).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import UTC, datetime
+from typing import Any
+
+import structlog
+from sqlalchemy import case, func, select
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.sql.elements import ColumnElement
+
+from ...domain.entities.progress import (
+    ClassProgressSummary,
+    LearnerProgress,
+    MasteryLevel,
+    StandardSummary,
+    StudentSummary,
+)
+from .models import Base, LearnerProgressRow, ParentStudentRow, _uuid7_str
+
+_log = structlog.get_logger("ailine.db.progress_store")
+
+
+def _iso(value: datetime | None) -> str | None:
+    if value is None:
+        return None
+    if value.tzinfo is None:  # SQLite drops the offset; values are stored in UTC
+        value = value.replace(tzinfo=UTC)
+    return value.isoformat()
+
+
+def _row_to_progress(row: LearnerProgressRow) -> LearnerProgress:
+    """Map a LearnerProgressRow to a domain LearnerProgress."""
+    return LearnerProgress(
+        progress_id=row.id,
+        student_id=row.student_id,
+        student_name=row.student_name or "",
+        teacher_id=row.teacher_id,
+        standard_code=row.standard_code,
+        standard_description=row.standard_description or "",
+        mastery_level=MasteryLevel(row.mastery_level),
+        session_count=row.session_count or 0,
+        last_activity=_iso(row.last_activity),
+        created_at=_iso(row.created_at) or "",
+        notes=row.notes or "",
+    )
+
+
+def _level_count(level: MasteryLevel) -> Any:
+    return func.sum(case((LearnerProgressRow.mastery_level == level.value, 1), else_=0))
+
+
+def _latest_nonempty(key: Any, value: Any, teacher_id: str) -> Any:
+    """``(key, value)`` of each key's most recently active row with a non-empty value."""
+    lp = LearnerProgressRow
+    ranked = (
+        select(
+            key.label("key"),
+            value.label("value"),
+            func.row_number()
+            .over(partition_by=key, order_by=(lp.last_activity.desc(), lp.id.desc()))
+            .label("rn"),
+        )
+        .where(lp.teacher_id == teacher_id, value != "")
+        .subquery()
+    )
+    return select(ranked.c.key, ranked.c.value).where(ranked.c.rn == 1)
+
+
+def _keep_if_empty(new: Any, old: Any) -> ColumnElement[Any]:
+    """Upsert SET value: *new* unless it is empty, then *old*."""
+    return case((new == "", old), else_=new)
+
+
+def _dialect_insert(dialect: str) -> Any:
+    """``insert`` construct with ``on_conflict_do_update`` for *dialect*."""
+    if dialect == "postgresql":
+        from sqlalchemy.dialects.postgresql import insert as pg_insert
+
+        return pg_insert
+    from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+    return sqlite_insert
+
+
+class SqlProgressStore:
+    """Progress store over an async SQLAlchemy session factory.
+
+    Args:
+        session_factory: An ``async_sessionmaker`` (Postgres or aiosqlite).
+        engine: Optional engine owned by this store, disposed by :meth:`close`.
+    """
+
+    def __init__(self, session_factory: Any, *, engine: Any | None = None) -> None:
+        self._session_factory = session_factory
+        self._engine = engine
+        self._tables_ready = False
+        self._tables_lock = asyncio.Lock()
+
+    @classmethod
+    def from_url(cls, url: str) -> SqlProgressStore:
+        """Create a store with its own small engine on *url*."""
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        engine_kwargs: dict[str, Any] = {}
+        if not url.startswith("sqlite"):
+            engine_kwargs.update(pool_size=2, max_overflow=2, pool_pre_ping=True)
+        engine = create_async_engine(url, **engine_kwargs)
+        return cls(async_sessionmaker(engine, expire_on_commit=False), engine=engine)
+
+    # --- Parent links ---
+
+    async def link_parent_student(self, parent_id: str, student_id: str) -> None:
+        """Register a parent-student linkage for access control."""
+        await self._ensure_tables()
+        if await self.is_parent_linked(parent_id, student_id):
+            return
+        async with self._session_factory() as session:
+            session.add(ParentStudentRow(parent_id=parent_id, student_id=student_id))
+            try:
+                await session.commit()
+            except IntegrityError:
+                # Linked concurrently, or an id unknown to ``users``
+                await session.rollback()
+                _log.warning(
+                    "progress_store.link_failed", parent_id=parent_id, student_id=student_id
+                )
+
+    async def is_parent_linked(self, parent_id: str, student_id: str) -> bool:
+        """Check if a parent is linked to a specific student."""
+        await self._ensure_tables()
+        stmt = select(ParentStudentRow.id).where(
+            ParentStudentRow.parent_id == parent_id,
+            ParentStudentRow.student_id == student_id,
+        )
+        async with self._session_factory() as session:
+            return (await session.execute(stmt.limit(1))).first() is not None
+
+    # --- Progress ---
+
+    async def record_progress(
+        self,
+        teacher_id: str,
+        student_id: str,
+        student_name: str,
+        standard_code: str,
+        standard_description: str,
+        mastery_level: MasteryLevel,
+        notes: str = "",
+    ) -> LearnerProgress:
+        """Record or update a student's mastery on a standard."""
+        await self._ensure_tables()
+        args = (
+            teacher_id,
+            student_id,
+            student_name,
+            standard_code,
+            standard_description,
+            MasteryLevel(mastery_level),
+            notes,
+        )
+        return await self._upsert(*args)
+
+    async def get_dashboard(self, teacher_id: str) -> ClassProgressSummary:
+        """Aggregated class progress summary, computed in the database."""
+        await self._ensure_tables()
+        lp = LearnerProgressRow
+        levels = (MasteryLevel.MASTERED, MasteryLevel.PROFICIENT, MasteryLevel.DEVELOPING)
+        counts = [_level_count(level) for level in levels]
+
+        distribution_stmt = (
+            select(lp.mastery_level, func.count())
+            .where(lp.teacher_id == teacher_id)
+            .group_by(lp.mastery_level)
+        )
+        students_stmt = (
+            select(
+                lp.student_id,
+                func.count(),
+                *counts,
+                func.max(lp.last_activity),
+            )
+            .where(lp.teacher_id == teacher_id)
+            .group_by(lp.student_id)
+            .order_by(func.min(lp.created_at), lp.student_id)
+        )
+        standards_stmt = (
+            select(
+                lp.standard_code,
+                func.count(),
+                *counts,
+            )
+            .where(lp.teacher_id == teacher_id)
+            .group_by(lp.standard_code)
+            .order_by(func.min(lp.created_at), lp.standard_code)
+        )
+
+        async with self._session_factory() as session:
+            distribution_rows = (await session.execute(distribution_stmt)).all()
+            student_rows = (await session.execute(students_stmt)).all()
+            standard_rows = (await session.execute(standards_stmt)).all()
+            names = dict(
+                (await session.execute(_latest_nonempty(lp.student_id, lp.student_name, teacher_id))).all()
+            )
+            descriptions = dict(
+                (
+                    await session.execute(
+                        _latest_nonempty(lp.standard_code, lp.standard_description, teacher_id)
+                    )
+                ).all()
+            )
+
+        summary = ClassProgressSummary(teacher_id=teacher_id)
+        for level_value, n in distribution_rows:
+            summary.mastery_distribution[level_value] = int(n)
+        summary.students = [
+            StudentSummary(
+                student_id=sid,
+                student_name=names.get(sid, ""),
+                standards_count=int(total),
+                mastered_count=int(mastered or 0),
+                proficient_count=int(proficient or 0),
+                developing_count=int(developing or 0),
+                last_activity=_iso(last_activity),
+            )
+            for sid, total, mastered, proficient, developing, last_activity in student_rows
+        ]
+        summary.standards = [
+            StandardSummary(
+                standard_code=code,
+                standard_description=descriptions.get(code, ""),
+                student_count=int(total),
+                mastered_count=int(mastered or 0),
+                proficient_count=int(proficient or 0),
+                developing_count=int(developing or 0),
+            )
+            for code, total, mastered, proficient, developing in standard_rows
+        ]
+        summary.total_students = len(summary.students)
+        summary.total_standards = len(summary.standards)
+        return summary
+
+    async def get_student(self, teacher_id: str, student_id: str) -> list[LearnerProgress]:
+        """Get all progress records for a specific student under a teacher."""
+        return await self._select(
+            LearnerProgressRow.teacher_id == teacher_id,
+            LearnerProgressRow.student_id == student_id,
+        )
+
+    async def get_student_all_teachers(self, student_id: str) -> list[LearnerProgress]:
+        """Get all progress records for a student across all teachers."""
+        return await self._select(LearnerProgressRow.student_id == student_id)
+
+    async def close(self) -> None:
+        """Dispose the owned engine."""
+        if self._engine is not None:
+            await self._engine.dispose()
+
+    # --- Internals ---
+
+    async def _upsert(
+        self,
+        teacher_id: str,
+        student_id: str,
+        student_name: str,
+        standard_code: str,
+        standard_description: str,
+        level: MasteryLevel,
+        notes: str,
+    ) -> LearnerProgress:
+        lp = LearnerProgressRow
+        async with self._session_factory() as session:
+            now = datetime.now(UTC)
+            stmt = _dialect_insert(session.get_bind().dialect.name)(lp).values(
+                id=_uuid7_str(),
+                teacher_id=teacher_id,
+                student_id=student_id,
+                student_name=student_name,
+                standard_code=standard_code,
+                standard_description=standard_description,
+                mastery_level=level.value,
+                session_count=1,
+                notes=notes,
+                last_activity=now,
+                created_at=now,
+            )
+            new = stmt.excluded
+            stmt = stmt.on_conflict_do_update(
+                index_elements=[lp.teacher_id, lp.student_id, lp.standard_code],
+                set_={
+                    "mastery_level": new.mastery_level,
+                    "session_count": lp.session_count + 1,
+                    "last_activity": new.last_activity,
+                    "notes": _keep_if_empty(new.notes, lp.notes),
+                    "student_name": _keep_if_empty(new.student_name, lp.student_name),
+                    "standard_description": _keep_if_empty(
+                        new.standard_description, lp.standard_description
+                    ),
+                },
+            ).returning(lp)
+            row = (
+                await session.execute(stmt, execution_options={"populate_existing": True})
+            ).scalar_one()
+            await session.commit()
+            return _row_to_progress(row)
+
+    async def _select(self, *where: Any) -> list[LearnerProgress]:
+        await self._ensure_tables()
+        stmt = (
+            select(LearnerProgressRow)
+            .where(*where)
+            .order_by(LearnerProgressRow.created_at, LearnerProgressRow.id)
+        )
+        async with self._session_factory() as session:
+            rows = (await session.execute(stmt)).scalars().all()
+        return [_row_to_progress(r) for r in rows]
+
+    async def _ensure_tables(self) -> None:
+        if self._tables_ready:
+            return
+        async with self._tables_lock:
+            if self._tables_ready:
+                return
+            tables = [
+                Base.metadata.tables["learner_progress"],
+                Base.metadata.tables["parent_students"],
+            ]
+            async with self._session_factory() as session:
+                await session.run_sync(
+                    lambda s: Base.metadata.create_all(s.connection(), tables=tables)
+                )
+                await session.commit()
+            self._tables_ready = True
@@ -0,0 +1,473 @@
+"""Database-backed trace store (Postgres or SQLite).
+
+Persists pipeline run traces in ``run_traces`` / ``node_traces`` so
+``/traces`` and ``/runs`` survive restarts and are not capped at the
+in-memory store's 500 runs.  Same contract as
+``shared.trace_store.TraceStore`` (tenant checks, F-252 no implicit
+creation), with two differences:
+
+- node traces are write-behind: ``append_node`` buffers them and a flush
+  inserts every pending node in one statement (after ``batch_window_ms``,
+  at ``batch_max_nodes`` pending for a run, or before a read that needs
+  them).  Flushes are serialized and a failed one is retried, then put
+  back in the buffer;
+- returned ``RunTrace`` objects are snapshots -- change a run through
+  ``update_run`` / ``append_node``, not by mutating the object.
+
+Expired runs (not updated for ``ttl_seconds``) are hidden from reads and
+purged periodically.  Tables are created on first use when missing
+(Postgres deployments get them from migration 0009).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import structlog
+from sqlalchemy import delete, func, insert, select, update
+from sqlalchemy.exc import IntegrityError
+
+from ...domain.entities.trace import NodeTrace, RunTrace
+from .models import Base, NodeTraceRow, RunTraceRow, _uuid7_str
+
+_log = structlog.get_logger("ailine.db.trace_store")
+
+_DEFAULT_TTL_SECONDS = 7 * 24 * 3600
+# Owners of recently seen runs, so append_node/update_run skip the lookup
+_OWNER_CACHE_SIZE = 4096
+# Minimum interval between purges of expired runs
+_PURGE_INTERVAL_S = 300.0
+# Flush retries after a failed write (connection blip, lock timeout), with
+# exponential backoff from _FLUSH_BACKOFF_S.  A failed write is rolled back
+# as a whole, so the batch is safe to redo.
+_FLUSH_ATTEMPTS = 3
+_FLUSH_BACKOFF_S = 0.05
+
+# RunTrace field -> run_traces column for update_run()
+_UPDATABLE_COLUMNS: dict[str, str] = {
+    "status": "status",
+    "user_prompt": "user_prompt",
+    "subject": "subject",
+    "total_time_ms": "total_time_ms",
+    "final_score": "final_score",
+    "model_used": "model_used",
+    "refinement_count": "refinement_count",
+    "scorecard": "scorecard_json",
+}
+
+
+def _iso(value: datetime | None) -> str:
+    if value is None:
+        return ""
+    if value.tzinfo is None:  # SQLite drops the offset; values are stored in UTC
+        value = value.replace(tzinfo=UTC)
+    return value.isoformat()
+
+
+def _row_to_trace(row: RunTraceRow, nodes: list[dict[str, Any]]) -> RunTrace:
+    """Map a RunTraceRow and its node JSON to a domain RunTrace."""
+    return RunTrace(
+        run_id=row.run_id,
+        teacher_id=row.teacher_id,
+        status=row.status,
+        created_at=_iso(row.created_at),
+        user_prompt=row.user_prompt or "",
+        subject=row.subject or "",
+        total_time_ms=row.total_time_ms or 0.0,
+        nodes=[NodeTrace.model_validate(n) for n in nodes],
+        final_score=row.final_score,
+        model_used=row.model_used or "",
+        refinement_count=row.refinement_count or 0,
+        scorecard=row.scorecard_json,
+    )
+
+
+class SqlTraceStore:
+    """Trace store over an async SQLAlchemy session factory.
+
+    Args:
+        session_factory: An ``async_sessionmaker`` (Postgres or aiosqlite).
+        engine: Optional engine owned by this store, disposed by :meth:`close`.
+        ttl_seconds: Runs not updated for this long are expired.
+        batch_window_ms: How long node traces are buffered before a flush
+            (0 = write each node through).
+        batch_max_nodes: Pending nodes of one run that trigger a flush.
+    """
+
+    def __init__(
+        self,
+        session_factory: Any,
+        *,
+        engine: Any | None = None,
+        ttl_seconds: int = _DEFAULT_TTL_SECONDS,
+        batch_window_ms: float = 50.0,
+        batch_max_nodes: int = 64,
+    ) -> None:
+        self._session_factory = session_factory
+        self._engine = engine
+        self._ttl = ttl_seconds
+        self._batch_window_ms = batch_window_ms
+        self._batch_max_nodes = batch_max_nodes
+        self._tables_ready = False
+        self._tables_lock = asyncio.Lock()
+        self._owners: OrderedDict[str, str] = OrderedDict()
+        self._last_purge = 0.0
+        # run_id -> [(node row id, node JSON)]; ids are taken at append
+        # time so concurrent flushes keep the append order.
+        self._pending: dict[str, list[tuple[str, dict[str, Any]]]] = {}
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+        self._flush_lock = asyncio.Lock()
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> SqlTraceStore:
+        """Create a store with its own small engine on *url*."""
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        engine_kwargs: dict[str, Any] = {}
+        if not url.startswith("sqlite"):
+            engine_kwargs.update(pool_size=2, max_overflow=2, pool_pre_ping=True)
+        engine = create_async_engine(url, **engine_kwargs)
+        return cls(
+            async_sessionmaker(engine, expire_on_commit=False), engine=engine, **kwargs
+        )
+
+    # --- Reads ---
+
+    async def get(self, run_id: str, *, teacher_id: str) -> RunTrace | None:
+        """Get a trace by run_id, or None if not found / expired / not owned."""
+        await self._ensure_tables()
+        if self._needs_flush(run_id):
+            await self.flush()  # read-your-writes on this node
+        async with self._session_factory() as session:
+            row = (
+                await session.execute(
+                    select(RunTraceRow).where(
+                        RunTraceRow.run_id == run_id,
+                        RunTraceRow.teacher_id == teacher_id,
+                        RunTraceRow.updated_at >= self._cutoff(),
+                    )
+                )
+            ).scalar_one_or_none()
+            if row is None:
+                return None
+            nodes = await self._load_nodes(session, [run_id])
+        return _row_to_trace(row, nodes.get(run_id, []))
+
+    async def list_recent(
+        self,
+        limit: int = 20,
+        *,
+        teacher_id: str | None = None,
+        status: str | None = None,
+        offset: int = 0,
+    ) -> list[RunTrace]:
+        """List recent traces, newest first (by last update).
+
+        Served by ``ix_run_traces_teacher_updated``; nodes of the page are
+        loaded with one extra query.
+        """
+        await self._ensure_tables()
+        if self._pending or self._flush_lock.locked():
+            await self.flush()
+        stmt = (
+            self._filtered(select(RunTraceRow), teacher_id, status)
+            .order_by(RunTraceRow.updated_at.desc(), RunTraceRow.run_id.desc())
+            .offset(offset)
+            .limit(limit)
+        )
+        async with self._session_factory() as session:
+            rows = list((await session.execute(stmt)).scalars())
+            nodes = await self._load_nodes(session, [r.run_id for r in rows])
+        return [_row_to_trace(r, nodes.get(r.run_id, [])) for r in rows]
+
+    async def count(
+        self, *, teacher_id: str | None = None, status: str | None = None
+    ) -> int:
+        """Number of traces matching the ``list_recent`` filters."""
+        await self._ensure_tables()
+        stmt = self._filtered(
+            select(func.count()).select_from(RunTraceRow), teacher_id, status
+        )
+        async with self._session_factory() as session:
+            return int((await session.execute(stmt)).scalar_one())
+
+    # --- Writes ---
+
+    async def get_or_create(self, run_id: str, *, teacher_id: str = "") -> RunTrace:
+        """Get existing trace or create a new empty one.
+
+        When *teacher_id* is provided and the stored trace has no owner
+        yet, it is recorded for tenant isolation.
+        """
+        await self._ensure_tables()
+        await self._maybe_purge()
+        if self._needs_flush(run_id):
+            await self.flush()
+        async with self._session_factory() as session:
+            row = await session.get(RunTraceRow, run_id)
+            if row is None:
+                now = datetime.now(UTC)
+                row = RunTraceRow(
+                    run_id=run_id, teacher_id=teacher_id, created_at=now, updated_at=now
+                )
+                session.add(row)
+                try:
+                    await session.commit()
+                except IntegrityError:
+                    # Created concurrently (another request or node)
+                    await session.rollback()
+                    row = await session.get(RunTraceRow, run_id)
+                    if row is None:  # pragma: no cover - deleted in between
+                        raise
+            elif teacher_id and not row.teacher_id:
+                row.teacher_id = teacher_id
+                row.updated_at = datetime.now(UTC)
+                await session.commit()
+            nodes = await self._load_nodes(session, [run_id])
+        self._remember_owner(run_id, row.teacher_id)
+        return _row_to_trace(row, nodes.get(run_id, []))
+
+    async def append_node(
+        self, run_id: str, node: NodeTrace, *, teacher_id: str = ""
+    ) -> None:
+        """Buffer a node trace for the run (write-behind).
+
+        F-252: ignored with a warning when the run does not exist or
+        belongs to another teacher.
+        """
+        owner = await self._owner(run_id)
+        if owner is None:
+            _log.warning("trace_store.append_node_unknown_run", run_id=run_id)
+            return
+        if teacher_id and owner and owner != teacher_id:
+            _log.warning(
+                "trace_store.append_node_tenant_mismatch",
+                run_id=run_id,
+                expected=owner,
+                got=teacher_id,
+            )
+            return
+        pending = self._pending.setdefault(run_id, [])
+        pending.append((_uuid7_str(), node.model_dump(mode="json")))
+        if self._batch_window_ms <= 0 or len(pending) >= self._batch_max_nodes:
+            await self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(
+                self._batch_window_ms / 1000.0, self._flush_in_background
+            )
+
+    async def update_run(
+        self, run_id: str, *, teacher_id: str = "", **kwargs: Any
+    ) -> None:
+        """Update top-level run fields (status, total_time_ms, etc.).
+
+        F-252: ignored with a warning when the run does not exist or
+        belongs to another teacher.  Unknown fields are ignored.
+        """
+        owner = await self._owner(run_id)
+        if owner is None:
+            _log.warning("trace_store.update_run_unknown_run", run_id=run_id)
+            return
+        if teacher_id and owner and owner != teacher_id:
+            _log.warning(
+                "trace_store.update_run_tenant_mismatch",
+                run_id=run_id,
+                expected=owner,
+                got=teacher_id,
+            )
+            return
+        values = {
+            _UPDATABLE_COLUMNS[key]: value
+            for key, value in kwargs.items()
+            if key in _UPDATABLE_COLUMNS
+        }
+        values["updated_at"] = datetime.now(UTC)
+        async with self._session_factory() as session:
+            await session.execute(
+                update(RunTraceRow).where(RunTraceRow.run_id == run_id).values(**values)
+            )
+            await session.commit()
+
+    async def flush(self) -> None:
+        """Insert every buffered node trace in one statement.
+
+        Only one flush writes at a time: a caller arriving while a batch
+        is in flight waits for it, then writes what was buffered since.
+        A failed write is retried with backoff; if it still fails, the
+        batch goes back to the buffer ahead of nodes appended meanwhile
+        and the error is raised, so nothing is lost.
+        """
+        async with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            batch, self._pending = self._pending, {}
+            if not batch:
+                return
+            try:
+                await self._write_batch_with_retry(batch)
+            except BaseException:
+                for run_id, nodes in self._pending.items():
+                    batch.setdefault(run_id, []).extend(nodes)
+                self._pending = batch
+                raise
+
+    async def _write_batch_with_retry(
+        self, batch: dict[str, list[tuple[str, dict[str, Any]]]]
+    ) -> None:
+        for attempt in range(1, _FLUSH_ATTEMPTS + 1):
+            try:
+                await self._write_batch(batch)
+                return
+            except Exception as exc:
+                if attempt == _FLUSH_ATTEMPTS:
+                    raise
+                _log.warning("trace_store.flush_retry", attempt=attempt, error=str(exc))
+                await asyncio.sleep(_FLUSH_BACKOFF_S * 2 ** (attempt - 1))
+
+    async def _write_batch(self, batch: dict[str, list[tuple[str, dict[str, Any]]]]) -> None:
+        await self._ensure_tables()
+        async with self._session_factory() as session:
+            # Runs purged since append_node checked them are dropped
+            existing = set(
+                (
+                    await session.execute(
+                        select(RunTraceRow.run_id).where(RunTraceRow.run_id.in_(list(batch)))
+                    )
+                ).scalars()
+            )
+            rows = [
+                {"id": node_id, "run_id": run_id, "data_json": data}
+                for run_id, nodes in batch.items()
+                if run_id in existing
+                for node_id, data in nodes
+            ]
+            if rows:
+                await session.execute(insert(NodeTraceRow), rows)
+                await session.execute(
+                    update(RunTraceRow)
+                    .where(RunTraceRow.run_id.in_(existing))
+                    .values(updated_at=datetime.now(UTC))
+                )
+            await session.commit()
+        missing = batch.keys() - existing
+        if missing:
+            _log.warning("trace_store.flush_dropped_runs", run_ids=sorted(missing))
+
+    async def close(self) -> None:
+        """Flush buffered nodes and dispose the owned engine."""
+        try:
+            await self.flush()
+        finally:
+            if self._flush_tasks:
+                await asyncio.gather(*self._flush_tasks, return_exceptions=True)
+            if self._engine is not None:
+                await self._engine.dispose()
+
+    # --- Internals ---
+
+    def _needs_flush(self, run_id: str) -> bool:
+        """True when *run_id* has buffered nodes or a flush is writing."""
+        return run_id in self._pending or self._flush_lock.locked()
+
+    def _cutoff(self) -> datetime:
+        return datetime.now(UTC) - timedelta(seconds=self._ttl)
+
+    def _filtered(self, stmt: Any, teacher_id: str | None, status: str | None) -> Any:
+        stmt = stmt.where(RunTraceRow.updated_at >= self._cutoff())
+        if teacher_id is not None:
+            stmt = stmt.where(RunTraceRow.teacher_id == teacher_id)
+        if status is not None:
+            stmt = stmt.where(RunTraceRow.status == status)
+        return stmt
+
+    async def _load_nodes(
+        self, session: Any, run_ids: list[str]
+    ) -> dict[str, list[dict[str, Any]]]:
+        if not run_ids:
+            return {}
+        result = await session.execute(
+            select(NodeTraceRow.run_id, NodeTraceRow.data_json)
+            .where(NodeTraceRow.run_id.in_(run_ids))
+            .order_by(NodeTraceRow.run_id, NodeTraceRow.id)
+        )
+        nodes: dict[str, list[dict[str, Any]]] = {}
+        for run_id, data in result:
+            nodes.setdefault(run_id, []).append(data)
+        return nodes
+
+    async def _owner(self, run_id: str) -> str | None:
+        """Owning teacher of *run_id* ("" if unowned), None if it does not exist."""
+        owner: str | None = self._owners.get(run_id)
+        if owner is not None:
+            self._owners.move_to_end(run_id)
+            return owner
+        await self._ensure_tables()
+        async with self._session_factory() as session:
+            owner = (
+                await session.execute(
+                    select(RunTraceRow.teacher_id).where(RunTraceRow.run_id == run_id)
+                )
+            ).scalar_one_or_none()
+        if owner is not None:
+            self._remember_owner(run_id, owner)
+        return owner
+
+    def _remember_owner(self, run_id: str, teacher_id: str) -> None:
+        # Unowned runs are not cached: another node may still claim them.
+        if not teacher_id:
+            return
+        self._owners[run_id] = teacher_id
+        self._owners.move_to_end(run_id)
+        if len(self._owners) > _OWNER_CACHE_SIZE:
+            self._owners.popitem(last=False)
+
+    async def _ensure_tables(self) -> None:
+        if self._tables_ready:
+            return
+        async with self._tables_lock:
+            if self._tables_ready:
+                return
+            tables = [Base.metadata.tables["run_traces"], Base.metadata.tables["node_traces"]]
+            async with self._session_factory() as session:
+                await session.run_sync(
+                    lambda s: Base.metadata.create_all(s.connection(), tables=tables)
+                )
+                await session.commit()
+            self._tables_ready = True
+
+    async def _maybe_purge(self) -> None:
+        """Delete expired runs and their nodes, at most every few minutes."""
+        now = time.monotonic()
+        if now - self._last_purge < _PURGE_INTERVAL_S:
+            return
+        self._last_purge = now
+        cutoff = self._cutoff()
+        expired = select(RunTraceRow.run_id).where(RunTraceRow.updated_at < cutoff)
+        async with self._session_factory() as session:
+            # Explicit node delete: SQLite does not cascade without PRAGMA foreign_keys
+            await session.execute(delete(NodeTraceRow).where(NodeTraceRow.run_id.in_(expired)))
+            result = await session.execute(
+                delete(RunTraceRow).where(RunTraceRow.updated_at < cutoff)
+            )
+            await session.commit()
+        if result.rowcount:
+            self._owners.clear()
+            _log.info("trace_store.purged", runs=result.rowcount)
+
+    def _flush_in_background(self) -> None:
+        self._flush_timer = None
+        task = asyncio.create_task(self._background_flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _background_flush(self) -> None:
+        try:
+            await self.flush()
+        except Exception as exc:
+            _log.warning("trace_store.flush_failed", error=str(exc))
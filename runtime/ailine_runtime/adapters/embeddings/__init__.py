@@ -1,7 +1,9 @@
 """Embedding adapter implementations."""
 
+from .cached_embeddings import CachedEmbeddings
 from .fake_embeddings import FakeEmbeddings
 
 __all__ = [
+    "CachedEmbeddings",
     "FakeEmbeddings",
 ]
@@ -0,0 +1,351 @@
+"""Content-addressed caching decorator for embedding adapters.
+
+Wraps any ``Embeddings`` implementation and memoizes vectors by
+``(model_name, dimensions, sha256(text))``.  Re-ingesting a lightly edited
+material or answering a repeated tutor question then only pays for the
+texts that were never embedded before.
+
+Two tiers:
+
+1. **In-process LRU** -- always on, bounded by ``max_entries``.
+2. **Shared backend** (optional) -- Redis or Postgres, so that every
+   worker and restart benefits from vectors embedded elsewhere.
+
+Vectors are stored as raw little-endian float32 bytes (4 bytes per
+dimension), roughly 5x smaller than a JSON list of floats.  Backend
+failures are logged and treated as misses: the cache never turns a
+working embedding call into a failing one.
+"""
+
+from __future__ import annotations
+
+import hashlib
+from collections import OrderedDict
+from typing import Any, Protocol, runtime_checkable
+
+import numpy as np
+
+from ...domain.ports.embeddings import Embeddings
+from ...shared.metrics import embedding_cache_requests_total
+from ...shared.observability import get_logger
+
+_log = get_logger("ailine.adapters.embeddings.cache")
+
+_DEFAULT_MAX_ENTRIES = 10_000
+_DEFAULT_TTL_SECONDS = 30 * 24 * 3600
+_FLOAT32 = np.dtype("<f4")
+
+
+def encode_embedding(vec: list[float]) -> bytes:
+    """Pack an embedding as little-endian float32 bytes."""
+    return np.asarray(vec, dtype=_FLOAT32).tobytes()
+
+
+def decode_embedding(data: bytes) -> list[float]:
+    """Unpack bytes produced by :func:`encode_embedding`."""
+    result: list[float] = np.frombuffer(data, dtype=_FLOAT32).tolist()
+    return result
+
+
+@runtime_checkable
+class EmbeddingCacheBackend(Protocol):
+    """Shared (out-of-process) tier of the embedding cache."""
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        """Return the stored value for each key (``None`` when absent)."""
+        ...
+
+    async def set_many(self, items: dict[str, bytes]) -> None:
+        """Store all *items*; existing keys may be left untouched."""
+        ...
+
+    async def dispose(self) -> None:
+        """Release connections held by the backend."""
+        ...
+
+
+class CachedEmbeddings:
+    """``Embeddings`` decorator with an LRU tier and an optional shared tier.
+
+    Duplicate texts within one ``embed_batch`` call are embedded once.
+    Hits and misses are counted per tier in
+    ``ailine_embedding_cache_requests_total``.
+
+    Args:
+        inner: The embeddings adapter to wrap.
+        max_entries: Capacity of the in-process LRU tier (0 disables it).
+        backend: Optional shared cache tier (Redis/Postgres).
+    """
+
+    def __init__(
+        self,
+        inner: Embeddings,
+        *,
+        max_entries: int = _DEFAULT_MAX_ENTRIES,
+        backend: EmbeddingCacheBackend | None = None,
+    ) -> None:
+        self._inner = inner
+        self._max_entries = max_entries
+        self._backend = backend
+        self._lru: OrderedDict[str, bytes] = OrderedDict()
+
+    # -- Protocol properties --------------------------------------------------
+
+    @property
+    def dimensions(self) -> int:
+        """Dimensionality of the wrapped adapter."""
+        return self._inner.dimensions
+
+    @property
+    def model_name(self) -> str:
+        """Model identifier of the wrapped adapter."""
+        return self._inner.model_name
+
+    @property
+    def inner(self) -> Embeddings:
+        """The wrapped (uncached) adapter."""
+        return self._inner
+
+    # -- Public API (matches Embeddings protocol) -----------------------------
+
+    async def embed_text(self, text: str) -> list[float]:
+        """Return the cached embedding for *text*, embedding it on a miss."""
+        [vec] = await self.embed_batch([text])
+        return vec
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        """Embed *texts*, calling the wrapped adapter only for cache misses.
+
+        Returns:
+            One embedding per input text, in input order.
+        """
+        if not texts:
+            return []
+
+        keys = [self.cache_key(t) for t in texts]
+        found: dict[str, bytes] = {}
+
+        # Tier 1: in-process LRU
+        pending: list[str] = []
+        for key in dict.fromkeys(keys):
+            cached = self._lru_get(key)
+            if cached is None:
+                pending.append(key)
+            else:
+                found[key] = cached
+        self._count("memory", hits=len(found), misses=len(pending))
+
+        # Tier 2: shared backend
+        if pending and self._backend is not None:
+            from_backend = await self._backend_get(pending)
+            for key, value in from_backend.items():
+                found[key] = value
+                self._lru_put(key, value)
+            self._count(
+                "backend", hits=len(from_backend), misses=len(pending) - len(from_backend)
+            )
+            pending = [k for k in pending if k not in from_backend]
+
+        # Miss path: embed each unique missing text once
+        if pending:
+            missing = set(pending)
+            to_embed: dict[str, str] = {}
+            for key, text in zip(keys, texts, strict=True):
+                if key in missing and key not in to_embed:
+                    to_embed[key] = text
+            vectors = await self._inner.embed_batch(list(to_embed.values()))
+            fresh = {
+                key: encode_embedding(vec)
+                for key, vec in zip(to_embed, vectors, strict=True)
+            }
+            for key, value in fresh.items():
+                found[key] = value
+                self._lru_put(key, value)
+            if self._backend is not None:
+                await self._backend_set(fresh)
+
+        _log.debug(
+            "embedding_cache_batch",
+            model=self.model_name,
+            count=len(texts),
+            embedded=len(pending),
+        )
+        return [decode_embedding(found[key]) for key in keys]
+
+    # -- Keys and tiers ---------------------------------------------------------
+
+    def cache_key(self, text: str) -> str:
+        """Content address for *text* under the wrapped model's settings."""
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{self.model_name}:{self.dimensions}:{digest}"
+
+    def _lru_get(self, key: str) -> bytes | None:
+        value = self._lru.get(key)
+        if value is not None:
+            self._lru.move_to_end(key)
+        return value
+
+    def _lru_put(self, key: str, value: bytes) -> None:
+        if self._max_entries <= 0:
+            return
+        self._lru[key] = value
+        self._lru.move_to_end(key)
+        while len(self._lru) > self._max_entries:
+            self._lru.popitem(last=False)
+
+    async def _backend_get(self, keys: list[str]) -> dict[str, bytes]:
+        assert self._backend is not None
+        try:
+            values = await self._backend.get_many(keys)
+        except Exception as exc:
+            _log.warning("embedding_cache_backend_get_failed", error=str(exc))
+            return {}
+        return {k: v for k, v in zip(keys, values, strict=True) if v is not None}
+
+    async def _backend_set(self, items: dict[str, bytes]) -> None:
+        assert self._backend is not None
+        try:
+            await self._backend.set_many(items)
+        except Exception as exc:
+            _log.warning("embedding_cache_backend_set_failed", error=str(exc))
+
+    @staticmethod
+    def _count(tier: str, *, hits: int, misses: int) -> None:
+        if hits:
+            embedding_cache_requests_total.inc(hits, tier=tier, result="hit")
+        if misses:
+            embedding_cache_requests_total.inc(misses, tier=tier, result="miss")
+
+    async def dispose(self) -> None:
+        """Release the shared backend's connections (if any)."""
+        if self._backend is not None:
+            await self._backend.dispose()
+
+
+# -- Shared backends ------------------------------------------------------------
+
+
+class RedisEmbeddingCache:
+    """Redis tier: one ``MGET`` per lookup, one pipelined ``SET EX`` per write.
+
+    Args:
+        client: A ``redis.asyncio.Redis`` client created with
+            ``decode_responses=False`` (values are raw bytes).
+        prefix: Key namespace.
+        ttl_seconds: Expiry for stored vectors (0 = no expiry).
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        prefix: str = "ailine:emb:",
+        ttl_seconds: int = _DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self._redis = client
+        self._prefix = prefix
+        self._ttl = ttl_seconds
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> RedisEmbeddingCache:
+        """Create a backend with its own connection pool for *url*."""
+        from redis.asyncio import Redis
+
+        return cls(Redis.from_url(url, decode_responses=False), **kwargs)
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        values: list[bytes | None] = await self._redis.mget(
+            [self._prefix + k for k in keys]
+        )
+        return values
+
+    async def set_many(self, items: dict[str, bytes]) -> None:
+        if not items:
+            return
+        pipe = self._redis.pipeline(transaction=False)
+        for key, value in items.items():
+            pipe.set(self._prefix + key, value, ex=self._ttl or None)
+        await pipe.execute()
+
+    async def dispose(self) -> None:
+        await self._redis.aclose()
+
+
+class PgEmbeddingCache:
+    """Postgres tier: a ``(key TEXT PRIMARY KEY, vector BYTEA)`` table.
+
+    The table is created on first use.  Writes use
+    ``ON CONFLICT DO NOTHING`` since a key always maps to the same vector.
+
+    Args:
+        session_factory: An ``async_sessionmaker`` bound to a PostgreSQL engine.
+        table_name: Cache table name.
+        engine: Optional engine owned by this backend, disposed by
+            :meth:`dispose`.
+    """
+
+    def __init__(
+        self,
+        session_factory: Any,
+        *,
+        table_name: str = "embedding_cache",
+        engine: Any | None = None,
+    ) -> None:
+        self._session_factory = session_factory
+        self._table = table_name
+        self._engine = engine
+        self._table_ready = False
+
+    async def _ensure_table(self, session: Any) -> None:
+        if self._table_ready:
+            return
+        from sqlalchemy import text
+
+        await session.execute(
+            text(
+                f"""
+                CREATE TABLE IF NOT EXISTS {self._table} (
+                    key         TEXT PRIMARY KEY,
+                    vector      BYTEA NOT NULL,
+                    created_at  TIMESTAMPTZ NOT NULL DEFAULT now()
+                )
+                """
+            )
+        )
+        self._table_ready = True
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        from sqlalchemy import text
+
+        async with self._session_factory() as session:
+            await self._ensure_table(session)
+            result = await session.execute(
+                text(
+                    f"SELECT key, vector FROM {self._table} "
+                    "WHERE key = ANY(CAST(:keys AS text[]))"
+                ),
+                {"keys": keys},
+            )
+            rows = {row.key: bytes(row.vector) for row in result.fetchall()}
+            await session.commit()
+        return [rows.get(k) for k in keys]
+
+    async def set_many(self, items: dict[str, bytes]) -> None:
+        if not items:
+            return
+        from sqlalchemy import text
+
+        async with self._session_factory() as session:
+            await self._ensure_table(session)
+            await session.execute(
+                text(
+                    f"INSERT INTO {self._table} (key, vector) "
+                    "VALUES (:key, :vector) ON CONFLICT (key) DO NOTHING"
+                ),
+                [{"key": k, "vector": v} for k, v in items.items()],
+            )
+            await session.commit()
+
+    async def dispose(self) -> None:
+        if self._engine is not None:
+            await self._engine.dispose()
@@ -6,6 +6,7 @@ then L2-normalizes the truncated vector.
 
 from __future__ import annotations
 
+import asyncio
 from typing import TYPE_CHECKING
 
 import numpy as np
@@ -18,6 +19,7 @@ if TYPE_CHECKING:
 _log = get_logger("ailine.adapters.embeddings.gemini")
 
 _BATCH_LIMIT = 100  # Gemini API max contents per request
+_DEFAULT_MAX_CONCURRENCY = 4  # In-flight embed_content requests per adapter
 
 
 class GeminiEmbeddings:
@@ -30,6 +32,9 @@ class GeminiEmbeddings:
         dimensions: Target embedding dimensionality after Matryoshka
             truncation. The model natively supports this via
             ``output_dimensionality``.
+        max_concurrency: Maximum number of ``embed_content`` sub-batch
+            requests in flight at once (shared across all callers of
+            this adapter instance).
     """
 
     def __init__(
@@ -38,11 +43,13 @@ class GeminiEmbeddings:
         model: str = "gemini-embedding-001",
         api_key: str = "",
         dimensions: int = 3072,
+        max_concurrency: int = _DEFAULT_MAX_CONCURRENCY,
     ) -> None:
         from google import genai
 
         self._model = model
         self._dimensions = dimensions
+        self._semaphore = asyncio.Semaphore(max(1, max_concurrency))
         self._client: Client = (
             genai.Client(api_key=api_key) if api_key else genai.Client()
         )
@@ -102,25 +109,34 @@ class GeminiEmbeddings:
     async def embed_batch(self, texts: list[str]) -> list[list[float]]:
         """Embed multiple texts, respecting the API batch limit.
 
-        Texts are split into chunks of up to 100 and sent sequentially.
+        Texts are split into chunks of up to 100 which are sent
+        concurrently, bounded by ``max_concurrency``.  Output order
+        matches input order.
 
         Returns:
             List of L2-normalized embeddings, one per input text.
         """
         _log.debug("embed_batch", model=self._model, count=len(texts))
 
-        results: list[list[float]] = []
         config = self._embed_config()
+        batches = [
+            texts[offset : offset + _BATCH_LIMIT]
+            for offset in range(0, len(texts), _BATCH_LIMIT)
+        ]
+        embedded = await asyncio.gather(
+            *(self._embed_sub_batch(batch, config) for batch in batches)
+        )
+        return [vec for batch_vectors in embedded for vec in batch_vectors]
 
-        for offset in range(0, len(texts), _BATCH_LIMIT):
-            batch = texts[offset : offset + _BATCH_LIMIT]
+    async def _embed_sub_batch(self, batch: list[str], config) -> list[list[float]]:
+        """Send one API-sized batch under the concurrency semaphore."""
+        async with self._semaphore:
             response = await self._client.aio.models.embed_content(
                 model=self._model,
                 contents=batch,  # type: ignore[arg-type]  # google-genai accepts list[str]
                 config=config,
             )
-            for emb in response.embeddings or []:
-                vec = np.array(emb.values, dtype=np.float32)
-                results.append(self._l2_normalize(vec))
-
-        return results
+        return [
+            self._l2_normalize(np.array(emb.values, dtype=np.float32))
+            for emb in response.embeddings or []
+        ]
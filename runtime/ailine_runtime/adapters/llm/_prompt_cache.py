@@ -0,0 +1,89 @@
+"""Shared helpers for provider-side prompt caching and usage reporting.
+
+The ``ChatLLM`` port lets callers mark the end of a stable prompt prefix
+with ``cache_breakpoint`` (the ``cache`` message key).  Each adapter maps
+that prefix onto its provider's mechanism -- ``cache_control`` blocks for
+Anthropic, explicit cached content for Gemini, a stable message order and
+``prompt_cache_key`` for OpenAI -- and reports the resulting token usage,
+including cached tokens, to the ``ObservabilityStore``.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any
+
+from ...domain.ports.llm import CACHE_BREAKPOINT_KEY, TokenUsage
+from ...shared.observability import get_logger
+from ...shared.observability_store import get_observability_store
+
+_log = get_logger("ailine.adapters.llm.prompt_cache")
+
+
+def strip_cache_marks(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    """Copy of *messages* without the port-level ``cache`` key."""
+    return [
+        {k: v for k, v in m.items() if k != CACHE_BREAKPOINT_KEY} if CACHE_BREAKPOINT_KEY in m else m
+        for m in messages
+    ]
+
+
+def breakpoint_indices(messages: list[dict[str, Any]]) -> list[int]:
+    """Indices of the messages that end a stable prefix.
+
+    Explicitly marked messages when there are any; otherwise the last
+    message of the leading run of system messages.
+    """
+    marked = [i for i, m in enumerate(messages) if m.get(CACHE_BREAKPOINT_KEY)]
+    if marked:
+        return marked
+    leading = 0
+    while leading < len(messages) and messages[leading].get("role") == "system":
+        leading += 1
+    return [leading - 1] if leading else []
+
+
+def stable_prefix_length(messages: list[dict[str, Any]]) -> int:
+    """Number of leading messages that form the stable (cacheable) prefix."""
+    indices = breakpoint_indices(messages)
+    return indices[-1] + 1 if indices else 0
+
+
+def prefix_digest(model: str, messages: list[dict[str, Any]]) -> str:
+    """Content digest identifying a stable prefix for *model*."""
+    payload = json.dumps(
+        [model, strip_cache_marks(messages)], sort_keys=True, ensure_ascii=False, default=str
+    )
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def as_int(value: Any) -> int:
+    """Usage counters from SDK objects; anything non-integer counts as 0."""
+    return value if isinstance(value, int) and not isinstance(value, bool) else 0
+
+
+def report_usage(model: str, usage: TokenUsage) -> None:
+    """Record a call's token usage (incl. prompt-cache hits) for dashboards.
+
+    Never raises: usage reporting must not fail an LLM call.
+    """
+    try:
+        get_observability_store().record_tokens(
+            input_tokens=usage.input_tokens,
+            output_tokens=usage.output_tokens,
+            model=model,
+            cached_input_tokens=usage.cached_input_tokens,
+            cache_write_tokens=usage.cache_write_tokens,
+        )
+    except Exception:
+        _log.warning("llm_usage_report_failed", model=model, exc_info=True)
+        return
+    if usage.cached_input_tokens or usage.cache_write_tokens:
+        _log.debug(
+            "llm_prompt_cache",
+            model=model,
+            input_tokens=usage.input_tokens,
+            cached_input_tokens=usage.cached_input_tokens,
+            cache_write_tokens=usage.cache_write_tokens,
+        )
@@ -2,6 +2,11 @@
 
 Implements the ChatLLM port using the Anthropic Python SDK.
 Supports native web search via the web_search_20250305 server tool.
+
+Prompt caching: system messages are sent as ``system`` blocks and every
+stable-prefix breakpoint (see ``domain.ports.llm.cache_breakpoint``; by
+default the end of the system prompt) gets ``cache_control: ephemeral``.
+Anthropic allows at most four breakpoints per request; the last four win.
 """
 
 from __future__ import annotations
@@ -11,19 +16,30 @@ from typing import Any
 
 from anthropic import AsyncAnthropic
 
-from ...domain.ports.llm import WebSearchResult, WebSearchSource
+from ...domain.ports.llm import TokenUsage, WebSearchResult, WebSearchSource
 from ...shared.observability import get_logger
+from ._prompt_cache import as_int, breakpoint_indices, report_usage, strip_cache_marks
 
 _log = get_logger("ailine.adapters.llm.anthropic")
 
+_MAX_CACHE_BREAKPOINTS = 4
+_EPHEMERAL = {"type": "ephemeral"}
+
 
 class AnthropicChatLLM:
     """ChatLLM implementation backed by Anthropic's Messages API."""
 
-    def __init__(self, *, model: str = "claude-opus-4-6", api_key: str = "") -> None:
+    def __init__(
+        self,
+        *,
+        model: str = "claude-opus-4-6",
+        api_key: str = "",
+        prompt_caching: bool = True,
+    ) -> None:
         # Strip provider prefix if present (e.g. "anthropic:claude-opus-4-6" → "claude-opus-4-6")
         self._model = model.removeprefix("anthropic:")
         self._client = AsyncAnthropic(api_key=api_key) if api_key else AsyncAnthropic()
+        self._prompt_caching = prompt_caching
 
     @property
     def model_name(self) -> str:
@@ -37,6 +53,7 @@ class AnthropicChatLLM:
             "tool_use": True,
             "vision": True,
             "web_search": True,
+            "prompt_caching": self._prompt_caching,
             "max_output_tokens": 8192,
         }
 
@@ -48,13 +65,17 @@ class AnthropicChatLLM:
         max_tokens: int = 4096,
         **kwargs: Any,
     ) -> str:
+        system, chat = self._prepare(messages, kwargs.pop("system", None))
+        if system is not None:
+            kwargs["system"] = system
         response = await self._client.messages.create(
             model=self._model,
-            messages=messages,  # type: ignore[arg-type]  # SDK accepts dict messages
+            messages=chat,  # type: ignore[arg-type]  # SDK accepts dict messages
             temperature=temperature,
             max_tokens=max_tokens,
             **kwargs,
         )
+        self._report(getattr(response, "usage", None))
         for block in response.content:
             if hasattr(block, "text"):
                 return block.text  # type: ignore[no-any-return]
@@ -68,15 +89,76 @@ class AnthropicChatLLM:
         max_tokens: int = 4096,
         **kwargs: Any,
     ) -> AsyncIterator[str]:
+        system, chat = self._prepare(messages, kwargs.pop("system", None))
+        if system is not None:
+            kwargs["system"] = system
         async with self._client.messages.stream(
             model=self._model,
-            messages=messages,  # type: ignore[arg-type]  # SDK accepts dict messages
+            messages=chat,  # type: ignore[arg-type]  # SDK accepts dict messages
             temperature=temperature,
             max_tokens=max_tokens,
             **kwargs,
         ) as stream:
             async for text in stream.text_stream:
                 yield text
+            try:
+                final = await stream.get_final_message()
+            except Exception:
+                _log.debug("anthropic_stream_usage_unavailable", model=self._model)
+            else:
+                self._report(getattr(final, "usage", None))
+
+    # -- Prompt caching -------------------------------------------------------
+
+    def _prepare(
+        self,
+        messages: list[dict[str, Any]],
+        system_kwarg: Any,
+    ) -> tuple[list[dict[str, Any]] | None, list[dict[str, Any]]]:
+        """Split system messages into ``system`` blocks and add cache breakpoints.
+
+        Returns:
+            (``system`` argument or None, remaining chat messages).
+        """
+        breakpoints: set[int] = set()
+        if self._prompt_caching:
+            breakpoints = set(breakpoint_indices(messages)[-_MAX_CACHE_BREAKPOINTS:])
+        system_blocks: list[dict[str, Any]] = []
+        if isinstance(system_kwarg, str) and system_kwarg:
+            system_blocks.append({"type": "text", "text": system_kwarg})
+        elif isinstance(system_kwarg, list):
+            system_blocks.extend(system_kwarg)
+
+        chat: list[dict[str, Any]] = []
+        for i, message in enumerate(strip_cache_marks(messages)):
+            cached = i in breakpoints
+            if message.get("role") == "system":
+                block: dict[str, Any] = {"type": "text", "text": str(message.get("content", ""))}
+                if cached:
+                    block["cache_control"] = _EPHEMERAL
+                system_blocks.append(block)
+            elif cached:
+                chat.append({**message, "content": _with_cache_control(message.get("content", ""))})
+            else:
+                chat.append(message)
+
+        return (system_blocks or None), chat
+
+    def _report(self, usage: Any) -> None:
+        if usage is None:
+            return
+        cached = as_int(getattr(usage, "cache_read_input_tokens", 0))
+        written = as_int(getattr(usage, "cache_creation_input_tokens", 0))
+        report_usage(
+            self._model,
+            TokenUsage(
+                # Anthropic's input_tokens excludes cache reads and writes
+                input_tokens=as_int(getattr(usage, "input_tokens", 0)) + cached + written,
+                output_tokens=as_int(getattr(usage, "output_tokens", 0)),
+                cached_input_tokens=cached,
+                cache_write_tokens=written,
+            ),
+        )
 
     async def generate_with_search(
         self,
@@ -140,4 +222,14 @@ class AnthropicChatLLM:
         )
 
 
+def _with_cache_control(content: Any) -> list[dict[str, Any]]:
+    """Content blocks of a message with ``cache_control`` on the last block."""
+    if isinstance(content, list) and content:
+        blocks = [dict(b) for b in content]
+    else:
+        blocks = [{"type": "text", "text": str(content)}]
+    blocks[-1]["cache_control"] = _EPHEMERAL
+    return blocks
+
+
 assert isinstance(AnthropicChatLLM, type), "AnthropicChatLLM must be a class"
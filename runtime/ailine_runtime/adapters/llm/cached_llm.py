@@ -0,0 +1,419 @@
+"""Response-caching decorator for ChatLLM adapters.
+
+Many LLM calls are effectively deterministic for a given input: gloss
+translation at a low temperature with a fixed system prompt, quality-gate
+scoring of the same draft, re-running a demo scenario or retrying a failed
+refine.  ``CachedChatLLM`` memoizes their responses under a digest of
+``(model, messages, temperature, max_tokens, tools and other kwargs)``.
+
+A request is cached when it is *deterministic enough*: its temperature is
+at or below ``max_temperature``.  Callers can override this per call with
+``use_cache=True`` (always cache) or ``use_cache=False`` (bypass).
+``stream`` replays a cached response without calling the provider.
+
+Backends: in-process LRU (default), a SQLite file (survives restarts,
+handy for demos) or Redis (shared across workers).  Backend failures are
+logged and treated as misses: the cache never turns a working LLM call
+into a failing one.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from pathlib import Path
+from typing import Any, Protocol, runtime_checkable
+
+from ...domain.ports.llm import ChatLLM, WebSearchResult
+from ...shared.metrics import llm_cache_requests_total
+from ...shared.observability import get_logger
+
+_log = get_logger("ailine.adapters.llm.cache")
+
+_DEFAULT_MAX_ENTRIES = 1024
+_DEFAULT_TTL_SECONDS = 24 * 3600
+_DEFAULT_MAX_TEMPERATURE = 0.5
+
+
+@runtime_checkable
+class LLMCacheBackend(Protocol):
+    """Storage tier of the LLM response cache."""
+
+    name: str
+
+    async def get(self, key: str) -> str | None:
+        """Return the cached response for *key* (``None`` when absent)."""
+        ...
+
+    async def set(self, key: str, value: str) -> None:
+        """Store *value* under *key*."""
+        ...
+
+    async def clear(self) -> None:
+        """Drop every cached response."""
+        ...
+
+    async def dispose(self) -> None:
+        """Release connections held by the backend."""
+        ...
+
+
+class CachedChatLLM:
+    """``ChatLLM`` decorator that serves repeated deterministic requests from a cache.
+
+    Hits and misses are counted per backend in
+    ``ailine_llm_cache_requests_total``.
+
+    Args:
+        inner: The LLM adapter to wrap.
+        backend: Cache storage; an in-process LRU when omitted.
+        max_temperature: Requests at or below this temperature are cached
+            unless the call passes ``use_cache=False``.
+    """
+
+    def __init__(
+        self,
+        inner: ChatLLM,
+        *,
+        backend: LLMCacheBackend | None = None,
+        max_temperature: float = _DEFAULT_MAX_TEMPERATURE,
+    ) -> None:
+        self._inner = inner
+        self._backend: LLMCacheBackend = backend if backend is not None else MemoryLLMCache()
+        self._max_temperature = max_temperature
+
+    # -- Protocol properties --------------------------------------------------
+
+    @property
+    def model_name(self) -> str:
+        return self._inner.model_name
+
+    @property
+    def capabilities(self) -> dict[str, Any]:
+        return {**self._inner.capabilities, "response_cache": self._backend.name}
+
+    @property
+    def inner(self) -> ChatLLM:
+        """The wrapped (uncached) adapter."""
+        return self._inner
+
+    @property
+    def backend(self) -> LLMCacheBackend:
+        """The cache storage tier."""
+        return self._backend
+
+    # -- Public API (matches ChatLLM protocol) --------------------------------
+
+    async def generate(
+        self,
+        messages: list[dict[str, Any]],
+        *,
+        temperature: float = 1.0,
+        max_tokens: int = 4096,
+        use_cache: bool | None = None,
+        **kwargs: Any,
+    ) -> str:
+        """Return the cached response for this request, generating it on a miss."""
+        key = self._key_for(messages, temperature, max_tokens, use_cache, kwargs)
+        if key is not None:
+            cached = await self._lookup(key)
+            if cached is not None:
+                return cached
+
+        text = await self._inner.generate(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+        if key is not None and text:
+            await self._store(key, text)
+        return text
+
+    async def stream(
+        self,
+        messages: list[dict[str, Any]],
+        *,
+        temperature: float = 1.0,
+        max_tokens: int = 4096,
+        use_cache: bool | None = None,
+        **kwargs: Any,
+    ) -> AsyncIterator[str]:
+        """Replay a cached response, or stream from the provider and cache it.
+
+        A response is only stored once the provider stream completes.
+        """
+        key = self._key_for(messages, temperature, max_tokens, use_cache, kwargs)
+        if key is not None:
+            cached = await self._lookup(key)
+            if cached is not None:
+                yield cached
+                return
+
+        chunks: list[str] = []
+        async for chunk in self._inner.stream(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        ):
+            chunks.append(chunk)
+            yield chunk
+        if key is not None and chunks:
+            await self._store(key, "".join(chunks))
+
+    async def generate_with_search(
+        self,
+        query: str,
+        *,
+        max_results: int = 5,
+        **kwargs: Any,
+    ) -> WebSearchResult:
+        """Web search results are time-sensitive and never cached."""
+        return await self._inner.generate_with_search(
+            query, max_results=max_results, **kwargs
+        )
+
+    # -- Keys and storage -------------------------------------------------------
+
+    def cache_key(
+        self,
+        messages: list[dict[str, Any]],
+        *,
+        temperature: float,
+        max_tokens: int,
+        **kwargs: Any,
+    ) -> str:
+        """Digest of everything that determines the response."""
+        payload = json.dumps(
+            {
+                "model": self.model_name,
+                "messages": messages,
+                "temperature": temperature,
+                "max_tokens": max_tokens,
+                "kwargs": kwargs,
+            },
+            sort_keys=True,
+            ensure_ascii=False,
+            default=str,
+        )
+        return "llm:" + hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def _key_for(
+        self,
+        messages: list[dict[str, Any]],
+        temperature: float,
+        max_tokens: int,
+        use_cache: bool | None,
+        kwargs: dict[str, Any],
+    ) -> str | None:
+        if use_cache is False or (use_cache is None and temperature > self._max_temperature):
+            return None
+        return self.cache_key(
+            messages, temperature=temperature, max_tokens=max_tokens, **kwargs
+        )
+
+    async def _lookup(self, key: str) -> str | None:
+        try:
+            value = await self._backend.get(key)
+        except Exception as exc:
+            _log.warning("llm_cache_get_failed", backend=self._backend.name, error=str(exc))
+            value = None
+        result = "hit" if value is not None else "miss"
+        llm_cache_requests_total.inc(backend=self._backend.name, result=result)
+        _log.debug("llm_cache_lookup", model=self.model_name, result=result)
+        return value
+
+    async def _store(self, key: str, value: str) -> None:
+        try:
+            await self._backend.set(key, value)
+        except Exception as exc:
+            _log.warning("llm_cache_set_failed", backend=self._backend.name, error=str(exc))
+
+    async def clear(self) -> None:
+        """Drop every cached response."""
+        await self._backend.clear()
+
+    async def dispose(self) -> None:
+        """Release the backend's connections (if any)."""
+        await self._backend.dispose()
+
+
+# -- Backends -------------------------------------------------------------------
+
+
+class MemoryLLMCache:
+    """In-process LRU with an optional TTL.
+
+    Args:
+        max_entries: Capacity; the least recently used entry is evicted.
+        ttl_seconds: Entry lifetime (0 = never expire).
+    """
+
+    name = "memory"
+
+    def __init__(
+        self, *, max_entries: int = _DEFAULT_MAX_ENTRIES, ttl_seconds: int = 0
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._entries: OrderedDict[str, tuple[str, float]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    async def get(self, key: str) -> str | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        value, expires_at = entry
+        if expires_at and expires_at <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        if self._max_entries <= 0:
+            return
+        expires_at = time.monotonic() + self._ttl if self._ttl else 0.0
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    async def clear(self) -> None:
+        self.clear_sync()
+
+    def clear_sync(self) -> None:
+        """Synchronous ``clear`` for callers outside the event loop."""
+        self._entries.clear()
+
+    async def dispose(self) -> None:
+        return None
+
+
+class SQLiteLLMCache:
+    """SQLite file tier: survives restarts without any external service.
+
+    Queries run in a worker thread on one connection guarded by a lock.
+    Expired rows are ignored on read and purged on write.
+
+    Args:
+        path: Database file (parent directories are created).
+        ttl_seconds: Entry lifetime (0 = never expire).
+    """
+
+    name = "sqlite"
+
+    def __init__(self, path: str | Path, *, ttl_seconds: int = _DEFAULT_TTL_SECONDS) -> None:
+        self._path = Path(path)
+        self._ttl = ttl_seconds
+        self._lock = threading.Lock()
+        self._conn: sqlite3.Connection | None = None
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self._path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(self._path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL, expires_at REAL NOT NULL)"
+            )
+            conn.commit()
+            self._conn = conn
+        return self._conn
+
+    def _get(self, key: str) -> str | None:
+        with self._lock:
+            row = (
+                self._connect()
+                .execute(
+                    "SELECT value FROM llm_cache WHERE key = ? AND (expires_at = 0 OR expires_at > ?)",
+                    (key, time.time()),
+                )
+                .fetchone()
+            )
+        return row[0] if row else None
+
+    def _set(self, key: str, value: str) -> None:
+        now = time.time()
+        with self._lock:
+            conn = self._connect()
+            conn.execute(
+                "INSERT OR REPLACE INTO llm_cache (key, value, expires_at) VALUES (?, ?, ?)",
+                (key, value, now + self._ttl if self._ttl else 0.0),
+            )
+            conn.execute("DELETE FROM llm_cache WHERE expires_at != 0 AND expires_at <= ?", (now,))
+            conn.commit()
+
+    def _clear(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            conn.execute("DELETE FROM llm_cache")
+            conn.commit()
+
+    def _close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    async def get(self, key: str) -> str | None:
+        return await asyncio.to_thread(self._get, key)
+
+    async def set(self, key: str, value: str) -> None:
+        await asyncio.to_thread(self._set, key, value)
+
+    async def clear(self) -> None:
+        await asyncio.to_thread(self._clear)
+
+    async def dispose(self) -> None:
+        await asyncio.to_thread(self._close)
+
+
+class RedisLLMCache:
+    """Redis tier shared by every worker: ``GET`` / ``SET EX`` per request.
+
+    Args:
+        client: A ``redis.asyncio.Redis`` client created with
+            ``decode_responses=True``.
+        prefix: Key namespace.
+        ttl_seconds: Entry lifetime (0 = no expiry).
+    """
+
+    name = "redis"
+
+    def __init__(
+        self,
+        client: Any,
+        *,
+        prefix: str = "ailine:",
+        ttl_seconds: int = _DEFAULT_TTL_SECONDS,
+    ) -> None:
+        self._redis = client
+        self._prefix = prefix
+        self._ttl = ttl_seconds
+
+    @classmethod
+    def from_url(cls, url: str, **kwargs: Any) -> RedisLLMCache:
+        """Create a backend with its own connection pool for *url*."""
+        from redis.asyncio import Redis
+
+        return cls(Redis.from_url(url, decode_responses=True), **kwargs)
+
+    async def get(self, key: str) -> str | None:
+        value: str | None = await self._redis.get(self._prefix + key)
+        return value
+
+    async def set(self, key: str, value: str) -> None:
+        await self._redis.set(self._prefix + key, value, ex=self._ttl or None)
+
+    async def clear(self) -> None:
+        keys = [k async for k in self._redis.scan_iter(match=f"{self._prefix}llm:*")]
+        if keys:
+            await self._redis.delete(*keys)
+
+    async def dispose(self) -> None:
+        await self._redis.aclose()
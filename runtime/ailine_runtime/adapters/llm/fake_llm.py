@@ -47,6 +47,7 @@ class FakeChatLLM:
             "tool_use": False,
             "vision": False,
             "web_search": True,
+            "prompt_caching": False,
         }
 
     @staticmethod
@@ -2,30 +2,62 @@
 
 Implements the ChatLLM port using the google-genai SDK.
 Supports native web search via Google Search grounding tool.
+
+Prompt caching: system messages go to ``system_instruction``.  When the
+stable prefix (see ``domain.ports.llm.cache_breakpoint``; by default the
+system prompt) is large enough for explicit caching, it is uploaded once
+as a ``CachedContent`` resource (keyed by a digest of model + prefix,
+refreshed before its TTL runs out) and later calls only send the dynamic
+suffix with ``cached_content=<name>``.  Smaller prefixes still benefit
+from Gemini's implicit caching because they are sent first and verbatim.
 """
 
 from __future__ import annotations
 
+import asyncio
+import time
 from collections.abc import AsyncIterator
 from typing import Any
 
-from ...domain.ports.llm import WebSearchResult, WebSearchSource
+from ...domain.ports.llm import TokenUsage, WebSearchResult, WebSearchSource
 from ...shared.observability import get_logger
+from ._prompt_cache import as_int, prefix_digest, report_usage, stable_prefix_length, strip_cache_marks
 
 _log = get_logger("ailine.adapters.llm.gemini")
 
+_DEFAULT_CACHE_TTL_SECONDS = 3600
+# Explicit caching requires a minimum prompt size (1024-4096 tokens by model)
+_DEFAULT_CACHE_MIN_TOKENS = 4096
+# Recreate a cache this long before it expires rather than racing expiry
+_CACHE_REFRESH_MARGIN_S = 60.0
+
 
 class GeminiChatLLM:
     """ChatLLM implementation backed by Gemini via google-genai."""
 
     def __init__(
-        self, *, model: str = "gemini-3-flash-preview", api_key: str = ""
+        self,
+        *,
+        model: str = "gemini-3-flash-preview",
+        api_key: str = "",
+        prompt_caching: bool = True,
+        cache_ttl_seconds: int = _DEFAULT_CACHE_TTL_SECONDS,
+        cache_min_tokens: int = _DEFAULT_CACHE_MIN_TOKENS,
     ) -> None:
         from google import genai
 
         # Strip provider prefix if present (e.g. "google-gla:gemini-3-flash-preview" → "gemini-3-flash-preview")
         self._model = model.removeprefix("google-gla:").removeprefix("google-vertex:")
         self._client = genai.Client(api_key=api_key) if api_key else genai.Client()
+        self._prompt_caching = prompt_caching
+        self._cache_ttl_s = cache_ttl_seconds
+        self._cache_min_tokens = cache_min_tokens
+        # prefix digest -> (CachedContent name, monotonic expiry)
+        self._caches: dict[str, tuple[str, float]] = {}
+        # prefix digest -> monotonic time before which creation is not retried
+        self._cache_failures: dict[str, float] = {}
+        # prefix digest -> lock held while its cache is created (dropped after)
+        self._cache_locks: dict[str, asyncio.Lock] = {}
 
     @property
     def model_name(self) -> str:
@@ -40,6 +72,7 @@ class GeminiChatLLM:
             "vision": True,
             "thinking": True,
             "web_search": True,
+            "prompt_caching": self._prompt_caching,
         }
 
     async def generate(
@@ -50,17 +83,15 @@ class GeminiChatLLM:
         max_tokens: int = 4096,
         **kwargs: Any,
     ) -> str:
-        from google import genai
-
-        contents = _convert_messages(messages)
+        contents, config = await self._build_request(
+            messages, temperature=temperature, max_tokens=max_tokens
+        )
         response = await self._client.aio.models.generate_content(
             model=self._model,
             contents=contents,  # type: ignore[arg-type]  # google-genai accepts dict format
-            config=genai.types.GenerateContentConfig(
-                temperature=temperature,
-                max_output_tokens=max_tokens,
-            ),
+            config=config,
         )
+        self._report(getattr(response, "usage_metadata", None))
         return response.text or ""
 
     async def stream(
@@ -71,20 +102,129 @@ class GeminiChatLLM:
         max_tokens: int = 4096,
         **kwargs: Any,
     ) -> AsyncIterator[str]:
-        from google import genai
-
-        contents = _convert_messages(messages)
+        contents, config = await self._build_request(
+            messages, temperature=temperature, max_tokens=max_tokens
+        )
         response_stream = await self._client.aio.models.generate_content_stream(
             model=self._model,
             contents=contents,  # type: ignore[arg-type]  # google-genai accepts dict format
-            config=genai.types.GenerateContentConfig(
-                temperature=temperature,
-                max_output_tokens=max_tokens,
-            ),
+            config=config,
         )
+        usage: Any = None
         async for chunk in response_stream:
+            usage = getattr(chunk, "usage_metadata", None) or usage
             if chunk.text:
                 yield chunk.text
+        self._report(usage)
+
+    # -- Prompt caching -------------------------------------------------------
+
+    async def _build_request(
+        self,
+        messages: list[dict[str, Any]],
+        *,
+        temperature: float,
+        max_tokens: int,
+    ) -> tuple[list[dict[str, Any]], Any]:
+        """Contents and config, served from an explicit cache when possible."""
+        from google import genai
+
+        messages = list(messages)
+        if self._prompt_caching:
+            prefix = stable_prefix_length(messages)
+            suffix = messages[prefix:]
+            # Cached requests cannot also set system_instruction
+            if prefix and not any(m.get("role") == "system" for m in suffix):
+                name = await self._cached_content(messages[:prefix])
+                if name is not None:
+                    return _convert_messages(strip_cache_marks(suffix)), genai.types.GenerateContentConfig(
+                        temperature=temperature,
+                        max_output_tokens=max_tokens,
+                        cached_content=name,
+                    )
+
+        system, chat = _split_system(messages)
+        return _convert_messages(chat), genai.types.GenerateContentConfig(
+            temperature=temperature,
+            max_output_tokens=max_tokens,
+            system_instruction=system,
+        )
+
+    async def _cached_content(self, prefix: list[dict[str, Any]]) -> str | None:
+        """Name of a live CachedContent holding *prefix*, creating it if needed."""
+        digest = prefix_digest(self._model, prefix)
+        cached = self._live_cache(digest)
+        if cached is not None:
+            return cached
+        now = time.monotonic()
+        if self._cache_failures.get(digest, 0.0) > now:
+            return None
+        # Rough chars/4 estimate; explicit caches below the minimum are rejected
+        if sum(len(str(m.get("content", ""))) for m in prefix) // 4 < self._cache_min_tokens:
+            return None
+
+        lock = self._cache_locks.setdefault(digest, asyncio.Lock())
+        try:
+            async with lock:
+                cached = self._live_cache(digest)
+                if cached is not None:
+                    return cached
+                if self._cache_failures.get(digest, 0.0) > time.monotonic():
+                    return None
+                return await self._create_cache(digest, prefix)
+        finally:
+            # Waiters keep their reference; later callers find the entry instead.
+            if self._cache_locks.get(digest) is lock:
+                del self._cache_locks[digest]
+
+    async def _create_cache(self, digest: str, prefix: list[dict[str, Any]]) -> str | None:
+        """Create a CachedContent for *prefix*; None (uncached) on failure."""
+        from google import genai
+
+        system, chat = _split_system(prefix)
+        name: str | None = None
+        try:
+            cache = await self._client.aio.caches.create(
+                model=self._model,
+                config=genai.types.CreateCachedContentConfig(
+                    system_instruction=system,
+                    contents=_convert_messages(chat) or None,  # type: ignore[arg-type]
+                    ttl=f"{self._cache_ttl_s}s",
+                    display_name=f"ailine-{digest[:16]}",
+                ),
+            )
+            name = cache.name
+            if name is None:
+                _log.warning("gemini_cache_unnamed", model=self._model)
+        except Exception:
+            _log.warning("gemini_cache_create_failed", model=self._model, exc_info=True)
+        now = time.monotonic()
+        if name is None:
+            self._cache_failures = {k: t for k, t in self._cache_failures.items() if t > now}
+            self._cache_failures[digest] = now + self._cache_ttl_s
+            return None
+        self._caches = {k: v for k, v in self._caches.items() if v[1] > now}
+        self._caches[digest] = (name, now + self._cache_ttl_s)
+        _log.info("gemini_cache_created", model=self._model, cache=name)
+        return name
+
+    def _live_cache(self, digest: str) -> str | None:
+        entry = self._caches.get(digest)
+        if entry is None or entry[1] - _CACHE_REFRESH_MARGIN_S <= time.monotonic():
+            return None
+        return entry[0]
+
+    def _report(self, usage: Any) -> None:
+        if usage is None:
+            return
+        report_usage(
+            self._model,
+            TokenUsage(
+                input_tokens=as_int(getattr(usage, "prompt_token_count", 0)),
+                output_tokens=as_int(getattr(usage, "candidates_token_count", 0)),
+                cached_input_tokens=as_int(getattr(usage, "cached_content_token_count", 0)),
+            ),
+        )
 
     async def generate_with_search(
         self,
@@ -127,6 +267,13 @@ class GeminiChatLLM:
         return WebSearchResult(text=text, sources=sources)
 
 
+def _split_system(messages: list[dict[str, Any]]) -> tuple[str | None, list[dict[str, Any]]]:
+    """Joined system prompt (or None) and the remaining messages."""
+    system = [str(m.get("content", "")) for m in messages if m.get("role") == "system"]
+    chat = [m for m in messages if m.get("role") != "system"]
+    return ("\n\n".join(system) if system else None), chat
+
+
 def _convert_messages(messages: list[dict[str, Any]]) -> list[dict[str, Any]]:
     """Convert OpenAI-style messages to Gemini contents format."""
     contents: list[dict[str, Any]] = []
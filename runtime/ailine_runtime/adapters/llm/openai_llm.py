@@ -3,6 +3,14 @@
 Implements the ChatLLM port using the OpenAI Python SDK.
 - Regular generate/stream: Chat Completions API
 - Web search: Responses API (web_search_preview tool)
+
+Prompt caching is automatic on OpenAI for exact prompt prefixes of
+1024+ tokens.  The adapter keeps the prefix stable -- system messages are
+hoisted to the front in their original order -- and, on native OpenAI,
+sends a ``prompt_cache_key`` derived from the stable prefix (see
+``domain.ports.llm.cache_breakpoint``) so requests sharing it are routed
+to the same cache.  Cached-token counts come back in
+``usage.prompt_tokens_details.cached_tokens``.
 """
 
 from __future__ import annotations
@@ -10,8 +18,9 @@ from __future__ import annotations
 from collections.abc import AsyncIterator
 from typing import Any
 
-from ...domain.ports.llm import WebSearchResult, WebSearchSource
+from ...domain.ports.llm import TokenUsage, WebSearchResult, WebSearchSource
 from ...shared.observability import get_logger
+from ._prompt_cache import as_int, prefix_digest, report_usage, stable_prefix_length, strip_cache_marks
 
 _log = get_logger("ailine.adapters.llm.openai")
 
@@ -30,6 +39,7 @@ class OpenAIChatLLM:
         model: str = "gpt-4o",
         api_key: str = "",
         provider: str = "openai",
+        prompt_caching: bool = True,
     ) -> None:
         from openai import AsyncOpenAI
 
@@ -37,6 +47,7 @@ class OpenAIChatLLM:
         self._model = model.removeprefix("openai:").removeprefix("openrouter:")
         self._provider = provider
         self._api_key = api_key
+        self._prompt_caching = prompt_caching
 
         kwargs: dict = {}
         if api_key:
@@ -62,6 +73,7 @@ class OpenAIChatLLM:
             "tool_use": True,
             "vision": True,
             "web_search": self._provider == "openai",
+            "prompt_caching": self._prompt_caching,
         }
 
     async def generate(
@@ -74,11 +86,12 @@ class OpenAIChatLLM:
     ) -> str:
         response = await self._client.chat.completions.create(
             model=self._model,
-            messages=messages,  # type: ignore[arg-type]  # SDK accepts dict messages
+            messages=self._prepare(messages, kwargs),  # type: ignore[arg-type]  # SDK accepts dict messages
             temperature=temperature,
             max_tokens=max_tokens,
             **kwargs,
         )
+        self._report(getattr(response, "usage", None))
         return response.choices[0].message.content or ""
 
     async def stream(
@@ -89,18 +102,54 @@ class OpenAIChatLLM:
         max_tokens: int = 4096,
         **kwargs: Any,
     ) -> AsyncIterator[str]:
+        prepared = self._prepare(messages, kwargs)
+        if self._provider == "openai":
+            kwargs.setdefault("stream_options", {"include_usage": True})
         response_stream = await self._client.chat.completions.create(
             model=self._model,
-            messages=messages,  # type: ignore[arg-type]  # SDK accepts dict messages
+            messages=prepared,  # type: ignore[arg-type]  # SDK accepts dict messages
             temperature=temperature,
             max_tokens=max_tokens,
             stream=True,
             **kwargs,
         )
+        usage: Any = None
         async for chunk in response_stream:  # type: ignore[union-attr]
+            # With include_usage the final chunk carries usage and no choices
+            usage = getattr(chunk, "usage", None) or usage
+            if not chunk.choices:
+                continue
             delta = chunk.choices[0].delta
             if delta.content:
                 yield delta.content
+        self._report(usage)
+
+    # -- Prompt caching -------------------------------------------------------
+
+    def _prepare(self, messages: list[dict[str, Any]], kwargs: dict[str, Any]) -> list[dict[str, Any]]:
+        """Order *messages* for prefix caching; set ``prompt_cache_key`` in *kwargs*."""
+        if not self._prompt_caching:
+            return strip_cache_marks(messages)
+        # Stable order: system messages first, then the conversation
+        ordered = [m for m in messages if m.get("role") == "system"]
+        ordered += [m for m in messages if m.get("role") != "system"]
+        prefix = stable_prefix_length(ordered)
+        if prefix and self._provider == "openai":
+            kwargs.setdefault("prompt_cache_key", prefix_digest(self._model, ordered[:prefix])[:32])
+        return strip_cache_marks(ordered)
+
+    def _report(self, usage: Any) -> None:
+        if usage is None:
+            return
+        details = getattr(usage, "prompt_tokens_details", None)
+        report_usage(
+            self._model,
+            TokenUsage(
+                input_tokens=as_int(getattr(usage, "prompt_tokens", 0)),
+                output_tokens=as_int(getattr(usage, "completion_tokens", 0)),
+                cached_input_tokens=as_int(getattr(details, "cached_tokens", 0)),
+            ),
+        )
 
     async def generate_with_search(
         self,
@@ -4,13 +4,23 @@ Data types (RouteFeatures, ScoreBreakdown, RouteDecision, RouteMetrics,
 RoutingRule, SmartRouterConfig) and the stateless compute_route() function
 live here to keep smart_router.py focused on orchestration and telemetry.
 
+Scoring runs on every LLM call, so it is kept cheap: the features are
+extracted in one pass (extract_route_features) with a single combined
+signal regex, and token estimates are cached per message content digest
+with large uncached encodes moved off the event loop
+(estimate_tokens_async).
+
 Implements ADR-049: Weighted complexity scoring with rebalanced weights
 (0.25/0.25/0.25/0.15/0.10).
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import math
 import re
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import TYPE_CHECKING, Any
 
@@ -31,6 +41,15 @@ TIER_MIDDLE_MAX = 0.70
 # Default ring buffer capacity for metrics history
 DEFAULT_METRICS_CAPACITY = 100
 
+# Hedging / latency-aware failover defaults
+DEFAULT_HEDGE_PERCENTILE = 0.95
+DEFAULT_HEDGE_MIN_SAMPLES = 20
+DEFAULT_LATENCY_EWMA_ALPHA = 0.3
+DEFAULT_DEGRADED_PROBE_INTERVAL_S = 30.0
+
+# Tier escalation order (cheapest first)
+TIER_ORDER = ("cheap", "middle", "primary")
+
 
 @dataclass(frozen=True)
 class RouteFeatures:
@@ -83,6 +102,7 @@ class RouteMetrics:
     score_breakdown: ScoreBreakdown | None = None
     is_fallback: bool = False  # True if a non-preferred provider was used
     wall_time_iso: str = ""  # ISO 8601 wall-clock time for display/audit
+    hedged: bool = False  # True if a second tier was raced against the first
 
 
 @dataclass(frozen=True)
@@ -104,6 +124,15 @@ class SmartRouterConfig:
     mode: str = "weighted"  # "weighted" or "rules"
     rules: list[RoutingRule] = field(default_factory=list)
     metrics_capacity: int = DEFAULT_METRICS_CAPACITY
+    # Hedged requests: if the routed provider has not answered by its
+    # observed latency percentile, race the next tier (generate only).
+    hedge: bool = False
+    hedge_percentile: float = DEFAULT_HEDGE_PERCENTILE
+    hedge_min_samples: int = DEFAULT_HEDGE_MIN_SAMPLES  # per provider, before hedging by latency
+    # Per-provider latency EWMA; providers above the threshold are skipped
+    latency_ewma_alpha: float = DEFAULT_LATENCY_EWMA_ALPHA
+    degraded_latency_ms: float | None = None  # None disables degraded-provider skipping
+    degraded_probe_interval_s: float = DEFAULT_DEGRADED_PROBE_INTERVAL_S
 
 
 def compute_route(features: RouteFeatures) -> RouteDecision:
@@ -151,41 +180,128 @@ def compute_route(features: RouteFeatures) -> RouteDecision:
     return RouteDecision(tier=tier, score=score, score_breakdown=breakdown)
 
 
+def latency_percentile(latencies_ms: list[float], q: float) -> float:
+    """Nearest-rank percentile *q* (0-1] of a non-empty latency sample."""
+    ordered = sorted(latencies_ms)
+    rank = max(1, math.ceil(q * len(ordered)))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
 # --- Scoring functions (stateless, used by SmartRouterAdapter) ---
 
-# Complexity signal patterns for intent scoring
-_COMPLEXITY_SIGNALS = [
+# Complexity signal categories for intent scoring.  All their keywords
+# are compiled into one alternation (factored by common prefix, so each
+# position of the prompt is tested against one branch per first letter
+# rather than every keyword), and a single scan of the prompt finds every
+# category instead of one regex pass per category.  The alternation sits
+# in a lookahead so matches never consume text: a keyword overlapping
+# another ("evaluaTEAcher") is still seen, exactly as with separate
+# per-category searches.  The prompt is lower-cased once and matched
+# case-sensitively, which is much faster in ``re`` than IGNORECASE.
+_COMPLEXITY_CATEGORIES = (
     # Cognitive verbs (PT + EN)
-    re.compile(r"(?:analis|compar|avali|sintetiz|critic|analyze|compare|evaluate|synthesize|critique)", re.IGNORECASE),
+    ("cognitive", r"analis|compar|avali|sintetiz|critic|analyze|compare|evaluate|synthesize|critique"),
     # Depth signals (PT + EN)
-    re.compile(r"(?:multi|complex|detalhad|aprofundad|detailed|in-depth)", re.IGNORECASE),
+    ("depth", r"multi|complex|detalhad|aprofundad|detailed|in-depth"),
     # Curriculum alignment (PT + EN)
-    re.compile(
-        r"(?:curricul|BNCC|standard|alignment|assessment|rubric"
-        r"|formative|summative|scaffold|UDL|IEP|curriculum|standards)",
-        re.IGNORECASE,
+    (
+        "curriculum",
+        r"curricul|BNCC|standard|alignment|assessment|rubric"
+        r"|formative|summative|scaffold|UDL|IEP|curriculum|standards",
     ),
     # Accessibility / inclusion (PT + EN)
-    re.compile(
-        r"(?:acessibilid|inclusiv|adapt|TEA|TDAH|accessibility|inclusive"
-        r"|autism|ADHD|dyslexia|hearing|impairment|differentiated|accommodation)",
-        re.IGNORECASE,
+    (
+        "accessibility",
+        r"acessibilid|inclusiv|adapt|TEA|TDAH|accessibility|inclusive"
+        r"|autism|ADHD|dyslexia|hearing|impairment|differentiated|accommodation",
     ),
-]
+)
+_SIGNAL_CATEGORY = {
+    keyword.lower(): category
+    for category, keywords in _COMPLEXITY_CATEGORIES
+    for keyword in keywords.split("|")
+}
+
+
+def _prefix_alternation(words: list[str]) -> str:
+    """Regex matching any of *words*, factored into a prefix trie."""
+    trie: dict[str, Any] = {}
+    for word in words:
+        node = trie
+        for ch in word:
+            node = node.setdefault(ch, {})
+        node[""] = {}
+
+    def render(node: dict[str, Any]) -> str:
+        branches = [re.escape(ch) + render(child) for ch, child in sorted(node.items()) if ch]
+        if not branches:
+            return ""
+        alternation = branches[0] if len(branches) == 1 else "(?:" + "|".join(branches) + ")"
+        return f"(?:{alternation})?" if "" in node else alternation
+
+    return render(trie)
+
+
+_COMPLEXITY_PATTERN = re.compile(f"(?=({_prefix_alternation(sorted(_SIGNAL_CATEGORY))}))")
+
+# Character thresholds for the token dimension (highest first)
+_CHAR_THRESHOLDS = ((8000, 1.0), (4000, 0.7), (2000, 0.4))
+
+# Per-message token counts, keyed by a digest of the message content
+_TOKEN_CACHE_SIZE = 4096
+_token_cache: OrderedDict[bytes, int] = OrderedDict()
+# Uncached text above this many characters is tokenized in a worker thread
+_OFFLOAD_MIN_CHARS = 2000
+
+
+def _content_text(message: dict[str, Any]) -> str:
+    """Message content as text (stringified only when not already a str)."""
+    content = message.get("content", "")
+    return content if isinstance(content, str) else str(content)
+
+
+def _count_chars(messages: list[dict[str, Any]], *, limit: int | None = None) -> int:
+    """Total content length, stopping early once it exceeds *limit*."""
+    total = 0
+    for message in messages:
+        total += len(_content_text(message))
+        if limit is not None and total > limit:
+            break
+    return total
+
+
+def _score_chars(total_chars: int) -> float:
+    for threshold, score in _CHAR_THRESHOLDS:
+        if total_chars > threshold:
+            return score
+    return 0.1
+
+
+def _intent_matches(text: str) -> int:
+    """Number of distinct signal categories found in one pass over *text*."""
+    found: set[str] = set()
+    for match in _COMPLEXITY_PATTERN.finditer(text.lower()):
+        found.add(_SIGNAL_CATEGORY[match.group(1)])
+        if len(found) == len(_COMPLEXITY_CATEGORIES):
+            break
+    return len(found)
+
+
+def _score_intent_matches(matches: int) -> float:
+    if matches >= 3:
+        return 1.0
+    if matches >= 2:
+        return 0.6
+    if matches >= 1:
+        return 0.3
+    return 0.0
 
 
 def score_tokens(messages: list[dict[str, Any]]) -> float:
     """Estimate token complexity from total character length."""
     if not messages:
         return 0.0
-    total_chars = sum(len(str(m.get("content", ""))) for m in messages)
-    if total_chars > 8000:
-        return 1.0
-    if total_chars > 4000:
-        return 0.7
-    if total_chars > 2000:
-        return 0.4
-    return 0.1
+    return _score_chars(_count_chars(messages, limit=_CHAR_THRESHOLDS[0][0]))
 
 
 def score_structured(kwargs: dict[str, Any]) -> float:
@@ -223,23 +339,115 @@ def score_intent(messages: list[dict[str, Any]]) -> float:
     """Score based on detected complexity signals in the prompt."""
     if not messages:
         return 0.0
-    last_content = str(messages[-1].get("content", ""))
-    matches = sum(1 for pat in _COMPLEXITY_SIGNALS if pat.search(last_content))
-    if matches >= 3:
-        return 1.0
-    if matches >= 2:
-        return 0.6
-    if matches >= 1:
-        return 0.3
-    return 0.0
+    return _score_intent_matches(_intent_matches(_content_text(messages[-1])))
+
+
+def extract_route_features(
+    messages: list[dict[str, Any]],
+    kwargs: dict[str, Any],
+    *,
+    rule_tier: str | None = None,
+) -> RouteFeatures:
+    """Compute every scoring dimension in a single pass over *messages*.
+
+    Equivalent to calling the individual ``score_*`` functions, but each
+    message's content is read once and the last message is scanned once
+    by the combined signal regex.
+    """
+    if not messages:
+        return RouteFeatures(
+            token_score=0.0,
+            structured_score=score_structured(kwargs),
+            tool_score=score_tools(kwargs),
+            history_score=score_history(messages),
+            intent_score=0.0,
+            rule_tier=rule_tier,
+        )
+    last_text = _content_text(messages[-1])
+    total_chars = _count_chars(messages[:-1], limit=_CHAR_THRESHOLDS[0][0]) + len(last_text)
+    return RouteFeatures(
+        token_score=_score_chars(total_chars),
+        structured_score=score_structured(kwargs),
+        tool_score=score_tools(kwargs),
+        history_score=score_history(messages),
+        intent_score=_score_intent_matches(_intent_matches(last_text)),
+        rule_tier=rule_tier,
+    )
+
+
+# --- Token estimation ---
+
+
+def _content_key(text: str) -> bytes:
+    return hashlib.blake2b(text.encode("utf-8", "surrogatepass"), digest_size=16).digest()
+
+
+def _cached_tokens(key: bytes) -> int | None:
+    count = _token_cache.get(key)
+    if count is not None:
+        _token_cache.move_to_end(key)
+    return count
+
+
+def _store_tokens(key: bytes, count: int) -> None:
+    _token_cache[key] = count
+    _token_cache.move_to_end(key)
+    while len(_token_cache) > _TOKEN_CACHE_SIZE:
+        _token_cache.popitem(last=False)
+
+
+def _count_uncached(texts: list[str]) -> list[int]:
+    from ...app.token_counter import count_tokens
+
+    return [count_tokens(text) for text in texts]
+
+
+def _split_cached(messages: list[dict[str, Any]]) -> tuple[int, list[bytes], list[str]]:
+    """Sum cached per-message counts; return the keys/texts still to count."""
+    cached_total = 0
+    keys: list[bytes] = []
+    texts: list[str] = []
+    for message in messages:
+        text = _content_text(message)
+        if not text:
+            continue
+        key = _content_key(text)
+        count = _cached_tokens(key)
+        if count is None:
+            keys.append(key)
+            texts.append(text)
+        else:
+            cached_total += count
+    return cached_total, keys, texts
+
+
+def _finish_count(cached_total: int, keys: list[bytes], counts: list[int]) -> int:
+    for key, count in zip(keys, counts, strict=True):
+        _store_tokens(key, count)
+    return max(1, cached_total + sum(counts))
 
 
 def estimate_tokens(messages: list[dict[str, Any]]) -> int:
     """Estimate token count using tiktoken BPE tokenization.
 
     Uses cl100k_base encoding (GPT-4/Claude family) for accurate counts.
+    Counts are computed per message and cached by a digest of the
+    content, so the shared prefix of a growing conversation (system
+    prompt, earlier turns) is only encoded once.
     """
-    from ...app.token_counter import count_tokens
+    cached_total, keys, texts = _split_cached(messages)
+    return _finish_count(cached_total, keys, _count_uncached(texts))
 
-    total_text = " ".join(str(m.get("content", "")) for m in messages)
-    return max(1, count_tokens(total_text))
+
+async def estimate_tokens_async(messages: list[dict[str, Any]]) -> int:
+    """Like :func:`estimate_tokens`, but never BPE-encodes large text on the loop.
+
+    Cache hits are resolved inline; when the uncached text exceeds
+    ``_OFFLOAD_MIN_CHARS`` characters the encode runs in a worker thread.
+    """
+    cached_total, keys, texts = _split_cached(messages)
+    if sum(len(text) for text in texts) > _OFFLOAD_MIN_CHARS:
+        counts = await asyncio.to_thread(_count_uncached, texts)
+    else:
+        counts = _count_uncached(texts)
+    return _finish_count(cached_total, keys, counts)
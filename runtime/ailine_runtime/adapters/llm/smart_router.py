@@ -17,12 +17,22 @@ Observability:
   - In-memory ring buffer (default 100) for recent metrics retrieval
   - Structured logging of routing decisions, latency, and fallback attempts
 
+Latency-aware failover (opt-in via SmartRouterConfig):
+  - Per-provider latency EWMA; when it exceeds ``degraded_latency_ms`` the
+    provider is skipped in favour of the next healthy tier (one probe
+    request is let through every ``degraded_probe_interval_s``)
+  - ``hedge=True``: if the routed provider has not answered ``generate``
+    by its observed p95 (from the RouteMetrics buffer), the same request
+    is raced on the next tier's provider; the first success wins and the
+    loser is cancelled.  A failed provider triggers the race immediately.
+
 Types and pure scoring functions live in routing_types.py. This module
 re-exports them for backward compatibility.
 """
 
 from __future__ import annotations
 
+import asyncio
 import re
 import time
 from collections import deque
@@ -32,6 +42,7 @@ from datetime import UTC, datetime
 from typing import Any
 
 from ...domain.ports.llm import ChatLLM, WebSearchResult
+from ...shared.metrics import llm_hedged_requests_total
 from ...shared.observability import get_logger
 from ...shared.tracing import trace_llm_call
 
@@ -40,6 +51,7 @@ from .routing_types import (
     DEFAULT_METRICS_CAPACITY,
     TIER_CHEAP_MAX,
     TIER_MIDDLE_MAX,
+    TIER_ORDER,
     W_HISTORY,
     W_INTENT,
     W_STRUCTURED,
@@ -53,6 +65,9 @@ from .routing_types import (
     SmartRouterConfig,
     compute_route,
     estimate_tokens,
+    estimate_tokens_async,
+    extract_route_features,
+    latency_percentile,
     score_history,
     score_intent,
     score_structured,
@@ -94,7 +109,14 @@ class SmartRouterAdapter:
         At least one provider must be present at construction time. If a
         call to a provider raises an exception, the caller receives the
         error directly (no automatic retry across tiers) -- retries are
-        handled upstream by the LangGraph ``RetryPolicy``.
+        handled upstream by the LangGraph ``RetryPolicy``.  The exception
+        is hedging mode (``config.hedge``), where ``generate`` races the
+        next tier when the routed provider is slow or fails.
+
+    Tier escalation:
+        The "next tier" of a provider is the next more capable tier with a
+        distinct provider (cheap -> middle -> primary); from the top tier
+        the router steps down instead.
     """
 
     def __init__(self, config: SmartRouterConfig) -> None:
@@ -110,6 +132,11 @@ class SmartRouterAdapter:
         self._metrics: deque[RouteMetrics] = deque(
             maxlen=config.metrics_capacity,
         )
+        self._rules = [
+            (re.compile(rule.pattern, re.IGNORECASE), rule) for rule in config.rules
+        ]
+        # provider model_name -> (latency EWMA in ms, monotonic time of last sample)
+        self._latency_ewma: dict[str, tuple[float, float]] = {}
 
     @property
     def model_name(self) -> str:
@@ -117,10 +144,10 @@ class SmartRouterAdapter:
 
     @property
     def capabilities(self) -> dict[str, Any]:
-        has_search = any(
-            getattr(p, "capabilities", {}).get("web_search", False)
-            for p in [self._cheap, self._middle, self._primary]
-            if p is not None
+        providers = [p for p in (self._cheap, self._middle, self._primary) if p is not None]
+        has_search = any(getattr(p, "capabilities", {}).get("web_search", False) for p in providers)
+        has_caching = any(
+            getattr(p, "capabilities", {}).get("prompt_caching", False) for p in providers
         )
         return {
             "provider": "smart-router",
@@ -128,6 +155,7 @@ class SmartRouterAdapter:
             "tool_use": True,
             "vision": False,
             "web_search": has_search,
+            "prompt_caching": has_caching,
             "routing_mode": self._config.mode,
         }
 
@@ -143,14 +171,7 @@ class SmartRouterAdapter:
         if self._config.mode == "rules" or self._config.rules:
             rule_tier = self._check_rules(messages)
 
-        return RouteFeatures(
-            token_score=score_tokens(messages),
-            structured_score=score_structured(kwargs),
-            tool_score=score_tools(kwargs),
-            history_score=score_history(messages),
-            intent_score=score_intent(messages),
-            rule_tier=rule_tier,
-        )
+        return extract_route_features(messages, kwargs, rule_tier=rule_tier)
 
     def _route_and_resolve(
         self,
@@ -178,6 +199,17 @@ class SmartRouterAdapter:
         provider: ChatLLM = (
             tier_provider if tier_provider is not None else self._fallback
         )
+        if self._is_degraded(provider):
+            healthy = self._next_provider(tier, exclude=provider)
+            if healthy is not None:
+                _log.warning(
+                    "smart_router.degraded_skip",
+                    requested_tier=tier,
+                    degraded_provider=provider.model_name,
+                    latency_ewma_ms=round(self._latency_ewma[provider.model_name][0], 2),
+                    provider=healthy.model_name,
+                )
+                provider, is_fallback = healthy, True
         return decision, features, provider, is_fallback
 
     def score_complexity(self, messages: list[dict[str, Any]], **kwargs: Any) -> float:
@@ -213,6 +245,60 @@ class SmartRouterAdapter:
         provider = self._get_tier_provider(tier)
         return provider if provider is not None else self._fallback
 
+    def _next_provider(self, tier: str, *, exclude: ChatLLM) -> ChatLLM | None:
+        """First healthy provider after *tier*, other than *exclude*.
+
+        Tries the more capable tiers in ascending order, then the less
+        capable ones in descending order.
+        """
+        idx = TIER_ORDER.index(tier) if tier in TIER_ORDER else len(TIER_ORDER) - 1
+        order = [*TIER_ORDER[idx + 1 :], *reversed(TIER_ORDER[:idx])]
+        for candidate_tier in order:
+            candidate = self._get_tier_provider(candidate_tier)
+            if candidate is not None and candidate is not exclude and not self._is_degraded(candidate):
+                return candidate
+        return None
+
+    # --- Provider latency tracking ---
+
+    def _observe_latency(self, provider_name: str, latency_ms: float) -> None:
+        """Fold a latency sample into the provider's EWMA."""
+        previous = self._latency_ewma.get(provider_name)
+        alpha = self._config.latency_ewma_alpha
+        ewma = latency_ms if previous is None else alpha * latency_ms + (1 - alpha) * previous[0]
+        self._latency_ewma[provider_name] = (ewma, time.monotonic())
+
+    def _is_degraded(self, provider: ChatLLM) -> bool:
+        """True if the provider's latency EWMA is above the threshold.
+
+        A degraded provider that has not been sampled for
+        ``degraded_probe_interval_s`` is let through once so it can
+        recover.
+        """
+        threshold = self._config.degraded_latency_ms
+        entry = self._latency_ewma.get(provider.model_name)
+        if threshold is None or entry is None:
+            return False
+        ewma, sampled_at = entry
+        if ewma <= threshold:
+            return False
+        return time.monotonic() - sampled_at < self._config.degraded_probe_interval_s
+
+    def get_provider_latency(self) -> dict[str, float]:
+        """Current latency EWMA (ms) per provider model name."""
+        return {name: ewma for name, (ewma, _) in self._latency_ewma.items()}
+
+    def _hedge_delay_ms(self, provider_name: str) -> float | None:
+        """Observed latency percentile of a provider, from the metrics buffer.
+
+        None until the buffer holds ``hedge_min_samples`` calls answered
+        by that provider.
+        """
+        samples = [m.latency_ms for m in self._metrics if m.provider_name == provider_name]
+        if not samples or len(samples) < self._config.hedge_min_samples:
+            return None
+        return latency_percentile(samples, self._config.hedge_percentile)
+
     # --- Telemetry ---
 
     def _record_metrics(
@@ -224,6 +310,7 @@ class SmartRouterAdapter:
         token_estimate: int,
         *,
         is_fallback: bool = False,
+        hedged: bool = False,
     ) -> RouteMetrics:
         """Create and store a RouteMetrics entry."""
         metrics = RouteMetrics(
@@ -237,6 +324,7 @@ class SmartRouterAdapter:
             score_breakdown=decision.score_breakdown,
             is_fallback=is_fallback,
             wall_time_iso=datetime.now(UTC).isoformat(),
+            hedged=hedged,
         )
         self._metrics.append(metrics)
         return metrics
@@ -310,21 +398,34 @@ class SmartRouterAdapter:
             provider_name,
             is_fallback=is_fallback,
         )
-        token_est = estimate_tokens(messages)
+        token_est = await estimate_tokens_async(messages)
 
+        hedged = False
         with trace_llm_call(
             provider=provider_name,
             model=provider_name,
             tier=decision.tier,
         ) as span_data:
-            t0 = time.monotonic()
-            result = await provider.generate(
-                messages,
-                temperature=temperature,
-                max_tokens=max_tokens,
-                **kwargs,
-            )
-            latency_ms = (time.monotonic() - t0) * 1000
+            if self._config.hedge:
+                result, winner, latency_ms, hedged = await self._generate_hedged(
+                    decision.tier,
+                    provider,
+                    messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs,
+                )
+                if winner is not provider:
+                    provider_name, is_fallback = winner.model_name, True
+                span_data["hedged"] = hedged
+            else:
+                result, latency_ms = await self._timed_generate(
+                    provider,
+                    messages,
+                    temperature=temperature,
+                    max_tokens=max_tokens,
+                    **kwargs,
+                )
             span_data["latency_ms"] = latency_ms
             span_data["tokens_in"] = token_est
 
@@ -336,9 +437,99 @@ class SmartRouterAdapter:
             latency_ms,
             token_est,
             is_fallback=is_fallback,
+            hedged=hedged,
         )
         return result
 
+    async def _timed_generate(
+        self,
+        provider: ChatLLM,
+        messages: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> tuple[str, float]:
+        """Call ``provider.generate``; return the text and latency in ms."""
+        t0 = time.monotonic()
+        result = await provider.generate(messages, **kwargs)
+        latency_ms = (time.monotonic() - t0) * 1000
+        self._observe_latency(provider.model_name, latency_ms)
+        return result, latency_ms
+
+    async def _generate_hedged(
+        self,
+        tier: str,
+        provider: ChatLLM,
+        messages: list[dict[str, Any]],
+        **kwargs: Any,
+    ) -> tuple[str, ChatLLM, float, bool]:
+        """Race *provider* against the next tier once it is slow or fails.
+
+        The hedge fires when *provider* has not answered within its
+        observed p95 latency, or as soon as it raises.  The first
+        successful answer wins and the other call is cancelled (its
+        elapsed time still counts towards the provider's EWMA, so a
+        provider that keeps losing is eventually marked degraded).
+
+        Returns:
+            (text, winning provider, winner latency in ms, hedge fired).
+        """
+        backup = self._next_provider(tier, exclude=provider)
+        if backup is None:
+            result, latency_ms = await self._timed_generate(provider, messages, **kwargs)
+            return result, provider, latency_ms, False
+
+        delay_ms = self._hedge_delay_ms(provider.model_name)
+        first = asyncio.ensure_future(self._timed_generate(provider, messages, **kwargs))
+        calls: dict[asyncio.Future[tuple[str, float]], tuple[ChatLLM, float]] = {
+            first: (provider, time.monotonic()),
+        }
+        pending: set[asyncio.Future[tuple[str, float]]] = {first}
+        trigger: str | None = None
+        error: BaseException | None = None
+        try:
+            while pending:
+                timeout = delay_ms / 1000 if trigger is None and delay_ms is not None else None
+                done, pending = await asyncio.wait(
+                    pending, timeout=timeout, return_when=asyncio.FIRST_COMPLETED
+                )
+                for call in sorted(done, key=lambda c: calls[c][1]):
+                    exc = call.exception()
+                    if exc is None:
+                        result, latency_ms = call.result()
+                        winner = calls[call][0]
+                        if trigger is not None:
+                            llm_hedged_requests_total.inc(
+                                trigger=trigger,
+                                winner="primary" if winner is provider else "hedge",
+                            )
+                        return result, winner, latency_ms, trigger is not None
+                    _log.warning(
+                        "smart_router.provider_failed",
+                        provider=calls[call][0].model_name,
+                        error=str(exc),
+                    )
+                    error = error or exc
+                if trigger is None:
+                    trigger = "error" if done else "latency"
+                    _log.info(
+                        "smart_router.hedge",
+                        trigger=trigger,
+                        provider=provider.model_name,
+                        hedge_provider=backup.model_name,
+                        delay_ms=round(delay_ms, 2) if delay_ms is not None else None,
+                    )
+                    hedge = asyncio.ensure_future(self._timed_generate(backup, messages, **kwargs))
+                    calls[hedge] = (backup, time.monotonic())
+                    pending.add(hedge)
+            llm_hedged_requests_total.inc(trigger=trigger or "error", winner="none")
+            assert error is not None
+            raise error
+        finally:
+            for call, (loser, started) in calls.items():
+                if not call.done():
+                    call.cancel()
+                    self._observe_latency(loser.model_name, (time.monotonic() - started) * 1000)
+                    _log.info("smart_router.hedge_cancelled", provider=loser.model_name)
+
     async def stream(
         self,
         messages: list[dict[str, Any]],
@@ -358,7 +549,7 @@ class SmartRouterAdapter:
             provider_name,
             is_fallback=is_fallback,
         )
-        token_est = estimate_tokens(messages)
+        token_est = await estimate_tokens_async(messages)
 
         # Note: trace_llm_call is a sync context manager so we cannot wrap
         # it around an async generator that yields across iterations.
@@ -438,8 +629,8 @@ class SmartRouterAdapter:
         if not messages:
             return None
         last_content = str(messages[-1].get("content", ""))
-        for rule in self._config.rules:
-            if re.search(rule.pattern, last_content, re.IGNORECASE):
+        for pattern, rule in self._rules:
+            if pattern.search(last_content):
                 _log.info(
                     "smart_router.rule_match",
                     pattern=rule.pattern,
@@ -5,14 +5,20 @@ REST API using the ``eleven_v3`` model.
 
 Requires: ``httpx>=0.28`` (already a core dependency).
 
+Requests go through the container's shared ``HttpClientPool`` so every
+segment of an audio-script export reuses a warm keep-alive connection
+instead of paying a new TCP + TLS handshake.
+
 Satisfies the ``TTS`` protocol from ``domain.ports.media``.
 """
 
 from __future__ import annotations
 
+import httpx
 import structlog
 
 from ...domain.ports.media import VoiceInfo
+from ...shared.http_client import HttpClientPool
 
 logger = structlog.get_logger(__name__)
 
@@ -40,6 +46,11 @@ class ElevenLabsTTS:
         ElevenLabs model.  ``eleven_v3`` is the latest multilingual model.
     timeout:
         HTTP request timeout in seconds.
+    http:
+        Shared HTTP client pool.  When omitted the adapter creates a
+        private pool on first use (closed by :meth:`aclose`).
+    base_url:
+        API base URL (override for stub servers in tests/benchmarks).
     """
 
     def __init__(
@@ -49,11 +60,37 @@ class ElevenLabsTTS:
         voice_id: str = "21m00Tcm4TlvDq8ikWAM",
         model_id: str = "eleven_v3",
         timeout: float = 30.0,
+        http: HttpClientPool | None = None,
+        base_url: str = _ELEVENLABS_API_BASE,
     ) -> None:
         self._api_key = api_key
         self._voice_id = voice_id
         self._model_id = model_id
         self._timeout = timeout
+        self._http = http
+        self._owns_http = False
+        self._base_url = base_url.rstrip("/")
+
+    @property
+    def voice_id(self) -> str:
+        return self._voice_id
+
+    @property
+    def model_id(self) -> str:
+        return self._model_id
+
+    def _client(self) -> httpx.AsyncClient:
+        if self._http is None:
+            self._http = HttpClientPool(timeout=self._timeout)
+            self._owns_http = True
+        return self._http.client
+
+    async def aclose(self) -> None:
+        """Close the private pool (a shared pool is owned by the Container)."""
+        if self._owns_http and self._http is not None:
+            await self._http.dispose()
+            self._http = None
+            self._owns_http = False
 
     def _headers(self) -> dict[str, str]:
         return {
@@ -73,33 +110,30 @@ class ElevenLabsTTS:
         httpx.HTTPStatusError
             On non-2xx responses from the API.
         """
-        import httpx
-
-        url = f"{_ELEVENLABS_API_BASE}/text-to-speech/{self._voice_id}"
+        url = f"{self._base_url}/text-to-speech/{self._voice_id}"
         payload = {
             "text": text,
             "model_id": self._model_id,
             "voice_settings": _DEFAULT_VOICE_SETTINGS,
         }
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            logger.debug(
-                "elevenlabs_tts.synthesize",
-                voice_id=self._voice_id,
-                model_id=self._model_id,
-                text_length=len(text),
-                locale=locale,
-            )
-            response = await client.post(
-                url, headers=self._headers(), json=payload
-            )
-            response.raise_for_status()
-            logger.debug(
-                "elevenlabs_tts.synthesize_ok",
-                status=response.status_code,
-                content_length=len(response.content),
-            )
-            return response.content
+        logger.debug(
+            "elevenlabs_tts.synthesize",
+            voice_id=self._voice_id,
+            model_id=self._model_id,
+            text_length=len(text),
+            locale=locale,
+        )
+        response = await self._client().post(
+            url, headers=self._headers(), json=payload, timeout=self._timeout
+        )
+        response.raise_for_status()
+        logger.debug(
+            "elevenlabs_tts.synthesize_ok",
+            status=response.status_code,
+            content_length=len(response.content),
+        )
+        return response.content
 
     async def list_voices(
         self, *, language: str | None = None
@@ -109,17 +143,15 @@ class ElevenLabsTTS:
         When *language* is provided, filters to voices whose labels
         contain a matching language tag (case-insensitive substring).
         """
-        import httpx
+        url = f"{self._base_url}/voices"
 
-        url = f"{_ELEVENLABS_API_BASE}/voices"
-
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            logger.debug("elevenlabs_tts.list_voices", language=language)
-            response = await client.get(
-                url,
-                headers={"xi-api-key": self._api_key},
-            )
-            response.raise_for_status()
+        logger.debug("elevenlabs_tts.list_voices", language=language)
+        response = await self._client().get(
+            url,
+            headers={"xi-api-key": self._api_key},
+            timeout=self._timeout,
+        )
+        response.raise_for_status()
 
         data = response.json()
         voices_raw = data.get("voices", [])
@@ -163,19 +195,17 @@ class ElevenLabsTTS:
 
         Returns None if the voice is not found (404).
         """
-        import httpx
-
-        url = f"{_ELEVENLABS_API_BASE}/voices/{voice_id}"
+        url = f"{self._base_url}/voices/{voice_id}"
 
-        async with httpx.AsyncClient(timeout=self._timeout) as client:
-            logger.debug("elevenlabs_tts.get_voice", voice_id=voice_id)
-            response = await client.get(
-                url,
-                headers={"xi-api-key": self._api_key},
-            )
-            if response.status_code == 404:
-                return None
-            response.raise_for_status()
+        logger.debug("elevenlabs_tts.get_voice", voice_id=voice_id)
+        response = await self._client().get(
+            url,
+            headers={"xi-api-key": self._api_key},
+            timeout=self._timeout,
+        )
+        if response.status_code == 404:
+            return None
+        response.raise_for_status()
 
         v = response.json()
         labels = v.get("labels", {}) or {}
@@ -6,11 +6,19 @@ Used when no API keys are configured or in CI environments (ADR-051).
 
 from __future__ import annotations
 
+import re
+from collections.abc import AsyncIterator
+
+from ...domain.ports.media import TranscriptSegment
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+")
+
 
 class FakeSTT:
     """STT implementation that returns canned transcriptions for testing.
 
-    Satisfies the ``STT`` protocol from ``domain.ports.media``.
+    Satisfies the ``STT`` and ``StreamingSTT`` protocols from
+    ``domain.ports.media``.
     """
 
     def __init__(self, *, responses: list[str] | None = None) -> None:
@@ -29,3 +37,14 @@ class FakeSTT:
             text = f"[Transcricao simulada: {len(audio_bytes)} bytes de audio em {language}]"
         self._call_count += 1
         return text
+
+    async def transcribe_stream(
+        self, audio_bytes: bytes, *, language: str = "pt"
+    ) -> AsyncIterator[TranscriptSegment]:
+        """Yield the deterministic transcription one sentence per segment.
+
+        Segments are given synthetic one-second timings.
+        """
+        text = await self.transcribe(audio_bytes, language=language)
+        for i, sentence in enumerate(s for s in _SENTENCE_END.split(text) if s):
+            yield TranscriptSegment(start=float(i), end=float(i + 1), text=sentence)
@@ -5,6 +5,14 @@ image-based OCR.  Both are lazy-imported so the module can be
 loaded even when the underlying libraries are not installed
 (ADR-041).
 
+With ``workers > 0`` extraction is page-parallel on a process pool:
+the PDF is cut into page ranges of ``page_range_size`` pages, each range
+is extracted in a worker process, and only pages without a text layer
+are OCR'd (from the images embedded in the page, which is what a scanned
+page is).  At most ``workers + 1`` ranges are in flight, so memory is
+bounded by the range size rather than the document size, and
+``iter_pages`` yields pages in order as soon as their range is done.
+
 Requires:
 - ``pypdf>=5`` for PDF text extraction.
 - ``pytesseract>=0.3`` + system Tesseract binary for image OCR.
@@ -14,15 +22,30 @@ from __future__ import annotations
 
 import asyncio
 import io
+import multiprocessing
+from collections import deque
+from collections.abc import AsyncIterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from typing import Any
 
 import structlog
 
+from ...domain.ports.media import PageText
+from ...shared.metrics import ocr_pages_total
+
 logger = structlog.get_logger(__name__)
 
 # Supported file types for the public API
 PDF_TYPE = "pdf"
 IMAGE_TYPE = "image"
 
+DEFAULT_PAGE_RANGE_SIZE = 8
+DEFAULT_OCR_LANG = "por+eng"
+
+_PYPDF_MISSING = "[Extracao de texto PDF requer pypdf instalado]"
+_PYTESSERACT_MISSING = "[OCR de imagem requer pytesseract e Pillow instalados]"
+_IMAGE_EXTRACTION_FAILED = "[Falha na extracao de texto da imagem]"
+
 
 class OCRProcessor:
     """Extract text from PDF/image files.
@@ -31,8 +54,56 @@ class OCRProcessor:
     protocol but is used by application-layer services that need
     document text extraction (material ingestion, accessibility
     features).
+
+    Parameters
+    ----------
+    workers:
+        Worker processes for page-parallel extraction.  ``0`` keeps the
+        serial, text-layer-only extraction on the default executor.
+    page_range_size:
+        Pages per unit of work sent to a worker.
+    ocr_lang:
+        Tesseract language codes.
+    executor:
+        Executor to run page ranges on (tests/benchmarks); a ``spawn``
+        process pool of *workers* processes when omitted.
     """
 
+    def __init__(
+        self,
+        *,
+        workers: int = 0,
+        page_range_size: int = DEFAULT_PAGE_RANGE_SIZE,
+        ocr_lang: str = DEFAULT_OCR_LANG,
+        executor: Executor | None = None,
+    ) -> None:
+        self._workers = max(0, workers)
+        self._page_range_size = max(1, page_range_size)
+        self._ocr_lang = ocr_lang
+        self._executor = executor
+        self._owns_executor = executor is None
+
+    @property
+    def parallel(self) -> bool:
+        """Whether page-parallel extraction is enabled."""
+        return self._workers > 0 or not self._owns_executor
+
+    def _pool(self) -> Executor:
+        if self._executor is None:
+            # spawn: forking a process that runs an event loop and threads
+            # is unsafe
+            self._executor = ProcessPoolExecutor(
+                max_workers=self._workers,
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return self._executor
+
+    async def dispose(self) -> None:
+        """Shut down the worker processes (called by ``Container.close()``)."""
+        if self._owns_executor and self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
     async def extract_text(
         self, file_bytes: bytes, *, file_type: str = PDF_TYPE
     ) -> str:
@@ -51,11 +122,72 @@ class OCRProcessor:
             Extracted text, or a diagnostic message if the required
             library is not available.
         """
+        if self.parallel:
+            missing = _missing_library(file_type)
+            if missing is not None:
+                return missing
+            pages = [
+                page.text
+                async for page in self.iter_pages(file_bytes, file_type=file_type)
+                if page.text
+            ]
+            return "\n".join(pages)
         loop = asyncio.get_running_loop()
         if file_type == PDF_TYPE:
             return await loop.run_in_executor(None, self._extract_pdf, file_bytes)
         return await loop.run_in_executor(None, self._extract_image, file_bytes)
 
+    async def iter_pages(
+        self, file_bytes: bytes, *, file_type: str = PDF_TYPE
+    ) -> AsyncIterator[PageText]:
+        """Yield pages in order as their page range finishes extracting.
+
+        Yields nothing when the required library is not installed.
+        Closing the iterator cancels ranges not yet started.
+        """
+        if _missing_library(file_type) is not None:
+            logger.warning("ocr.library_missing", file_type=file_type)
+            return
+        loop = asyncio.get_running_loop()
+        if file_type != PDF_TYPE:
+            text = await loop.run_in_executor(
+                self._pool(), _ocr_image_bytes, file_bytes, self._ocr_lang
+            )
+            ocr_pages_total.inc(method="ocr" if text else "empty")
+            yield PageText(index=0, text=text, ocr=True)
+            return
+
+        from pypdf import PdfReader
+
+        reader = await asyncio.to_thread(PdfReader, io.BytesIO(file_bytes))
+        page_count = len(reader.pages)
+        size = self._page_range_size
+        slice_lock = asyncio.Lock()
+
+        async def extract(start: int, stop: int) -> list[tuple[int, str, bool]]:
+            # Slicing walks the shared reader, which is not thread-safe
+            async with slice_lock:
+                chunk = await asyncio.to_thread(_slice_pdf, reader, start, stop)
+            return await loop.run_in_executor(
+                self._pool(), _extract_pdf_range, chunk, start, self._ocr_lang
+            )
+
+        window = max(1, self._workers) + 1
+        pending: deque[asyncio.Task[list[tuple[int, str, bool]]]] = deque()
+        try:
+            for start in range(0, page_count, size):
+                pending.append(asyncio.create_task(extract(start, min(start + size, page_count))))
+                if len(pending) >= window:
+                    for page in await pending.popleft():
+                        yield _page(page)
+            while pending:
+                for page in await pending.popleft():
+                    yield _page(page)
+        finally:
+            for task in pending:
+                task.cancel()
+            await asyncio.gather(*pending, return_exceptions=True)
+
     # -- Private sync helpers (run in executor) ----------------------------
 
     def _extract_pdf(self, file_bytes: bytes) -> str:
@@ -64,7 +196,7 @@ class OCRProcessor:
             from pypdf import PdfReader
         except ImportError:
             logger.warning("ocr.pypdf_missing")
-            return "[Extracao de texto PDF requer pypdf instalado]"
+            return _PYPDF_MISSING
 
         reader = PdfReader(io.BytesIO(file_bytes))
         pages: list[str] = []
@@ -81,12 +213,97 @@ class OCRProcessor:
             from PIL import Image
         except ImportError:
             logger.warning("ocr.pytesseract_missing")
-            return "[OCR de imagem requer pytesseract e Pillow instalados]"
+            return _PYTESSERACT_MISSING
 
         try:
             image = Image.open(io.BytesIO(file_bytes))
-            text: str = pytesseract.image_to_string(image, lang="por+eng")
+            text: str = pytesseract.image_to_string(image, lang=self._ocr_lang)
             return text.strip()
         except OSError:
             logger.exception("ocr.image_extraction_failed")
-            return "[Falha na extracao de texto da imagem]"
+            return _IMAGE_EXTRACTION_FAILED
+
+
+def _missing_library(file_type: str) -> str | None:
+    """Diagnostic message when *file_type*'s extraction library is missing."""
+    try:
+        if file_type == PDF_TYPE:
+            import pypdf  # noqa: F401
+        else:
+            import PIL  # noqa: F401
+            import pytesseract  # noqa: F401
+    except ImportError:
+        return _PYPDF_MISSING if file_type == PDF_TYPE else _PYTESSERACT_MISSING
+    return None
+
+
+def _page(item: tuple[int, str, bool]) -> PageText:
+    index, text, ocr = item
+    if not text:
+        ocr_pages_total.inc(method="empty")
+    else:
+        ocr_pages_total.inc(method="ocr" if ocr else "text")
+    return PageText(index=index, text=text, ocr=ocr)
+
+
+def _slice_pdf(reader: Any, start: int, stop: int) -> bytes:
+    """Serialize pages ``[start, stop)`` of *reader* as a standalone PDF."""
+    from pypdf import PdfWriter
+
+    writer = PdfWriter()
+    for index in range(start, stop):
+        writer.add_page(reader.pages[index])
+    buf = io.BytesIO()
+    writer.write(buf)
+    return buf.getvalue()
+
+
+# -- Worker-process functions (module level so they can be pickled) ----------
+
+
+def _extract_pdf_range(
+    pdf_bytes: bytes, first_index: int, ocr_lang: str
+) -> list[tuple[int, str, bool]]:
+    """Extract every page of a page-range PDF; OCR pages without a text layer."""
+    from pypdf import PdfReader
+
+    reader = PdfReader(io.BytesIO(pdf_bytes))
+    pages: list[tuple[int, str, bool]] = []
+    for offset, page in enumerate(reader.pages):
+        text = (page.extract_text() or "").strip()
+        if text:
+            pages.append((first_index + offset, text, False))
+        else:
+            pages.append((first_index + offset, _ocr_page_images(page, ocr_lang), True))
+    return pages
+
+
+def _ocr_page_images(page: Any, ocr_lang: str) -> str:
+    """OCR the images embedded in a PDF page (a scanned page is one image)."""
+    try:
+        import pytesseract
+    except ImportError:
+        return ""
+    texts: list[str] = []
+    try:
+        for embedded in page.images:
+            text = pytesseract.image_to_string(embedded.image, lang=ocr_lang).strip()
+            if text:
+                texts.append(text)
+    except Exception:
+        logger.warning("ocr.page_image_failed", exc_info=True)
+    return "\n".join(texts)
+
+
+def _ocr_image_bytes(file_bytes: bytes, ocr_lang: str) -> str:
+    """OCR a standalone image file."""
+    import pytesseract
+    from PIL import Image
+
+    try:
+        image = Image.open(io.BytesIO(file_bytes))
+        text: str = pytesseract.image_to_string(image, lang=ocr_lang)
+        return text.strip()
+    except OSError:
+        logger.exception("ocr.image_extraction_failed")
+        return _IMAGE_EXTRACTION_FAILED
@@ -4,6 +4,13 @@ Uses CTranslate2-backed Whisper V3 Turbo for fast, accurate
 speech-to-text.  The model is loaded lazily on first call to avoid
 import overhead when the adapter is not in use (ADR-020).
 
+Transcriptions run on a dedicated worker pool rather than the event
+loop's default executor: ``replicas`` threads, each decoding with its own
+model replica, so concurrent uploads neither queue behind unrelated
+blocking work nor serialize on one model.  Audio is decoded from memory
+(no temp file), and ``transcribe_stream`` yields segments as the model
+produces them.
+
 Requires: ``faster-whisper>=1.2.1`` (pinned in pyproject.toml[media]).
 For GPU acceleration: CUDA 12 + cuDNN 9.
 """
@@ -12,15 +19,24 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import os
-import tempfile
+import io
+import queue
+import threading
+from collections.abc import AsyncIterator, Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+from ...domain.ports.media import TranscriptSegment
+from ...shared.metrics import stt_pool_workers
+
+_DONE = object()
+
 
 class WhisperSTT:
     """STT using faster-whisper (local inference).
 
-    Satisfies the ``STT`` protocol from ``domain.ports.media``.
+    Satisfies the ``STT`` and ``StreamingSTT`` protocols from
+    ``domain.ports.media``.
 
     Parameters
     ----------
@@ -31,6 +47,11 @@ class WhisperSTT:
         ``"cpu"`` or ``"cuda"``.  CPU is the safe default.
     compute_type:
         Quantisation level.  ``"int8"`` is recommended for CPU (ADR-020).
+    replicas:
+        Worker threads, each with its own model replica (loaded on
+        demand).  Every replica holds a full copy of the model weights.
+    cpu_threads:
+        CTranslate2 threads per replica (``0`` = library default).
     """
 
     def __init__(
@@ -39,52 +60,184 @@ class WhisperSTT:
         model_size: str = "turbo",
         device: str = "cpu",
         compute_type: str = "int8",
+        replicas: int = 1,
+        cpu_threads: int = 0,
     ) -> None:
         self._model_size = model_size
         self._device = device
         self._compute_type = compute_type
+        self._replicas = max(1, replicas)
+        self._cpu_threads = cpu_threads
         self._model: Any = None
+        self._idle: queue.SimpleQueue[Any] = queue.SimpleQueue()
+        self._loaded = 0
+        self._busy = 0
+        self._lock = threading.Lock()
+        self._executor: ThreadPoolExecutor | None = None
 
-    def _ensure_model(self) -> None:
-        """Lazy-load the WhisperModel on first use."""
-        if self._model is not None:
-            return
+    # -- Worker pool ----------------------------------------------------------
+
+    def _load_model(self) -> Any:
+        """Load one model replica."""
         try:
             from faster_whisper import WhisperModel
         except ImportError as exc:
             raise ImportError(
                 "faster-whisper is required for WhisperSTT. Install with: pip install 'faster-whisper>=1.2.1'"
             ) from exc
-        self._model = WhisperModel(
-            self._model_size,
-            device=self._device,
-            compute_type=self._compute_type,
-        )
+        kwargs: dict[str, Any] = {"device": self._device, "compute_type": self._compute_type}
+        if self._cpu_threads > 0:
+            kwargs["cpu_threads"] = self._cpu_threads
+        return WhisperModel(self._model_size, **kwargs)
+
+    def _ensure_model(self) -> None:
+        """Lazy-load the first WhisperModel replica on first use."""
+        with self._lock:
+            if self._model is not None:
+                return
+            self._model = self._load_model()
+            self._loaded = 1
+            self._idle.put(self._model)
+            self._report()
+
+    def _pool(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._replicas, thread_name_prefix="whisper-stt"
+            )
+            stt_pool_workers.set(self._replicas, state="limit")
+        return self._executor
+
+    def _acquire(self) -> Any:
+        """Borrow an idle replica, loading a new one while under ``replicas``.
+
+        Runs on a pool thread.  There are never more pool threads than
+        replicas, so the blocking ``get`` always has a replica coming back.
+        """
+        try:
+            model = self._idle.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                if self._loaded < self._replicas:
+                    self._loaded += 1
+                    load = True
+                else:
+                    load = False
+            if load:
+                try:
+                    model = self._load_model()
+                except BaseException:
+                    with self._lock:
+                        self._loaded -= 1
+                    raise
+            else:
+                model = self._idle.get()
+        with self._lock:
+            self._busy += 1
+            self._report()
+        return model
+
+    def _release(self, model: Any) -> None:
+        with self._lock:
+            self._busy -= 1
+            self._report()
+        self._idle.put(model)
+
+    def _report(self) -> None:
+        stt_pool_workers.set(self._loaded, state="loaded")
+        stt_pool_workers.set(self._busy, state="busy")
+
+    def stats(self) -> dict[str, int]:
+        """Worker pool snapshot (for health checks, tests and benchmarks)."""
+        return {"replicas": self._replicas, "loaded": self._loaded, "busy": self._busy}
+
+    async def dispose(self) -> None:
+        """Stop the worker pool and drop loaded replicas."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        with self._lock:
+            self._model = None
+            self._idle = queue.SimpleQueue()
+            self._loaded = 0
+            self._report()
+
+    # -- Transcription ----------------------------------------------------------
 
     async def transcribe(self, audio_bytes: bytes, *, language: str = "pt") -> str:
         """Transcribe audio bytes to text.
 
-        Delegates to a thread-pool executor because faster-whisper is
+        Runs on the adapter's worker pool because faster-whisper is
         synchronous and CPU/GPU-bound.
         """
         self._ensure_model()
         loop = asyncio.get_running_loop()
         return await loop.run_in_executor(
-            None, self._sync_transcribe, audio_bytes, language
+            self._pool(), self._sync_transcribe, audio_bytes, language
         )
 
     def _sync_transcribe(self, audio_bytes: bytes, language: str) -> str:
-        """Blocking transcription called from the executor."""
-        tmp_path: str | None = None
+        """Blocking transcription called from the worker pool."""
+        model = self._acquire()
         try:
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as tmp:
-                tmp.write(audio_bytes)
-                tmp.flush()
-                tmp_path = tmp.name
-
-            segments, _info = self._model.transcribe(tmp_path, language=language)
+            segments, _info = model.transcribe(io.BytesIO(audio_bytes), language=language)
             return " ".join(seg.text for seg in segments).strip()
         finally:
-            if tmp_path is not None:
-                with contextlib.suppress(OSError):
-                    os.unlink(tmp_path)
+            self._release(model)
+
+    async def transcribe_stream(
+        self, audio_bytes: bytes, *, language: str = "pt"
+    ) -> AsyncIterator[TranscriptSegment]:
+        """Yield segments as the model decodes them.
+
+        Closing the iterator stops decoding after the current segment.
+        """
+        self._ensure_model()
+        loop = asyncio.get_running_loop()
+        items: asyncio.Queue[Any] = asyncio.Queue()
+        stop = threading.Event()
+
+        def emit(item: Any) -> None:
+            # The consumer may be gone (and its loop closed) by now
+            with contextlib.suppress(RuntimeError):
+                loop.call_soon_threadsafe(items.put_nowait, item)
+
+        loop.run_in_executor(self._pool(), self._sync_stream, audio_bytes, language, emit, stop)
+        try:
+            while True:
+                item = await items.get()
+                if item is _DONE:
+                    return
+                if isinstance(item, BaseException):
+                    raise item
+                yield item
+        finally:
+            stop.set()
+
+    def _sync_stream(
+        self,
+        audio_bytes: bytes,
+        language: str,
+        emit: Callable[[Any], None],
+        stop: threading.Event,
+    ) -> None:
+        """Blocking decode loop; pushes segments to *emit* as produced."""
+        try:
+            model = self._acquire()
+        except BaseException as exc:
+            emit(exc)
+            return
+        outcome: Any = _DONE
+        try:
+            segments, _info = model.transcribe(io.BytesIO(audio_bytes), language=language)
+            # faster-whisper decodes lazily: each step of this loop runs
+            # the model on the next window of audio.
+            for seg in segments:
+                if stop.is_set():
+                    break
+                emit(TranscriptSegment(start=seg.start, end=seg.end, text=seg.text.strip()))
+        except Exception as exc:
+            outcome = exc
+        finally:
+            self._release(model)
+        emit(outcome)
@@ -0,0 +1,35 @@
+"""Batching helper shared by the bulk upsert implementations."""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterable, AsyncIterator, Iterable
+from typing import TypeVar
+
+T = TypeVar("T")
+
+
+async def iter_batches(
+    items: AsyncIterable[T] | Iterable[T], size: int
+) -> AsyncIterator[list[T]]:
+    """Yield lists of at most *size* items from a sync or async iterable.
+
+    Only one batch is held in memory at a time, so callers can stream
+    arbitrarily long inputs with bounded memory.
+    """
+    if size < 1:
+        raise ValueError(f"batch size must be >= 1 (got {size})")
+    batch: list[T] = []
+    if isinstance(items, AsyncIterable):
+        async for item in items:
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+    else:
+        for item in items:
+            batch.append(item)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+    if batch:
+        yield batch
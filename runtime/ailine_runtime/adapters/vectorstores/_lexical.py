@@ -0,0 +1,98 @@
+"""In-process BM25 index shared by vector stores without native full-text search.
+
+Postings are kept as ``term -> {doc: term_frequency}`` dicts so that
+upserts and deletes update the index incrementally; a query only touches
+the postings of its own terms.  Tokenization deliberately mirrors
+PostgreSQL's ``simple`` text-search configuration (lower-cased word
+tokens, no stemming, no stop words) so the in-process and ``tsvector``
+rankings agree on what counts as a match -- curriculum codes such as
+``EF04MA07`` stay a single token.
+"""
+
+from __future__ import annotations
+
+import heapq
+import re
+from collections import Counter
+from collections.abc import Container, Hashable
+from typing import Generic, TypeVar
+
+from ...shared.bm25 import bm25_idf, bm25_term_score
+
+_TOKEN_RE = re.compile(r"\w+")
+
+K = TypeVar("K", bound=Hashable)
+
+
+def lexical_tokens(text: str) -> list[str]:
+    """Lower-cased word tokens of *text* (underscores split words)."""
+    return _TOKEN_RE.findall(text.lower().replace("_", " "))
+
+
+class Bm25Index(Generic[K]):  # noqa: UP046
+    """Incrementally maintained BM25 (Okapi) index over short documents."""
+
+    def __init__(self) -> None:
+        self._postings: dict[str, dict[K, int]] = {}
+        self._terms: dict[K, tuple[str, ...]] = {}
+        self._lengths: dict[K, int] = {}
+        self._total_length = 0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, doc: K, text: str) -> None:
+        """Index *text* under *doc*, replacing any previous version."""
+        self.remove(doc)
+        tokens = lexical_tokens(text)
+        counts = Counter(tokens)
+        for term, tf in counts.items():
+            self._postings.setdefault(term, {})[doc] = tf
+        self._terms[doc] = tuple(counts)
+        self._lengths[doc] = len(tokens)
+        self._total_length += len(tokens)
+
+    def remove(self, doc: K) -> None:
+        """Drop *doc* from the index (no-op when absent)."""
+        terms = self._terms.pop(doc, None)
+        if terms is None:
+            return
+        for term in terms:
+            posting = self._postings[term]
+            del posting[doc]
+            if not posting:
+                del self._postings[term]
+        self._total_length -= self._lengths.pop(doc)
+
+    def search(
+        self,
+        query: str,
+        *,
+        k: int,
+        candidates: Container[K] | None = None,
+    ) -> list[tuple[K, float]]:
+        """Return up to *k* ``(doc, score)`` pairs, best first.
+
+        Args:
+            query: Free text; any query term may match (OR semantics).
+            k: Maximum number of results.
+            candidates: Optional allow-list of documents (tenant/metadata
+                pre-filtering); IDF statistics stay corpus-wide.
+        """
+        n_docs = len(self._lengths)
+        if k <= 0 or not n_docs:
+            return []
+        avgdl = self._total_length / n_docs or 1.0
+        scores: dict[K, float] = {}
+        for term in dict.fromkeys(lexical_tokens(query)):
+            posting = self._postings.get(term)
+            if not posting:
+                continue
+            idf = bm25_idf(n_docs, len(posting))
+            for doc, tf in posting.items():
+                if candidates is not None and doc not in candidates:
+                    continue
+                scores[doc] = scores.get(doc, 0.0) + bm25_term_score(
+                    idf, tf, self._lengths[doc], avgdl
+                )
+        return heapq.nlargest(k, scores.items(), key=lambda item: item[1])
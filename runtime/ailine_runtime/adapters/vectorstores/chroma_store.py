@@ -2,10 +2,29 @@
 
 Provides a lightweight, file- or in-memory-based vector store that does
 not require PostgreSQL.  Useful for rapid local iteration and demos.
+
+ChromaDB only exposes a synchronous API.  By default every call runs on
+a dedicated, bounded thread pool so that a large upsert or HNSW query
+does not block the event loop (and with it every SSE stream and tutor
+WebSocket on a single-worker node):
+
+- Writes (``upsert``/``delete``) are serialized by a per-collection
+  ``asyncio.Lock``, so they apply in call order and can never occupy
+  more than one pool thread.
+- Concurrent ``search`` calls arriving within ``coalesce_window_ms`` of
+  each other with the same ``k`` and filters are sent to Chroma as one
+  multi-query ``collection.query`` and the result rows fanned back out.
+
+``executor_workers=0`` restores the legacy inline behavior.
 """
 
 from __future__ import annotations
 
+import asyncio
+import functools
+import json
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
 from ...domain.ports.vectorstore import VectorSearchResult
@@ -13,6 +32,25 @@ from ...shared.observability import get_logger
 
 _log = get_logger("ailine.adapters.vectorstores.chroma")
 
+_DEFAULT_EXECUTOR_WORKERS = 4
+_DEFAULT_COALESCE_WINDOW_MS = 2.0
+# Flush a coalesced batch early once it holds this many queries.
+_MAX_COALESCED_QUERIES = 64
+
+_QUERY_INCLUDE = ["documents", "metadatas", "distances"]
+
+
+class _SearchBatch:
+    """Searches waiting to be sent as one ``collection.query``."""
+
+    __slots__ = ("embeddings", "futures", "k", "where")
+
+    def __init__(self, k: int, where: dict[str, Any] | None) -> None:
+        self.k = k
+        self.where = where
+        self.embeddings: list[list[float]] = []
+        self.futures: list[asyncio.Future[list[VectorSearchResult]]] = []
+
 
 class ChromaVectorStore:
     """VectorStore backed by ChromaDB.
@@ -21,6 +59,13 @@ class ChromaVectorStore:
         collection_name: Name of the Chroma collection.
         persist_directory: Path to persist on disk.  ``None`` for
             ephemeral (in-memory) mode.
+        client: An existing Chroma client (e.g. ``chromadb.HttpClient``);
+            takes precedence over *persist_directory*.
+        executor_workers: Size of the dedicated thread pool running Chroma
+            calls.  ``0`` runs them inline on the event loop.
+        coalesce_window_ms: How long a ``search`` waits for concurrent
+            searches to share its ``collection.query``.  ``0`` disables
+            coalescing (each search is its own query, still off-loop).
     """
 
     def __init__(
@@ -28,22 +73,42 @@ class ChromaVectorStore:
         *,
         collection_name: str = "chunks",
         persist_directory: str | None = None,
+        client: Any | None = None,
+        executor_workers: int = _DEFAULT_EXECUTOR_WORKERS,
+        coalesce_window_ms: float = _DEFAULT_COALESCE_WINDOW_MS,
     ) -> None:
-        import chromadb
-
-        if persist_directory:
-            self._client = chromadb.PersistentClient(path=persist_directory)
+        if client is not None:
+            self._client = client
         else:
-            self._client = chromadb.EphemeralClient()
+            import chromadb
+
+            if persist_directory:
+                self._client = chromadb.PersistentClient(path=persist_directory)
+            else:
+                self._client = chromadb.EphemeralClient()
 
         self._collection = self._client.get_or_create_collection(
             name=collection_name,
             metadata={"hnsw:space": "cosine"},
         )
+        self._executor = (
+            ThreadPoolExecutor(
+                max_workers=executor_workers,
+                thread_name_prefix=f"chroma-{collection_name}",
+            )
+            if executor_workers > 0
+            else None
+        )
+        self._coalesce_s = coalesce_window_ms / 1000.0
+        self._write_lock = asyncio.Lock()
+        self._pending: dict[tuple[int, str], _SearchBatch] = {}
+        self._inflight: set[asyncio.Task[None]] = set()
         _log.info(
             "chroma_store_init",
             collection=collection_name,
             persist=persist_directory,
+            executor_workers=executor_workers,
+            coalesce_window_ms=coalesce_window_ms,
         )
 
     # -- Protocol methods -----------------------------------------------------
@@ -59,8 +124,7 @@ class ChromaVectorStore:
     ) -> None:
         """Insert or update documents in the Chroma collection.
 
-        ChromaDB's ``upsert`` is synchronous; we call it directly since
-        the library does not expose an async API.
+        Runs on the store's thread pool under the collection write lock.
         """
         if not ids:
             return
@@ -75,12 +139,14 @@ class ChromaVectorStore:
             enriched_metas = [{**m, "_tenant_id": tenant_id} for m in metadatas]
         sanitized_metas = [_sanitize_metadata(m) for m in enriched_metas]
 
-        self._collection.upsert(
-            ids=ids,
-            embeddings=embeddings,
-            documents=texts,
-            metadatas=sanitized_metas,
-        )
+        async with self._write_lock:
+            await self._run(
+                self._collection.upsert,
+                ids=ids,
+                embeddings=embeddings,
+                documents=texts,
+                metadatas=sanitized_metas,
+            )
 
     async def search(
         self,
@@ -93,7 +159,8 @@ class ChromaVectorStore:
         """Query the Chroma collection for similar vectors.
 
         Chroma returns distances; for cosine space, distance = 1 - similarity,
-        so we convert back to a similarity score.
+        so we convert back to a similarity score.  Concurrent searches with
+        the same ``k``, filters and tenant are coalesced into one query.
 
         Args:
             query_embedding: The query vector.
@@ -105,50 +172,172 @@ class ChromaVectorStore:
         """
         _log.debug("search", k=k, filters=filters, tenant_id=tenant_id)
 
-        # Structural tenant isolation via Chroma where clause (ADR-060)
-        where = dict(filters) if filters else {}
-        if tenant_id is not None:
-            where["_tenant_id"] = tenant_id
-        where_clause: dict[str, Any] | None = where or None
+        if self._executor is None or self._coalesce_s <= 0:
+            results = await self.search_many(
+                query_embeddings=[query_embedding],
+                k=k,
+                filters=filters,
+                tenant_id=tenant_id,
+            )
+            return results[0]
+        return await self._coalesced_search(
+            query_embedding, k=k, where=_where_clause(filters, tenant_id)
+        )
+
+    async def search_many(
+        self,
+        *,
+        query_embeddings: list[list[float]],
+        k: int = 5,
+        filters: dict[str, Any] | None = None,
+        tenant_id: str | None = None,
+    ) -> list[list[VectorSearchResult]]:
+        """Query the collection with several vectors in one ``query`` call.
+
+        Chroma natively accepts a list of query embeddings and returns one
+        result row per query, so the whole batch is a single HNSW call.
+
+        Returns:
+            One result list per query embedding, in input order.
+        """
+        if not query_embeddings:
+            return []
 
-        result = self._collection.query(
-            query_embeddings=[query_embedding],
+        result = await self._run(
+            self._collection.query,
+            query_embeddings=query_embeddings,
             n_results=k,
-            where=where_clause,
-            include=["documents", "metadatas", "distances"],
+            where=_where_clause(filters, tenant_id),
+            include=_QUERY_INCLUDE,
         )
 
-        items: list[VectorSearchResult] = []
-        if result["ids"] and result["ids"][0]:
-            for i, doc_id in enumerate(result["ids"][0]):
-                distance = result["distances"][0][i] if result["distances"] else 0.0
-                score = 1.0 - distance  # cosine distance -> similarity
-                text = result["documents"][0][i] if result["documents"] else ""
-                metadata = result["metadatas"][0][i] if result["metadatas"] else {}
-                items.append(
-                    VectorSearchResult(
-                        id=doc_id,
-                        score=score,
-                        text=text,
-                        metadata=metadata,
-                    )
-                )
-
-        return items
+        return [_parse_query_row(result, q) for q in range(len(query_embeddings))]
 
     async def delete(self, *, ids: list[str]) -> None:
-        """Delete documents by their IDs."""
+        """Delete documents by their IDs (under the collection write lock)."""
         if not ids:
             return
 
         _log.debug("delete", collection=self._collection.name, count=len(ids))
-        self._collection.delete(ids=ids)
+        async with self._write_lock:
+            await self._run(self._collection.delete, ids=ids)
+
+    async def chunk_hashes(
+        self,
+        *,
+        material_id: str,
+        tenant_id: str | None = None,
+    ) -> dict[str, str | None]:
+        """Map the stored chunk IDs of *material_id* to their ``chunk_hash``."""
+        where: dict[str, Any] = {"material_id": material_id}
+        if tenant_id is not None:
+            where = {"$and": [where, {"_tenant_id": tenant_id}]}
+        result = await self._run(self._collection.get, where=where, include=["metadatas"])
+        metadatas = result.get("metadatas") or [None] * len(result["ids"])
+        return {
+            doc_id: (meta or {}).get("chunk_hash")
+            for doc_id, meta in zip(result["ids"], metadatas, strict=True)
+        }
+
+    async def dispose(self) -> None:
+        """Shut the thread pool down once in-flight Chroma calls finish."""
+        if self._executor is not None:
+            await asyncio.to_thread(self._executor.shutdown, wait=True)
+
+    # -- Execution ------------------------------------------------------------
+
+    async def _run(self, fn: Callable[..., Any], /, **kwargs: Any) -> Any:
+        """Call a synchronous Chroma method on the pool (or inline)."""
+        if self._executor is None:
+            return fn(**kwargs)
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(fn, **kwargs))
+
+    async def _coalesced_search(
+        self,
+        query_embedding: list[float],
+        *,
+        k: int,
+        where: dict[str, Any] | None,
+    ) -> list[VectorSearchResult]:
+        """Join (or open) the pending batch for ``(k, where)`` and await its row."""
+        loop = asyncio.get_running_loop()
+        key = (k, json.dumps(where, sort_keys=True, default=str))
+        batch = self._pending.get(key)
+        if batch is None:
+            batch = self._pending[key] = _SearchBatch(k, where)
+            loop.call_later(self._coalesce_s, self._flush, key, batch)
+        future: asyncio.Future[list[VectorSearchResult]] = loop.create_future()
+        batch.embeddings.append(query_embedding)
+        batch.futures.append(future)
+        if len(batch.embeddings) >= _MAX_COALESCED_QUERIES:
+            self._flush(key, batch)
+        return await future
+
+    def _flush(self, key: tuple[int, str], batch: _SearchBatch) -> None:
+        """Send *batch* if it is still the pending batch for *key*."""
+        if self._pending.get(key) is not batch:
+            return
+        del self._pending[key]
+        task = asyncio.get_running_loop().create_task(self._execute_batch(batch))
+        self._inflight.add(task)
+        task.add_done_callback(self._inflight.discard)
+
+    async def _execute_batch(self, batch: _SearchBatch) -> None:
+        _log.debug("search_coalesced", queries=len(batch.embeddings), k=batch.k)
+        try:
+            result = await self._run(
+                self._collection.query,
+                query_embeddings=batch.embeddings,
+                n_results=batch.k,
+                where=batch.where,
+                include=_QUERY_INCLUDE,
+            )
+        except Exception as exc:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+        for q, future in enumerate(batch.futures):
+            if not future.done():
+                future.set_result(_parse_query_row(result, q))
+
+
+def _where_clause(
+    filters: dict[str, Any] | None, tenant_id: str | None
+) -> dict[str, Any] | None:
+    """Chroma ``where`` for metadata filters plus tenant isolation (ADR-060)."""
+    where = dict(filters) if filters else {}
+    if tenant_id is not None:
+        where["_tenant_id"] = tenant_id
+    return where or None
+
+
+def _parse_query_row(result: Any, q: int) -> list[VectorSearchResult]:
+    """Convert row *q* of a Chroma ``query`` response into search results.
+
+    Chroma returns distances; for cosine space, distance = 1 - similarity,
+    so we convert back to a similarity score.
+    """
+    ids = result["ids"][q] if result["ids"] and len(result["ids"]) > q else []
+    items: list[VectorSearchResult] = []
+    for i, doc_id in enumerate(ids):
+        distance = result["distances"][q][i] if result["distances"] else 0.0
+        text = result["documents"][q][i] if result["documents"] else ""
+        metadata = result["metadatas"][q][i] if result["metadatas"] else {}
+        items.append(
+            VectorSearchResult(
+                id=doc_id,
+                score=1.0 - distance,
+                text=text,
+                metadata=metadata,
+            )
+        )
+    return items
 
 
 def _sanitize_metadata(meta: dict[str, Any]) -> dict[str, str | int | float | bool]:
     """Flatten metadata values to types Chroma accepts."""
-    import json
-
     sanitized: dict[str, str | int | float | bool] = {}
     for key, value in meta.items():
         if isinstance(value, str | int | float | bool):
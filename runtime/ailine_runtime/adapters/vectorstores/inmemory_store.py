@@ -1,50 +1,85 @@
-"""In-memory VectorStore adapter for testing.
+"""In-memory VectorStore adapter for testing and single-node fallback.
 
-Stores vectors in a plain dictionary and computes cosine similarity
-using NumPy.  No external dependencies beyond NumPy.
+Stores vectors in a contiguous, pre-normalized float32 matrix so that a
+search is one matrix-vector product followed by an ``np.argpartition``
+top-k.  Tenant partitions and metadata equality filters are served from
+row-index sets, so filtered searches only score the candidate rows.
+Chunk text is also kept in an in-process BM25 index for lexical search.
+No external dependencies beyond NumPy.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+from collections.abc import AsyncIterable, Iterable
 from typing import Any
 
 import numpy as np
 
-from ...domain.ports.vectorstore import VectorSearchResult
+from ...domain.ports.vectorstore import VectorRecord, VectorSearchResult
+from ._batching import iter_batches
+from ._lexical import Bm25Index
 
+_DEFAULT_CAPACITY = 1024
+_EMPTY_ROWS = np.empty(0, dtype=np.intp)
 
-@dataclass
-class _StoredChunk:
-    """Internal representation of a stored chunk."""
-
-    id: str
-    embedding: np.ndarray
-    text: str
-    metadata: dict[str, Any]
-    tenant_id: str = ""
+# Cache key for a row-index array: ("t", tenant_id) or ("m", key, value).
+_RowKey = tuple[Any, ...]
 
 
 class InMemoryVectorStore:
-    """VectorStore backed by an in-memory dictionary.
+    """VectorStore backed by an in-memory float32 matrix.
+
+    Layout:
+        - ``_matrix`` holds one L2-normalized embedding per row, so cosine
+          similarity reduces to a dot product with the normalized query.
+        - ``_active`` marks rows that are live and have a non-zero norm
+          (zero vectors are stored but never returned by ``search``).
+        - Deleted rows go to a free list and are reused by later upserts.
+        - ``_tenant_rows`` partitions rows by tenant, and ``_meta_index``
+          maps each hashable ``(key, value)`` metadata pair to its rows.
+          Both are materialized as sorted ``np.intp`` arrays on first use
+          and cached until a write touches them.
+        - ``_lexical`` is a BM25 index over chunk text keyed by row.
+
+    Suitable for unit tests, dev, and the single-node fallback deployment
+    where deterministic, fast vector operations are needed without
+    external infrastructure.
 
-    Suitable for unit tests and lightweight integration tests that need
-    deterministic, fast vector operations without external infrastructure.
+    Args:
+        initial_capacity: Number of rows to pre-allocate once the
+            embedding dimension is known.  The matrix doubles on demand.
     """
 
-    def __init__(self) -> None:
-        self._store: dict[str, _StoredChunk] = {}
+    def __init__(self, *, initial_capacity: int = _DEFAULT_CAPACITY) -> None:
+        self._initial_capacity = max(1, initial_capacity)
+        self._reset()
+
+    def _reset(self) -> None:
+        self._dim: int | None = None
+        self._matrix = np.empty((0, 0), dtype=np.float32)
+        self._active = np.zeros(0, dtype=bool)
+        self._size = 0
+        self._free: list[int] = []
+        self._row_of: dict[str, int] = {}
+        self._ids: list[str | None] = []
+        self._texts: list[str] = []
+        self._metas: list[dict[str, Any]] = []
+        self._tenants: list[str] = []
+        self._tenant_rows: dict[str, set[int]] = {}
+        self._meta_index: dict[str, dict[Any, set[int]]] = {}
+        self._row_cache: dict[_RowKey, np.ndarray] = {}
+        self._lexical: Bm25Index[int] = Bm25Index()
 
     # -- Inspection helpers (test-only) ---------------------------------------
 
     @property
     def count(self) -> int:
         """Number of stored chunks."""
-        return len(self._store)
+        return len(self._row_of)
 
     def clear(self) -> None:
         """Remove all stored chunks."""
-        self._store.clear()
+        self._reset()
 
     # -- Protocol methods -----------------------------------------------------
 
@@ -57,15 +92,76 @@ class InMemoryVectorStore:
         metadatas: list[dict[str, Any]],
         tenant_id: str | None = None,
     ) -> None:
-        """Insert or update chunks in memory."""
+        """Insert or update chunks in memory.
+
+        Embeddings are normalized in one vectorized pass and written into
+        their rows with a single fancy-indexed assignment.
+
+        Raises:
+            ValueError: If the input lists differ in length or the
+                embedding dimension does not match the stored vectors.
+        """
+        if not ids:
+            return
+
+        n = len(ids)
+        if not (len(embeddings) == len(texts) == len(metadatas) == n):
+            raise ValueError(
+                f"upsert expects ids/embeddings/texts/metadatas with same length "
+                f"(got {n}/{len(embeddings)}/{len(texts)}/{len(metadatas)})"
+            )
+
+        vecs = np.array(embeddings, dtype=np.float32, ndmin=2)
+        self._ensure_dimension(int(vecs.shape[1]))
+        self._reserve(self._size + n)
+
+        norms = np.linalg.norm(vecs, axis=1)
+        nonzero = norms > 0
+        vecs[nonzero] /= norms[nonzero, None]
+
+        effective_tenant = tenant_id or ""
+        rows = np.empty(n, dtype=np.intp)
         for i, doc_id in enumerate(ids):
-            self._store[doc_id] = _StoredChunk(
-                id=doc_id,
-                embedding=np.array(embeddings[i], dtype=np.float32),
-                text=texts[i],
-                metadata=dict(metadatas[i]),
-                tenant_id=tenant_id or "",
+            row = self._row_of.get(doc_id)
+            if row is None:
+                row = self._allocate_row()
+                self._row_of[doc_id] = row
+                self._ids[row] = doc_id
+            else:
+                self._unindex_row(row)
+            self._texts[row] = texts[i]
+            self._metas[row] = dict(metadatas[i])
+            self._tenants[row] = effective_tenant
+            self._index_row(row)
+            self._lexical.add(row, texts[i])
+            rows[i] = row
+
+        self._matrix[rows] = vecs
+        self._active[rows] = nonzero
+
+    async def bulk_upsert(
+        self,
+        records: AsyncIterable[VectorRecord] | Iterable[VectorRecord],
+        *,
+        tenant_id: str | None = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """Stream records into the matrix in batches of *batch_size*.
+
+        Returns:
+            Number of records written.
+        """
+        written = 0
+        async for batch in iter_batches(records, batch_size):
+            await self.upsert(
+                ids=[r.id for r in batch],
+                embeddings=[r.embedding for r in batch],
+                texts=[r.text for r in batch],
+                metadatas=[r.metadata for r in batch],
+                tenant_id=tenant_id,
             )
+            written += len(batch)
+        return written
 
     async def search(
         self,
@@ -87,48 +183,304 @@ class InMemoryVectorStore:
         Returns:
             Results ordered by descending similarity score.
         """
-        query_vec = np.array(query_embedding, dtype=np.float32)
-        query_norm = float(np.linalg.norm(query_vec))
-        if query_norm == 0:
-            return []
+        results = await self.search_many(
+            query_embeddings=[query_embedding],
+            k=k,
+            filters=filters,
+            tenant_id=tenant_id,
+        )
+        return results[0]
 
-        scored: list[tuple[float, _StoredChunk]] = []
+    async def search_many(
+        self,
+        *,
+        query_embeddings: list[list[float]],
+        k: int = 5,
+        filters: dict[str, Any] | None = None,
+        tenant_id: str | None = None,
+    ) -> list[list[VectorSearchResult]]:
+        """Score several queries against the candidate rows in one matmul.
 
-        for chunk in self._store.values():
-            # Structural tenant isolation
-            if tenant_id is not None and chunk.tenant_id != tenant_id:
-                continue
+        Candidate rows are resolved once for the shared filters/tenant, then
+        ``queries @ candidates.T`` yields an ``(n_queries, n_rows)`` score
+        matrix whose rows are reduced with ``np.argpartition``.
 
-            # Apply metadata filters
-            if filters and not _matches_filters(chunk.metadata, filters):
-                continue
+        Returns:
+            One result list per query embedding, in input order.  Zero
+            query vectors yield an empty list.
+        """
+        if not query_embeddings:
+            return []
+        if k <= 0 or not self._row_of:
+            return [[] for _ in query_embeddings]
 
-            chunk_norm = float(np.linalg.norm(chunk.embedding))
-            if chunk_norm == 0:
-                continue
+        queries, usable = self._normalize_queries(query_embeddings)
+
+        candidates = self._candidate_rows(filters, tenant_id)
+        if candidates is None:
+            # Unfiltered: score the whole matrix in place and sink inactive rows.
+            active = self._active[: self._size]
+            scores = queries @ self._matrix[: self._size].T
+            n_active = int(np.count_nonzero(active))
+            if n_active < self._size:
+                scores[:, ~active] = -np.inf
+            candidates = np.arange(self._size, dtype=np.intp)
+            top_n = min(k, n_active)
+        else:
+            candidates = candidates[self._active[candidates]]
+            scores = queries @ self._matrix[candidates].T
+            top_n = min(k, len(candidates))
 
-            similarity = float(
-                np.dot(query_vec, chunk.embedding) / (query_norm * chunk_norm)
+        results: list[list[VectorSearchResult]] = []
+        for col in range(len(query_embeddings)):
+            if not usable[col]:
+                results.append([])
+                continue
+            row_scores = scores[col]
+            top = _top_k(row_scores, top_n)
+            results.append(
+                [
+                    VectorSearchResult(
+                        id=self._ids[row] or "",
+                        score=float(row_scores[idx]),
+                        text=self._texts[row],
+                        metadata=dict(self._metas[row]),
+                    )
+                    for idx, row in zip(
+                        top.tolist(), candidates[top].tolist(), strict=True
+                    )
+                ]
             )
-            scored.append((similarity, chunk))
+        return results
+
+    async def lexical_search(
+        self,
+        *,
+        query: str,
+        k: int = 5,
+        filters: dict[str, Any] | None = None,
+        tenant_id: str | None = None,
+    ) -> list[VectorSearchResult]:
+        """Rank chunks by BM25 over their text (``LexicalSearch`` capability).
 
-        # Sort by descending similarity
-        scored.sort(key=lambda pair: pair[0], reverse=True)
+        Tenant and metadata filters restrict the candidate rows exactly as
+        in :meth:`search_many`.
 
+        Returns:
+            Up to *k* results ordered by descending BM25 score.
+        """
+        if k <= 0 or not self._row_of:
+            return []
+        candidates = self._candidate_rows(filters, tenant_id)
+        allowed = None if candidates is None else set(candidates.tolist())
         return [
             VectorSearchResult(
-                id=chunk.id,
+                id=self._ids[row] or "",
                 score=score,
-                text=chunk.text,
-                metadata=dict(chunk.metadata),
+                text=self._texts[row],
+                metadata=dict(self._metas[row]),
             )
-            for score, chunk in scored[:k]
+            for row, score in self._lexical.search(query, k=k, candidates=allowed)
         ]
 
     async def delete(self, *, ids: list[str]) -> None:
         """Delete chunks by their IDs."""
         for doc_id in ids:
-            self._store.pop(doc_id, None)
+            row = self._row_of.pop(doc_id, None)
+            if row is None:
+                continue
+            self._unindex_row(row)
+            self._lexical.remove(row)
+            self._active[row] = False
+            self._ids[row] = None
+            self._texts[row] = ""
+            self._metas[row] = {}
+            self._tenants[row] = ""
+            self._free.append(row)
+
+    async def chunk_hashes(
+        self,
+        *,
+        material_id: str,
+        tenant_id: str | None = None,
+    ) -> dict[str, str | None]:
+        """Map the stored chunk IDs of *material_id* to their ``chunk_hash``."""
+        rows = self._indexed_rows(("m", "material_id", material_id))
+        if tenant_id is not None and len(rows):
+            rows = np.intersect1d(rows, self._indexed_rows(("t", tenant_id)), assume_unique=True)
+        return {
+            str(self._ids[row]): self._metas[row].get("chunk_hash")
+            for row in rows.tolist()
+        }
+
+    # -- Storage management ---------------------------------------------------
+
+    def _ensure_dimension(self, dim: int) -> None:
+        """Fix the matrix width on first insert; reject mismatches afterwards."""
+        if self._dim == dim:
+            return
+        if self._dim is not None and self._row_of:
+            raise ValueError(
+                f"Embedding dimension mismatch: store holds {self._dim}-d vectors, got {dim}-d"
+            )
+        # Empty store (fresh or fully deleted): (re)start with the new width.
+        self._reset()
+        self._dim = dim
+        self._matrix = np.zeros((self._initial_capacity, dim), dtype=np.float32)
+        self._active = np.zeros(self._initial_capacity, dtype=bool)
+
+    def _reserve(self, rows: int) -> None:
+        """Grow the matrix geometrically so it can hold at least *rows* rows."""
+        capacity = self._matrix.shape[0]
+        if rows <= capacity:
+            return
+        new_capacity = max(rows, capacity * 2)
+        matrix = np.zeros((new_capacity, self._matrix.shape[1]), dtype=np.float32)
+        matrix[: self._size] = self._matrix[: self._size]
+        active = np.zeros(new_capacity, dtype=bool)
+        active[: self._size] = self._active[: self._size]
+        self._matrix = matrix
+        self._active = active
+
+    def _allocate_row(self) -> int:
+        if self._free:
+            return self._free.pop()
+        row = self._size
+        self._size += 1
+        self._ids.append(None)
+        self._texts.append("")
+        self._metas.append({})
+        self._tenants.append("")
+        return row
+
+    # -- Tenant / metadata indexes --------------------------------------------
+
+    def _index_row(self, row: int) -> None:
+        tenant = self._tenants[row]
+        self._tenant_rows.setdefault(tenant, set()).add(row)
+        self._row_cache.pop(("t", tenant), None)
+        for key, value in self._metas[row].items():
+            if not _is_hashable(value):
+                continue
+            self._meta_index.setdefault(key, {}).setdefault(value, set()).add(row)
+            self._row_cache.pop(("m", key, value), None)
+
+    def _unindex_row(self, row: int) -> None:
+        tenant = self._tenants[row]
+        tenant_rows = self._tenant_rows.get(tenant)
+        if tenant_rows is not None:
+            tenant_rows.discard(row)
+            if not tenant_rows:
+                del self._tenant_rows[tenant]
+        self._row_cache.pop(("t", tenant), None)
+        for key, value in self._metas[row].items():
+            if not _is_hashable(value):
+                continue
+            by_value = self._meta_index.get(key)
+            if by_value is None or value not in by_value:
+                continue
+            by_value[value].discard(row)
+            if not by_value[value]:
+                del by_value[value]
+                if not by_value:
+                    del self._meta_index[key]
+            self._row_cache.pop(("m", key, value), None)
+
+    def _indexed_rows(self, key: _RowKey) -> np.ndarray:
+        """Return the sorted row array for a tenant or metadata pair (cached)."""
+        cached = self._row_cache.get(key)
+        if cached is not None:
+            return cached
+        members = (
+            self._tenant_rows.get(key[1])
+            if key[0] == "t"
+            else self._meta_index.get(key[1], {}).get(key[2])
+        )
+        cached = (
+            np.fromiter(sorted(members), dtype=np.intp, count=len(members))
+            if members
+            else _EMPTY_ROWS
+        )
+        self._row_cache[key] = cached
+        return cached
+
+    def _candidate_rows(
+        self,
+        filters: dict[str, Any] | None,
+        tenant_id: str | None,
+    ) -> np.ndarray | None:
+        """Resolve tenant and metadata filters to candidate rows.
+
+        Returns ``None`` when there is nothing to filter on, meaning every
+        row is a candidate and the caller can score the whole matrix.
+        """
+        partitions: list[np.ndarray] = []
+        if tenant_id is not None:
+            partitions.append(self._indexed_rows(("t", tenant_id)))
+
+        residual: dict[str, Any] = {}
+        for key, value in (filters or {}).items():
+            if _is_hashable(value):
+                partitions.append(self._indexed_rows(("m", key, value)))
+            else:
+                residual[key] = value
+
+        if not partitions and not residual:
+            return None
+
+        if partitions:
+            partitions.sort(key=len)
+            rows = partitions[0]
+            for other in partitions[1:]:
+                if not len(rows):
+                    break
+                rows = np.intersect1d(rows, other, assume_unique=True)
+        else:
+            rows = np.fromiter(
+                sorted(self._row_of.values()), dtype=np.intp, count=len(self._row_of)
+            )
+
+        if residual and len(rows):
+            rows = np.fromiter(
+                (row for row in rows.tolist() if _matches_filters(self._metas[row], residual)),
+                dtype=np.intp,
+            )
+        return rows
+
+    def _normalize_queries(
+        self, query_embeddings: list[list[float]]
+    ) -> tuple[np.ndarray, np.ndarray]:
+        """Stack and L2-normalize queries; also return the non-zero mask."""
+        queries = np.array(query_embeddings, dtype=np.float32, ndmin=2)
+        if queries.shape[1] != self._dim:
+            raise ValueError(
+                f"Query dimension mismatch: store holds {self._dim}-d vectors, "
+                f"got {queries.shape[1]}-d"
+            )
+        norms = np.linalg.norm(queries, axis=1)
+        usable = norms > 0
+        queries[usable] /= norms[usable, None]
+        return queries, usable
+
+
+def _top_k(scores: np.ndarray, k: int) -> np.ndarray:
+    """Indices of the *k* highest scores, best first (ties by position)."""
+    if k <= 0:
+        return _EMPTY_ROWS
+    part = (
+        np.argpartition(-scores, k - 1)[:k]
+        if k < len(scores)
+        else np.arange(len(scores), dtype=np.intp)
+    )
+    return part[np.lexsort((part, -scores[part]))]
+
+
+def _is_hashable(value: Any) -> bool:
+    try:
+        hash(value)
+    except TypeError:
+        return False
+    return True
 
 
 def _matches_filters(metadata: dict[str, Any], filters: dict[str, Any]) -> bool:
@@ -0,0 +1,121 @@
+"""Wire encodings for pgvector ``vector`` values.
+
+Two encodings are supported:
+
+- **Text** (fallback): ``"[0.1,0.2,...]"`` literals parsed server-side by
+  ``vector_in``.  Works with any driver but costs ~20-60 KB of decimal
+  text per 1536-3072-d vector on both ends.
+- **Binary**: pgvector's ``vector_send``/``vector_recv`` layout -- a
+  big-endian ``uint16`` dimension, a ``uint16`` reserved word (0), then
+  ``dim`` big-endian float32 values.  Encoding is a single NumPy
+  ``astype`` + ``tobytes``; no float formatting or parsing happens.
+
+The binary path is enabled per asyncpg connection by
+:func:`install_binary_vector_codec`, which registers an asyncpg type codec
+for ``vector`` whenever SQLAlchemy opens a new raw connection.  Once the
+codec is installed, vector bind parameters must be passed as NumPy arrays
+(or float sequences) instead of text literals -- see
+``PgVectorStore(binary_vectors=True)``.  The ``vector`` extension must
+already exist (migrations) when such a connection opens: a connection
+without the codec could not take those parameters, so it is refused.
+"""
+
+from __future__ import annotations
+
+import struct
+from collections.abc import Sequence
+from typing import Any
+
+import numpy as np
+
+from ...shared.observability import get_logger
+
+_log = get_logger("ailine.adapters.vectorstores.pgvector_codec")
+
+_HEADER = struct.Struct(">HH")
+_BE_FLOAT32 = np.dtype(">f4")
+
+
+def format_vector_text(vec: Sequence[float] | np.ndarray) -> str:
+    """Encode *vec* as a pgvector text literal (``[v1,v2,...]``)."""
+    return "[" + ",".join(str(v) for v in vec) + "]"
+
+
+def encode_vector_binary(vec: Sequence[float] | np.ndarray) -> bytes:
+    """Encode *vec* in pgvector's binary ``vector_recv`` format."""
+    arr = np.asarray(vec, dtype=_BE_FLOAT32)
+    if arr.ndim != 1:
+        raise ValueError(f"expected a 1-d vector, got shape {arr.shape}")
+    return _HEADER.pack(arr.shape[0], 0) + arr.tobytes()
+
+
+def decode_vector_binary(data: bytes | bytearray | memoryview) -> np.ndarray:
+    """Decode pgvector's binary ``vector_send`` format to a float32 array."""
+    dim, unused = _HEADER.unpack_from(data)
+    if unused != 0:
+        raise ValueError("invalid pgvector binary header (reserved word != 0)")
+    payload = memoryview(data)[_HEADER.size :]
+    if len(payload) != 4 * dim:
+        raise ValueError(
+            f"invalid pgvector binary payload: {len(payload)} bytes for {dim} dims"
+        )
+    return np.frombuffer(payload, dtype=_BE_FLOAT32).astype(np.float32)
+
+
+def to_vector_param(vec: Sequence[float] | np.ndarray) -> np.ndarray:
+    """Prepare *vec* as a bind value for the binary codec (C-contiguous float32)."""
+    return np.ascontiguousarray(vec, dtype=np.float32)
+
+
+async def register_vector_codec(conn: Any, *, schema: str = "public") -> None:
+    """Register the binary ``vector`` codec on a raw asyncpg connection.
+
+    Raises:
+        RuntimeError: The ``vector`` type does not exist in *schema* (the
+            pgvector extension has not been created yet).  Binary-mode
+            stores bind NumPy arrays, which a connection on the default
+            text codecs rejects, so the connection must not be used.
+    """
+    try:
+        await conn.set_type_codec(
+            "vector",
+            schema=schema,
+            encoder=encode_vector_binary,
+            decoder=decode_vector_binary,
+            format="binary",
+        )
+    except ValueError as exc:
+        _log.error("binary_codec_unavailable", schema=schema, error=str(exc))
+        raise RuntimeError(
+            f"pgvector type {schema}.vector not found: create the extension "
+            "(run the migrations) or disable binary vectors"
+        ) from exc
+
+
+def install_binary_vector_codec(engine: Any, *, schema: str = "public") -> bool:
+    """Install the binary codec on every new connection of an async engine.
+
+    Only the ``asyncpg`` driver exposes per-connection type codecs; for any
+    other driver this is a no-op and callers should keep the text path.
+
+    Args:
+        engine: A SQLAlchemy ``AsyncEngine``.
+        schema: Schema in which the ``vector`` extension type lives.
+
+    Returns:
+        ``True`` when the codec hook was installed.
+    """
+    if getattr(engine.dialect, "driver", "") != "asyncpg":
+        _log.info("binary_codec_skipped", driver=getattr(engine.dialect, "driver", ""))
+        return False
+
+    from sqlalchemy import event
+
+    @event.listens_for(engine.sync_engine, "connect")
+    def _on_connect(dbapi_connection: Any, _record: Any) -> None:
+        dbapi_connection.run_async(
+            lambda conn: register_vector_codec(conn, schema=schema)
+        )
+
+    _log.info("binary_codec_installed", schema=schema)
+    return True
@@ -1,26 +1,38 @@
 """pgvector VectorStore adapter using SQLAlchemy async.
 
 Uses the ``<=>`` cosine distance operator and an HNSW index for
-approximate nearest-neighbor search.
+approximate nearest-neighbor search, plus a ``tsvector`` GIN index for
+lexical search.
 """
 
 from __future__ import annotations
 
 import re
-from collections.abc import Callable
-from typing import Any
+import uuid
+from collections.abc import AsyncIterable, Callable, Iterable
+from typing import Any, cast
 
 from sqlalchemy import text
+from sqlalchemy.engine import CursorResult
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from ...domain.ports.vectorstore import VectorSearchResult
+from ...domain.ports.vectorstore import VectorRecord, VectorSearchResult
 from ...shared.observability import get_logger
+from ._batching import iter_batches
+from ._lexical import lexical_tokens
+from .pgvector_codec import format_vector_text, to_vector_param
 
 _log = get_logger("ailine.adapters.vectorstores.pgvector")
 
 # Strict SQL identifier pattern to prevent injection via table name (FINDING-SEC-1).
 _VALID_IDENT = re.compile(r"^[a-zA-Z_][a-zA-Z0-9_]*$")
 
+_STAGING_COLUMNS = ["id", "tenant_id", "embedding", "content", "metadata"]
+
+# Text-search configuration for lexical search: no stemming or stop words,
+# so codes like EF04MA07 and Portuguese terms match verbatim.
+_TS_CONFIG = "simple"
+
 
 class PgVectorStore:
     """VectorStore backed by PostgreSQL + pgvector.
@@ -30,6 +42,12 @@ class PgVectorStore:
             (typically a ``sessionmaker`` or async context manager).
         table_name: Name of the chunks table. Must be a valid SQL identifier.
         dimensions: Embedding vector length (must match the column width).
+        binary_vectors: Send vectors in pgvector's binary wire format
+            instead of ``[v1,...]`` text literals.  Requires the asyncpg
+            codec from ``pgvector_codec.install_binary_vector_codec`` on
+            the engine, and the extension to exist before it connects
+            (connections are refused otherwise, so ``ensure_table``
+            cannot bootstrap it); leave ``False`` to use the text fallback.
 
     Graceful degradation:
         When PostgreSQL is unreachable, all query/upsert methods raise
@@ -48,6 +66,7 @@ class PgVectorStore:
         *,
         table_name: str = "chunks",
         dimensions: int = 1536,
+        binary_vectors: bool = False,
     ) -> None:
         if not _VALID_IDENT.match(table_name):
             raise ValueError(
@@ -58,11 +77,16 @@ class PgVectorStore:
         self._session_factory = session_factory
         self._table = table_name
         self._dimensions = dimensions
+        self._binary = binary_vectors
+
+    def _vector_param(self, vec: list[float]) -> Any:
+        """Bind value for a single vector in the configured wire format."""
+        return to_vector_param(vec) if self._binary else format_vector_text(vec)
 
     # -- DDL helpers (run once at startup or via migration) --------------------
 
     async def ensure_table(self) -> None:
-        """Create the chunks table and HNSW index if they do not exist.
+        """Create the chunks table, HNSW and full-text indexes if missing.
 
         Intended for development bootstrapping.  Production should use
         Alembic migrations instead.
@@ -104,6 +128,17 @@ class PgVectorStore:
                     """
                 )
             )
+            # GIN index for lexical search (must match lexical_search's expression)
+            idx_fts = f"idx_{self._table}_content_fts"
+            await session.execute(
+                text(
+                    f"""
+                    CREATE INDEX IF NOT EXISTS {idx_fts}
+                        ON {self._table}
+                        USING gin (to_tsvector('{_TS_CONFIG}', content))
+                    """
+                )
+            )
             await session.commit()
         _log.info("ensure_table_done", table=self._table)
 
@@ -158,7 +193,7 @@ class PgVectorStore:
             {
                 "id": ids[i],
                 "tenant_id": effective_tenant,
-                "embedding": "[" + ",".join(str(v) for v in embeddings[i]) + "]",
+                "embedding": self._vector_param(embeddings[i]),
                 "content": texts[i],
                 "metadata": _json_dumps(metadatas[i]),
             }
@@ -169,6 +204,119 @@ class PgVectorStore:
             await session.execute(stmt, params_list)
             await session.commit()
 
+    async def bulk_upsert(
+        self,
+        records: AsyncIterable[VectorRecord] | Iterable[VectorRecord],
+        *,
+        tenant_id: str | None = None,
+        batch_size: int = 1000,
+    ) -> int:
+        """Stream many chunks in with ``COPY`` and merge them in one statement.
+
+        Intended for re-indexing whole material libraries, where per-row
+        ``ON CONFLICT`` handling of :meth:`upsert` and its WAL volume
+        dominate.  Within a single transaction:
+
+        1. ``CREATE TEMP TABLE`` staging (temporary tables are never
+           WAL-logged and are private to the session, so concurrent bulk
+           loads cannot collide).
+        2. ``COPY`` each batch of *batch_size* records into staging via
+           asyncpg's binary ``copy_records_to_table``.  Records are pulled
+           lazily from *records*, so memory stays bounded by one batch.
+        3. One ``INSERT ... SELECT ... ON CONFLICT DO UPDATE`` merges the
+           staging rows into the chunks table.  When an ID appears more
+           than once in the stream the last occurrence wins.
+
+        In text mode the staging ``embedding`` column is ``text`` and is
+        cast to ``vector`` during the merge; in binary mode it is a
+        ``vector`` column fed by the binary codec.
+
+        Args:
+            records: Sync or async iterable of ``VectorRecord``.
+            tenant_id: Stored with every row for structural isolation.
+            batch_size: Records per ``COPY`` call.
+
+        Returns:
+            Number of rows merged into the chunks table.
+        """
+        effective_tenant = tenant_id or ""
+        staging = f"{self._table}_stage_{uuid.uuid4().hex[:12]}"
+        embedding_type = f"vector({self._dimensions})" if self._binary else "text"
+        copied = 0
+
+        async with self._session_factory() as session:
+            conn = await session.connection()
+            raw = await conn.get_raw_connection()
+            driver = raw.driver_connection
+            if driver is None:
+                raise RuntimeError("bulk_upsert needs an open asyncpg driver connection")
+
+            await session.execute(
+                text(
+                    f"""
+                    CREATE TEMP TABLE {staging} (
+                        seq        BIGSERIAL,
+                        id         TEXT NOT NULL,
+                        tenant_id  TEXT NOT NULL,
+                        embedding  {embedding_type} NOT NULL,
+                        content    TEXT NOT NULL,
+                        metadata   TEXT NOT NULL
+                    ) ON COMMIT DROP
+                    """
+                )
+            )
+
+            async for batch in iter_batches(records, batch_size):
+                rows = [
+                    (
+                        rec.id,
+                        effective_tenant,
+                        self._vector_param(rec.embedding),
+                        rec.text,
+                        _json_dumps(rec.metadata),
+                    )
+                    for rec in batch
+                ]
+                await driver.copy_records_to_table(
+                    staging, records=rows, columns=_STAGING_COLUMNS
+                )
+                copied += len(rows)
+                _log.debug("bulk_upsert_batch", table=self._table, rows=len(rows))
+
+            merged = 0
+            if copied:
+                result = await session.execute(
+                    text(
+                        f"""
+                        INSERT INTO {self._table} (id, tenant_id, embedding, content, metadata)
+                        SELECT DISTINCT ON (id)
+                               id,
+                               tenant_id,
+                               CAST(embedding AS vector),
+                               content,
+                               CAST(metadata AS jsonb)
+                        FROM {staging}
+                        ORDER BY id, seq DESC
+                        ON CONFLICT (id) DO UPDATE SET
+                            tenant_id = EXCLUDED.tenant_id,
+                            embedding = EXCLUDED.embedding,
+                            content   = EXCLUDED.content,
+                            metadata  = EXCLUDED.metadata
+                        """
+                    )
+                )
+                merged = int(cast(CursorResult[Any], result).rowcount)
+            await session.commit()
+
+        _log.info(
+            "bulk_upsert_done",
+            table=self._table,
+            copied=copied,
+            merged=merged,
+            tenant_id=effective_tenant,
+        )
+        return merged
+
     async def search(
         self,
         *,
@@ -199,36 +347,21 @@ class PgVectorStore:
         Returns:
             List of ``VectorSearchResult`` ordered by descending similarity.
         """
-        vec_str = "[" + ",".join(str(v) for v in query_embedding) + "]"
-
-        conditions: list[str] = []
         params: dict[str, Any] = {
-            "query_vec": vec_str,
+            "query_vec": self._vector_param(query_embedding),
             "k": k,
         }
-
-        # Structural tenant isolation: always filter by tenant_id when provided
-        if tenant_id is not None:
-            conditions.append("tenant_id = :tenant_id")
-            params["tenant_id"] = tenant_id
-
-        if filters:
-            conditions.append("metadata @> :filter_json::jsonb")
-            params["filter_json"] = _json_dumps(filters)
-
-        where_clause = ""
-        if conditions:
-            where_clause = "WHERE " + " AND ".join(conditions)
+        where_clause = _build_where(filters, tenant_id, params)
 
         query = text(
             f"""
             SELECT id,
-                   1 - (embedding <=> :query_vec::vector) AS score,
+                   1 - (embedding <=> CAST(:query_vec AS vector)) AS score,
                    content,
                    metadata
             FROM {self._table}
             {where_clause}
-            ORDER BY embedding <=> :query_vec::vector
+            ORDER BY embedding <=> CAST(:query_vec AS vector)
             LIMIT :k
             """
         )
@@ -241,15 +374,142 @@ class PgVectorStore:
             result = await session.execute(query, params)
             rows = result.fetchall()
 
-        return [
-            VectorSearchResult(
-                id=row[0],
-                score=float(row[1]),
-                text=row[2],
-                metadata=row[3] if isinstance(row[3], dict) else _json_loads(row[3]),
-            )
-            for row in rows
-        ]
+        return [_row_to_result(row) for row in rows]
+
+    async def search_many(
+        self,
+        *,
+        query_embeddings: list[list[float]],
+        k: int = 5,
+        filters: dict[str, Any] | None = None,
+        tenant_id: str | None = None,
+    ) -> list[list[VectorSearchResult]]:
+        """Run several similarity searches in a single round trip.
+
+        The query vectors are sent as one array parameter, ``unnest``-ed
+        ``WITH ORDINALITY`` and joined ``LATERAL`` against the per-query
+        top-k subquery, so each query still uses the HNSW index while the
+        whole batch costs one session and one network round trip.
+
+        Tenant isolation and metadata filters behave exactly as in
+        :meth:`search` and apply to every query in the batch.
+
+        Returns:
+            One result list per query embedding, in input order.
+        """
+        if not query_embeddings:
+            return []
+
+        params: dict[str, Any] = {
+            "query_vecs": [self._vector_param(emb) for emb in query_embeddings],
+            "k": k,
+        }
+        where_clause = _build_where(filters, tenant_id, params)
+        # Binary mode binds a vector[] directly; text mode casts each literal.
+        query_source = (
+            "SELECT v.vec, v.ord FROM unnest(CAST(:query_vecs AS vector[])) "
+            "WITH ORDINALITY AS v(vec, ord)"
+            if self._binary
+            else "SELECT CAST(v.vec AS vector) AS vec, v.ord "
+            "FROM unnest(CAST(:query_vecs AS text[])) WITH ORDINALITY AS v(vec, ord)"
+        )
+
+        query = text(
+            f"""
+            SELECT q.ord,
+                   hit.id,
+                   hit.score,
+                   hit.content,
+                   hit.metadata
+            FROM ({query_source}) AS q
+            CROSS JOIN LATERAL (
+                SELECT id,
+                       1 - (embedding <=> q.vec) AS score,
+                       content,
+                       metadata
+                FROM {self._table}
+                {where_clause}
+                ORDER BY embedding <=> q.vec
+                LIMIT :k
+            ) AS hit
+            ORDER BY q.ord, hit.score DESC
+            """
+        )
+
+        _log.debug(
+            "search_many",
+            table=self._table,
+            queries=len(query_embeddings),
+            k=k,
+            filters=filters,
+            tenant_id=tenant_id,
+        )
+
+        async with self._session_factory() as session:
+            result = await session.execute(query, params)
+            rows = result.fetchall()
+
+        grouped: list[list[VectorSearchResult]] = [[] for _ in query_embeddings]
+        for row in rows:
+            # WITH ORDINALITY is 1-based
+            grouped[int(row[0]) - 1].append(_row_to_result(row[1:]))
+        return grouped
+
+    async def lexical_search(
+        self,
+        *,
+        query: str,
+        k: int = 5,
+        filters: dict[str, Any] | None = None,
+        tenant_id: str | None = None,
+    ) -> list[VectorSearchResult]:
+        """Rank chunks with PostgreSQL full-text search (``LexicalSearch``).
+
+        The query is tokenized like ``to_tsvector('simple', ...)`` and
+        turned into an OR ``tsquery``, so any term may match; rows are
+        ranked by ``ts_rank_cd`` (cover density).  Tenant isolation and
+        metadata filters behave exactly as in :meth:`search`.
+
+        Returns:
+            Up to *k* results ordered by descending ``ts_rank_cd`` score.
+        """
+        terms = list(dict.fromkeys(lexical_tokens(query)))
+        if k <= 0 or not terms:
+            return []
+
+        params: dict[str, Any] = {"tsquery": " | ".join(terms), "k": k}
+        where_clause = _build_where(filters, tenant_id, params)
+        match = f"to_tsvector('{_TS_CONFIG}', content) @@ q.query"
+        where_clause = f"{where_clause} AND {match}" if where_clause else f"WHERE {match}"
+
+        stmt = text(
+            f"""
+            SELECT id,
+                   ts_rank_cd(to_tsvector('{_TS_CONFIG}', content), q.query) AS score,
+                   content,
+                   metadata
+            FROM {self._table},
+                 to_tsquery('{_TS_CONFIG}', :tsquery) AS q(query)
+            {where_clause}
+            ORDER BY score DESC
+            LIMIT :k
+            """
+        )
+
+        _log.debug(
+            "lexical_search",
+            table=self._table,
+            terms=len(terms),
+            k=k,
+            filters=filters,
+            tenant_id=tenant_id,
+        )
+
+        async with self._session_factory() as session:
+            result = await session.execute(stmt, params)
+            rows = result.fetchall()
+
+        return [_row_to_result(row) for row in rows]
 
     async def delete(self, *, ids: list[str]) -> None:
         """Delete chunks by their IDs."""
@@ -265,6 +525,57 @@ class PgVectorStore:
             await session.execute(stmt, {"ids": ids})
             await session.commit()
 
+    async def chunk_hashes(
+        self,
+        *,
+        material_id: str,
+        tenant_id: str | None = None,
+    ) -> dict[str, str | None]:
+        """Map the stored chunk IDs of *material_id* to their ``chunk_hash``.
+
+        Reads only IDs and one JSONB field, never the embeddings.
+        """
+        params: dict[str, Any] = {}
+        where = _build_where({"material_id": material_id}, tenant_id, params)
+        stmt = text(
+            f"SELECT id, metadata->>'chunk_hash' FROM {self._table} {where}"
+        )
+        async with self._session_factory() as session:
+            result = await session.execute(stmt, params)
+            return {row[0]: row[1] for row in result.fetchall()}
+
+
+def _build_where(
+    filters: dict[str, Any] | None,
+    tenant_id: str | None,
+    params: dict[str, Any],
+) -> str:
+    """Build the tenant/metadata WHERE clause, adding its bind values to *params*.
+
+    Structural tenant isolation (ADR-060): the ``tenant_id`` condition is
+    always emitted when a tenant is provided.
+    """
+    conditions: list[str] = []
+    if tenant_id is not None:
+        conditions.append("tenant_id = :tenant_id")
+        params["tenant_id"] = tenant_id
+    if filters:
+        conditions.append("metadata @> CAST(:filter_json AS jsonb)")
+        params["filter_json"] = _json_dumps(filters)
+    if not conditions:
+        return ""
+    return "WHERE " + " AND ".join(conditions)
+
+
+def _row_to_result(row: Any) -> VectorSearchResult:
+    """Map an ``(id, score, content, metadata)`` row to a search result."""
+    return VectorSearchResult(
+        id=row[0],
+        score=float(row[1]),
+        text=row[2],
+        metadata=row[3] if isinstance(row[3], dict) else _json_loads(row[3]),
+    )
+
 
 # -- JSON helpers (avoid import-time dependency on psycopg/asyncpg) -----------
 
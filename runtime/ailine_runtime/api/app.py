@@ -31,6 +31,8 @@ from ..shared.metrics import (
     render_metrics,
 )
 from ..shared.observability import configure_logging
+from ..shared.progress_store import ProgressBackend
+from ..shared.trace_store import TraceBackend
 
 _log = structlog.get_logger("ailine.api.app")
 
@@ -120,6 +122,12 @@ def create_app(settings: Settings | None = None) -> FastAPI:
 
     container = Container.build(settings)
 
+    from .streaming.replay import build_replay_store
+
+    replay_store = build_replay_store(settings)
+    trace_store = _wire_trace_store(settings)
+    progress_store = _wire_progress_store(settings)
+
     @asynccontextmanager
     async def lifespan(_app: FastAPI) -> AsyncIterator[None]:
         """Manage application lifecycle: graceful startup and shutdown."""
@@ -142,6 +150,20 @@ def create_app(settings: Settings | None = None) -> FastAPI:
         yield
         _log.info("app.shutdown_started")
         await container.close()
+        try:
+            await replay_store.close()
+        except Exception:
+            _log.exception("app.replay_store_close_failed")
+        if trace_store is not None:
+            try:
+                await trace_store.close()
+            except Exception:
+                _log.exception("app.trace_store_close_failed")
+        if progress_store is not None:
+            try:
+                await progress_store.close()
+            except Exception:
+                _log.exception("app.progress_store_close_failed")
         _log.info("app.shutdown_complete")
 
     app = FastAPI(
@@ -154,6 +176,7 @@ def create_app(settings: Settings | None = None) -> FastAPI:
     # Store container in app state for access in routers
     app.state.container = container
     app.state.settings = settings
+    app.state.replay_store = replay_store
 
     # Auto-instrument FastAPI with OpenTelemetry spans
     instrument_fastapi(app)
@@ -676,6 +699,45 @@ def _wire_skill_repo(container: Container, skills_v1_module: Any) -> None:
     skills_v1_module.set_skill_repo(repo)
 
 
+def _wire_trace_store(settings: Settings) -> TraceBackend | None:
+    """Install the trace store selected by ``settings.trace`` (/traces, /runs).
+
+    Skips wiring if a store already exists (e.g., created by test fixtures
+    before ``create_app()``).  Returns the installed store so shutdown can
+    flush and close it, or None.
+    """
+    from ..shared.trace_store import build_trace_store, is_trace_store_set, set_trace_store
+
+    if is_trace_store_set():
+        _log.info("trace_store.wired", backend="pre_existing")
+        return None
+    store = build_trace_store(settings)
+    set_trace_store(store)
+    _log.info("trace_store.wired", backend=type(store).__name__)
+    return store
+
+
+def _wire_progress_store(settings: Settings) -> ProgressBackend | None:
+    """Install the progress store selected by ``settings.progress`` (/progress).
+
+    Skips wiring if a store already exists.  Returns the installed store so
+    shutdown can close it, or None.
+    """
+    from ..shared.progress_store import (
+        build_progress_store,
+        is_progress_store_set,
+        set_progress_store,
+    )
+
+    if is_progress_store_set():
+        _log.info("progress_store.wired", backend="pre_existing")
+        return None
+    store = build_progress_store(settings)
+    set_progress_store(store)
+    _log.info("progress_store.wired", backend=type(store).__name__)
+    return store
+
+
 def _wire_user_repo(
     container: Container, auth_module: Any, *, db_url: str = ""
 ) -> None:
@@ -86,7 +86,7 @@ async def seed_demo_data(request: Request) -> dict[str, Any]:
     Requires AILINE_DEMO_MODE=1. Idempotent.
     """
     _require_demo_mode(request, require_token=True)
-    return seed_demo_data_for_teacher()
+    return await seed_demo_data_for_teacher()
 
 
 # ---------------------------------------------------------------------------
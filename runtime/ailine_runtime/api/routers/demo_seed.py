@@ -16,7 +16,7 @@ from .demo_profiles import DEMO_PROFILES
 logger = structlog.get_logger("ailine.api.demo.seed")
 
 
-def seed_demo_data_for_teacher() -> dict[str, Any]:
+async def seed_demo_data_for_teacher() -> dict[str, Any]:
     """Populate stores with sample data for the demo teacher profile.
 
     Idempotent: returns existing data if already seeded.
@@ -166,7 +166,7 @@ def seed_demo_data_for_teacher() -> dict[str, Any]:
          "Benefits from Libras-annotated content"),
     ]
     for student_id, name, code, desc, level, notes in progress_data:
-        p = progress_store.record_progress(
+        p = await progress_store.record_progress(
             teacher_id=teacher_id,
             student_id=student_id,
             student_name=name,
@@ -8,15 +8,20 @@ external services.
 
 from __future__ import annotations
 
+import json
+from collections.abc import AsyncIterator
 from typing import Any, Literal
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Request, UploadFile
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
+from sse_starlette.sse import EventSourceResponse
 
 from ...accessibility.braille_translator import BrfConfig, text_to_brf_bytes
 from ...app.authz import require_authenticated
+from ...app.services.tts_stream import stream_speech
+from ...domain.ports.media import StreamingSTT, TranscriptSegment
 from ...shared.sanitize import sanitize_prompt
 
 logger = structlog.get_logger(__name__)
@@ -39,6 +44,9 @@ class SynthesizeRequest(BaseModel):
     )
     locale: str = Field("pt-BR", description="BCP-47 locale tag.")
     speed: float = Field(1.0, ge=0.25, le=4.0, description="Playback speed multiplier.")
+    stream: bool = Field(
+        False, description="Stream audio sentence by sentence over a chunked response."
+    )
 
 
 class TranscriptionResponse(BaseModel):
@@ -173,6 +181,62 @@ async def transcribe_audio(
     return TranscriptionResponse(text=text)
 
 
+@router.post("/transcribe/stream")
+async def transcribe_audio_stream(
+    request: Request,
+    file: UploadFile,
+    language: str = "pt",
+    _teacher_id: str = Depends(require_authenticated),
+) -> EventSourceResponse:
+    """Transcribe an audio file, streaming segments over SSE as decoded.
+
+    Emits one ``segment`` event per decoded span (``index``, ``start``,
+    ``end``, ``text``) and a final ``done`` event with the full text, or
+    an ``error`` event if transcription fails.  Adapters without
+    segment streaming produce a single segment.
+    """
+    _validate_content_type(file, allowed_prefixes=("audio/",), label="audio")
+    _check_content_length(request, MAX_AUDIO_SIZE, "audio")
+    stt = _get_adapter(request, "stt")
+    audio_bytes = await file.read()
+    if not audio_bytes:
+        raise HTTPException(status_code=400, detail="Empty audio file.")
+    if len(audio_bytes) > MAX_AUDIO_SIZE:
+        raise HTTPException(
+            status_code=413, detail="File too large. Maximum audio size: 10MB."
+        )
+    logger.info("media.transcribe_stream", language=language, size=len(audio_bytes))
+
+    async def segments() -> AsyncIterator[TranscriptSegment]:
+        if isinstance(stt, StreamingSTT):
+            async for segment in stt.transcribe_stream(audio_bytes, language=language):
+                yield segment
+        else:
+            text = await stt.transcribe(audio_bytes, language=language)
+            yield TranscriptSegment(start=0.0, end=0.0, text=text)
+
+    async def event_generator() -> AsyncIterator[dict[str, str]]:
+        texts: list[str] = []
+        try:
+            async for segment in segments():
+                payload = {
+                    "index": len(texts),
+                    "start": segment.start,
+                    "end": segment.end,
+                    "text": segment.text,
+                }
+                texts.append(segment.text)
+                yield {"event": "segment", "data": json.dumps(payload, ensure_ascii=False)}
+        except Exception:
+            logger.exception("media.transcribe_stream_failed")
+            yield {"event": "error", "data": json.dumps({"detail": "Transcription failed."})}
+            return
+        done = {"text": " ".join(texts).strip(), "segments": len(texts)}
+        yield {"event": "done", "data": json.dumps(done, ensure_ascii=False)}
+
+    return EventSourceResponse(event_generator())
+
+
 @router.post("/synthesize")
 async def synthesize_speech(
     request: Request,
@@ -181,7 +245,9 @@ async def synthesize_speech(
 ) -> Response:
     """Synthesize text to audio (TTS).
 
-    Returns raw audio bytes with an appropriate content type.
+    Returns raw audio bytes with an appropriate content type.  With
+    ``stream=true`` the audio is sent in chunks as each sentence is
+    synthesized.
     """
     tts = _get_adapter(request, "tts")
     logger.info(
@@ -189,7 +255,19 @@ async def synthesize_speech(
         locale=body.locale,
         speed=body.speed,
         text_length=len(body.text),
+        stream=body.stream,
     )
+    if body.stream:
+        speech = await stream_speech(
+            tts,
+            body.text,
+            locale=body.locale,
+            speed=body.speed,
+            config=getattr(getattr(request.app.state, "settings", None), "tts", None),
+        )
+        return StreamingResponse(
+            speech.chunks, media_type=speech.media_type, headers=speech.headers
+        )
     audio_bytes = await tts.synthesize(body.text, locale=body.locale, speed=body.speed)
     return Response(
         content=audio_bytes,
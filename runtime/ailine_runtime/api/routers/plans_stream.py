@@ -1,8 +1,14 @@
-"""SSE streaming endpoint for plan generation.
+"""SSE streaming endpoints for plan generation.
 
 POST /plans/generate/stream
 Streams typed SSE events (14 types) as the pipeline progresses.
 
+GET /plans/runs/{run_id}/events
+Resumable stream of a run's events from the replay store (ADR-054),
+honoring ``Last-Event-ID``.  With the Redis replay store the run can be
+followed from any node, and it keeps running when the POST client
+disconnects.
+
 ADR-006: SSE for pipeline, WebSocket for tutor.
 ADR-024: Typed SSE event contract.
 ADR-038: LangGraph custom stream_mode.
@@ -19,19 +25,21 @@ from typing import Any
 
 import structlog
 from ailine_agents import AgentDepsFactory
+from ailine_agents.resilience import IdempotencyGuard
 from ailine_agents.workflows.plan_workflow import build_plan_workflow
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Path, Query, Request
 from pydantic import BaseModel, Field
 from sse_starlette.sse import EventSourceResponse
 
-from ailine_agents.resilience import IdempotencyGuard
-
 from ...app.authz import require_authenticated
+from ...shared.metrics import sse_streams_open
 from ...shared.review_store import get_review_store
 from ...shared.sanitize import sanitize_prompt
 from ...shared.trace_store import get_trace_store
 from ...workflow.plan_workflow import DEFAULT_RECURSION_LIMIT, RunState
+from ..streaming.channel import SSEChannel
 from ..streaming.events import SSEEventEmitter
+from ..streaming.replay import InMemoryReplayStore, ReplayStore, persist_events
 
 logger = structlog.get_logger("ailine.api.plans_stream")
 
@@ -40,9 +48,44 @@ router = APIRouter()
 # Heartbeat interval to keep the connection alive (seconds).
 _HEARTBEAT_INTERVAL_S = 15.0
 
+# A resumed stream ends after this long without a new event (e.g. the
+# node running the pipeline died before emitting a terminal event).
+_TAIL_IDLE_TIMEOUT_S = 600.0
+
+_RUN_ID_PATTERN = r"^[a-zA-Z0-9_-]+$"
+
+_SSE_HEADERS = {
+    "X-Accel-Buffering": "no",
+    "Cache-Control": "no-cache, no-store",
+    "Connection": "keep-alive",
+}
+
 # Idempotency guard -- prevent duplicate concurrent runs with the same run_id.
 _idempotency_guard = IdempotencyGuard(ttl_seconds=300.0, max_size=1000)
 
+# Runs whose client went away keep executing (resumable via GET
+# /plans/runs/{run_id}/events); hold references so they are not collected.
+_background_runs: set[asyncio.Task[None]] = set()
+
+# Fallback for apps that were not built by create_app (single-node only).
+_local_replay_store = InMemoryReplayStore()
+
+
+def _get_replay_store(request: Request) -> ReplayStore:
+    store: ReplayStore | None = getattr(request.app.state, "replay_store", None)
+    return store if store is not None else _local_replay_store
+
+
+def _parse_event_id(value: str | None) -> int | None:
+    """Seq from a ``Last-Event-ID`` header; ignores malformed values."""
+    if value is None:
+        return None
+    try:
+        seq = int(value.strip())
+    except ValueError:
+        return None
+    return seq if seq >= 0 else None
+
 
 class PlanStreamIn(BaseModel):
     """Request body for streaming plan generation."""
@@ -51,7 +94,7 @@ class PlanStreamIn(BaseModel):
         ...,
         min_length=1,
         max_length=128,
-        pattern=r"^[a-zA-Z0-9_-]+$",
+        pattern=_RUN_ID_PATTERN,
         description="Client-generated run ID for observability (alphanumeric, hyphens, underscores).",
     )
     user_prompt: str = Field(
@@ -71,11 +114,11 @@ class PlanStreamIn(BaseModel):
 
 async def _heartbeat_loop(
     emitter: SSEEventEmitter,
-    queue: asyncio.Queue[dict[str, str] | None],
+    channel: SSEChannel,
     done: asyncio.Event,
     interval: float = _HEARTBEAT_INTERVAL_S,
 ) -> None:
-    """Push heartbeat events into the queue at a fixed interval.
+    """Publish heartbeat events to the channel at a fixed interval.
 
     Stops when the ``done`` event is set or the task is cancelled.
     """
@@ -84,8 +127,7 @@ async def _heartbeat_loop(
             await asyncio.sleep(interval)
             if done.is_set():
                 return
-            event = emitter.heartbeat()
-            await queue.put({"data": event.to_sse_data()})
+            channel.publish(emitter.heartbeat())
     except asyncio.CancelledError:
         return  # Graceful shutdown: pipeline finished, heartbeat no longer needed
 
@@ -96,11 +138,22 @@ async def _run_pipeline(
     settings: Any,
     container: Any,
     emitter: SSEEventEmitter,
-    queue: asyncio.Queue[dict[str, str] | None],
+    channel: SSEChannel,
     idem_key: str,
     done: asyncio.Event,
+    replay_channel: SSEChannel | None = None,
 ) -> None:
-    """Execute the LangGraph plan workflow, pushing SSE events to the queue."""
+    """Execute the LangGraph plan workflow, publishing SSE events to the channel.
+
+    When *replay_channel* is given every event is also published there
+    for persistence in the replay store.
+    """
+
+    def publish(event: Any) -> None:
+        channel.publish(event)
+        if replay_channel is not None:
+            replay_channel.publish(event)
+
     trace_store = None
     try:
         # Initialize trace (tenant-scoped for isolation)
@@ -125,15 +178,12 @@ async def _run_pipeline(
         )
         workflow = build_plan_workflow(deps)
 
-        # Synchronous writer callback: puts events into the async queue.
-        # Because LangGraph node functions are already async, this runs
-        # inside the same event loop -- asyncio.Queue.put_nowait is safe.
-        # Wrapped in try/except to prevent QueueFull from crashing the pipeline.
+        # Synchronous writer callback.  LangGraph node functions are
+        # async, so this runs inside the same event loop; publish never
+        # blocks or raises -- a slow client gets progress coalesced
+        # instead of stalling the pipeline.
         def stream_writer(event: Any) -> None:
-            try:
-                queue.put_nowait({"data": event.to_sse_data()})
-            except asyncio.QueueFull:
-                logger.warning("sse_queue_full", run_id=body.run_id)
+            publish(event)
 
         init_state: RunState = {
             "run_id": body.run_id,
@@ -154,8 +204,7 @@ async def _run_pipeline(
         }
 
         # Emit run start
-        start_event = emitter.run_start({"prompt": body.user_prompt[:200]})
-        await queue.put({"data": start_event.to_sse_data()})
+        publish(emitter.run_start({"prompt": body.user_prompt[:200]}))
 
         # Execute the full workflow
         final_state = await workflow.ainvoke(init_state, config=config)
@@ -176,8 +225,7 @@ async def _run_pipeline(
         if scorecard:
             final_payload["scorecard"] = scorecard
 
-        complete_event = emitter.run_complete(final_payload)
-        await queue.put({"data": complete_event.to_sse_data()})
+        publish(emitter.run_complete(final_payload))
 
         # Post-completion side-effects: wrapped separately so a failure
         # here does NOT trigger the outer except (which would emit a
@@ -207,8 +255,7 @@ async def _run_pipeline(
             error=str(exc),
             tb=traceback.format_exc(),
         )
-        error_event = emitter.run_failed(str(exc), stage="pipeline")
-        await queue.put({"data": error_event.to_sse_data()})
+        publish(emitter.run_failed(str(exc), stage="pipeline"))
 
         # Mark trace as failed (guard against trace_store init failure)
         if trace_store is not None:
@@ -217,8 +264,10 @@ async def _run_pipeline(
     finally:
         done.set()
         _idempotency_guard.complete(idem_key, None)
-        # Sentinel to signal the generator to stop
-        await queue.put(None)
+        # The generator stops once the remaining events are delivered
+        channel.close()
+        if replay_channel is not None:
+            replay_channel.close()
 
 
 @router.post("/generate/stream")
@@ -252,48 +301,121 @@ async def plans_generate_stream(
     if not _idempotency_guard.try_acquire(idem_key):
         raise HTTPException(status_code=409, detail="A run with this ID is already in progress")
 
-    emitter = SSEEventEmitter(safe_body.run_id)
-    queue: asyncio.Queue[dict[str, str] | None] = asyncio.Queue(maxsize=500)
+    run_id = safe_body.run_id
+    replay_store = _get_replay_store(request)
+    try:
+        claimed = await replay_store.bind_owner(run_id, teacher_id)
+    except Exception as exc:
+        # Live delivery still works; only resumption is unavailable.
+        logger.warning("replay_bind_owner_failed", run_id=run_id, error=str(exc))
+        claimed = True
+    if not claimed:
+        _idempotency_guard.fail(idem_key)
+        raise HTTPException(status_code=409, detail="Run ID belongs to another user")
+
+    emitter = SSEEventEmitter(run_id)
+    channel = SSEChannel(run_id)
+    replay_channel = SSEChannel(run_id)
     done = asyncio.Event()
 
     async def event_generator() -> AsyncIterator[dict[str, str]]:
-        # Start the pipeline and heartbeat as background tasks
+        # The pipeline and its replay writer run as background tasks that
+        # outlive this response if the client disconnects.
         pipeline_task = asyncio.create_task(
-            _run_pipeline(safe_body, teacher_id, settings, container, emitter, queue, idem_key, done)
+            _run_pipeline(
+                safe_body,
+                teacher_id,
+                settings,
+                container,
+                emitter,
+                channel,
+                idem_key,
+                done,
+                replay_channel=replay_channel,
+            )
+        )
+        persist_task = asyncio.create_task(
+            persist_events(replay_store, run_id, replay_channel)
         )
-        heartbeat_task = asyncio.create_task(_heartbeat_loop(emitter, queue, done))
+        for task in (pipeline_task, persist_task):
+            _background_runs.add(task)
+            task.add_done_callback(_background_runs.discard)
+        heartbeat_task = asyncio.create_task(_heartbeat_loop(emitter, channel, done))
+        sse_streams_open.inc()
 
         try:
-            while True:
-                # Check if client disconnected
-                if await request.is_disconnected():  # pragma: no cover
-                    logger.info("client_disconnected", run_id=body.run_id)
-                    break
-
-                try:
-                    item = await asyncio.wait_for(queue.get(), timeout=1.0)
-                except TimeoutError:  # pragma: no cover
-                    continue
-
-                if item is None:
-                    # Pipeline finished (sentinel)
-                    break
-
-                yield item
+            async for event in channel:
+                yield {"id": str(event.seq), "data": event.to_sse_data()}
         finally:
+            sse_streams_open.dec()
+            finished = channel.closed
+            stats = channel.stats()
+            channel.detach()
+            if stats["coalesced"] or stats["dropped"]:
+                logger.info("sse_events_shed", run_id=run_id, **stats)
             heartbeat_task.cancel()
-            if not pipeline_task.done():  # pragma: no cover
-                pipeline_task.cancel()
+            tasks = [heartbeat_task]
+            if finished:
+                # Run over: let the replay writer store the tail of the run
+                tasks += [pipeline_task, persist_task]
+            else:
+                logger.info("run_detached_from_client", run_id=run_id)
             # Suppress CancelledError from background tasks
-            for task in (heartbeat_task, pipeline_task):
+            for task in tasks:
                 with contextlib.suppress(asyncio.CancelledError, Exception):
                     await task
 
+    async def on_disconnect(_message: Any) -> None:
+        # sse-starlette watches the ASGI receive channel for
+        # http.disconnect and cancels the generator; detaching here also
+        # stops buffering for a client that is gone.
+        logger.info("client_disconnected", run_id=run_id)
+        channel.detach()
+
     return EventSourceResponse(
         event_generator(),
-        headers={
-            "X-Accel-Buffering": "no",
-            "Cache-Control": "no-cache, no-store",
-            "Connection": "keep-alive",
-        },
+        client_close_handler_callable=on_disconnect,
+        headers=_SSE_HEADERS,
     )
+
+
+@router.get("/runs/{run_id}/events")
+async def plans_run_events(
+    request: Request,
+    run_id: str = Path(..., min_length=1, max_length=128, pattern=_RUN_ID_PATTERN),
+    last_event_id: str | None = Header(None, alias="Last-Event-ID"),
+    after_seq: int | None = Query(
+        None, ge=0, description="Resume after this seq (for clients that cannot set headers)."
+    ),
+    teacher_id: str = Depends(require_authenticated),
+) -> EventSourceResponse:
+    """Stream a run's events from the replay store, resuming after a given seq.
+
+    Replays the buffered events after ``Last-Event-ID`` (or ``after_seq``),
+    then follows the run live until its terminal event.  Works from any
+    node when the Redis replay store is configured.
+    """
+    replay_store = _get_replay_store(request)
+    try:
+        owner = await replay_store.owner(run_id)
+    except Exception as exc:
+        logger.warning("replay_owner_lookup_failed", run_id=run_id, error=str(exc))
+        raise HTTPException(status_code=503, detail="Replay store unavailable.") from exc
+    if owner != teacher_id:
+        raise HTTPException(status_code=404, detail="Run not found")
+
+    resume_after = _parse_event_id(last_event_id)
+    if after_seq is not None:
+        resume_after = max(after_seq, resume_after or 0)
+
+    async def event_generator() -> AsyncIterator[dict[str, str]]:
+        sse_streams_open.inc()
+        try:
+            async for seq, payload in replay_store.tail(
+                run_id, resume_after, idle_timeout=_TAIL_IDLE_TIMEOUT_S
+            ):
+                yield {"id": str(seq), "data": payload}
+        finally:
+            sse_streams_open.dec()
+
+    return EventSourceResponse(event_generator(), headers=_SSE_HEADERS)
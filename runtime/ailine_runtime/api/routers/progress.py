@@ -52,7 +52,7 @@ async def progress_record(body: ProgressRecordIn) -> dict[str, Any]:
         ) from exc
 
     store = get_progress_store()
-    progress = store.record_progress(
+    progress = await store.record_progress(
         teacher_id=teacher_id,
         student_id=body.student_id,
         student_name=body.student_name,
@@ -69,7 +69,7 @@ async def progress_dashboard() -> dict:
     """Get class progress overview for the authenticated teacher."""
     teacher_id = require_authenticated()
     store = get_progress_store()
-    summary = store.get_dashboard(teacher_id)
+    summary = await store.get_dashboard(teacher_id)
     return summary.model_dump()
 
 
@@ -93,7 +93,7 @@ async def progress_student(student_id: str) -> list[dict[str, Any]]:
                 detail="Students can only view their own progress.",
             )
         # Aggregate across all teachers' records for this student
-        all_records = store.get_student_all_teachers(student_id)
+        all_records = await store.get_student_all_teachers(student_id)
         if not all_records:
             raise HTTPException(
                 status_code=404,
@@ -103,12 +103,12 @@ async def progress_student(student_id: str) -> list[dict[str, Any]]:
 
     # Parents: must have a verified linkage to this student (FERPA compliance)
     if role == UserRole.PARENT:
-        if not store.is_parent_linked(user_id, student_id):
+        if not await store.is_parent_linked(user_id, student_id):
             raise HTTPException(
                 status_code=403,
                 detail="Access denied: you are not linked to this student.",
             )
-        all_records = store.get_student_all_teachers(student_id)
+        all_records = await store.get_student_all_teachers(student_id)
         if not all_records:
             raise HTTPException(
                 status_code=404,
@@ -117,7 +117,7 @@ async def progress_student(student_id: str) -> list[dict[str, Any]]:
         return [r.model_dump() for r in all_records]
 
     # Teacher/admin: view records they own
-    records = store.get_student(user_id, student_id)
+    records = await store.get_student(user_id, student_id)
     if not records:
         raise HTTPException(
             status_code=404,
@@ -139,7 +139,7 @@ async def progress_overview() -> dict[str, Any]:
     store = get_progress_store()
 
     if role == UserRole.STUDENT:
-        records = store.get_student_all_teachers(user_id)
+        records = await store.get_student_all_teachers(user_id)
         return {
             "role": "student",
             "student_id": user_id,
@@ -157,7 +157,7 @@ async def progress_overview() -> dict[str, Any]:
         }
 
     # Teacher/admin
-    summary = store.get_dashboard(user_id)
+    summary = await store.get_dashboard(user_id)
     return {
         "role": role or "teacher",
         **summary.model_dump(),
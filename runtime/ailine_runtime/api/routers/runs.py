@@ -29,13 +29,12 @@ async def list_runs(
     and offset-based pagination via ``limit`` + ``offset``.
     """
     store = get_trace_store()
-    # F-259: Server-side status filtering (moved from client-side to store)
-    all_traces = await store.list_recent(
-        limit=500, teacher_id=teacher_id, status=status,
+    # F-259: Server-side status filtering (moved from client-side to store);
+    # the store pages too, so only the requested runs are loaded.
+    page = await store.list_recent(
+        limit=limit, teacher_id=teacher_id, status=status, offset=offset,
     )
-
-    total = len(all_traces)
-    page = all_traces[offset : offset + limit]
+    total = await store.count(teacher_id=teacher_id, status=status)
 
     return {
         "items": [
@@ -11,10 +11,11 @@ from typing import Any
 
 import structlog
 from fastapi import APIRouter, Depends, HTTPException, Request
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from ...app.authz import require_teacher_or_admin
+from ...app.services.tts_stream import stream_speech
 
 logger = structlog.get_logger(__name__)
 
@@ -48,6 +49,13 @@ class TTSSynthesizeRequest(BaseModel):
         le=4.0,
         description="Playback speed multiplier.",
     )
+    stream: bool = Field(
+        False,
+        description=(
+            "Stream audio sentence by sentence over a chunked response "
+            "instead of waiting for the whole text to be synthesized."
+        ),
+    )
 
 
 class VoiceInfoResponse(BaseModel):
@@ -99,6 +107,8 @@ async def synthesize_speech(
     """Synthesize text into audio.
 
     Returns raw audio bytes (audio/mpeg for ElevenLabs, audio/wav for fake).
+    With ``stream=true`` the audio is sent in chunks as each sentence is
+    synthesized.
     """
     tts = _get_tts(request)
 
@@ -108,8 +118,21 @@ async def synthesize_speech(
         language=body.language,
         speed=body.speed,
         text_length=len(body.text),
+        stream=body.stream,
     )
 
+    if body.stream:
+        speech = await stream_speech(
+            tts,
+            body.text,
+            locale=body.language,
+            speed=body.speed,
+            config=getattr(getattr(request.app.state, "settings", None), "tts", None),
+        )
+        return StreamingResponse(
+            speech.chunks, media_type=speech.media_type, headers=speech.headers
+        )
+
     audio_bytes = await tts.synthesize(
         body.text, locale=body.language, speed=body.speed
     )
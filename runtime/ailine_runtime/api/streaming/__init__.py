@@ -1,3 +1,4 @@
+from .channel import SSEChannel
 from .events import SSEEvent, SSEEventEmitter, SSEEventType
 
-__all__ = ["SSEEvent", "SSEEventEmitter", "SSEEventType"]
+__all__ = ["SSEChannel", "SSEEvent", "SSEEventEmitter", "SSEEventType"]
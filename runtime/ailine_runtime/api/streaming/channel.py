@@ -0,0 +1,197 @@
+"""Per-run SSE delivery channel with bounded, coalescing buffering.
+
+Sits between the pipeline (producer) and the SSE response (consumer) of
+one run.  Publishing never blocks the pipeline and never raises; when
+the client reads slower than the pipeline emits, the channel sheds only
+events that carry no information the client will miss:
+
+- ``stage.progress`` is coalesced: once the buffer holds ``capacity``
+  events, a new progress event replaces the one still pending for the
+  same stage, so only the latest progress per stage is kept;
+- ``heartbeat`` is dropped while other events are pending (those keep
+  the connection alive anyway).
+
+Every other event -- run/stage lifecycle, quality, tool and terminal
+events -- is always delivered, in order.  Progress and heartbeats are
+the only unbounded event streams, so the buffer is bounded by
+``capacity`` plus one progress event per stage plus the pipeline's
+lifecycle events.  Shed events leave gaps in ``seq``, which the event
+contract already allows (ADR-024).
+"""
+
+from __future__ import annotations
+
+import asyncio
+from collections import deque
+from collections.abc import AsyncIterator
+
+from ...shared.metrics import sse_events_shed_total, sse_queue_depth
+from .events import SSEEvent, SSEEventType
+
+DEFAULT_CAPACITY = 256
+
+
+class _Entry:
+    __slots__ = ("event", "live")
+
+    def __init__(self, event: SSEEvent) -> None:
+        self.event = event
+        self.live = True
+
+
+class SSEChannel:
+    """Bounded single-producer, single-consumer event buffer for one run.
+
+    The producer calls :meth:`publish` for every event and :meth:`close`
+    once the run is over; the consumer iterates the channel (``async
+    for``) until it is closed and drained, and calls :meth:`detach` when
+    the client goes away, which discards the buffer and turns further
+    publishes into no-ops.
+
+    Parameters
+    ----------
+    run_id:
+        Run the channel delivers events for.
+    capacity:
+        Buffered events beyond which progress is coalesced.
+    """
+
+    def __init__(self, run_id: str, *, capacity: int = DEFAULT_CAPACITY) -> None:
+        self._run_id = run_id
+        self._capacity = max(1, capacity)
+        self._buffer: deque[_Entry] = deque()
+        self._progress: dict[str, _Entry] = {}
+        self._depth = 0
+        self._peak_depth = 0
+        self._coalesced = 0
+        self._dropped = 0
+        self._closed = False
+        self._detached = False
+        self._readable = asyncio.Event()
+        # Metrics are synced from the consumer side: publishing is the hot
+        # path under pressure and must not take the metric locks per event.
+        self._reported_depth = 0
+        self._unreported_shed: dict[tuple[str, str], int] = {}
+
+    @property
+    def run_id(self) -> str:
+        return self._run_id
+
+    @property
+    def depth(self) -> int:
+        """Events waiting to be delivered."""
+        return self._depth
+
+    @property
+    def closed(self) -> bool:
+        """Whether the producer has finished."""
+        return self._closed
+
+    @property
+    def detached(self) -> bool:
+        """Whether the consumer has gone away."""
+        return self._detached
+
+    def stats(self) -> dict[str, int]:
+        """Buffering snapshot (for logs, tests and benchmarks)."""
+        return {
+            "depth": self._depth,
+            "peak_depth": self._peak_depth,
+            "coalesced": self._coalesced,
+            "dropped": self._dropped,
+        }
+
+    # -- Producer side ----------------------------------------------------------
+
+    def publish(self, event: SSEEvent) -> None:
+        """Buffer *event* for delivery; never blocks.
+
+        Safe to call from synchronous callbacks running on the event loop
+        (the LangGraph stream writer).  Ignored once the channel is
+        closed or detached.
+        """
+        if self._closed or self._detached:
+            return
+        if event.type == SSEEventType.HEARTBEAT and self._depth:
+            self._shed(event, "dropped")
+            return
+        entry = _Entry(event)
+        if event.type == SSEEventType.STAGE_PROGRESS:
+            pending = self._progress.get(event.stage)
+            if pending is not None and self._depth >= self._capacity:
+                self._shed(pending.event, "coalesced")
+                if self._buffer[-1] is pending:
+                    # Still the newest entry: overwrite in place
+                    pending.event = event
+                    return
+                # Keep the stream's seq order monotonic: retire the stale
+                # update and append the latest one.
+                pending.live = False
+                self._depth -= 1
+            self._progress[event.stage] = entry
+        self._buffer.append(entry)
+        self._depth += 1
+        self._peak_depth = max(self._peak_depth, self._depth)
+        self._readable.set()
+
+    def close(self) -> None:
+        """Mark the run as finished; the consumer stops once drained."""
+        self._closed = True
+        self._readable.set()
+
+    # -- Consumer side ----------------------------------------------------------
+
+    async def get(self) -> SSEEvent | None:
+        """Next event in order, or ``None`` once closed and drained."""
+        while True:
+            while self._buffer:
+                entry = self._buffer.popleft()
+                if not entry.live:
+                    continue
+                self._depth -= 1
+                event = entry.event
+                if (
+                    event.type == SSEEventType.STAGE_PROGRESS
+                    and self._progress.get(event.stage) is entry
+                ):
+                    del self._progress[event.stage]
+                self._report()
+                return event
+            self._report()
+            if self._closed or self._detached:
+                return None
+            self._readable.clear()
+            await self._readable.wait()
+
+    def detach(self) -> None:
+        """Consumer gone: discard buffered events and wake a waiting reader."""
+        if self._detached:
+            return
+        self._detached = True
+        self._depth = 0
+        self._buffer.clear()
+        self._progress.clear()
+        self._report()
+        self._readable.set()
+
+    async def __aiter__(self) -> AsyncIterator[SSEEvent]:
+        while (event := await self.get()) is not None:
+            yield event
+
+    def _shed(self, event: SSEEvent, reason: str) -> None:
+        if reason == "coalesced":
+            self._coalesced += 1
+        else:
+            self._dropped += 1
+        key = (reason, event.type.value)
+        self._unreported_shed[key] = self._unreported_shed.get(key, 0) + 1
+
+    def _report(self) -> None:
+        """Bring the depth gauge and shed counters up to date."""
+        if self._depth != self._reported_depth:
+            sse_queue_depth.inc(self._depth - self._reported_depth)
+            self._reported_depth = self._depth
+        if self._unreported_shed:
+            for (reason, event_type), count in self._unreported_shed.items():
+                sse_events_shed_total.inc(count, reason=reason, type=event_type)
+            self._unreported_shed.clear()
@@ -6,17 +6,30 @@ and the SSEEventEmitter that manages run-scoped sequencing.
 ADR-024: Typed SSE event contract -- lifecycle + quality + tool events with seq/run_id.
 ADR-038: LangGraph custom stream_mode for SSE -- get_stream_writer() gives full control.
 FINDING-22: Thread-safe emission with asyncio.Lock for parallel LangGraph branches.
+
+Serialization is on the hot path (every event is sent to the client and
+stored for replay), so events are encoded once and cached: a per-run
+envelope prefix is reused, the payload goes through orjson when it is
+installed, and pydantic's ``model_dump_json`` is the fallback for values
+neither encoder handles natively.
 """
 
 from __future__ import annotations
 
 import asyncio
+import functools
 import json
+from collections.abc import Mapping
 from datetime import UTC, datetime
 from enum import StrEnum
-from typing import Any
+from typing import Any, Self
+
+from pydantic import BaseModel, Field, PrivateAttr
 
-from pydantic import BaseModel, Field
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson ships with langgraph/langsmith
+    orjson = None  # type: ignore[assignment]
 
 
 class SSEEventType(StrEnum):
@@ -52,6 +65,19 @@ class SSEEventType(StrEnum):
     HEARTBEAT = "heartbeat"
 
 
+def _dumps(value: Any) -> str:
+    """Compact JSON (UTF-8 preserved); raises TypeError for unsupported values."""
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"))
+
+
+@functools.lru_cache(maxsize=1024)
+def _envelope_prefix(run_id: str) -> str:
+    """``{"run_id":...,"seq":`` -- identical for every event of a run."""
+    return '{"run_id":' + _dumps(run_id) + ',"seq":'
+
+
 class SSEEvent(BaseModel):
     """SSE event envelope: {run_id, seq, ts, type, stage, payload}.
 
@@ -67,9 +93,46 @@ class SSEEvent(BaseModel):
     stage: str
     payload: dict[str, Any] = Field(default_factory=dict)
 
+    _sse_data: str | None = PrivateAttr(default=None)
+
     def to_sse_data(self) -> str:
-        """Serialize to JSON string suitable for SSE data field."""
-        return json.dumps(self.model_dump(), ensure_ascii=False)
+        """Serialize to JSON string suitable for SSE data field.
+
+        Encoded once per event: the live stream and the replay store
+        share the same string.
+        """
+        data = self._sse_data
+        if data is None:
+            try:
+                data = (
+                    f"{_envelope_prefix(self.run_id)}{self.seq},"
+                    f'"ts":{_dumps(self.ts)},"type":"{self.type.value}",'
+                    f'"stage":{_dumps(self.stage)},"payload":{_dumps(self.payload)}}}'
+                )
+            except TypeError:
+                # Values orjson/json cannot encode natively (pydantic models,
+                # sets, oversized ints...): let pydantic serialize them.
+                data = self.model_dump_json()
+            self._sse_data = data
+        return data
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Reassigning a field invalidates the cached encoding (in-place
+        # mutation of ``payload`` after the first encode is not detected).
+        super().__setattr__(name, value)
+        if name in SSEEvent.model_fields:
+            self._sse_data = None
+
+    def model_copy(self, *, update: Mapping[str, Any] | None = None, deep: bool = False) -> Self:
+        copied = super().model_copy(update=update, deep=deep)
+        copied._sse_data = None
+        return copied
+
+    def __eq__(self, other: object) -> bool:
+        # The serialization cache is not part of the event's identity.
+        if isinstance(other, SSEEvent):
+            return self.__dict__ == other.__dict__
+        return NotImplemented
 
 
 class SSEEventEmitter:
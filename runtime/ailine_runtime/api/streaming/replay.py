@@ -3,14 +3,90 @@
 Stores the last N events per run_id in a Redis ZSET (score = seq).
 On reconnection with Last-Event-ID, replays missed events.
 
+``tail()`` follows a run live: it backfills from the buffer, then waits
+for appends (an in-process signal, or a Redis pub/sub notification
+published with every append) until the run is marked terminal.  With
+the Redis store this lets a client watch a run executing on another
+node.
+
 When Redis is unavailable, falls back to an in-memory store
 (suitable for single-instance dev/test).
 """
 
 from __future__ import annotations
 
+import asyncio
+import contextlib
+import time
 from collections import defaultdict
+from collections.abc import AsyncIterator, Awaitable
 from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Protocol, cast
+
+from ...shared.metrics import replay_flush_duration, replay_flush_events
+from ...shared.observability import get_logger
+from .events import SSEEventType
+
+if TYPE_CHECKING:
+    from ...shared.config import Settings
+    from .channel import SSEChannel
+
+_log = get_logger("ailine.streaming.replay")
+
+# Fallback re-check interval while tailing (a notification may be lost,
+# e.g. across a Redis reconnect).
+_TAIL_POLL_INTERVAL_S = 1.0
+
+# Flush retries after a failed pipeline write (connection blip, timeout),
+# with exponential backoff from _FLUSH_BACKOFF_S.  Writes are idempotent
+# (ZADD of the same score/member pairs), so a partial write is safe to redo.
+_FLUSH_ATTEMPTS = 3
+_FLUSH_BACKOFF_S = 0.05
+
+_TERMINAL_TYPES = {
+    SSEEventType.RUN_COMPLETE: "completed",
+    SSEEventType.RUN_FAILED: "failed",
+}
+
+# Serialized SSEEvent envelopes start with this and embed their seq, so
+# they are unique ZSET members as-is; anything else is stored as
+# "{seq}|{payload}".
+_ENVELOPE_HEAD = '{"run_id":'
+
+
+def _member(seq: int, payload: str) -> str:
+    if payload.startswith(_ENVELOPE_HEAD):
+        return payload
+    return f"{seq}|{payload}"
+
+
+# One flush of a run's buffered events: add them, trim to keep_last,
+# refresh both TTLs and wake tailers -- a single round trip per run.
+# KEYS: events zset, seq counter
+# ARGV: keep_last, ttl, notify channel, last seq, then score/member pairs
+_FLUSH_LUA = """
+redis.call('ZADD', KEYS[1], unpack(ARGV, 5))
+redis.call('ZREMRANGEBYRANK', KEYS[1], 0, -(tonumber(ARGV[1]) + 1))
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+redis.call('EXPIRE', KEYS[2], ARGV[2])
+redis.call('PUBLISH', ARGV[3], ARGV[4])
+return 1
+"""
+
+
+# Claim a run_id for a tenant: fails if another tenant owns it, otherwise
+# (re)sets the owner and drops any previous run's events and terminal marker.
+# KEYS: owner, events zset, terminal
+# ARGV: owner, ttl
+_CLAIM_LUA = """
+local current = redis.call('GET', KEYS[1])
+if current and current ~= ARGV[1] then
+    return 0
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+redis.call('DEL', KEYS[2], KEYS[3])
+return 1
+"""
 
 
 @dataclass(frozen=True)
@@ -20,18 +96,58 @@ class ReplayConfig:
     ttl_seconds: int = 30 * 60  # 30 minutes
     keep_last: int = 100
     prefix: str = "runs"
+    # Write-behind batching (RedisReplayStore): appends are buffered for up
+    # to batch_window_ms, or until a run has batch_max_events pending, then
+    # written in one pipeline.  batch_window_ms=0 writes through.
+    batch_window_ms: float = 5.0
+    batch_max_events: int = 64
+
+
+class ReplayStore(Protocol):
+    """Operations shared by the replay store implementations."""
+
+    async def append(self, run_id: str, seq: int, payload: str) -> None: ...
+
+    async def replay(
+        self, run_id: str, after_seq: int | None = None
+    ) -> list[tuple[int, str]]: ...
+
+    async def mark_terminal(self, run_id: str, terminal_type: str) -> bool: ...
+
+    async def is_terminal(self, run_id: str) -> bool: ...
+
+    async def bind_owner(self, run_id: str, owner: str) -> bool: ...
+
+    async def owner(self, run_id: str) -> str | None: ...
+
+    def tail(
+        self,
+        run_id: str,
+        after_seq: int | None = None,
+        *,
+        idle_timeout: float | None = None,
+    ) -> AsyncIterator[tuple[int, str]]: ...
+
+    async def close(self) -> None: ...
 
 
 class InMemoryReplayStore:
     """In-memory replay store for single-instance dev/test.
 
-    Uses a dict of lists, trimmed to keep_last entries.
-    No TTL enforcement (entries persist until process restart).
+    Uses a dict of lists, trimmed to keep_last entries.  A run is dropped
+    (events, terminal marker and owner) ttl_seconds after it is marked
+    terminal; expired runs are swept on the next ``bind_owner`` or
+    ``mark_terminal``.
     """
 
     def __init__(self, config: ReplayConfig | None = None) -> None:
         self._config = config or ReplayConfig()
         self._store: dict[str, list[tuple[int, str]]] = defaultdict(list)
+        self._owners: dict[str, str] = {}
+        self._signals: dict[str, asyncio.Event] = {}
+        # run_id -> monotonic expiry, in terminal order (constant TTL, so
+        # also expiry order).
+        self._expiry: dict[str, float] = {}
 
     async def append(self, run_id: str, seq: int, payload: str) -> None:
         """Append an event to the replay buffer."""
@@ -40,6 +156,7 @@ class InMemoryReplayStore:
         # Trim to keep_last
         if len(entries) > self._config.keep_last:
             self._store[run_id] = entries[-self._config.keep_last :]
+        self._notify(run_id)
 
     async def replay(
         self, run_id: str, after_seq: int | None = None
@@ -61,23 +178,111 @@ class InMemoryReplayStore:
 
     async def mark_terminal(self, run_id: str, terminal_type: str) -> bool:
         """Mark a run as terminated. Returns True if this was the first terminal marker."""
+        self._evict_expired()
         key = f"_terminal:{run_id}"
         if key in self._store:
             return False
         self._store[key] = [(0, terminal_type)]
+        self._expiry[run_id] = time.monotonic() + self._config.ttl_seconds
+        self._notify(run_id)
         return True
 
     async def is_terminal(self, run_id: str) -> bool:
         """Check if a run has been marked as terminal."""
         return f"_terminal:{run_id}" in self._store
 
+    async def bind_owner(self, run_id: str, owner: str) -> bool:
+        """Claim *run_id* for *owner*; False if another tenant owns it.
+
+        Re-claiming one's own run_id starts a fresh run: the previous
+        events and terminal marker are dropped.
+        """
+        self._evict_expired()
+        if self._owners.setdefault(run_id, owner) != owner:
+            return False
+        self._store.pop(run_id, None)
+        self._store.pop(f"_terminal:{run_id}", None)
+        self._expiry.pop(run_id, None)
+        return True
+
+    async def owner(self, run_id: str) -> str | None:
+        """Tenant the run belongs to, or None for an unknown run."""
+        return self._owners.get(run_id)
+
+    async def tail(
+        self,
+        run_id: str,
+        after_seq: int | None = None,
+        *,
+        idle_timeout: float | None = None,
+    ) -> AsyncIterator[tuple[int, str]]:
+        """Replay events after *after_seq*, then follow new ones live.
+
+        Ends once the run is terminal and every event has been yielded,
+        or after *idle_timeout* seconds without a new event.
+        """
+        while True:
+            # Take the signal before reading so an append racing with the
+            # read still wakes us up.
+            signal = self._signals.setdefault(run_id, asyncio.Event())
+            terminal = await self.is_terminal(run_id)
+            if terminal:
+                # Nothing will notify a terminal run again; tailers that
+                # see it terminal never wait, so the signal can go.
+                self._signals.pop(run_id, None)
+            events = await self.replay(run_id, after_seq)
+            for seq, payload in events:
+                after_seq = seq
+                yield seq, payload
+            if events:
+                continue
+            if terminal:
+                return
+            try:
+                await asyncio.wait_for(signal.wait(), timeout=idle_timeout)
+            except TimeoutError:
+                return
+
+    async def close(self) -> None:
+        """Nothing to release (kept for interface parity)."""
+
+    def _notify(self, run_id: str) -> None:
+        signal = self._signals.pop(run_id, None)
+        if signal is not None:
+            signal.set()
+
+    def _evict_expired(self) -> None:
+        now = time.monotonic()
+        while self._expiry:
+            run_id, expires_at = next(iter(self._expiry.items()))
+            if expires_at > now:
+                return
+            del self._expiry[run_id]
+            self._store.pop(run_id, None)
+            self._store.pop(f"_terminal:{run_id}", None)
+            self._owners.pop(run_id, None)
+            self._signals.pop(run_id, None)
+
 
 class RedisReplayStore:
     """Redis-backed replay store using Sorted Sets (ADR-054).
 
-    ZSET key: {prefix}:{run_id}:events (score = seq, member = "{seq}|{payload}")
+    ZSET key: {prefix}:{run_id}:events (score = seq, member = the serialized
+    event envelope verbatim, or "{seq}|{payload}" for other payloads)
     Terminal key: {prefix}:{run_id}:terminal (SET NX EX)
     Seq counter: {prefix}:{run_id}:seq (INCR)
+    Owner key: {prefix}:{run_id}:owner (claimed atomically, see _CLAIM_LUA)
+    Notify channel: {prefix}:{run_id}:notify (PUBLISH seq on append/terminal)
+
+    Writes are batched behind ``append``: events are buffered per run and
+    every run with pending events is written in one pipeline, one Lua
+    script call per run (ZADD + trim + expiry + notify).  A flush happens
+    ``batch_window_ms`` after the first buffered event, as soon as a run
+    reaches ``batch_max_events`` (awaited by the caller, which bounds the
+    buffer), and before ``mark_terminal``, ``replay`` of a run with pending
+    events and ``close``.  Flushes are serialized, so those callers also
+    wait for a write already in flight.  Flush sizes and latency are
+    exported as metrics.
     """
 
     def __init__(
@@ -90,6 +295,26 @@ class RedisReplayStore:
         self._redis: Redis = Redis.from_url(redis_url, decode_responses=True)
         self._config = config or ReplayConfig()
         self._prefix = self._config.prefix
+        self._init_batching()
+
+    @classmethod
+    def from_client(
+        cls, client: Any, config: ReplayConfig | None = None
+    ) -> RedisReplayStore:
+        """Wrap an existing ``redis.asyncio.Redis`` client (``decode_responses=True``)."""
+        store = cls.__new__(cls)
+        store._redis = client
+        store._config = config or ReplayConfig()
+        store._prefix = store._config.prefix
+        store._init_batching()
+        return store
+
+    def _init_batching(self) -> None:
+        self._pending: dict[str, list[tuple[int, str]]] = {}
+        self._flush_timer: asyncio.TimerHandle | None = None
+        self._flush_tasks: set[asyncio.Task[None]] = set()
+        self._flush_lock = asyncio.Lock()
+        self._script_sha: str | None = None
 
     def _events_key(self, run_id: str) -> str:
         return f"{self._prefix}:{run_id}:events"
@@ -100,28 +325,116 @@ class RedisReplayStore:
     def _terminal_key(self, run_id: str) -> str:
         return f"{self._prefix}:{run_id}:terminal"
 
+    def _owner_key(self, run_id: str) -> str:
+        return f"{self._prefix}:{run_id}:owner"
+
+    def _notify_channel(self, run_id: str) -> str:
+        return f"{self._prefix}:{run_id}:notify"
+
     async def next_seq(self, run_id: str) -> int:
         """Get the next sequence number via Redis INCR."""
         return int(await self._redis.incr(self._seq_key(run_id)))
 
     async def append(self, run_id: str, seq: int, payload: str) -> None:
-        """Append an event to the ZSET replay buffer."""
-        key = self._events_key(run_id)
-        # Member includes seq for uniqueness: "{seq}|{payload}"
-        member = f"{seq}|{payload}"
-
-        pipe = self._redis.pipeline(transaction=True)
-        pipe.zadd(key, {member: float(seq)})
-        # Trim: keep only last N by removing lowest scores
-        pipe.zremrangebyrank(key, 0, -(self._config.keep_last + 1))
-        pipe.expire(key, self._config.ttl_seconds)
-        pipe.expire(self._seq_key(run_id), self._config.ttl_seconds)
+        """Buffer an event for the ZSET replay buffer (write-behind).
+
+        Returns once buffered; awaits a flush when the run's buffer is
+        full or batching is disabled.
+        """
+        pending = self._pending.setdefault(run_id, [])
+        pending.append((seq, payload))
+        if (
+            self._config.batch_window_ms <= 0
+            or len(pending) >= self._config.batch_max_events
+        ):
+            await self.flush()
+        elif self._flush_timer is None:
+            self._flush_timer = asyncio.get_running_loop().call_later(
+                self._config.batch_window_ms / 1000.0, self._flush_in_background
+            )
+
+    async def flush(self) -> None:
+        """Write every buffered event in one pipeline.
+
+        Only one flush writes at a time: a caller arriving while a batch
+        is in flight waits for it, then writes what was buffered since.
+        A failed write is retried with backoff; if it still fails, the
+        batch goes back to the buffer ahead of events appended meanwhile
+        and the error is raised, so nothing is lost.
+        """
+        async with self._flush_lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            batch, self._pending = self._pending, {}
+            if not batch:
+                return
+            start = time.monotonic()
+            try:
+                await self._write_batch_with_retry(batch)
+            except BaseException:
+                for run_id, events in self._pending.items():
+                    batch.setdefault(run_id, []).extend(events)
+                self._pending = batch
+                raise
+            replay_flush_duration.observe(time.monotonic() - start)
+            replay_flush_events.observe(float(sum(len(events) for events in batch.values())))
+
+    async def _write_batch_with_retry(self, batch: dict[str, list[tuple[int, str]]]) -> None:
+        from redis.exceptions import NoScriptError
+
+        for attempt in range(1, _FLUSH_ATTEMPTS + 1):
+            try:
+                await self._write_batch(batch)
+                return
+            except NoScriptError:
+                if attempt == _FLUSH_ATTEMPTS:
+                    raise
+                # Script cache flushed (e.g. Redis restarted): reload and retry
+                self._script_sha = None
+            except Exception as exc:
+                if attempt == _FLUSH_ATTEMPTS:
+                    raise
+                _log.warning("replay.flush_retry", attempt=attempt, error=str(exc))
+                await asyncio.sleep(_FLUSH_BACKOFF_S * 2 ** (attempt - 1))
+
+    async def _write_batch(self, batch: dict[str, list[tuple[int, str]]]) -> None:
+        if self._script_sha is None:
+            self._script_sha = await self._redis.script_load(_FLUSH_LUA)
+        cfg = self._config
+        pipe = self._redis.pipeline(transaction=False)
+        for run_id, events in batch.items():
+            args: list[Any] = [
+                cfg.keep_last,
+                cfg.ttl_seconds,
+                self._notify_channel(run_id),
+                events[-1][0],
+            ]
+            for seq, payload in events:
+                args += [seq, _member(seq, payload)]
+            pipe.evalsha(
+                self._script_sha, 2, self._events_key(run_id), self._seq_key(run_id), *args
+            )
         await pipe.execute()
 
+    def _flush_in_background(self) -> None:
+        self._flush_timer = None
+        task = asyncio.create_task(self._background_flush())
+        self._flush_tasks.add(task)
+        task.add_done_callback(self._flush_tasks.discard)
+
+    async def _background_flush(self) -> None:
+        try:
+            await self.flush()
+        except Exception as exc:
+            _log.warning("replay.flush_failed", error=str(exc))
+
     async def replay(
         self, run_id: str, after_seq: int | None = None
     ) -> list[tuple[int, str]]:
         """Replay events from Redis ZSET."""
+        if run_id in self._pending or self._flush_lock.locked():
+            await self.flush()  # read-your-writes on this node
         key = self._events_key(run_id)
 
         if after_seq is not None:
@@ -134,14 +447,22 @@ class RedisReplayStore:
         result: list[tuple[int, str]] = []
         for member, score in items:
             seq = int(score)
-            # Extract payload from "{seq}|{payload}" format
-            payload = member.split("|", 1)[1] if "|" in member else member
+            if member.startswith(_ENVELOPE_HEAD):
+                payload = member
+            else:
+                # Extract payload from "{seq}|{payload}" format
+                payload = member.split("|", 1)[1] if "|" in member else member
             result.append((seq, payload))
         return result
 
     async def mark_terminal(self, run_id: str, terminal_type: str) -> bool:
-        """Atomically mark a run as terminated (SET NX EX)."""
-        return bool(
+        """Atomically mark a run as terminated (SET NX EX).
+
+        Buffered events are flushed first, so a tailer that sees the
+        marker finds the terminal event already stored.
+        """
+        await self.flush()
+        first = bool(
             await self._redis.set(
                 self._terminal_key(run_id),
                 terminal_type,
@@ -149,12 +470,141 @@ class RedisReplayStore:
                 ex=self._config.ttl_seconds,
             )
         )
+        if first:
+            await self._redis.publish(self._notify_channel(run_id), terminal_type)
+        return first
 
     async def is_terminal(self, run_id: str) -> bool:
         """Check if a run has been marked as terminal."""
         result = await self._redis.exists(self._terminal_key(run_id))
         return int(result) > 0
 
+    async def bind_owner(self, run_id: str, owner: str) -> bool:
+        """Claim *run_id* for *owner* on every node; False if another tenant owns it.
+
+        Re-claiming one's own run_id starts a fresh run: the previous
+        events and terminal marker are dropped in the same script.
+        """
+        self._pending.pop(run_id, None)
+        claimed = self._redis.eval(
+            _CLAIM_LUA,
+            3,
+            self._owner_key(run_id),
+            self._events_key(run_id),
+            self._terminal_key(run_id),
+            owner,
+            str(self._config.ttl_seconds),
+        )
+        return bool(await cast("Awaitable[int]", claimed))
+
+    async def owner(self, run_id: str) -> str | None:
+        """Tenant the run belongs to, or None for an unknown/expired run."""
+        value: str | None = await self._redis.get(self._owner_key(run_id))
+        return value
+
+    async def tail(
+        self,
+        run_id: str,
+        after_seq: int | None = None,
+        *,
+        idle_timeout: float | None = None,
+    ) -> AsyncIterator[tuple[int, str]]:
+        """Replay events after *after_seq*, then follow new ones live.
+
+        Subscribes to the run's notify channel before the first ZSET read
+        (so no append is missed between backfill and subscription) and
+        re-reads the ZSET on every notification, falling back to a
+        periodic re-check.  Uses one pub/sub connection per tailer.
+
+        Ends once the run is terminal and every event has been yielded,
+        or after *idle_timeout* seconds without a new event.
+        """
+        pubsub = self._redis.pubsub()
+        await pubsub.subscribe(self._notify_channel(run_id))
+        try:
+            last_event = time.monotonic()
+            while True:
+                terminal = await self.is_terminal(run_id)
+                events = await self.replay(run_id, after_seq)
+                for seq, payload in events:
+                    after_seq = seq
+                    yield seq, payload
+                if events:
+                    last_event = time.monotonic()
+                    continue
+                if terminal:
+                    return
+                timeout = _TAIL_POLL_INTERVAL_S
+                if idle_timeout is not None:
+                    remaining = idle_timeout - (time.monotonic() - last_event)
+                    if remaining <= 0:
+                        return
+                    timeout = min(timeout, remaining)
+                message = await pubsub.get_message(
+                    ignore_subscribe_messages=True, timeout=timeout
+                )
+                # Collapse a burst of notifications into one re-read
+                while message is not None:
+                    message = await pubsub.get_message(
+                        ignore_subscribe_messages=True, timeout=0
+                    )
+        finally:
+            with contextlib.suppress(Exception):
+                await pubsub.unsubscribe()
+                await pubsub.aclose()
+
     async def close(self) -> None:
-        """Close the Redis connection."""
+        """Flush buffered events and close the Redis connection."""
+        try:
+            await self.flush()
+        except Exception as exc:
+            _log.warning("replay.flush_failed", error=str(exc))
         await self._redis.close()
+
+
+# ---------------------------------------------------------------------------
+# Producer side and wiring
+# ---------------------------------------------------------------------------
+
+
+async def persist_events(
+    store: ReplayStore, run_id: str, channel: SSEChannel
+) -> None:
+    """Drain *channel* into *store*, marking the run terminal at the end.
+
+    The terminal marker is set only after the terminal event itself is
+    stored, so a tailer that sees the marker has every event available.
+    Store errors are logged and skipped: a replay outage must not fail
+    the run or its live stream.
+    """
+    async for event in channel:
+        try:
+            await store.append(run_id, event.seq, event.to_sse_data())
+            terminal_type = _TERMINAL_TYPES.get(event.type)
+            if terminal_type is not None:
+                await store.mark_terminal(run_id, terminal_type)
+        except Exception as exc:
+            _log.warning(
+                "replay.append_failed", run_id=run_id, seq=event.seq, error=str(exc)
+            )
+
+
+def build_replay_store(settings: Settings) -> ReplayStore:
+    """Build the replay store: Redis when configured, in-memory otherwise.
+
+    Uses ``AILINE_SSE_REPLAY`` (memory|redis); falls back to the in-memory
+    store when the redis package is missing.
+    """
+    cfg = settings.sse
+    config = ReplayConfig(
+        ttl_seconds=cfg.replay_ttl_seconds,
+        keep_last=cfg.replay_keep_last,
+        batch_window_ms=cfg.replay_batch_window_ms,
+        batch_max_events=cfg.replay_batch_max_events,
+    )
+    if cfg.replay == "redis" and settings.redis.url:
+        try:
+            return RedisReplayStore(settings.redis.url, config)
+        except ImportError:
+            _log.warning("replay.redis_import_failed: falling back to InMemoryReplayStore")
+    return InMemoryReplayStore(config)
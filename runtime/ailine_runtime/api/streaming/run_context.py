@@ -13,7 +13,7 @@ from typing import Any
 
 from ...shared.observability import get_logger
 from .events import SSEEvent, SSEEventEmitter, SSEEventType
-from .replay import InMemoryReplayStore
+from .replay import InMemoryReplayStore, ReplayStore
 
 _log = get_logger("ailine.streaming.run_context")
 
@@ -45,12 +45,12 @@ class RunContext:
         run_id: str,
         emitter: SSEEventEmitter,
         sink: EventSink,
-        replay_store: InMemoryReplayStore | None = None,
+        replay_store: ReplayStore | None = None,
     ) -> None:
         self._run_id = run_id
         self._emitter = emitter
         self._sink = sink
-        self._replay = replay_store or InMemoryReplayStore()
+        self._replay: ReplayStore = replay_store or InMemoryReplayStore()
         self._finalized = False
 
     @property
@@ -1,24 +1,64 @@
 """Material ingestion pipeline.
 
 Takes raw text content, splits it into overlapping chunks, embeds each
-chunk, and upserts them into the configured vector store.
+chunk, and upserts them into the configured vector store.  Edited
+materials can be re-ingested incrementally with ``update_material``,
+which only embeds chunks whose content hash changed.
+
+The stages run as a streaming pipeline connected by bounded queues:
+a chunk generator feeds embedding batches, several embedding batches are
+in flight at once, and embedded batches are written to the store as soon
+as they are ready.  Memory is bounded by the queue sizes rather than by
+the size of the material, and wall-clock time approaches the slowest
+stage instead of the sum of all stages.
+
+``ingest_pages`` feeds the same pipeline from an async stream of page
+texts, so the first chunks are embedded while later pages are still being
+extracted.  ``ingest_document`` is the entry point for uploaded PDFs and
+images: it streams a ``PagedOCRProcessor``'s pages into ``ingest_pages``
+and falls back to ``extract_text`` + ``ingest`` for other processors.
 """
 
 from __future__ import annotations
 
+import asyncio
+import hashlib
+import json
 import uuid
+from collections.abc import AsyncIterable, AsyncIterator, Iterator
 from dataclasses import dataclass, field
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
 from ...domain.ports.embeddings import Embeddings
-from ...domain.ports.vectorstore import VectorStore
+from ...domain.ports.events import EventBus
+from ...domain.ports.media import OCRProcessor, PagedOCRProcessor
+from ...domain.ports.vectorstore import (
+    BulkVectorStore,
+    ChunkInventory,
+    VectorRecord,
+    VectorStore,
+)
 from ...shared.observability import get_logger
 
+if TYPE_CHECKING:
+    from .rag_cache import RAGQueryCache
+
 _log = get_logger("ailine.app.services.ingestion")
 
 # Default chunking parameters per ADR conventions
 DEFAULT_CHUNK_SIZE = 512  # tokens (approx words for simple tokenizer)
 DEFAULT_CHUNK_OVERLAP = 64
+# Materials with at least this many chunks use the store's bulk path
+DEFAULT_BULK_THRESHOLD = 500
+
+# Default pipeline parameters
+DEFAULT_EMBED_BATCH_SIZE = 64
+DEFAULT_EMBED_CONCURRENCY = 4
+DEFAULT_QUEUE_SIZE = 8
+
+# Event bus topics
+EVENT_INGESTION_PROGRESS = "ingestion.progress"
+EVENT_INGESTION_COMPLETED = "ingestion.completed"
 
 
 @dataclass(frozen=True)
@@ -35,6 +75,22 @@ class ChunkingConfig:
     chunk_overlap: int = DEFAULT_CHUNK_OVERLAP
 
 
+@dataclass(frozen=True)
+class PipelineConfig:
+    """Concurrency and back-pressure settings for the ingestion pipeline.
+
+    Args:
+        embed_batch_size: Chunks sent per ``embed_batch`` call.
+        embed_concurrency: Embedding batches allowed in flight at once.
+        queue_size: Maximum batches buffered between two stages.  A full
+            queue blocks the upstream stage (back-pressure).
+    """
+
+    embed_batch_size: int = DEFAULT_EMBED_BATCH_SIZE
+    embed_concurrency: int = DEFAULT_EMBED_CONCURRENCY
+    queue_size: int = DEFAULT_QUEUE_SIZE
+
+
 @dataclass(frozen=True)
 class IngestionResult:
     """Summary of a completed ingestion run.
@@ -50,18 +106,58 @@ class IngestionResult:
     chunk_ids: list[str] = field(default_factory=list)
 
 
+@dataclass(frozen=True)
+class MaterialDiff:
+    """Summary of an incremental ``update_material`` run.
+
+    Attributes:
+        material_id: The material identifier.
+        chunk_count: Number of chunks in the new version of the material.
+        added: Chunk IDs that did not exist before.
+        updated: Chunk IDs whose content changed and were re-embedded.
+        deleted: Orphaned chunk IDs removed from the store.
+        unchanged: Number of chunks left untouched.
+    """
+
+    material_id: str
+    chunk_count: int
+    added: list[str] = field(default_factory=list)
+    updated: list[str] = field(default_factory=list)
+    deleted: list[str] = field(default_factory=list)
+    unchanged: int = 0
+
+    @property
+    def embedded(self) -> int:
+        """Number of chunks sent to the embedding provider."""
+        return len(self.added) + len(self.updated)
+
+
 class IngestionService:
     """Orchestrates the material ingestion pipeline.
 
-    Pipeline stages:
-    1. **Chunk** -- split raw text into overlapping windows of tokens.
-    2. **Embed** -- batch-embed all chunks via the configured provider.
-    3. **Store** -- upsert chunk embeddings + metadata into the vector store.
+    Pipeline stages (run concurrently, connected by bounded queues):
+    1. **Chunk** -- lazily split raw text into overlapping windows of
+       tokens and group them into embedding batches.
+    2. **Embed** -- ``embed_concurrency`` workers embed batches in parallel.
+    3. **Store** -- upsert each embedded batch as soon as it is ready.
+       Large materials (``bulk_threshold`` chunks or more) are streamed
+       through ``bulk_upsert`` when the store implements ``BulkVectorStore``.
+
+    Progress is published on the optional event bus as
+    ``ingestion.progress`` after each stored batch, followed by one
+    ``ingestion.completed`` event.  Every write to the vector store
+    (including partial writes of a failed run) invalidates the tenant's
+    entries in the optional RAG query cache.
 
     Args:
         embeddings: An adapter satisfying the ``Embeddings`` protocol.
         vector_store: An adapter satisfying the ``VectorStore`` protocol.
         chunking: Optional chunking configuration overrides.
+        bulk_threshold: Minimum chunk count that switches to the bulk
+            (``COPY``-based for pgvector) write path.
+        pipeline: Optional pipeline concurrency overrides.
+        event_bus: Optional bus for progress events.
+        query_cache: Optional ``RAGQueryCache`` shared with ``RAGService``.
     """
 
     def __init__(
@@ -70,10 +166,18 @@ class IngestionService:
         embeddings: Embeddings,
         vector_store: VectorStore,
         chunking: ChunkingConfig | None = None,
+        bulk_threshold: int = DEFAULT_BULK_THRESHOLD,
+        pipeline: PipelineConfig | None = None,
+        event_bus: EventBus | None = None,
+        query_cache: RAGQueryCache | None = None,
     ) -> None:
         self._embeddings = embeddings
         self._store = vector_store
         self._chunking = chunking or ChunkingConfig()
+        self._bulk_threshold = bulk_threshold
+        self._pipeline = pipeline or PipelineConfig()
+        self._event_bus = event_bus
+        self._query_cache = query_cache
 
     async def ingest(
         self,
@@ -110,54 +214,419 @@ class IngestionService:
             chunk_overlap=self._chunking.chunk_overlap,
         )
 
-        # 1. Chunk
-        chunks = chunk_text(
-            text,
-            chunk_size=self._chunking.chunk_size,
-            chunk_overlap=self._chunking.chunk_overlap,
-        )
+        words, total = self._split(text)
 
-        if not chunks:
+        if total == 0:
             _log.warning("ingestion_empty", material_id=mat_id)
             return IngestionResult(material_id=mat_id, chunk_count=0)
 
-        # 2. Embed
-        embeddings = await self._embeddings.embed_batch(chunks)
-
-        # 3. Build IDs and metadata per chunk
-        chunk_ids: list[str] = []
-        chunk_metas: list[dict[str, Any]] = []
-
-        for idx in range(len(chunks)):
-            chunk_id = f"{mat_id}__chunk_{idx:04d}"
-            chunk_ids.append(chunk_id)
-
-            meta = dict(base_meta)
-            meta["chunk_index"] = idx
-            meta["chunk_count"] = len(chunks)
-            chunk_metas.append(meta)
-
-        # 4. Upsert (tenant-scoped when tenant_id provided -- ADR-060)
-        await self._store.upsert(
-            ids=chunk_ids,
-            embeddings=embeddings,
-            texts=chunks,
-            metadatas=chunk_metas,
+        use_bulk = self._use_bulk(total)
+        meta_digest = _metadata_digest(base_meta)
+        await self._run_pipeline(
+            (
+                (idx, chunk, _chunk_hash(chunk, meta_digest))
+                for idx, chunk in enumerate(self._windows(words))
+            ),
+            material_id=mat_id,
+            base_meta=base_meta,
+            chunk_count=total,
+            total=total,
             tenant_id=tenant_id,
+            use_bulk=use_bulk,
         )
 
         _log.info(
             "ingestion_done",
             material_id=mat_id,
-            chunk_count=len(chunks),
+            chunk_count=total,
+            bulk=use_bulk,
+        )
+        await self._publish(
+            EVENT_INGESTION_COMPLETED,
+            {"material_id": mat_id, "tenant_id": tenant_id, "chunk_count": total},
         )
 
         return IngestionResult(
             material_id=mat_id,
-            chunk_count=len(chunks),
-            chunk_ids=chunk_ids,
+            chunk_count=total,
+            chunk_ids=[_chunk_id(mat_id, idx) for idx in range(total)],
         )
 
+    async def ingest_pages(
+        self,
+        pages: AsyncIterable[str],
+        *,
+        material_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        tenant_id: str | None = None,
+    ) -> IngestionResult:
+        """Ingest a document streamed page by page.
+
+        Chunks are cut across page boundaries exactly as ``ingest`` cuts
+        the pages joined into one text (same chunk IDs and hashes), and
+        each chunk enters the embedding stage as soon as the pages it
+        spans have arrived.  The chunk count is unknown until the last
+        page, so chunk metadata carries no ``chunk_count`` and progress
+        events report ``chunks_total`` as ``None``.
+
+        Args:
+            pages: Async iterable of page texts, in document order.
+            material_id: Optional identifier for the source material.
+                Generated if not provided.
+            metadata: Optional base metadata to attach to every chunk.
+            tenant_id: Tenant identifier for structural isolation (ADR-060).
+
+        Returns:
+            An ``IngestionResult`` summarizing the operation.
+        """
+        _validate_chunking(self._chunking.chunk_size, self._chunking.chunk_overlap)
+        mat_id = material_id or str(uuid.uuid4())
+        base_meta = dict(metadata) if metadata else {}
+        base_meta["material_id"] = mat_id
+        _log.info("ingestion_pages_start", material_id=mat_id)
+
+        meta_digest = _metadata_digest(base_meta)
+        total = 0
+
+        async def chunks() -> AsyncIterator[tuple[int, str, str]]:
+            nonlocal total
+            async for chunk in _stream_windows(
+                pages, self._chunking.chunk_size, self._chunking.chunk_overlap
+            ):
+                yield total, chunk, _chunk_hash(chunk, meta_digest)
+                total += 1
+
+        await self._run_pipeline(
+            chunks(),
+            material_id=mat_id,
+            base_meta=base_meta,
+            chunk_count=None,
+            total=None,
+            tenant_id=tenant_id,
+            use_bulk=False,
+        )
+        if total == 0:
+            _log.warning("ingestion_empty", material_id=mat_id)
+        _log.info("ingestion_done", material_id=mat_id, chunk_count=total, bulk=False)
+        await self._publish(
+            EVENT_INGESTION_COMPLETED,
+            {"material_id": mat_id, "tenant_id": tenant_id, "chunk_count": total},
+        )
+        return IngestionResult(
+            material_id=mat_id,
+            chunk_count=total,
+            chunk_ids=[_chunk_id(mat_id, idx) for idx in range(total)],
+        )
+
+    async def ingest_document(
+        self,
+        ocr: OCRProcessor,
+        file_bytes: bytes,
+        *,
+        file_type: str = "pdf",
+        material_id: str | None = None,
+        metadata: dict[str, Any] | None = None,
+        tenant_id: str | None = None,
+    ) -> IngestionResult:
+        """Extract and ingest an uploaded PDF or image.
+
+        With a ``PagedOCRProcessor`` the pages are streamed into
+        :meth:`ingest_pages` as they are extracted; otherwise the whole
+        text is extracted first and passed to :meth:`ingest`.
+
+        Args:
+            ocr: The OCR adapter used for extraction.
+            file_bytes: Raw file content.
+            file_type: ``"pdf"`` or ``"image"``.
+            material_id: Optional identifier for the source material.
+            metadata: Optional base metadata to attach to every chunk.
+            tenant_id: Tenant identifier for structural isolation (ADR-060).
+
+        Returns:
+            An ``IngestionResult`` summarizing the operation.
+        """
+        if isinstance(ocr, PagedOCRProcessor):
+            pages = (
+                page.text async for page in ocr.iter_pages(file_bytes, file_type=file_type)
+            )
+            return await self.ingest_pages(
+                pages, material_id=material_id, metadata=metadata, tenant_id=tenant_id
+            )
+        text = await ocr.extract_text(file_bytes, file_type=file_type)
+        return await self.ingest(
+            text=text, material_id=material_id, metadata=metadata, tenant_id=tenant_id
+        )
+
+    async def update_material(
+        self,
+        *,
+        text: str,
+        material_id: str,
+        metadata: dict[str, Any] | None = None,
+        tenant_id: str | None = None,
+    ) -> MaterialDiff:
+        """Re-ingest an edited material, embedding only the chunks that changed.
+
+        Every chunk carries a ``chunk_hash`` (SHA-256 of its text and base
+        metadata).  New chunks are compared position by position with the
+        hashes already stored for *material_id*; only added or changed
+        chunks are embedded and upserted, and stored chunks beyond the new
+        chunk count are deleted.  Unchanged chunks keep their stored
+        metadata, including the ``chunk_count`` they were written with.
+
+        When the vector store cannot list stored chunks (no
+        ``ChunkInventory`` capability) every chunk is re-embedded and no
+        orphans can be detected.
+
+        Args:
+            text: The new full text of the material.
+            material_id: Identifier of the material being updated.
+            metadata: Base metadata to attach to every chunk.
+            tenant_id: Tenant owning the material (ADR-060).
+
+        Returns:
+            A ``MaterialDiff`` describing what was added, updated and deleted.
+        """
+        base_meta = dict(metadata) if metadata else {}
+        base_meta["material_id"] = material_id
+        words, total = self._split(text)
+
+        stored: dict[str, str | None] = {}
+        if isinstance(self._store, ChunkInventory):
+            stored = await self._store.chunk_hashes(
+                material_id=material_id, tenant_id=tenant_id
+            )
+        else:
+            _log.warning(
+                "ingestion_update_no_inventory",
+                material_id=material_id,
+                store=type(self._store).__name__,
+            )
+
+        meta_digest = _metadata_digest(base_meta)
+        changed: list[tuple[int, str, str]] = []
+        added: list[str] = []
+        updated: list[str] = []
+        for idx, chunk in enumerate(self._windows(words)):
+            chunk_id = _chunk_id(material_id, idx)
+            digest = _chunk_hash(chunk, meta_digest)
+            if chunk_id not in stored:
+                added.append(chunk_id)
+            elif stored[chunk_id] != digest:
+                updated.append(chunk_id)
+            else:
+                continue
+            changed.append((idx, chunk, digest))
+
+        new_ids = {_chunk_id(material_id, idx) for idx in range(total)}
+        orphans = sorted(cid for cid in stored if cid not in new_ids)
+
+        if changed:
+            await self._run_pipeline(
+                iter(changed),
+                material_id=material_id,
+                base_meta=base_meta,
+                chunk_count=total,
+                total=len(changed),
+                tenant_id=tenant_id,
+                use_bulk=self._use_bulk(len(changed)),
+            )
+        if orphans:
+            try:
+                await self._store.delete(ids=orphans)
+            finally:
+                self._invalidate_cache(tenant_id)
+
+        diff = MaterialDiff(
+            material_id=material_id,
+            chunk_count=total,
+            added=added,
+            updated=updated,
+            deleted=orphans,
+            unchanged=total - len(changed),
+        )
+        _log.info(
+            "ingestion_update_done",
+            material_id=material_id,
+            chunk_count=total,
+            added=len(added),
+            updated=len(updated),
+            deleted=len(orphans),
+            unchanged=diff.unchanged,
+        )
+        await self._publish(
+            EVENT_INGESTION_COMPLETED,
+            {"material_id": material_id, "tenant_id": tenant_id, "chunk_count": total},
+        )
+        return diff
+
+    def _split(self, text: str) -> tuple[list[str], int]:
+        """Tokenize *text* and count its chunks (validating the chunking config)."""
+        _validate_chunking(self._chunking.chunk_size, self._chunking.chunk_overlap)
+        words = text.split()
+        return words, _window_count(
+            len(words), self._chunking.chunk_size, self._chunking.chunk_overlap
+        )
+
+    def _windows(self, words: list[str]) -> Iterator[str]:
+        return _iter_windows(
+            words, self._chunking.chunk_size, self._chunking.chunk_overlap
+        )
+
+    def _use_bulk(self, count: int) -> bool:
+        return count >= self._bulk_threshold and isinstance(self._store, BulkVectorStore)
+
+    # -- Pipeline --------------------------------------------------------------
+
+    async def _run_pipeline(
+        self,
+        chunks: Iterator[tuple[int, str, str]] | AsyncIterator[tuple[int, str, str]],
+        *,
+        material_id: str,
+        base_meta: dict[str, Any],
+        chunk_count: int | None,
+        total: int | None,
+        tenant_id: str | None,
+        use_bulk: bool,
+    ) -> None:
+        """Run chunk -> embed -> store concurrently over bounded queues.
+
+        *chunks* (sync or async) yields ``(index, text, chunk_hash)``
+        tuples; *chunk_count* is the material's full chunk count (stored in
+        metadata) and *total* the number of chunks this run writes
+        (reported as progress); both are ``None`` when not known up front.
+        The first failure in any stage cancels the others and is re-raised
+        as-is (not wrapped in an ``ExceptionGroup``).
+        """
+        cfg = self._pipeline
+        workers = max(1, cfg.embed_concurrency)
+        embed_q: asyncio.Queue[list[tuple[int, str, str]] | None] = asyncio.Queue(
+            maxsize=max(1, cfg.queue_size)
+        )
+        store_q: asyncio.Queue[list[VectorRecord] | None] = asyncio.Queue(
+            maxsize=max(1, cfg.queue_size)
+        )
+        stored = 0
+
+        async def items() -> AsyncIterator[tuple[int, str, str]]:
+            if isinstance(chunks, AsyncIterator):
+                async for item in chunks:
+                    yield item
+            else:
+                for item in chunks:
+                    yield item
+
+        async def produce() -> None:
+            batch: list[tuple[int, str, str]] = []
+            async for item in items():
+                batch.append(item)
+                if len(batch) >= cfg.embed_batch_size:
+                    await embed_q.put(batch)
+                    batch = []
+            if batch:
+                await embed_q.put(batch)
+            for _ in range(workers):
+                await embed_q.put(None)
+
+        async def embed_worker() -> None:
+            while (batch := await embed_q.get()) is not None:
+                vectors = await self._embeddings.embed_batch([c for _, c, _ in batch])
+                records = [
+                    VectorRecord(
+                        id=_chunk_id(material_id, idx),
+                        embedding=vec,
+                        text=chunk,
+                        metadata={
+                            **base_meta,
+                            "chunk_index": idx,
+                            **({"chunk_count": chunk_count} if chunk_count is not None else {}),
+                            "chunk_hash": digest,
+                        },
+                    )
+                    for (idx, chunk, digest), vec in zip(batch, vectors, strict=True)
+                ]
+                await store_q.put(records)
+
+        async def embed_stage() -> None:
+            async with asyncio.TaskGroup() as tg:
+                for _ in range(workers):
+                    tg.create_task(embed_worker())
+            await store_q.put(None)
+
+        async def report(count: int) -> None:
+            nonlocal stored
+            if not count:
+                return
+            stored += count
+            await self._publish(
+                EVENT_INGESTION_PROGRESS,
+                {
+                    "material_id": material_id,
+                    "tenant_id": tenant_id,
+                    "chunks_stored": stored,
+                    "chunks_total": total,
+                },
+            )
+
+        # Records handed to bulk_upsert but not yet reported.  The last
+        # batch is only reported once bulk_upsert returns, so a failed
+        # final merge never shows up as a completed run.
+        unreported = 0
+
+        async def bulk_records() -> AsyncIterator[VectorRecord]:
+            nonlocal unreported
+            while (records := await store_q.get()) is not None:
+                await report(unreported)
+                unreported = 0
+                for record in records:
+                    yield record
+                unreported = len(records)
+
+        async def store_stage() -> None:
+            if use_bulk:
+                store = self._store
+                assert isinstance(store, BulkVectorStore)
+                await store.bulk_upsert(
+                    bulk_records(),
+                    tenant_id=tenant_id,
+                    batch_size=cfg.embed_batch_size,
+                )
+                await report(unreported)
+                return
+            while (records := await store_q.get()) is not None:
+                await self._store.upsert(
+                    ids=[r.id for r in records],
+                    embeddings=[r.embedding for r in records],
+                    texts=[r.text for r in records],
+                    metadatas=[r.metadata for r in records],
+                    tenant_id=tenant_id,
+                )
+                await report(len(records))
+
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tg.create_task(produce())
+                tg.create_task(embed_stage())
+                tg.create_task(store_stage())
+        except ExceptionGroup as eg:
+            raise _first_leaf(eg) from None
+        finally:
+            self._invalidate_cache(tenant_id)
+
+    def _invalidate_cache(self, tenant_id: str | None) -> None:
+        """Drop cached RAG results that may include the chunks just written."""
+        if self._query_cache is not None:
+            self._query_cache.invalidate(tenant_id)
+
+    async def _publish(self, event_type: str, data: dict[str, Any]) -> None:
+        """Publish a progress event; bus failures never fail an ingestion."""
+        if self._event_bus is None:
+            return
+        try:
+            await self._event_bus.publish(event_type, data)
+        except Exception:
+            _log.warning("ingestion_event_publish_failed", event_type=event_type)
+
 
 # -- Chunking utility --------------------------------------------------------
 
@@ -185,26 +654,80 @@ def chunk_text(
     Raises:
         ValueError: If ``chunk_overlap >= chunk_size``.
     """
+    _validate_chunking(chunk_size, chunk_overlap)
+    return list(_iter_windows(text.split(), chunk_size, chunk_overlap))
+
+
+def _validate_chunking(chunk_size: int, chunk_overlap: int) -> None:
     if chunk_overlap >= chunk_size:
         raise ValueError(
             f"chunk_overlap ({chunk_overlap}) must be less than chunk_size ({chunk_size})"
         )
 
-    words = text.split()
-    if not words:
-        return []
 
+def _iter_windows(words: list[str], chunk_size: int, chunk_overlap: int) -> Iterator[str]:
+    """Lazily yield overlapping word windows joined back into text."""
     step = chunk_size - chunk_overlap
-    chunks: list[str] = []
-
     for start in range(0, len(words), step):
-        window = words[start : start + chunk_size]
-        chunk = " ".join(window)
-        if chunk.strip():
-            chunks.append(chunk)
-
+        yield " ".join(words[start : start + chunk_size])
         # Stop if this window reached the end
         if start + chunk_size >= len(words):
             break
 
-    return chunks
+
+async def _stream_windows(
+    pages: AsyncIterable[str], chunk_size: int, chunk_overlap: int
+) -> AsyncIterator[str]:
+    """``_iter_windows`` over the words of *pages*, as the pages arrive.
+
+    A window is emitted once a word beyond it has arrived (so it is known
+    not to be the last) or the stream ends.
+    """
+    step = chunk_size - chunk_overlap
+    buffer: list[str] = []
+    async for page in pages:
+        buffer.extend(page.split())
+        while len(buffer) > chunk_size:
+            yield " ".join(buffer[:chunk_size])
+            del buffer[:step]
+    if buffer:
+        yield " ".join(buffer)
+
+
+def _window_count(n_words: int, chunk_size: int, chunk_overlap: int) -> int:
+    """Number of windows ``_iter_windows`` yields, without building them."""
+    if n_words == 0:
+        return 0
+    if n_words <= chunk_size:
+        return 1
+    step = chunk_size - chunk_overlap
+    return -(-(n_words - chunk_size) // step) + 1
+
+
+def _chunk_id(material_id: str, idx: int) -> str:
+    return f"{material_id}__chunk_{idx:04d}"
+
+
+def _metadata_digest(base_meta: dict[str, Any]) -> str:
+    """Stable digest of the base metadata shared by all chunks of a material."""
+    encoded = json.dumps(base_meta, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()
+
+
+def _chunk_hash(chunk: str, meta_digest: str) -> str:
+    """Content hash of one chunk: its text plus the material's base metadata.
+
+    Including the metadata means a metadata-only edit (e.g. a new
+    ``subject``) also rewrites the affected chunks.
+    """
+    h = hashlib.sha256(meta_digest.encode("ascii"))
+    h.update(chunk.encode("utf-8"))
+    return h.hexdigest()
+
+
+def _first_leaf(eg: BaseExceptionGroup[Any]) -> BaseException:
+    """Return the first non-group exception inside a (nested) group."""
+    exc: BaseException = eg
+    while isinstance(exc, BaseExceptionGroup):
+        exc = exc.exceptions[0]
+    return exc
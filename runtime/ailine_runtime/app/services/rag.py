@@ -3,21 +3,42 @@
 Embeds a user query, searches the vector store with optional metadata
 filters, and returns ranked results above a configurable similarity
 threshold.
+
+In hybrid mode the dense search runs concurrently with a lexical
+(BM25-style) search on stores that support ``LexicalSearch``, and the two
+rankings are merged with reciprocal rank fusion (RRF).  Exact tokens such
+as curriculum codes (``EF04MA07``) then surface even when the embedding
+ranks them low, so ``k`` no longer has to be inflated to catch them.
+
+An optional ``RAGQueryCache`` (see ``rag_cache``) answers repeated and
+near-identical queries without embedding or searching again.
 """
 
 from __future__ import annotations
 
-from dataclasses import dataclass
+import asyncio
+import dataclasses
+import time
+from collections.abc import Sequence
+from dataclasses import dataclass, field
 from typing import Any
 
+from ...domain.entities.rag_diagnostics import build_diagnostics
 from ...domain.ports.embeddings import Embeddings
-from ...domain.ports.vectorstore import VectorSearchResult, VectorStore
+from ...domain.ports.vectorstore import LexicalSearch, VectorSearchResult, VectorStore
 from ...shared.observability import get_logger
+from ...shared.rag_diagnostics_store import RAGDiagnosticsStore
+from .rag_cache import RAGQueryCache, cache_scope
 
 _log = get_logger("ailine.app.services.rag")
 
 DEFAULT_K = 5
 DEFAULT_SIMILARITY_THRESHOLD = 0.7
+DEFAULT_STAGE_K = 20
+DEFAULT_RRF_K = 60
+
+MODE_DENSE = "dense"
+MODE_HYBRID = "hybrid"
 
 
 @dataclass(frozen=True)
@@ -27,13 +48,63 @@ class RAGResult:
     Attributes:
         query: The original query text.
         results: Ranked search results above the similarity threshold.
-        total_candidates: How many results the vector store returned
-            before threshold filtering.
+            In hybrid mode they are ordered by fused rank and ``score`` is
+            the normalized RRF score (1.0 = ranked first by every stage).
+        total_candidates: How many distinct results the retrieval stages
+            returned before threshold filtering and fusion.
+        mode: ``"dense"`` or ``"hybrid"``.
+        stage_timings_ms: Wall time per stage (``cache``, ``embed``,
+            ``dense``, ``lexical``, ``fusion``, ``total``) in milliseconds.
+        cache_tier: ``"exact"`` or ``"semantic"`` when the result was served
+            from the query cache, else ``None``.
     """
 
     query: str
     results: list[VectorSearchResult]
     total_candidates: int
+    mode: str = MODE_DENSE
+    stage_timings_ms: dict[str, float] = field(default_factory=dict)
+    cache_tier: str | None = None
+
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[Sequence[VectorSearchResult]],
+    *,
+    k: int = DEFAULT_RRF_K,
+    limit: int | None = None,
+) -> list[VectorSearchResult]:
+    """Merge several rankings with reciprocal rank fusion.
+
+    Each result contributes ``1 / (k + rank)`` (1-based rank) per ranking
+    it appears in.  Fused scores are divided by the best attainable score,
+    ``len(rankings) / (k + 1)``, so they fall in ``(0, 1]``.  Ties keep
+    first-seen order; text and metadata come from the first occurrence.
+
+    Args:
+        rankings: Result lists, each ordered best first.
+        k: RRF smoothing constant (60 in the original paper).
+        limit: Maximum number of fused results (``None`` = all).
+
+    Returns:
+        Fused results ordered by descending fused score.
+    """
+    fused: dict[str, float] = {}
+    first: dict[str, VectorSearchResult] = {}
+    for ranking in rankings:
+        for rank, result in enumerate(ranking, start=1):
+            fused[result.id] = fused.get(result.id, 0.0) + 1.0 / (k + rank)
+            first.setdefault(result.id, result)
+    if not fused:
+        return []
+    best = len(rankings) / (k + 1)
+    ordered = sorted(fused.items(), key=lambda item: item[1], reverse=True)
+    if limit is not None:
+        ordered = ordered[:limit]
+    return [dataclasses.replace(first[doc_id], score=score / best) for doc_id, score in ordered]
+
+
+def _elapsed_ms(start: float) -> float:
+    return round((time.perf_counter() - start) * 1000, 3)
 
 
 class RAGService:
@@ -41,16 +112,29 @@ class RAGService:
 
     Orchestrates:
     1. Embed the query text.
-    2. Search the vector store with optional metadata filters.
-    3. Filter results below the similarity threshold.
-    4. Return ranked results with source attribution.
+    2. Search the vector store with optional metadata filters (and, in
+       hybrid mode, a concurrent lexical search).
+    3. Filter dense results below the similarity threshold.
+    4. Fuse the rankings (hybrid mode) and return ranked results with
+       source attribution.
 
     Args:
         embeddings: An adapter satisfying the ``Embeddings`` protocol.
         vector_store: An adapter satisfying the ``VectorStore`` protocol.
         default_k: Default number of candidates to retrieve from the
-            vector store before threshold filtering.
+            vector store before threshold filtering (dense mode), or the
+            number of fused results to return (hybrid mode).
         similarity_threshold: Minimum similarity score to include a result.
+        hybrid: Enable hybrid retrieval by default.  Ignored (dense only)
+            when the store does not implement ``LexicalSearch``.
+        k_dense: Dense candidates fetched per query in hybrid mode.
+        k_lexical: Lexical candidates fetched per query in hybrid mode.
+        rrf_k: Reciprocal rank fusion constant.
+        diagnostics_store: When set, queries issued with a ``run_id``
+            record a ``RAGDiagnostics`` report (including stage timings).
+        cache: Optional tenant-scoped result cache consulted by
+            :meth:`query`.  Share the same instance with
+            ``IngestionService`` so writes invalidate it.
     """
 
     def __init__(
@@ -60,11 +144,26 @@ class RAGService:
         vector_store: VectorStore,
         default_k: int = DEFAULT_K,
         similarity_threshold: float = DEFAULT_SIMILARITY_THRESHOLD,
+        hybrid: bool = False,
+        k_dense: int = DEFAULT_STAGE_K,
+        k_lexical: int = DEFAULT_STAGE_K,
+        rrf_k: int = DEFAULT_RRF_K,
+        diagnostics_store: RAGDiagnosticsStore | None = None,
+        cache: RAGQueryCache | None = None,
     ) -> None:
         self._embeddings = embeddings
         self._store = vector_store
         self._default_k = default_k
         self._threshold = similarity_threshold
+        self._hybrid = hybrid
+        self._k_dense = k_dense
+        self._k_lexical = k_lexical
+        self._rrf_k = rrf_k
+        self._diagnostics = diagnostics_store
+        self._cache = cache
+        self._lexical: LexicalSearch | None = (
+            vector_store if isinstance(vector_store, LexicalSearch) else None
+        )
 
     async def query(
         self,
@@ -74,6 +173,11 @@ class RAGService:
         filters: dict[str, Any] | None = None,
         similarity_threshold: float | None = None,
         tenant_id: str | None = None,
+        hybrid: bool | None = None,
+        k_dense: int | None = None,
+        k_lexical: int | None = None,
+        run_id: str | None = None,
+        use_cache: bool = True,
     ) -> RAGResult:
         """Execute a RAG retrieval query.
 
@@ -86,6 +190,13 @@ class RAGService:
             tenant_id: Tenant identifier for structural isolation (ADR-060).
                 When provided, vector search results are scoped to this
                 tenant at the adapter level.
+            hybrid: Override the default retrieval mode for this query.
+            k_dense: Override the dense candidate count (hybrid mode).
+            k_lexical: Override the lexical candidate count (hybrid mode).
+            run_id: When set (and a diagnostics store is configured), a
+                diagnostics report is saved under this ID.
+            use_cache: Set to ``False`` to bypass the query cache (neither
+                read nor populated) for this call.
 
         Returns:
             A ``RAGResult`` containing filtered, ranked results.
@@ -96,6 +207,10 @@ class RAGService:
             if similarity_threshold is not None
             else self._threshold
         )
+        use_hybrid = self._use_hybrid(hybrid)
+        mode = MODE_HYBRID if use_hybrid else MODE_DENSE
+        dense_k = max(effective_k, k_dense or self._k_dense) if use_hybrid else effective_k
+        lexical_k = max(effective_k, k_lexical or self._k_lexical) if use_hybrid else 0
 
         _log.info(
             "rag_query_start",
@@ -104,33 +219,409 @@ class RAGService:
             threshold=threshold,
             filters=filters,
             tenant_id=tenant_id,
+            mode=mode,
         )
 
-        # 1. Embed the query
-        query_embedding = await self._embeddings.embed_text(text)
+        start = time.perf_counter()
+        timings: dict[str, float] = {}
+        cache = self._cache if use_cache else None
+        scope = cache_scope(
+            tenant_id,
+            k=effective_k,
+            filters=filters,
+            threshold=threshold,
+            mode=mode,
+            k_dense=dense_k,
+            k_lexical=lexical_k,
+            rrf_k=self._rrf_k if use_hybrid else 0,
+        )
+        generation = cache.generation if cache is not None else 0
+        query_embedding: list[float] | None = None
+        cached: RAGResult | None = None
+        tier = "exact"
 
-        # 2. Search the vector store (tenant-scoped when tenant_id provided)
-        candidates = await self._store.search(
-            query_embedding=query_embedding,
+        if cache is not None:
+            t0 = time.perf_counter()
+            cached = cache.get_exact(scope, text)
+            timings["cache"] = _elapsed_ms(t0)
+            if cached is None and cache.semantic:
+                t0 = time.perf_counter()
+                query_embedding = await self._embeddings.embed_text(text)
+                timings["embed"] = _elapsed_ms(t0)
+                t0 = time.perf_counter()
+                cached = cache.get_semantic(scope, query_embedding)
+                timings["cache"] += _elapsed_ms(t0)
+                tier = "semantic"
+
+        if cached is not None:
+            timings["total"] = _elapsed_ms(start)
+            result = dataclasses.replace(
+                cached,
+                query=text,
+                results=list(cached.results),
+                stage_timings_ms=timings,
+                cache_tier=tier,
+            )
+        else:
+            result = await self._retrieve(
+                text,
+                k=effective_k,
+                dense_k=dense_k,
+                lexical_k=lexical_k,
+                filters=filters,
+                threshold=threshold,
+                tenant_id=tenant_id,
+                query_embedding=query_embedding,
+                timings=timings,
+            )
+            timings["total"] = _elapsed_ms(start)
+            if cache is not None:
+                cache.put(scope, text, result, embedding=query_embedding, generation=generation)
+
+        _log.info(
+            "rag_query_done",
+            total_candidates=result.total_candidates,
+            after_threshold=len(result.results),
+            threshold=threshold,
+            mode=result.mode,
+            cache_tier=result.cache_tier,
+            timings_ms=timings,
+        )
+
+        if run_id is not None and self._diagnostics is not None:
+            await self._record_diagnostics(
+                result,
+                run_id=run_id,
+                tenant_id=tenant_id,
+                k=effective_k,
+                filters=filters,
+                threshold=threshold,
+            )
+        return result
+
+    async def query_many(
+        self,
+        *,
+        texts: list[str],
+        k: int | None = None,
+        filters: dict[str, Any] | None = None,
+        similarity_threshold: float | None = None,
+        tenant_id: str | None = None,
+        hybrid: bool | None = None,
+        k_dense: int | None = None,
+        k_lexical: int | None = None,
+    ) -> list[RAGResult]:
+        """Execute several retrieval queries for the cost of one.
+
+        All query texts are embedded with a single ``embed_batch`` call and
+        searched with a single ``VectorStore.search_many`` round trip.  The
+        ``k``, filters, threshold and tenant apply to every sub-query.  In
+        hybrid mode the per-query lexical searches run concurrently with
+        the batched dense search.  The query cache is not consulted.
+
+        Args:
+            texts: The query texts to embed and search with.
+            k: Override the default number of candidates per query.
+            filters: Optional metadata filters shared by all queries.
+            similarity_threshold: Override the default similarity threshold.
+            tenant_id: Tenant identifier for structural isolation (ADR-060).
+            hybrid: Override the default retrieval mode.
+            k_dense: Override the dense candidate count (hybrid mode).
+            k_lexical: Override the lexical candidate count (hybrid mode).
+
+        Returns:
+            One ``RAGResult`` per query text, in input order.  Stage
+            timings are those of the shared batch.
+        """
+        if not texts:
+            return []
+
+        effective_k = k if k is not None else self._default_k
+        threshold = (
+            similarity_threshold
+            if similarity_threshold is not None
+            else self._threshold
+        )
+        use_hybrid = self._use_hybrid(hybrid)
+        mode = MODE_HYBRID if use_hybrid else MODE_DENSE
+
+        _log.info(
+            "rag_query_many_start",
+            queries=len(texts),
             k=effective_k,
+            threshold=threshold,
             filters=filters,
             tenant_id=tenant_id,
+            mode=mode,
         )
 
-        total_candidates = len(candidates)
+        start = time.perf_counter()
+        timings: dict[str, float] = {}
+        dense_k = max(effective_k, k_dense or self._k_dense) if use_hybrid else effective_k
 
-        # 3. Filter by similarity threshold
-        filtered = [r for r in candidates if r.score >= threshold]
+        async with asyncio.TaskGroup() as tg:
+            dense_task = tg.create_task(
+                self._dense_many(
+                    texts, k=dense_k, filters=filters, tenant_id=tenant_id, timings=timings
+                )
+            )
+            lexical_task = (
+                tg.create_task(
+                    self._lexical_many(
+                        texts,
+                        k=max(effective_k, k_lexical or self._k_lexical),
+                        filters=filters,
+                        tenant_id=tenant_id,
+                        timings=timings,
+                    )
+                )
+                if use_hybrid
+                else None
+            )
+        batches = dense_task.result()
+
+        if lexical_task is None:
+            fused = [[r for r in candidates if r.score >= threshold] for candidates in batches]
+            totals = [len(candidates) for candidates in batches]
+        else:
+            fusion_timings: dict[str, float] = {}
+            fused, totals = [], []
+            for dense, lexical in zip(batches, lexical_task.result(), strict=True):
+                fused.append(
+                    self._fuse(
+                        dense, lexical, k=effective_k, threshold=threshold, timings=fusion_timings
+                    )
+                )
+                totals.append(len({r.id for r in dense} | {r.id for r in lexical}))
+            timings["fusion"] = fusion_timings.get("fusion", 0.0)
+        timings["total"] = _elapsed_ms(start)
+
+        results = [
+            RAGResult(
+                query=query_text,
+                results=query_results,
+                total_candidates=total,
+                mode=mode,
+                stage_timings_ms=dict(timings),
+            )
+            for query_text, query_results, total in zip(texts, fused, totals, strict=True)
+        ]
 
         _log.info(
-            "rag_query_done",
-            total_candidates=total_candidates,
-            after_threshold=len(filtered),
+            "rag_query_many_done",
+            queries=len(texts),
+            total_candidates=sum(r.total_candidates for r in results),
+            after_threshold=sum(len(r.results) for r in results),
             threshold=threshold,
+            mode=mode,
+            timings_ms=timings,
         )
 
+        return results
+
+    # -- Retrieval stages -------------------------------------------------------
+
+    async def _retrieve(
+        self,
+        text: str,
+        *,
+        k: int,
+        dense_k: int,
+        lexical_k: int,
+        filters: dict[str, Any] | None,
+        threshold: float,
+        tenant_id: str | None,
+        query_embedding: list[float] | None,
+        timings: dict[str, float],
+    ) -> RAGResult:
+        """Run retrieval (dense, or dense + lexical when *lexical_k* > 0)."""
+        if not lexical_k:
+            # 1. Embed the query  2. Search (tenant-scoped when tenant_id provided)
+            candidates = await self._dense(
+                text,
+                k=dense_k,
+                filters=filters,
+                tenant_id=tenant_id,
+                timings=timings,
+                query_embedding=query_embedding,
+            )
+            # 3. Filter by similarity threshold
+            return RAGResult(
+                query=text,
+                results=[r for r in candidates if r.score >= threshold],
+                total_candidates=len(candidates),
+                mode=MODE_DENSE,
+                stage_timings_ms=timings,
+            )
+
+        async with asyncio.TaskGroup() as tg:
+            dense_task = tg.create_task(
+                self._dense(
+                    text,
+                    k=dense_k,
+                    filters=filters,
+                    tenant_id=tenant_id,
+                    timings=timings,
+                    query_embedding=query_embedding,
+                )
+            )
+            lexical_task = tg.create_task(
+                self._lexical_search(
+                    text, k=lexical_k, filters=filters, tenant_id=tenant_id, timings=timings
+                )
+            )
+        dense, lexical = dense_task.result(), lexical_task.result()
         return RAGResult(
             query=text,
-            results=filtered,
-            total_candidates=total_candidates,
+            results=self._fuse(dense, lexical, k=k, threshold=threshold, timings=timings),
+            total_candidates=len({r.id for r in dense} | {r.id for r in lexical}),
+            mode=MODE_HYBRID,
+            stage_timings_ms=timings,
+        )
+
+    def _use_hybrid(self, hybrid: bool | None) -> bool:
+        wanted = self._hybrid if hybrid is None else hybrid
+        if wanted and self._lexical is None:
+            _log.debug("rag_hybrid_unsupported", store=type(self._store).__name__)
+            return False
+        return wanted
+
+    async def _dense(
+        self,
+        text: str,
+        *,
+        k: int,
+        filters: dict[str, Any] | None,
+        tenant_id: str | None,
+        timings: dict[str, float],
+        query_embedding: list[float] | None = None,
+    ) -> list[VectorSearchResult]:
+        if query_embedding is None:
+            t0 = time.perf_counter()
+            query_embedding = await self._embeddings.embed_text(text)
+            timings["embed"] = _elapsed_ms(t0)
+
+        t0 = time.perf_counter()
+        candidates = await self._store.search(
+            query_embedding=query_embedding,
+            k=k,
+            filters=filters,
+            tenant_id=tenant_id,
+        )
+        timings["dense"] = _elapsed_ms(t0)
+        return candidates
+
+    async def _dense_many(
+        self,
+        texts: list[str],
+        *,
+        k: int,
+        filters: dict[str, Any] | None,
+        tenant_id: str | None,
+        timings: dict[str, float],
+    ) -> list[list[VectorSearchResult]]:
+        t0 = time.perf_counter()
+        query_embeddings = await self._embeddings.embed_batch(texts)
+        timings["embed"] = _elapsed_ms(t0)
+
+        t0 = time.perf_counter()
+        batches = await self._store.search_many(
+            query_embeddings=query_embeddings,
+            k=k,
+            filters=filters,
+            tenant_id=tenant_id,
+        )
+        timings["dense"] = _elapsed_ms(t0)
+        return batches
+
+    async def _lexical_search(
+        self,
+        text: str,
+        *,
+        k: int,
+        filters: dict[str, Any] | None,
+        tenant_id: str | None,
+        timings: dict[str, float],
+    ) -> list[VectorSearchResult]:
+        assert self._lexical is not None
+        t0 = time.perf_counter()
+        hits = await self._lexical.lexical_search(
+            query=text, k=k, filters=filters, tenant_id=tenant_id
+        )
+        timings["lexical"] = _elapsed_ms(t0)
+        return hits
+
+    async def _lexical_many(
+        self,
+        texts: list[str],
+        *,
+        k: int,
+        filters: dict[str, Any] | None,
+        tenant_id: str | None,
+        timings: dict[str, float],
+    ) -> list[list[VectorSearchResult]]:
+        assert self._lexical is not None
+        t0 = time.perf_counter()
+        hits = await asyncio.gather(
+            *(
+                self._lexical.lexical_search(
+                    query=text, k=k, filters=filters, tenant_id=tenant_id
+                )
+                for text in texts
+            )
+        )
+        timings["lexical"] = _elapsed_ms(t0)
+        return list(hits)
+
+    def _fuse(
+        self,
+        dense: list[VectorSearchResult],
+        lexical: list[VectorSearchResult],
+        *,
+        k: int,
+        threshold: float,
+        timings: dict[str, float],
+    ) -> list[VectorSearchResult]:
+        """RRF-merge thresholded dense hits with lexical hits.
+
+        The similarity threshold only applies to dense candidates: a
+        lexical hit matched query terms verbatim and is kept as evidence.
+        """
+        t0 = time.perf_counter()
+        fused = reciprocal_rank_fusion(
+            [[r for r in dense if r.score >= threshold], lexical],
+            k=self._rrf_k,
+            limit=k,
+        )
+        timings["fusion"] = round(timings.get("fusion", 0.0) + _elapsed_ms(t0), 3)
+        return fused
+
+    async def _record_diagnostics(
+        self,
+        result: RAGResult,
+        *,
+        run_id: str,
+        tenant_id: str | None,
+        k: int,
+        filters: dict[str, Any] | None,
+        threshold: float,
+    ) -> None:
+        assert self._diagnostics is not None
+        report = build_diagnostics(
+            run_id=run_id,
+            query=result.query,
+            results=[
+                {"id": r.id, "score": r.score, "text": r.text, "metadata": r.metadata}
+                for r in result.results
+            ],
+            k_requested=k,
+            filters=filters,
+            threshold=threshold,
+            retrieval_mode=result.mode,
+            stage_timings_ms=result.stage_timings_ms,
         )
+        report.teacher_id = tenant_id or ""
+        try:
+            await self._diagnostics.save(report)
+        except Exception as exc:
+            _log.warning("rag_diagnostics_save_failed", run_id=run_id, error=str(exc))
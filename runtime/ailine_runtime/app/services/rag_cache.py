@@ -0,0 +1,302 @@
+"""Tenant-scoped result cache for ``RAGService.query``.
+
+Tutor sessions in one class keep asking near-identical questions, and
+every uncached query pays an embedding call plus a vector search.  The
+cache sits in front of retrieval with two tiers:
+
+1. **Exact** -- keyed by the normalized query text (case-folded,
+   whitespace-collapsed, surrounding punctuation stripped), so
+   ``"O que é fração?"`` and ``"o que é fração"`` share an entry.
+   A hit skips the embedding call entirely.
+2. **Semantic** (optional) -- on an exact miss the query is embedded
+   anyway; if its cosine similarity with a cached query of the same
+   scope reaches ``semantic_threshold`` the cached result is reused and
+   only the vector search is saved.
+
+Entries are scoped by tenant and by every retrieval parameter that can
+change the result (``k``, filters, threshold, mode, stage sizes).  They
+expire after ``ttl_seconds``, the least recently used entry is evicted
+beyond ``max_entries``, and writes to the vector store invalidate them:
+``IngestionService`` calls :meth:`RAGQueryCache.invalidate` for the
+tenant it wrote to, and :meth:`RAGQueryCache.subscribe` extends that to
+ingestions on other nodes via the event bus.  Unscoped queries
+(``tenant_id=None``) search every tenant, so they are dropped by any
+invalidation.
+"""
+
+from __future__ import annotations
+
+import json
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import numpy as np
+
+from ...domain.ports.events import EventBus
+from ...shared.metrics import rag_cache_evictions_total, rag_cache_requests_total
+from ...shared.observability import get_logger
+
+if TYPE_CHECKING:
+    from .rag import RAGResult
+
+_log = get_logger("ailine.app.services.rag_cache")
+
+DEFAULT_MAX_ENTRIES = 1024
+DEFAULT_TTL_SECONDS = 600.0
+DEFAULT_SEMANTIC_THRESHOLD = 0.95
+
+_PUNCTUATION = " \t\n?!.,;:¿¡\"'"
+
+# (tenant_id, canonical JSON of the retrieval parameters)
+_Scope = tuple[str | None, str]
+_Key = tuple[_Scope, str]
+
+
+def normalize_query(text: str) -> str:
+    """Canonical form of a query for the exact tier."""
+    return " ".join(text.casefold().split()).strip(_PUNCTUATION)
+
+
+def cache_scope(tenant_id: str | None, **params: Any) -> _Scope:
+    """Scope of a query: its tenant plus every result-affecting parameter."""
+    return tenant_id, json.dumps(params, sort_keys=True, default=str)
+
+
+@dataclass
+class _Entry:
+    result: RAGResult
+    embedding: np.ndarray | None
+    expires_at: float
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """Point-in-time counters of a :class:`RAGQueryCache`."""
+
+    size: int
+    exact_hits: int
+    semantic_hits: int
+    misses: int
+
+    @property
+    def hit_ratio(self) -> float:
+        """Fraction of lookups served from either tier."""
+        lookups = self.exact_hits + self.semantic_hits + self.misses
+        return (self.exact_hits + self.semantic_hits) / lookups if lookups else 0.0
+
+
+class RAGQueryCache:
+    """LRU + TTL cache of ``RAGResult`` objects with an optional semantic tier.
+
+    All methods are synchronous and never await, so they are safe to call
+    from concurrent tasks on one event loop.
+
+    Args:
+        max_entries: Maximum number of cached results (LRU eviction).
+        ttl_seconds: Lifetime of an entry.
+        semantic: Enable the embedding-similarity tier.
+        semantic_threshold: Minimum cosine similarity for a semantic hit.
+        clock: Monotonic time source (injectable for tests).
+    """
+
+    def __init__(
+        self,
+        *,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+        ttl_seconds: float = DEFAULT_TTL_SECONDS,
+        semantic: bool = False,
+        semantic_threshold: float = DEFAULT_SEMANTIC_THRESHOLD,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        self._max_entries = max_entries
+        self._ttl = ttl_seconds
+        self._semantic = semantic
+        self._semantic_threshold = semantic_threshold
+        self._clock = clock
+        self._entries: OrderedDict[_Key, _Entry] = OrderedDict()
+        self._by_scope: dict[_Scope, set[_Key]] = {}
+        self._generation = 0
+        self._lookups = 0
+        self._exact_hits = 0
+        self._semantic_hits = 0
+
+    @property
+    def semantic(self) -> bool:
+        """Whether the semantic tier is enabled."""
+        return self._semantic
+
+    @property
+    def generation(self) -> int:
+        """Invalidation counter; capture it before retrieving a result to cache."""
+        return self._generation
+
+    def stats(self) -> CacheStats:
+        """Current size and hit/miss counters."""
+        return CacheStats(
+            size=len(self._entries),
+            exact_hits=self._exact_hits,
+            semantic_hits=self._semantic_hits,
+            misses=self._lookups - self._exact_hits - self._semantic_hits,
+        )
+
+    # -- Lookup ------------------------------------------------------------------
+
+    def get_exact(self, scope: _Scope, text: str) -> RAGResult | None:
+        """Return the cached result for the normalized *text* in *scope*.
+
+        Every call counts as one lookup in :meth:`stats`.
+        """
+        self._lookups += 1
+        entry = self._live((scope, normalize_query(text)))
+        if entry is None:
+            self._count("exact", hit=False)
+            return None
+        self._exact_hits += 1
+        self._count("exact", hit=True)
+        return entry.result
+
+    def get_semantic(self, scope: _Scope, embedding: list[float]) -> RAGResult | None:
+        """Return the result of the most similar cached query in *scope*.
+
+        Only a hit when the tier is enabled and the best cosine similarity
+        reaches the configured threshold.  Call after a :meth:`get_exact`
+        miss for the same query.
+        """
+        if not self._semantic:
+            return None
+        best = self._nearest(scope, embedding)
+        if best is None:
+            self._count("semantic", hit=False)
+            return None
+        self._entries.move_to_end(best)
+        self._semantic_hits += 1
+        self._count("semantic", hit=True)
+        return self._entries[best].result
+
+    # -- Writes ------------------------------------------------------------------
+
+    def put(
+        self,
+        scope: _Scope,
+        text: str,
+        result: RAGResult,
+        *,
+        embedding: list[float] | None = None,
+        generation: int | None = None,
+    ) -> None:
+        """Cache *result* for *text* in *scope*.
+
+        Args:
+            embedding: Query embedding, kept for the semantic tier.
+            generation: Value of :attr:`generation` captured before the
+                result was retrieved.  If an invalidation happened since,
+                the (possibly stale) result is not cached.
+        """
+        if self._max_entries <= 0:
+            return
+        if generation is not None and generation != self._generation:
+            return
+        key = (scope, normalize_query(text))
+        vector = _unit(embedding) if self._semantic and embedding is not None else None
+        self._entries[key] = _Entry(result, vector, self._clock() + self._ttl)
+        self._entries.move_to_end(key)
+        self._by_scope.setdefault(scope, set()).add(key)
+        while len(self._entries) > self._max_entries:
+            oldest = next(iter(self._entries))
+            self._drop(oldest)
+            rag_cache_evictions_total.inc(reason="size")
+
+    def invalidate(self, tenant_id: str | None = None) -> int:
+        """Drop every entry that may include chunks of *tenant_id*.
+
+        ``None`` clears the whole cache.  Entries of unscoped queries are
+        always dropped because they search across tenants.
+
+        Returns:
+            Number of entries removed.
+        """
+        self._generation += 1
+        scopes = [
+            s
+            for s in self._by_scope
+            if tenant_id is None or s[0] is None or s[0] == tenant_id
+        ]
+        removed = 0
+        for scope in scopes:
+            for key in list(self._by_scope.get(scope, ())):
+                self._drop(key)
+                removed += 1
+        if removed:
+            rag_cache_evictions_total.inc(removed, reason="invalidation")
+        _log.debug("rag_cache_invalidated", tenant_id=tenant_id, removed=removed)
+        return removed
+
+    def clear(self) -> None:
+        """Remove every entry (counters are kept)."""
+        self.invalidate(None)
+
+    async def subscribe(self, event_bus: EventBus, event_type: str) -> None:
+        """Invalidate on *event_type* events carrying a ``tenant_id``.
+
+        Used with ``ingestion.completed`` so ingestions on other nodes
+        (Redis event bus) also evict this node's entries.
+        """
+
+        async def _on_event(data: dict[str, Any]) -> None:
+            self.invalidate(data.get("tenant_id"))
+
+        await event_bus.subscribe(event_type, _on_event)
+
+    # -- Internals ---------------------------------------------------------------
+
+    def _live(self, key: _Key, *, touch: bool = True) -> _Entry | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= self._clock():
+            self._drop(key)
+            rag_cache_evictions_total.inc(reason="ttl")
+            return None
+        if touch:
+            self._entries.move_to_end(key)
+        return entry
+
+    def _nearest(self, scope: _Scope, embedding: list[float]) -> _Key | None:
+        query = _unit(embedding)
+        if query is None:
+            return None
+        candidates: list[tuple[_Key, np.ndarray]] = []
+        for key in list(self._by_scope.get(scope, ())):
+            entry = self._live(key, touch=False)
+            vec = entry.embedding if entry is not None else None
+            if vec is not None and vec.shape == query.shape:
+                candidates.append((key, vec))
+        if not candidates:
+            return None
+        sims = np.stack([vec for _, vec in candidates]) @ query
+        idx = int(np.argmax(sims))
+        return candidates[idx][0] if sims[idx] >= self._semantic_threshold else None
+
+    def _drop(self, key: _Key) -> None:
+        self._entries.pop(key, None)
+        keys = self._by_scope.get(key[0])
+        if keys is not None:
+            keys.discard(key)
+            if not keys:
+                del self._by_scope[key[0]]
+
+    @staticmethod
+    def _count(tier: str, *, hit: bool) -> None:
+        rag_cache_requests_total.inc(tier=tier, result="hit" if hit else "miss")
+
+
+def _unit(embedding: list[float] | None) -> np.ndarray | None:
+    if embedding is None:
+        return None
+    vec = np.asarray(embedding, dtype=np.float32)
+    norm = float(np.linalg.norm(vec))
+    return vec / norm if norm > 0 else None
+
@@ -0,0 +1,353 @@
+"""Streaming, segmented TTS synthesis with a content-addressed segment cache.
+
+``TTS.synthesize`` returns the audio for the whole text at once, so a
+long ``render_audio_script`` lesson makes the user wait for every
+sentence before hearing the first one.  ``StreamingSynthesizer``:
+
+1. splits the text at sentence (and line) boundaries, breaking overlong
+   sentences at the last comma or space before ``max_segment_chars``;
+2. synthesizes segments concurrently under a bounded semaphore, at most
+   ``max_lookahead`` segments ahead of the one being consumed, so a slow
+   reader bounds memory instead of buffering the whole text's audio;
+3. yields the audio strictly in text order as soon as each segment and
+   all segments before it are ready.
+
+Segments are cached by ``(voice, model, locale, speed, sha256(text))``
+in a byte-bounded LRU, so repeated phrases ("Pausa", "Checagem rápida:",
+step headers) skip synthesis entirely.  Time to first audio and cache
+hits/misses are exported on ``/metrics``.
+
+MP3 segments are concatenated frame streams.  WAV segments are merged
+into one stream: a single header with "unknown length" sizes, followed by
+the PCM data of every segment.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import hashlib
+import re
+import struct
+import time
+from collections import OrderedDict
+from collections.abc import AsyncIterator
+from dataclasses import dataclass
+from typing import Any
+
+from ...domain.ports.media import TTS
+from ...shared.config import TTSConfig
+from ...shared.metrics import tts_segment_cache_requests_total, tts_time_to_first_audio
+from ...shared.observability import get_logger
+
+_log = get_logger("ailine.app.services.tts_stream")
+
+DEFAULT_MAX_CONCURRENCY = 4
+DEFAULT_MAX_LOOKAHEAD = 8
+DEFAULT_MAX_SEGMENT_CHARS = 400
+DEFAULT_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+_SENTENCE_BOUNDARY = re.compile(r"(?<=[.!?…;:])\s+|\n+")
+# Streaming WAV: RIFF/data sizes unknown up front
+_WAV_UNKNOWN_SIZE = 0xFFFFFFFF
+
+
+def split_segments(text: str, *, max_chars: int = DEFAULT_MAX_SEGMENT_CHARS) -> list[str]:
+    """Split *text* into synthesis segments at sentence and line boundaries."""
+    segments: list[str] = []
+    for sentence in _SENTENCE_BOUNDARY.split(text):
+        sentence = sentence.strip()
+        while len(sentence) > max_chars:
+            cut = max(sentence.rfind(",", 0, max_chars), sentence.rfind(" ", 0, max_chars))
+            cut = cut + 1 if cut > 0 else max_chars
+            segments.append(sentence[:cut].strip())
+            sentence = sentence[cut:].strip()
+        if sentence:
+            segments.append(sentence)
+    return segments
+
+
+def voice_identity(tts: TTS) -> tuple[str, str]:
+    """(voice, model) of an adapter, for cache keys.
+
+    Adapters without ``voice_id``/``model_id`` are keyed by class name.
+    """
+    return (
+        str(getattr(tts, "voice_id", "") or ""),
+        str(getattr(tts, "model_id", "") or type(tts).__name__),
+    )
+
+
+class TTSSegmentCache:
+    """Content-addressed LRU of synthesized segments, bounded in bytes.
+
+    Args:
+        max_bytes: Total audio bytes kept; least recently used segments
+            are evicted beyond it.
+    """
+
+    def __init__(self, *, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> None:
+        self._max_bytes = max_bytes
+        self._entries: OrderedDict[str, bytes] = OrderedDict()
+        self._size = 0
+
+    @staticmethod
+    def key(*, voice: str, model: str, locale: str, speed: float, text: str) -> str:
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        return f"{voice}:{model}:{locale}:{speed:g}:{digest}"
+
+    @property
+    def size_bytes(self) -> int:
+        return self._size
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: str) -> bytes | None:
+        audio = self._entries.get(key)
+        if audio is not None:
+            self._entries.move_to_end(key)
+        tts_segment_cache_requests_total.inc(result="hit" if audio is not None else "miss")
+        return audio
+
+    def put(self, key: str, audio: bytes) -> None:
+        if len(audio) > self._max_bytes:
+            return
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self._size -= len(previous)
+        self._entries[key] = audio
+        self._size += len(audio)
+        while self._size > self._max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._size -= len(evicted)
+
+    def clear(self) -> None:
+        self._entries.clear()
+        self._size = 0
+
+
+class StreamingSynthesizer:
+    """Synthesize long text segment by segment and stream audio in order.
+
+    Args:
+        tts: The TTS adapter.
+        cache: Segment cache (``None`` disables caching).
+        max_concurrency: Segments synthesized at the same time.
+        max_segment_chars: Longest segment sent to the adapter.
+        max_lookahead: Segments started (in flight or waiting to be
+            consumed) ahead of the consumer; at least ``max_concurrency``.
+    """
+
+    def __init__(
+        self,
+        tts: TTS,
+        *,
+        cache: TTSSegmentCache | None = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        max_segment_chars: int = DEFAULT_MAX_SEGMENT_CHARS,
+        max_lookahead: int = DEFAULT_MAX_LOOKAHEAD,
+    ) -> None:
+        self._tts = tts
+        self._cache = cache
+        self._max_concurrency = max(1, max_concurrency)
+        self._max_segment_chars = max_segment_chars
+        self._max_lookahead = max(self._max_concurrency, max_lookahead)
+
+    async def stream(
+        self, text: str, *, locale: str = "pt-BR", speed: float = 1.0
+    ) -> AsyncIterator[bytes]:
+        """Yield the audio of each segment of *text*, in text order.
+
+        Segment audio is yielded as produced by the adapter; use
+        :func:`audio_byte_stream` to obtain one playable byte stream.
+        Closing the iterator cancels segments still being synthesized.
+        """
+        segments = split_segments(text, max_chars=self._max_segment_chars)
+        if not segments:
+            return
+        voice, model = voice_identity(self._tts)
+        semaphore = asyncio.Semaphore(self._max_concurrency)
+
+        async def synthesize(segment: str, key: str) -> bytes:
+            if self._cache is not None:
+                cached = self._cache.get(key)
+                if cached is not None:
+                    return cached
+            async with semaphore:
+                audio = await self._tts.synthesize(segment, locale=locale, speed=speed)
+            if self._cache is not None:
+                self._cache.put(key, audio)
+            return audio
+
+        keys = [
+            TTSSegmentCache.key(voice=voice, model=model, locale=locale, speed=speed, text=s)
+            for s in segments
+        ]
+        started = time.perf_counter()
+        # Tasks start in text order, within a window of max_lookahead
+        # segments past the consumer; the semaphore admits them FIFO, so
+        # earlier segments are synthesized first.  A phrase repeated within
+        # the window shares one task (later repeats hit the cache).
+        live: dict[str, asyncio.Task[bytes]] = {}
+        refs: dict[str, int] = {}
+        scheduled = 0
+        try:
+            for i, key in enumerate(keys):
+                while scheduled < min(len(segments), i + self._max_lookahead):
+                    ahead = keys[scheduled]
+                    if ahead not in live:
+                        live[ahead] = asyncio.create_task(synthesize(segments[scheduled], ahead))
+                    refs[ahead] = refs.get(ahead, 0) + 1
+                    scheduled += 1
+                audio = await live[key]
+                refs[key] -= 1
+                if not refs[key]:
+                    del refs[key], live[key]
+                if i == 0:
+                    tts_time_to_first_audio.observe(time.perf_counter() - started)
+                yield audio
+        finally:
+            for task in live.values():
+                task.cancel()
+            await asyncio.gather(*live.values(), return_exceptions=True)
+        _log.debug(
+            "tts_stream.completed",
+            segments=len(segments),
+            elapsed_ms=round((time.perf_counter() - started) * 1000),
+        )
+
+
+# -- Audio containers ---------------------------------------------------------
+
+
+def _wav_parts(audio: bytes) -> tuple[bytes, bytes] | None:
+    """(fmt chunk payload, PCM data) of a RIFF/WAVE file, or None."""
+    if audio[:4] != b"RIFF" or audio[8:12] != b"WAVE":
+        return None
+    fmt = b""
+    pos = 12
+    while pos + 8 <= len(audio):
+        chunk_id, size = struct.unpack_from("<4sI", audio, pos)
+        body = audio[pos + 8 : pos + 8 + size]
+        if chunk_id == b"fmt ":
+            fmt = body
+        elif chunk_id == b"data":
+            return fmt, body
+        pos += 8 + size + (size & 1)
+    return None
+
+
+def _streaming_wav_header(fmt: bytes) -> bytes:
+    return (
+        struct.pack("<4sI4s", b"RIFF", _WAV_UNKNOWN_SIZE, b"WAVE")
+        + struct.pack("<4sI", b"fmt ", len(fmt))
+        + fmt
+        + struct.pack("<4sI", b"data", _WAV_UNKNOWN_SIZE)
+    )
+
+
+async def audio_byte_stream(
+    segments: AsyncIterator[bytes],
+) -> tuple[str, AsyncIterator[bytes]]:
+    """Turn per-segment audio into one playable stream.
+
+    Waits for the first segment to pick the media type, so a response can
+    be started with the right ``Content-Type`` as soon as audio exists.
+
+    Returns:
+        (media type, iterator of body chunks).
+    """
+    iterator = aiter(segments)
+    try:
+        first = await anext(iterator)
+    except StopAsyncIteration:
+        first = b""
+    first_wav = _wav_parts(first)
+
+    async def body() -> AsyncIterator[bytes]:
+        try:
+            if first_wav is None:
+                yield first
+                async for audio in iterator:
+                    yield audio
+                return
+            fmt, pcm = first_wav
+            yield _streaming_wav_header(fmt) + pcm
+            async for audio in iterator:
+                parts = _wav_parts(audio)
+                yield parts[1] if parts is not None else audio
+        finally:
+            close: Any = getattr(iterator, "aclose", None)
+            if close is not None:
+                await close()
+
+    return ("audio/wav" if first_wav is not None else "audio/mpeg"), body()
+
+
+@dataclass(frozen=True)
+class SpeechStream:
+    """A streamed synthesis ready to be sent as an HTTP response body."""
+
+    media_type: str
+    chunks: AsyncIterator[bytes]
+
+    @property
+    def headers(self) -> dict[str, str]:
+        filename = "speech.wav" if self.media_type == "audio/wav" else "speech.mp3"
+        return {"Content-Disposition": f"inline; filename={filename}"}
+
+
+async def stream_speech(
+    tts: TTS,
+    text: str,
+    *,
+    locale: str,
+    speed: float,
+    config: TTSConfig | None = None,
+) -> SpeechStream:
+    """Synthesize *text* segment by segment as one playable audio stream.
+
+    Shared by the ``stream=true`` synthesis endpoints; returns once the
+    first segment is ready (see :func:`audio_byte_stream`).
+    """
+    synthesizer = build_streaming_synthesizer(tts, config)
+    media_type, chunks = await audio_byte_stream(
+        synthesizer.stream(text, locale=locale, speed=speed)
+    )
+    return SpeechStream(media_type=media_type, chunks=chunks)
+
+
+# -- Process-wide cache -----------------------------------------------------------
+
+_segment_cache: TTSSegmentCache | None = None
+
+
+def get_tts_segment_cache(*, max_bytes: int = DEFAULT_CACHE_MAX_BYTES) -> TTSSegmentCache:
+    """Return the process-wide segment cache (created on first use)."""
+    global _segment_cache
+    if _segment_cache is None:
+        _segment_cache = TTSSegmentCache(max_bytes=max_bytes)
+    return _segment_cache
+
+
+def build_streaming_synthesizer(tts: TTS, config: TTSConfig | None = None) -> StreamingSynthesizer:
+    """Streaming synthesizer for *tts* on the process-wide segment cache."""
+    config = config or TTSConfig()
+    cache = (
+        get_tts_segment_cache(max_bytes=config.segment_cache_max_bytes)
+        if config.segment_cache_max_bytes > 0
+        else None
+    )
+    return StreamingSynthesizer(
+        tts,
+        cache=cache,
+        max_concurrency=config.stream_concurrency,
+        max_segment_chars=config.segment_max_chars,
+        max_lookahead=config.stream_lookahead,
+    )
+
+
+def reset_tts_segment_cache() -> None:
+    """Drop the process-wide segment cache (tests)."""
+    global _segment_cache
+    _segment_cache = None
@@ -70,6 +70,13 @@ class RAGDiagnostics(BaseModel):
         default="",
         description="Why these documents were selected (threshold, score gap, etc.)",
     )
+    retrieval_mode: str = Field(
+        default="dense", description="dense | hybrid (dense + lexical, RRF-fused)"
+    )
+    stage_timings_ms: dict[str, float] = Field(
+        default_factory=dict,
+        description="Wall time per retrieval stage (embed, dense, lexical, fusion, total)",
+    )
 
 
 def check_answerability(
@@ -122,6 +129,8 @@ def build_diagnostics(
     k_requested: int = 5,
     filters: dict[str, Any] | None = None,
     threshold: float = 0.7,
+    retrieval_mode: str = "dense",
+    stage_timings_ms: dict[str, float] | None = None,
 ) -> RAGDiagnostics:
     """Build a complete RAG diagnostics report from search results.
 
@@ -182,4 +191,6 @@ def build_diagnostics(
         filters_applied=filters or {},
         answerability=answerability,
         selection_rationale=rationale,
+        retrieval_mode=retrieval_mode,
+        stage_timings_ms=stage_timings_ms or {},
     )
@@ -4,27 +4,54 @@ from .curriculum import CurriculumProvider
 from .db import Repository, UnitOfWork
 from .embeddings import Embeddings
 from .events import EventBus
-from .llm import ChatLLM, ChatMessage
-from .media import STT, TTS, ImageDescriber, SignRecognition, VoiceInfo
+from .llm import ChatLLM, ChatMessage, TokenUsage, cache_breakpoint
+from .media import (
+    STT,
+    TTS,
+    ImageDescriber,
+    PagedOCRProcessor,
+    PageText,
+    SignRecognition,
+    StreamingSTT,
+    TranscriptSegment,
+    VoiceInfo,
+)
 from .skills import SkillRepository
 from .storage import ObjectStorage
-from .vectorstore import VectorSearchResult, VectorStore
+from .vectorstore import (
+    BulkVectorStore,
+    ChunkInventory,
+    LexicalSearch,
+    VectorRecord,
+    VectorSearchResult,
+    VectorStore,
+)
 
 __all__ = [
     "STT",
     "TTS",
+    "BulkVectorStore",
     "ChatLLM",
     "ChatMessage",
+    "ChunkInventory",
     "CurriculumProvider",
     "Embeddings",
     "EventBus",
     "ImageDescriber",
+    "LexicalSearch",
     "ObjectStorage",
+    "PageText",
+    "PagedOCRProcessor",
     "Repository",
     "SignRecognition",
     "SkillRepository",
+    "StreamingSTT",
+    "TokenUsage",
+    "TranscriptSegment",
     "UnitOfWork",
+    "VectorRecord",
     "VectorSearchResult",
     "VectorStore",
     "VoiceInfo",
+    "cache_breakpoint",
 ]
@@ -6,18 +6,51 @@ from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import Any, Literal, Protocol, TypedDict, runtime_checkable
 
+# Message key marking the end of a stable prompt prefix (see ``cache_breakpoint``).
+CACHE_BREAKPOINT_KEY = "cache"
+
 
 class ChatMessage(TypedDict, total=False):
     """Typed structure for chat messages passed to LLM providers.
 
     Required keys: role, content.
-    Optional keys: name, tool_call_id (for tool messages).
+    Optional keys: name, tool_call_id (for tool messages), cache (prompt
+    caching breakpoint, see ``cache_breakpoint``).
     """
 
     role: Literal["system", "user", "assistant", "tool"]
     content: str
     name: str
     tool_call_id: str
+    cache: bool
+
+
+def cache_breakpoint(message: dict[str, Any]) -> dict[str, Any]:
+    """Return a copy of *message* marked as the end of a stable prompt prefix.
+
+    Everything up to and including a marked message is expected to be
+    byte-identical across calls (system prompt, skill fragments, schemas),
+    so adapters advertising ``capabilities["prompt_caching"]`` can serve it
+    from the provider's prompt cache.  Without any mark, the leading
+    system messages are treated as the stable prefix.  Adapters without
+    prompt caching strip the key.
+    """
+    return {**message, CACHE_BREAKPOINT_KEY: True}
+
+
+@dataclass(frozen=True)
+class TokenUsage:
+    """Token usage of a single LLM call, normalized across providers.
+
+    ``input_tokens`` counts the whole prompt, including the part served
+    from (``cached_input_tokens``) or written to (``cache_write_tokens``)
+    the provider's prompt cache.
+    """
+
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cached_input_tokens: int = 0
+    cache_write_tokens: int = 0
 
 
 @dataclass(frozen=True)
@@ -49,7 +82,7 @@ class ChatLLM(Protocol):
 
     @property
     def capabilities(self) -> dict[str, Any]:
-        """Feature detection: provider, streaming, vision, tool_use, web_search, etc."""
+        """Feature detection: provider, streaming, vision, tool_use, web_search, prompt_caching, etc."""
         ...  # pragma: no cover
 
     async def generate(
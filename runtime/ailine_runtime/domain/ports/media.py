@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
 from dataclasses import dataclass, field
 from typing import Protocol, runtime_checkable
 
@@ -13,6 +14,30 @@ class STT(Protocol):
     async def transcribe(self, audio_bytes: bytes, *, language: str = "pt") -> str: ...
 
 
+@dataclass(frozen=True)
+class TranscriptSegment:
+    """One decoded span of speech.
+
+    Attributes:
+        start: Segment start, in seconds from the beginning of the audio.
+        end: Segment end, in seconds.
+        text: Transcribed text of the segment.
+    """
+
+    start: float
+    end: float
+    text: str
+
+
+@runtime_checkable
+class StreamingSTT(STT, Protocol):
+    """STT that yields segments as they are decoded."""
+
+    def transcribe_stream(
+        self, audio_bytes: bytes, *, language: str = "pt"
+    ) -> AsyncIterator[TranscriptSegment]: ...
+
+
 @dataclass(frozen=True)
 class VoiceInfo:
     """Metadata about an available TTS voice.
@@ -87,3 +112,27 @@ class OCRProcessor(Protocol):
     async def extract_text(
         self, file_bytes: bytes, *, file_type: str = "pdf"
     ) -> str: ...
+
+
+@dataclass(frozen=True)
+class PageText:
+    """Text of one document page.
+
+    Attributes:
+        index: Zero-based page number.
+        text: Extracted text (empty when the page has none).
+        ocr: Whether the text came from OCR rather than the text layer.
+    """
+
+    index: int
+    text: str
+    ocr: bool = False
+
+
+@runtime_checkable
+class PagedOCRProcessor(OCRProcessor, Protocol):
+    """OCR processor that yields pages, in order, as they are extracted."""
+
+    def iter_pages(
+        self, file_bytes: bytes, *, file_type: str = "pdf"
+    ) -> AsyncIterator[PageText]: ...
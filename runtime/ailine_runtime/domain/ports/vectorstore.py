@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections.abc import AsyncIterable, Iterable
 from dataclasses import dataclass
 from typing import Any, Protocol, runtime_checkable
 
@@ -16,6 +17,16 @@ class VectorSearchResult:
     metadata: dict[str, Any]
 
 
+@dataclass(frozen=True)
+class VectorRecord:
+    """One chunk to be written by a bulk upsert."""
+
+    id: str
+    embedding: list[float]
+    text: str
+    metadata: dict[str, Any]
+
+
 @runtime_checkable
 class VectorStore(Protocol):
     """Protocol for vector stores."""
@@ -39,4 +50,79 @@ class VectorStore(Protocol):
         tenant_id: str | None = None,
     ) -> list[VectorSearchResult]: ...
 
+    async def search_many(
+        self,
+        *,
+        query_embeddings: list[list[float]],
+        k: int = 5,
+        filters: dict[str, Any] | None = None,
+        tenant_id: str | None = None,
+    ) -> list[list[VectorSearchResult]]:
+        """Run several searches sharing the same ``k``/filters/tenant at once.
+
+        Returns one result list per query embedding, in input order.
+        Adapters should serve the whole batch in a single round trip.
+        """
+        ...
+
     async def delete(self, *, ids: list[str]) -> None: ...
+
+
+@runtime_checkable
+class BulkVectorStore(Protocol):
+    """Optional capability: streaming bulk upsert for large ingestions.
+
+    Stores implementing this accept an (async) iterable of records and
+    write them in bounded batches, so callers never need to materialize
+    a whole material library in memory.
+    """
+
+    async def bulk_upsert(
+        self,
+        records: AsyncIterable[VectorRecord] | Iterable[VectorRecord],
+        *,
+        tenant_id: str | None = None,
+        batch_size: int = 1000,
+    ) -> int: ...
+
+
+@runtime_checkable
+class ChunkInventory(Protocol):
+    """Optional capability: list the stored chunks of one material.
+
+    Used by incremental re-ingestion to diff new chunks against what is
+    already indexed without re-reading embeddings.
+    """
+
+    async def chunk_hashes(
+        self,
+        *,
+        material_id: str,
+        tenant_id: str | None = None,
+    ) -> dict[str, str | None]:
+        """Map each stored chunk ID of *material_id* to its ``chunk_hash``.
+
+        The value is ``None`` for chunks written without a hash.
+        """
+        ...
+
+
+@runtime_checkable
+class LexicalSearch(Protocol):
+    """Optional capability: keyword (BM25-style) retrieval over chunk text.
+
+    Complements dense search for exact tokens that embeddings blur, such as
+    curriculum codes (``EF04MA07``) and rare domain terms.  Scores are
+    backend-specific relevance values: only their order is meaningful.
+    """
+
+    async def lexical_search(
+        self,
+        *,
+        query: str,
+        k: int = 5,
+        filters: dict[str, Any] | None = None,
+        tenant_id: str | None = None,
+    ) -> list[VectorSearchResult]:
+        """Return up to *k* chunks matching any term of *query*, best first."""
+        ...
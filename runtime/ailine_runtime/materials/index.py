@@ -0,0 +1,575 @@
+"""Persistent inverted index for the local material store.
+
+Replaces the "glob + JSON-parse every file per query" scan with a BM25
+index kept on disk next to the materials.  Queries only touch the
+postings of their own terms; ``add_material`` appends to the index
+instead of rebuilding it.
+
+Layout (under ``{AILINE_LOCAL_STORE}/index/``)::
+
+    meta.json           {"version", "generation"} -- atomically replaced
+    materials.jsonl     append-only material_id -> path / filter fields
+    lex-{g}.npy         uint8: sorted UTF-8 terms, concatenated
+    lexoff-{g}.npy      uint64: byte offset of each term in lex (T + 1)
+    postoff-{g}.npy     uint64: first posting of each term (T + 1)
+    post-{g}.npy        (chunk u4, tf u4) postings grouped by term
+    chunks-{g}.npy      (material u4, index u4, length u4) per chunk
+    delta-{g}.jsonl     append-only chunks added since generation g
+
+The generation-``g`` ``.npy`` files form an immutable main segment that is
+memory-mapped at query time (term lookup is a binary search over the
+mapped lexicon).  New materials go to the delta log, which is also held in
+memory as compact ``array`` postings.  When the delta grows past a fraction
+of the main segment, both are merged into generation ``g + 1``; the
+geometric threshold keeps total merge work linear in the corpus size.
+
+Readers in other processes pick up appended lines and new generations on
+their next query (cheap ``stat`` checks).  Like the rest of the local
+store, the index assumes a single writer process.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import json
+import os
+import threading
+from array import array
+from collections import Counter
+from collections.abc import Callable, Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+
+from ..shared.bm25 import bm25_idf, bm25_term_score
+
+_VERSION = 1
+_POSTING = np.dtype([("chunk", "<u4"), ("tf", "<u4")])
+_CHUNK = np.dtype([("material", "<u4"), ("index", "<u4"), ("length", "<u4")])
+
+# Merge the delta into a new main segment once it holds this many chunks,
+# or this fraction of the main segment, whichever is larger.
+_COMPACT_MIN_CHUNKS = 4096
+_COMPACT_RATIO = 0.25
+
+_SEGMENT_FILES = (
+    "lex-{g}.npy",
+    "lexoff-{g}.npy",
+    "postoff-{g}.npy",
+    "post-{g}.npy",
+    "chunks-{g}.npy",
+    "delta-{g}.jsonl",
+)
+
+
+@dataclass(frozen=True)
+class IndexedMaterial:
+    """Index entry for one material (everything except its content)."""
+
+    material_id: str
+    path: str
+    teacher_id: str
+    subject: str
+    subject_slug: str
+    title: str
+    tags: tuple[str, ...]
+
+
+@dataclass(frozen=True)
+class ChunkHit:
+    """A scored chunk returned by :meth:`MaterialIndex.search`."""
+
+    material: IndexedMaterial
+    chunk_index: int
+    score: float
+
+
+class MaterialIndex:
+    """BM25 inverted index over material chunks, persisted on disk.
+
+    Args:
+        index_dir: Directory holding the index files.
+        materials_dir: Root of the material JSON files; stored paths are
+            relative to it.
+        tokenize: Query/document tokenizer.
+        chunk: Splits a material's content into chunks.
+        scan: Yields ``(path, material)`` for every material file; used to
+            build the index when none exists yet.
+    """
+
+    def __init__(
+        self,
+        index_dir: Path,
+        materials_dir: Path,
+        *,
+        tokenize: Callable[[str], list[str]],
+        chunk: Callable[[str], list[str]],
+        scan: Callable[[], Iterable[tuple[Path, Any]]],
+    ) -> None:
+        self._dir = index_dir
+        self._materials_dir = materials_dir
+        self._tokenize = tokenize
+        self._chunk = chunk
+        self._scan = scan
+        self._lock = threading.RLock()
+        self._opened = False
+        self._reset_state(generation=0)
+
+    # -- Public API -------------------------------------------------------------
+
+    def add(self, material: Any, path: Path) -> None:
+        """Index *material* (stored at *path*); no-op if already indexed."""
+        with self._lock:
+            self._ensure_open()
+            self._refresh()
+            self._add(material, path)
+
+    def lookup(self, material_id: str) -> IndexedMaterial | None:
+        """Return the index entry for *material_id*, if any."""
+        with self._lock:
+            self._ensure_open()
+            self._refresh()
+            ordinal = self._ord_of.get(material_id)
+            return None if ordinal is None else self._materials[ordinal]
+
+    def material_path(self, entry: IndexedMaterial) -> Path:
+        """Absolute path of an indexed material's JSON file."""
+        return self._materials_dir / entry.path
+
+    def search(
+        self,
+        query: str,
+        *,
+        k: int = 5,
+        teacher_id: str | None = None,
+        subject_slug: str | None = None,
+        material_ids: Iterable[str] | None = None,
+        tags: Iterable[str] | None = None,
+    ) -> list[ChunkHit]:
+        """Return the top-*k* chunks for *query* by BM25 score.
+
+        Filters are ANDed; ``tags`` matches materials sharing at least one
+        tag (case-insensitive).  Ties are broken by insertion order.
+        """
+        terms = list(dict.fromkeys(self._tokenize(query)))
+        if not terms or k <= 0:
+            return []
+        with self._lock:
+            self._ensure_open()
+            self._refresh()
+            return self._search(terms, k, teacher_id, subject_slug, material_ids, tags)
+
+    def rebuild(self) -> None:
+        """Drop the index and rebuild it from the material files."""
+        with self._lock:
+            self._bootstrap()
+            self._opened = True
+
+    @property
+    def chunk_count(self) -> int:
+        with self._lock:
+            self._ensure_open()
+            return self._main_chunks + len(self._delta_len)
+
+    @property
+    def generation(self) -> int:
+        return self._generation
+
+    # -- State ------------------------------------------------------------------
+
+    def _reset_state(self, *, generation: int) -> None:
+        self._generation = generation
+        self._meta_stat: tuple[int, int] | None = None
+        # Material map (all generations)
+        self._materials: list[IndexedMaterial] = []
+        self._ord_of: dict[str, int] = {}
+        self._codes: dict[tuple[str, str], int] = {}
+        self._mat_teacher = array("I")
+        self._mat_subject = array("I")
+        self._materials_offset = 0
+        # Main segment (memory-mapped)
+        self._lex: np.ndarray = np.zeros(0, dtype=np.uint8)
+        self._lexoff: np.ndarray = np.zeros(1, dtype=np.uint64)
+        self._postoff: np.ndarray = np.zeros(1, dtype=np.uint64)
+        self._post: np.ndarray = np.zeros(0, dtype=_POSTING)
+        self._chunks: np.ndarray = np.zeros(0, dtype=_CHUNK)
+        self._main_chunks = 0
+        self._main_len = 0
+        # Delta segment (in memory, mirrored by delta-{g}.jsonl)
+        self._delta_post: dict[str, tuple[array[int], array[int]]] = {}
+        self._delta_mat = array("I")
+        self._delta_idx = array("I")
+        self._delta_len = array("I")
+        self._delta_total_len = 0
+        self._delta_offset = 0
+
+    def _path(self, name: str, generation: int | None = None) -> Path:
+        g = self._generation if generation is None else generation
+        return self._dir / name.format(g=g)
+
+    def _ensure_open(self) -> None:
+        if self._opened:
+            return
+        meta = self._read_meta()
+        if meta is None or meta.get("version") != _VERSION:
+            self._bootstrap()
+        else:
+            self._load(int(meta["generation"]))
+        self._opened = True
+
+    def _read_meta(self) -> dict[str, Any] | None:
+        try:
+            meta: dict[str, Any] = json.loads((self._dir / "meta.json").read_text("utf-8"))
+        except (OSError, json.JSONDecodeError):
+            return None
+        return meta
+
+    def _write_meta(self, generation: int) -> None:
+        tmp = self._dir / "meta.json.tmp"
+        tmp.write_text(json.dumps({"version": _VERSION, "generation": generation}), "utf-8")
+        os.replace(tmp, self._dir / "meta.json")
+
+    def _bootstrap(self) -> None:
+        """Create an empty index and add every existing material file."""
+        self._dir.mkdir(parents=True, exist_ok=True)
+        for f in self._dir.iterdir():
+            with contextlib.suppress(OSError):
+                f.unlink()
+        (self._dir / "materials.jsonl").write_bytes(b"")
+        self._reset_state(generation=0)
+        self._path("delta-{g}.jsonl").write_bytes(b"")
+        self._write_meta(0)
+        self._load(0)
+        for path, material in self._scan():
+            self._add(material, path)
+
+    def _load(self, generation: int) -> None:
+        """(Re)load generation *generation* from disk."""
+        self._reset_state(generation=generation)
+        if generation > 0:
+            self._lex = _load_array(self._path("lex-{g}.npy"))
+            self._lexoff = _load_array(self._path("lexoff-{g}.npy"))
+            self._postoff = _load_array(self._path("postoff-{g}.npy"))
+            self._post = _load_array(self._path("post-{g}.npy"))
+            self._chunks = _load_array(self._path("chunks-{g}.npy"))
+            self._main_chunks = len(self._chunks)
+            self._main_len = int(self._chunks["length"].sum(dtype=np.uint64))
+        self._meta_stat = _stat(self._dir / "meta.json")
+        self._refresh()
+
+    def _refresh(self) -> None:
+        """Pick up a new generation or lines appended since the last read."""
+        if _stat(self._dir / "meta.json") != self._meta_stat:
+            meta = self._read_meta()
+            if meta is not None and int(meta["generation"]) != self._generation:
+                self._load(int(meta["generation"]))
+                return
+            self._meta_stat = _stat(self._dir / "meta.json")
+        self._materials_offset = _read_tail(
+            self._dir / "materials.jsonl", self._materials_offset, self._apply_material
+        )
+        self._delta_offset = _read_tail(
+            self._path("delta-{g}.jsonl"), self._delta_offset, self._apply_chunk
+        )
+
+    # -- Writes ---------------------------------------------------------------------
+
+    def _add(self, material: Any, path: Path) -> None:
+        if material.material_id in self._ord_of:
+            return
+        ordinal = len(self._materials)
+        record = {
+            "id": material.material_id,
+            "path": path.resolve().relative_to(self._materials_dir).as_posix(),
+            "teacher": material.teacher_id,
+            "subject": material.subject,
+            "slug": path.parent.name,
+            "title": material.title,
+            "tags": list(material.tags),
+        }
+        chunk_records = []
+        for idx, text in enumerate(self._chunk(material.content)):
+            tokens = self._tokenize(text)
+            chunk_records.append({"m": ordinal, "i": idx, "n": len(tokens), "t": Counter(tokens)})
+        # The material line goes first so readers never see a chunk whose
+        # material they cannot resolve.  Our own appends are applied directly
+        # rather than re-read from disk.
+        self._materials_offset += _append_lines(self._dir / "materials.jsonl", [record])
+        self._apply_material(record)
+        self._delta_offset += _append_lines(self._path("delta-{g}.jsonl"), chunk_records)
+        for rec in chunk_records:
+            self._apply_chunk(rec)
+
+        threshold = max(_COMPACT_MIN_CHUNKS, int(self._main_chunks * _COMPACT_RATIO))
+        if len(self._delta_len) >= threshold:
+            self._compact()
+
+    def _apply_material(self, rec: dict[str, Any]) -> None:
+        entry = IndexedMaterial(
+            material_id=rec["id"],
+            path=rec["path"],
+            teacher_id=rec["teacher"],
+            subject=rec["subject"],
+            subject_slug=rec["slug"],
+            title=rec["title"],
+            tags=tuple(rec["tags"]),
+        )
+        self._ord_of[entry.material_id] = len(self._materials)
+        self._materials.append(entry)
+        self._mat_teacher.append(self._code("t", entry.teacher_id))
+        self._mat_subject.append(self._code("s", entry.subject_slug))
+
+    def _apply_chunk(self, rec: dict[str, Any]) -> None:
+        chunk_id = self._main_chunks + len(self._delta_len)
+        self._delta_mat.append(rec["m"])
+        self._delta_idx.append(rec["i"])
+        self._delta_len.append(rec["n"])
+        self._delta_total_len += rec["n"]
+        for term, tf in rec["t"].items():
+            entry = self._delta_post.get(term)
+            if entry is None:
+                entry = self._delta_post[term] = (array("I"), array("I"))
+            entry[0].append(chunk_id)
+            entry[1].append(tf)
+
+    def _code(self, kind: str, value: str) -> int:
+        key = (kind, value)
+        code = self._codes.get(key)
+        if code is None:
+            code = self._codes[key] = len(self._codes)
+        return code
+
+    def _compact(self) -> None:
+        """Merge main + delta into a new generation and switch to it."""
+        old = self._generation
+        new = old + 1
+
+        main_terms = [self._term_at(i) for i in range(len(self._lexoff) - 1)]
+        delta_terms = {term.encode("utf-8"): term for term in self._delta_post}
+        vocab = sorted(set(main_terms).union(delta_terms))
+        term_id = {term: i for i, term in enumerate(vocab)}
+
+        term_parts = [
+            np.repeat(
+                np.fromiter((term_id[t] for t in main_terms), dtype=np.uint32, count=len(main_terms)),
+                np.diff(self._postoff).astype(np.int64),
+            )
+        ]
+        chunk_parts = [np.asarray(self._post["chunk"])]
+        tf_parts = [np.asarray(self._post["tf"])]
+        for encoded, term in delta_terms.items():
+            chunk_ids, tfs = self._delta_post[term]
+            term_parts.append(np.full(len(chunk_ids), term_id[encoded], dtype=np.uint32))
+            chunk_parts.append(np.frombuffer(chunk_ids, dtype=np.uint32))
+            tf_parts.append(np.frombuffer(tfs, dtype=np.uint32))
+        terms = np.concatenate(term_parts)
+        order = np.lexsort((np.concatenate(chunk_parts), terms))
+
+        post = np.empty(len(order), dtype=_POSTING)
+        post["chunk"] = np.concatenate(chunk_parts)[order]
+        post["tf"] = np.concatenate(tf_parts)[order]
+        postoff = np.zeros(len(vocab) + 1, dtype=np.uint64)
+        postoff[1:] = np.cumsum(np.bincount(terms, minlength=len(vocab)))
+        lexoff = np.zeros(len(vocab) + 1, dtype=np.uint64)
+        lexoff[1:] = np.cumsum([len(t) for t in vocab])
+        lex = np.frombuffer(b"".join(vocab), dtype=np.uint8)
+
+        delta_chunks = np.empty(len(self._delta_len), dtype=_CHUNK)
+        delta_chunks["material"] = np.frombuffer(self._delta_mat, dtype=np.uint32)
+        delta_chunks["index"] = np.frombuffer(self._delta_idx, dtype=np.uint32)
+        delta_chunks["length"] = np.frombuffer(self._delta_len, dtype=np.uint32)
+        chunks = np.concatenate([np.asarray(self._chunks), delta_chunks])
+
+        arrays: tuple[np.ndarray, ...] = (lex, lexoff, postoff, post, chunks)
+        for name, arr in zip(_SEGMENT_FILES[: len(arrays)], arrays, strict=True):
+            np.save(self._path(name, new), arr)
+        self._path("delta-{g}.jsonl", new).write_bytes(b"")
+        self._write_meta(new)
+        self._load(new)
+
+        for name in _SEGMENT_FILES:
+            with contextlib.suppress(OSError):
+                self._path(name, old).unlink()
+
+    # -- Reads ----------------------------------------------------------------------
+
+    def _term_at(self, i: int) -> bytes:
+        return self._lex[int(self._lexoff[i]) : int(self._lexoff[i + 1])].tobytes()
+
+    def _main_postings(self, term: str) -> np.ndarray:
+        """Binary-search the memory-mapped lexicon for *term*'s postings."""
+        key = term.encode("utf-8")
+        lo, hi = 0, len(self._lexoff) - 1
+        while lo < hi:
+            mid = (lo + hi) // 2
+            if self._term_at(mid) < key:
+                lo = mid + 1
+            else:
+                hi = mid
+        if lo < len(self._lexoff) - 1 and self._term_at(lo) == key:
+            return self._post[int(self._postoff[lo]) : int(self._postoff[lo + 1])]
+        return self._post[:0]
+
+    def _chunk_column(self, chunk_ids: np.ndarray, field: str, delta: array[int]) -> np.ndarray:
+        """Gather a per-chunk column across the main and delta segments."""
+        out = np.empty(len(chunk_ids), dtype=np.int64)
+        in_main = chunk_ids < self._main_chunks
+        out[in_main] = self._chunks[field][chunk_ids[in_main]]
+        if not in_main.all():
+            delta_arr = np.frombuffer(delta, dtype=np.uint32)
+            out[~in_main] = delta_arr[chunk_ids[~in_main] - self._main_chunks]
+        return out
+
+    def _search(
+        self,
+        terms: list[str],
+        k: int,
+        teacher_id: str | None,
+        subject_slug: str | None,
+        material_ids: Iterable[str] | None,
+        tags: Iterable[str] | None,
+    ) -> list[ChunkHit]:
+        n_chunks = self._main_chunks + len(self._delta_len)
+        if n_chunks == 0:
+            return []
+        avgdl = max((self._main_len + self._delta_total_len) / n_chunks, 1e-9)
+
+        id_parts: list[np.ndarray] = []
+        tf_parts: list[np.ndarray] = []
+        idf_parts: list[np.ndarray] = []
+        for term in terms:
+            main = self._main_postings(term)
+            delta = self._delta_post.get(term)
+            ids = [main["chunk"].astype(np.int64)]
+            tfs = [main["tf"].astype(np.float64)]
+            if delta is not None:
+                ids.append(np.frombuffer(delta[0], dtype=np.uint32).astype(np.int64))
+                tfs.append(np.frombuffer(delta[1], dtype=np.uint32).astype(np.float64))
+            df = sum(len(part) for part in ids)
+            if df == 0:
+                continue
+            idf = bm25_idf(n_chunks, df)
+            id_parts.extend(ids)
+            tf_parts.extend(tfs)
+            idf_parts.append(np.full(df, idf))
+        if not id_parts:
+            return []
+
+        chunk_ids = np.concatenate(id_parts)
+        tf = np.concatenate(tf_parts)
+        dl = self._chunk_column(chunk_ids, "length", self._delta_len)
+        weights = bm25_term_score(np.concatenate(idf_parts), tf, dl, avgdl)
+        candidates, inverse = np.unique(chunk_ids, return_inverse=True)
+        scores = np.bincount(inverse, weights=weights)
+
+        mats = self._chunk_column(candidates, "material", self._delta_mat)
+        keep = self._material_mask(mats, teacher_id, subject_slug, material_ids, tags)
+        if keep is not None:
+            candidates, scores, mats = candidates[keep], scores[keep], mats[keep]
+        if not len(candidates):
+            return []
+
+        if len(scores) > k:
+            kth = np.partition(scores, len(scores) - k)[len(scores) - k]
+            top = scores >= kth
+            candidates, scores, mats = candidates[top], scores[top], mats[top]
+        order = np.lexsort((candidates, -scores))[:k]
+        idx = self._chunk_column(candidates[order], "index", self._delta_idx)
+        return [
+            ChunkHit(material=self._materials[m], chunk_index=int(i), score=float(s))
+            for m, i, s in zip(mats[order].tolist(), idx.tolist(), scores[order].tolist(), strict=True)
+        ]
+
+    def _material_mask(
+        self,
+        mats: np.ndarray,
+        teacher_id: str | None,
+        subject_slug: str | None,
+        material_ids: Iterable[str] | None,
+        tags: Iterable[str] | None,
+    ) -> np.ndarray | None:
+        """Boolean mask over candidate chunks' materials, or None (no filters)."""
+        mask: np.ndarray | None = None
+
+        def _and(m: np.ndarray) -> None:
+            nonlocal mask
+            mask = m if mask is None else mask & m
+
+        for kind, value, codes in (
+            ("t", teacher_id, self._mat_teacher),
+            ("s", subject_slug, self._mat_subject),
+        ):
+            if value is None:
+                continue
+            code = self._codes.get((kind, value))
+            if code is None:
+                return np.zeros(len(mats), dtype=bool)
+            _and(np.frombuffer(codes, dtype=np.uint32)[mats] == code)
+        if material_ids:
+            ords = [self._ord_of[mid] for mid in material_ids if mid in self._ord_of]
+            _and(np.isin(mats, ords))
+        tag_filter = {t.lower() for t in tags or ()}
+        if tag_filter:
+            allowed = [
+                m
+                for m in np.unique(mats).tolist()
+                if tag_filter.intersection(t.lower() for t in self._materials[m].tags)
+            ]
+            _and(np.isin(mats, allowed))
+        return mask
+
+
+# -- File helpers -------------------------------------------------------------------
+
+
+def _stat(path: Path) -> tuple[int, int] | None:
+    try:
+        st = path.stat()
+    except OSError:
+        return None
+    return (st.st_mtime_ns, st.st_size)
+
+
+def _load_array(path: Path) -> np.ndarray:
+    """Memory-map a ``.npy`` file (empty arrays cannot be mapped)."""
+    arr: np.ndarray
+    try:
+        arr = np.load(path, mmap_mode="r")
+    except ValueError:
+        arr = np.load(path)
+    return arr
+
+
+def _append_lines(path: Path, records: list[dict[str, Any]]) -> int:
+    """Append *records* as JSON lines in one write; return the bytes written."""
+    if not records:
+        return 0
+    data = "".join(json.dumps(r, ensure_ascii=False) + "\n" for r in records).encode("utf-8")
+    with path.open("ab") as f:
+        f.write(data)
+    return len(data)
+
+
+def _read_tail(path: Path, offset: int, apply: Callable[[dict[str, Any]], None]) -> int:
+    """Apply complete JSON lines appended to *path* after *offset*.
+
+    Returns the new offset (just past the last complete line).
+    """
+    try:
+        size = path.stat().st_size
+    except OSError:
+        return offset
+    if size <= offset:
+        return offset
+    with path.open("rb") as f:
+        f.seek(offset)
+        data = f.read(size - offset)
+    end = data.rfind(b"\n")
+    if end < 0:
+        return offset
+    for line in data[:end].splitlines():
+        if line:
+            apply(json.loads(line))
+    return offset + end + 1
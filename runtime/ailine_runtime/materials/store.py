@@ -3,13 +3,16 @@ from __future__ import annotations
 import json
 import os
 import re
+import threading
 import uuid
-from collections.abc import Iterable
+from collections.abc import Iterable, Iterator
 from dataclasses import dataclass
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+from .index import MaterialIndex
+
 # -----------------------------
 # Local material store (MVP)
 # -----------------------------
@@ -36,6 +39,11 @@ from typing import Any
 #     "created_at": "2026-02-11T..."
 #   }
 #
+# Busca e lookup por id usam um índice invertido persistente (BM25) em
+# .local_store/index/ -- ver materials/index.py.  O índice é atualizado
+# incrementalmente por add_material e reconstruído a partir dos arquivos
+# quando ainda não existe.
+#
 
 
 def _root_dir() -> Path:
@@ -102,22 +110,40 @@ def add_material(
     out_path.write_text(
         json.dumps(m.__dict__, ensure_ascii=False, indent=2), encoding="utf-8"
     )
+    get_material_index().add(m, out_path)
     return m
 
 
 def load_material(
     material_id: str, *, teacher_id: str | None = None, subject: str | None = None
 ) -> Material | None:
-    # Busca simples por varredura (MVP). Em produção: lookup por índice/DB.
-    for m in iter_materials(teacher_id=teacher_id, subject=subject):
-        if m.material_id == material_id:
-            return m
-    return None
+    entry = get_material_index().lookup(material_id)
+    if entry is None:
+        return None
+    if teacher_id is not None and entry.teacher_id != teacher_id:
+        return None
+    if subject is not None and entry.subject_slug != _slug(subject):
+        return None
+    return _read_material(get_material_index().material_path(entry))
+
+
+def _read_material(path: Path) -> Material | None:
+    try:
+        return Material(**json.loads(path.read_text(encoding="utf-8")))
+    except (json.JSONDecodeError, ValueError, TypeError, OSError):
+        return None
 
 
 def iter_materials(
     *, teacher_id: str | None = None, subject: str | None = None
 ) -> Iterable[Material]:
+    for _path, m in _iter_material_files(teacher_id=teacher_id, subject=subject):
+        yield m
+
+
+def _iter_material_files(
+    *, teacher_id: str | None = None, subject: str | None = None
+) -> Iterator[tuple[Path, Material]]:
     root = _materials_dir()
     teacher_dirs = (
         [root / teacher_id] if teacher_id else [p for p in root.iterdir() if p.is_dir()]
@@ -135,11 +161,34 @@ def iter_materials(
             if not sdir.exists():
                 continue
             for f in sdir.glob("*.json"):
-                try:
-                    raw = json.loads(f.read_text(encoding="utf-8"))
-                    yield Material(**raw)
-                except (json.JSONDecodeError, ValueError, TypeError, OSError):
-                    continue
+                m = _read_material(f)
+                if m is not None:
+                    yield f, m
+
+
+# -----------------------------
+# Persistent index (one per store root)
+# -----------------------------
+
+_INDEXES: dict[Path, MaterialIndex] = {}
+_INDEXES_LOCK = threading.Lock()
+
+
+def get_material_index() -> MaterialIndex:
+    """Return the inverted index for the current ``AILINE_LOCAL_STORE``."""
+    materials_dir = _materials_dir().resolve()
+    with _INDEXES_LOCK:
+        index = _INDEXES.get(materials_dir)
+        if index is None:
+            index = MaterialIndex(
+                materials_dir.parent / "index",
+                materials_dir,
+                tokenize=_tokens,
+                chunk=_chunk_text,
+                scan=_iter_material_files,
+            )
+            _INDEXES[materials_dir] = index
+        return index
 
 
 # -----------------------------
@@ -263,39 +312,40 @@ def search_materials(
     material_ids: list[str] | None = None,
     tags: list[str] | None = None,
 ) -> list[dict[str, Any]]:
-    q_tokens = _tokens(query)
-    if not q_tokens:
-        return []
-
-    id_filter = set(material_ids or [])
-    tag_filter = {t.lower() for t in (tags or [])}
+    """Rank material chunks for *query* with BM25 over the persistent index.
+
+    Only the top-k chunks' material files are read from disk (to return
+    their text); everything else is answered from the index.
+    """
+    index = get_material_index()
+    hits = index.search(
+        query,
+        k=max(1, min(k, 20)),
+        teacher_id=teacher_id,
+        subject_slug=_slug(subject) if subject else None,
+        material_ids=material_ids or None,
+        tags=tags or None,
+    )
 
+    contents: dict[str, list[str]] = {}
     scored: list[dict[str, Any]] = []
-    for m in iter_materials(teacher_id=teacher_id, subject=subject):
-        if id_filter and m.material_id not in id_filter:
-            continue
-        if tag_filter:
-            mt = {t.lower() for t in m.tags}
-            if not (mt & tag_filter):
-                continue
-
-        chunks = _chunk_text(m.content)
-        for idx, ch in enumerate(chunks):
-            ch_low = ch.lower()
-            score = sum(1 for t in q_tokens if t in ch_low)
-            if score <= 0:
-                continue
-            scored.append(
-                {
-                    "score": score,
-                    "material_id": m.material_id,
-                    "title": m.title,
-                    "subject": m.subject,
-                    "chunk_index": idx,
-                    "text": ch[:1200],
-                    "tags": m.tags,
-                }
-            )
-
-    scored.sort(key=lambda x: x["score"], reverse=True)
-    return scored[: max(1, min(k, 20))]
+    for hit in hits:
+        entry = hit.material
+        if entry.material_id not in contents:
+            m = _read_material(index.material_path(entry))
+            contents[entry.material_id] = _chunk_text(m.content) if m else []
+        chunks = contents[entry.material_id]
+        if hit.chunk_index >= len(chunks):
+            continue  # file removed or edited outside add_material
+        scored.append(
+            {
+                "score": round(hit.score, 4),
+                "material_id": entry.material_id,
+                "title": entry.title,
+                "subject": entry.subject,
+                "chunk_index": hit.chunk_index,
+                "text": chunks[hit.chunk_index][:1200],
+                "tags": list(entry.tags),
+            }
+        )
+    return scored
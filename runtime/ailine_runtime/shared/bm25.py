@@ -0,0 +1,27 @@
+"""BM25 (Okapi) scoring shared by the in-process lexical indexes.
+
+Both the local material index (numpy postings) and the in-memory vector
+store's lexical index score with these functions, so the two rank a
+query the same way.  The arithmetic works on plain floats and on numpy
+arrays alike.
+"""
+
+from __future__ import annotations
+
+import math
+from typing import Any
+
+# Robertson/Zaragoza defaults
+BM25_K1 = 1.2
+BM25_B = 0.75
+
+
+def bm25_idf(n_docs: int, df: int) -> float:
+    """Inverse document frequency of a term found in *df* of *n_docs* documents."""
+    return math.log(1.0 + (n_docs - df + 0.5) / (df + 0.5))
+
+
+def bm25_term_score(idf: Any, tf: Any, doc_len: Any, avgdl: float) -> Any:
+    """Contribution of one term to a document's score (scalars or arrays)."""
+    norm = 1.0 - BM25_B + BM25_B * doc_len / avgdl
+    return idf * tf * (BM25_K1 + 1.0) / (tf + BM25_K1 * norm)
@@ -13,6 +13,23 @@ class LLMConfig(BaseSettings):
     )
     model: str = "claude-opus-4-6"
     api_key: str = ""
+    prompt_caching: bool = True
+    """Use provider-side prompt caching for stable prompt prefixes
+    (Anthropic ``cache_control``, Gemini cached content, OpenAI
+    ``prompt_cache_key``)."""
+    prompt_cache_ttl_seconds: int = 3600
+    """Lifetime of explicit provider caches created by the adapter (Gemini)."""
+    response_cache: Literal["none", "memory", "sqlite", "redis"] = "none"
+    """Local cache of LLM responses for deterministic requests.  ``memory``
+    is an in-process LRU, ``sqlite`` a file under ``AILINE_LOCAL_STORE``
+    (survives restarts) and ``redis`` is shared via ``AILINE_REDIS_URL``."""
+    response_cache_max_entries: int = 1024
+    """Capacity of the in-process LRU (``response_cache=memory``)."""
+    response_cache_ttl_seconds: int = 24 * 3600
+    """Lifetime of cached responses (0 = never expire)."""
+    response_cache_max_temperature: float = 0.5
+    """Requests at or below this temperature are treated as deterministic
+    and cached; callers can override per call with ``use_cache``."""
 
 
 class EmbeddingConfig(BaseSettings):
@@ -25,11 +42,35 @@ class EmbeddingConfig(BaseSettings):
     """Max embeddings per API call. Controls chunking of large embed requests
     to avoid provider timeouts and memory pressure. Typical provider limits:
     Gemini=100, OpenAI=2048. Use a conservative default."""
+    max_concurrency: int = 4
+    """Max embedding API requests in flight per adapter when a large
+    ``embed_batch`` is split into provider-sized sub-batches."""
+    cache: Literal["none", "memory", "redis", "postgres"] = "none"
+    """Content-addressed embedding cache wrapped around the adapter.
+    ``memory`` keeps an in-process LRU only; ``redis``/``postgres`` add a
+    shared tier (using ``AILINE_REDIS_URL`` / ``AILINE_DB_URL``)."""
+    cache_max_entries: int = 10_000
+    """Capacity of the in-process LRU tier of the embedding cache."""
+    cache_ttl_seconds: int = 30 * 24 * 3600
+    """Expiry of vectors in the Redis tier (0 = never expire)."""
 
 
 class VectorStoreConfig(BaseSettings):
     model_config = SettingsConfigDict(env_prefix="AILINE_VECTORSTORE_")
     provider: Literal["pgvector", "chroma"] = "pgvector"
+    binary_vectors: bool = True
+    """Send pgvector embeddings in the binary wire format (asyncpg only).
+    Disable to fall back to ``[v1,v2,...]`` text literals."""
+    chroma_collection: str = "chunks"
+    """Chroma collection name (``provider=chroma``)."""
+    chroma_persist_directory: str = ""
+    """On-disk Chroma directory; empty for an ephemeral in-memory client."""
+    chroma_executor_workers: int = 4
+    """Threads running Chroma's synchronous calls off the event loop
+    (0 = run inline)."""
+    chroma_coalesce_window_ms: float = 2.0
+    """Window in which concurrent searches are merged into one multi-query
+    ``collection.query`` (0 = no coalescing)."""
 
 
 class DatabaseConfig(BaseSettings):
@@ -45,6 +86,107 @@ class RedisConfig(BaseSettings):
     url: str = "redis://localhost:6379/0"
 
 
+class HttpClientConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="AILINE_HTTP_")
+    max_connections: int = 100
+    """Total connections held by the shared HTTP client pool."""
+    max_connections_per_host: int = 20
+    """Concurrent requests allowed per upstream host; extra requests wait."""
+    max_keepalive_connections: int = 20
+    """Idle connections kept open for reuse."""
+    keepalive_expiry_seconds: float = 30.0
+    """How long an idle connection is kept before being closed."""
+    http2: bool = True
+    """Negotiate HTTP/2 (needs the optional ``h2`` package; HTTP/1.1
+    keep-alive otherwise)."""
+    timeout_seconds: float = 30.0
+    """Default request timeout; adapters may override per call."""
+    connect_timeout_seconds: float = 5.0
+    """Timeout for establishing a new connection."""
+
+
+class STTConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="AILINE_STT_")
+    model_size: str = "turbo"
+    """faster-whisper model for local STT (``turbo`` = Whisper V3 Turbo)."""
+    device: str = "cpu"
+    """``cpu`` or ``cuda``."""
+    compute_type: str = "int8"
+    """CTranslate2 quantisation (``int8`` recommended on CPU)."""
+    replicas: int = 1
+    """Local STT worker threads, each with its own model replica (a full
+    copy of the weights)."""
+    cpu_threads: int = 0
+    """CTranslate2 threads per replica (0 = library default)."""
+
+
+class OCRConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="AILINE_OCR_")
+    workers: int = 0
+    """Worker processes for page-parallel PDF/image extraction (opt-in;
+    0 = serial, text layer only, on the default executor)."""
+    page_range_size: int = 8
+    """Pages per unit of work; bounds per-worker memory."""
+    lang: str = "por+eng"
+    """Tesseract languages for pages without a text layer."""
+
+
+class TTSConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="AILINE_TTS_")
+    stream_concurrency: int = 4
+    """Segments synthesized at the same time by streaming synthesis."""
+    stream_lookahead: int = 8
+    """Segments streaming synthesis may run ahead of the client (bounds the
+    audio buffered for a slow reader; at least ``stream_concurrency``)."""
+    segment_max_chars: int = 400
+    """Longest text segment sent to the TTS adapter when streaming."""
+    segment_cache_max_bytes: int = 64 * 1024 * 1024
+    """Audio bytes kept by the process-wide segment cache (0 disables it)."""
+
+
+class SSEConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="AILINE_SSE_")
+    replay: Literal["memory", "redis"] = "memory"
+    """Where plan stream events are kept for resumption.  ``redis`` shares
+    them across nodes (``AILINE_REDIS_URL``) so ``GET
+    /plans/runs/{run_id}/events`` can follow a run from any node."""
+    replay_keep_last: int = 500
+    """Events kept per run for replay on reconnection."""
+    replay_ttl_seconds: int = 30 * 60
+    """Lifetime of a run's replay buffer after its last event."""
+    replay_batch_window_ms: float = 5.0
+    """Redis replay writes are buffered this long and sent in one pipeline
+    (0 = write each event through)."""
+    replay_batch_max_events: int = 64
+    """Pending events per run that trigger an immediate flush."""
+
+
+class TraceConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="AILINE_TRACE_")
+    store: Literal["memory", "db"] = "memory"
+    """Where pipeline run traces (/traces, /runs) are kept.  ``db`` uses the
+    ``run_traces``/``node_traces`` tables of ``AILINE_DB_URL`` and survives
+    restarts."""
+    ttl_seconds: int = 3600
+    """In-memory store: lifetime of a trace after its last update."""
+    max_entries: int = 500
+    """In-memory store: traces kept before the least recent is evicted."""
+    db_ttl_seconds: int = 7 * 24 * 3600
+    """Database store: traces not updated for this long are purged."""
+    batch_window_ms: float = 50.0
+    """Database store: node traces are buffered this long and inserted in
+    one batch (0 = write each node through)."""
+    batch_max_nodes: int = 64
+    """Database store: pending node traces that trigger an immediate flush."""
+
+
+class ProgressConfig(BaseSettings):
+    model_config = SettingsConfigDict(env_prefix="AILINE_PROGRESS_")
+    store: Literal["memory", "db"] = "memory"
+    """Where learner mastery progress (/progress) is kept.  ``db`` uses the
+    ``learner_progress`` / ``parent_students`` tables of ``AILINE_DB_URL``."""
+
+
 class Settings(BaseSettings):
     model_config = SettingsConfigDict(
         env_prefix="AILINE_",
@@ -84,6 +226,13 @@ class Settings(BaseSettings):
     vectorstore: VectorStoreConfig = Field(default_factory=VectorStoreConfig)
     db: DatabaseConfig = Field(default_factory=DatabaseConfig)
     redis: RedisConfig = Field(default_factory=RedisConfig)
+    http: HttpClientConfig = Field(default_factory=HttpClientConfig)
+    stt: STTConfig = Field(default_factory=STTConfig)
+    ocr: OCRConfig = Field(default_factory=OCRConfig)
+    tts: TTSConfig = Field(default_factory=TTSConfig)
+    sse: SSEConfig = Field(default_factory=SSEConfig)
+    trace: TraceConfig = Field(default_factory=TraceConfig)
+    progress: ProgressConfig = Field(default_factory=ProgressConfig)
 
     # Pipeline — all model IDs use Pydantic AI format: "provider:model-name"
     planner_model: str = "anthropic:claude-opus-4-6"
@@ -23,6 +23,7 @@ from ..domain.ports.media import (
 )
 from ..domain.ports.vectorstore import VectorStore
 from .config import Settings
+from .http_client import HttpClientPool
 
 _log = logging.getLogger("ailine.container")
 
@@ -73,6 +74,9 @@ class Container:
     vectorstore: VectorStore | None = None
     event_bus: EventBus | None = None
 
+    # Shared keep-alive HTTP client pool for httpx-based adapters
+    http: HttpClientPool | None = None
+
     # Media adapters (STT, TTS, image description/generation, OCR, sign recognition)
     stt: STT | None = None
     tts: TTS | None = None
@@ -92,6 +96,7 @@ class Container:
         from .container_adapters import (
             build_embeddings,
             build_event_bus,
+            build_http_pool,
             build_image_generator,
             build_llm,
             build_media,
@@ -101,10 +106,11 @@ class Container:
 
         cleanup: list[Any] = []
         event_bus = build_event_bus(settings)
-        llm = build_llm(settings)
-        embeddings = build_embeddings(settings)
+        http = build_http_pool(settings, cleanup)
+        llm = build_llm(settings, cleanup)
         vectorstore = build_vectorstore(settings, cleanup)
-        stt, tts, image_describer, ocr = build_media(settings)
+        embeddings = build_embeddings(settings, cleanup)
+        stt, tts, image_describer, ocr = build_media(settings, http, cleanup)
         sign_recognition = build_sign_recognition(settings)
         image_generator = build_image_generator(settings)
         container = cls(
@@ -113,6 +119,7 @@ class Container:
             embeddings=embeddings,
             vectorstore=vectorstore,
             event_bus=event_bus,
+            http=http,
             stt=stt,
             tts=tts,
             image_describer=image_describer,
@@ -132,6 +139,7 @@ class Container:
         Returns a dict with keys:
             - ``db``: ``{"status": "ok"|"unavailable"|"error", ...pool stats}``
             - ``redis``: ``{"status": "ok"|"unavailable"|"error"}``
+            - ``http`` (when the shared HTTP pool is wired): pool utilization
         """
         result: dict[str, Any] = {
             "db": {"status": "unavailable"},
@@ -154,6 +162,10 @@ class Container:
                     result["db"] = {"status": "error", "detail": str(exc)}
                 break
 
+        # Shared HTTP client pool utilization
+        if self.http is not None:
+            result["http"] = self.http.stats()
+
         # Redis / event bus connectivity via public protocol method
         if self.event_bus is not None:
             try:
@@ -167,12 +179,12 @@ class Container:
     # -- Scalability: graceful shutdown ----------------------------------------
 
     async def close(self) -> None:
-        """Dispose SQLAlchemy engine pools and close Redis connections.
+        """Dispose SQLAlchemy engine pools, the shared HTTP client pool and Redis connections.
 
         Safe to call multiple times.  Logs errors but does not raise,
         ensuring all resources are attempted for cleanup.
         """
-        # Dispose SQLAlchemy engines
+        # Dispose SQLAlchemy engines (and shared cache backends)
         for item in self._cleanup:
             try:
                 await item.dispose()
@@ -268,6 +280,7 @@ class Container:
             ("embeddings", self.embeddings),
             ("vectorstore", self.vectorstore),
             ("event_bus", self.event_bus),
+            ("http", self.http),
             ("stt", self.stt),
             ("tts", self.tts),
             ("image_describer", self.image_describer),
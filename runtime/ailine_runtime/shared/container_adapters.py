@@ -11,6 +11,7 @@ the Container dataclass; this module has adapter resolution logic).
 from __future__ import annotations
 
 import logging
+from pathlib import Path
 from typing import Any
 
 from ..domain.ports.embeddings import Embeddings
@@ -26,6 +27,7 @@ from ..domain.ports.media import (
 )
 from ..domain.ports.vectorstore import VectorStore
 from .config import Settings
+from .http_client import HttpClientPool
 
 _log = logging.getLogger("ailine.container")
 
@@ -33,9 +35,11 @@ _log = logging.getLogger("ailine.container")
 def build_vectorstore(settings: Settings, cleanup: list[Any]) -> VectorStore | None:
     """Build vector store adapter based on provider setting.
 
-    Returns None when the required database URL is not configured (e.g. SQLite dev).
-    When a SQLAlchemy engine is created, its reference is appended to the
-    ``cleanup`` list so the Container can dispose it on shutdown.
+    Returns None when the required database URL is not configured (e.g. SQLite dev)
+    or the provider's client library is not installed.
+    When a SQLAlchemy engine (pgvector) or a Chroma store (thread pool) is
+    created, its reference is appended to the ``cleanup`` list so the
+    Container can dispose it on shutdown.
     """
     provider = settings.vectorstore.provider
     if provider == "pgvector":
@@ -46,6 +50,9 @@ def build_vectorstore(settings: Settings, cleanup: list[Any]) -> VectorStore | N
         try:
             from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+            from ..adapters.vectorstores.pgvector_codec import (
+                install_binary_vector_codec,
+            )
             from ..adapters.vectorstores.pgvector_store import PgVectorStore
 
             engine = create_async_engine(
@@ -68,13 +75,36 @@ def build_vectorstore(settings: Settings, cleanup: list[Any]) -> VectorStore | N
                 settings.db.max_overflow,
                 type(engine.pool).__name__,
             )
+            # Binary vector wire format when the driver supports type codecs
+            binary_vectors = (
+                settings.vectorstore.binary_vectors
+                and install_binary_vector_codec(engine)
+            )
+
             session_factory = async_sessionmaker(engine, expire_on_commit=False)
             return PgVectorStore(
                 session_factory=session_factory,
                 dimensions=settings.embedding.dimensions,
+                binary_vectors=binary_vectors,
+            )
+        except ImportError:
+            return None
+    if provider == "chroma":
+        try:
+            from ..adapters.vectorstores.chroma_store import ChromaVectorStore
+
+            cfg = settings.vectorstore
+            chroma = ChromaVectorStore(
+                collection_name=cfg.chroma_collection,
+                persist_directory=cfg.chroma_persist_directory or None,
+                executor_workers=cfg.chroma_executor_workers,
+                coalesce_window_ms=cfg.chroma_coalesce_window_ms,
             )
         except ImportError:
             return None
+        # Track the thread pool for graceful shutdown
+        cleanup.append(chroma)
+        return chroma
     return None
 
 
@@ -108,8 +138,64 @@ def build_event_bus(settings: Settings) -> EventBus:
     return InMemoryEventBus()
 
 
-def build_llm(settings: Settings) -> ChatLLM:
-    """Build LLM adapter based on provider setting."""
+def build_llm(settings: Settings, cleanup: list[Any] | None = None) -> ChatLLM:
+    """Build LLM adapter, wrapped in the response cache if enabled.
+
+    A cache backend holding connections (SQLite/Redis) is appended to
+    ``cleanup`` so the Container releases it on shutdown.
+    """
+    llm = _build_llm_adapter(settings)
+    if settings.llm.response_cache == "none":
+        return llm
+    return wrap_llm_cache(llm, settings, cleanup)
+
+
+def wrap_llm_cache(
+    llm: ChatLLM, settings: Settings, cleanup: list[Any] | None = None
+) -> ChatLLM:
+    """Wrap *llm* in ``CachedChatLLM`` per ``settings.llm.response_cache``.
+
+    Falls back to the in-process LRU when the shared backend is not
+    configured or its optional dependency is missing.
+    """
+    from ..adapters.llm.cached_llm import (
+        CachedChatLLM,
+        LLMCacheBackend,
+        MemoryLLMCache,
+        RedisLLMCache,
+        SQLiteLLMCache,
+    )
+
+    cfg = settings.llm
+    backend: LLMCacheBackend | None = None
+    try:
+        if cfg.response_cache == "redis" and settings.redis.url:
+            backend = RedisLLMCache.from_url(
+                settings.redis.url, ttl_seconds=cfg.response_cache_ttl_seconds
+            )
+        elif cfg.response_cache == "sqlite":
+            backend = SQLiteLLMCache(
+                Path(settings.local_store) / "llm_cache.sqlite3",
+                ttl_seconds=cfg.response_cache_ttl_seconds,
+            )
+    except ImportError:
+        _log.warning("container.llm_cache_backend_unavailable backend=%s", cfg.response_cache)
+    if backend is None:
+        backend = MemoryLLMCache(
+            max_entries=cfg.response_cache_max_entries,
+            ttl_seconds=cfg.response_cache_ttl_seconds,
+        )
+    elif cleanup is not None:
+        cleanup.append(backend)
+
+    _log.info("container.llm_cache_enabled backend=%s", backend.name)
+    return CachedChatLLM(
+        llm, backend=backend, max_temperature=cfg.response_cache_max_temperature
+    )
+
+
+def _build_llm_adapter(settings: Settings) -> ChatLLM:
+    """Build LLM adapter based on provider setting (uncached)."""
     provider = settings.llm.provider
     api_key = settings.llm.api_key or resolve_api_key(settings, provider)
     model = settings.llm.model
@@ -123,23 +209,94 @@ def build_llm(settings: Settings) -> ChatLLM:
     if provider == "anthropic":
         from ..adapters.llm.anthropic_llm import AnthropicChatLLM
 
-        return AnthropicChatLLM(model=model, api_key=api_key)
+        return AnthropicChatLLM(
+            model=model, api_key=api_key, prompt_caching=settings.llm.prompt_caching
+        )
     if provider == "openai" or provider == "openrouter":
         from ..adapters.llm.openai_llm import OpenAIChatLLM
 
-        return OpenAIChatLLM(model=model, api_key=api_key, provider=provider)
+        return OpenAIChatLLM(
+            model=model,
+            api_key=api_key,
+            provider=provider,
+            prompt_caching=settings.llm.prompt_caching,
+        )
     if provider == "gemini":
         from ..adapters.llm.gemini_llm import GeminiChatLLM
 
-        return GeminiChatLLM(model=model, api_key=api_key)
+        return GeminiChatLLM(
+            model=model,
+            api_key=api_key,
+            prompt_caching=settings.llm.prompt_caching,
+            cache_ttl_seconds=settings.llm.prompt_cache_ttl_seconds,
+        )
     # Fallback to FakeLLM for testing / no-key scenarios
     from ..adapters.llm.fake_llm import FakeChatLLM
 
     return FakeChatLLM(model=model)
 
 
-def build_embeddings(settings: Settings) -> Embeddings | None:
-    """Build embeddings adapter based on provider setting."""
+def build_embeddings(
+    settings: Settings, cleanup: list[Any] | None = None
+) -> Embeddings | None:
+    """Build embeddings adapter, wrapped in the embedding cache if enabled.
+
+    A shared cache tier (Redis/Postgres) is appended to ``cleanup`` so the
+    Container releases its connections on shutdown.
+    """
+    embeddings = _build_embeddings_adapter(settings)
+    if embeddings is None or settings.embedding.cache == "none":
+        return embeddings
+    return wrap_embeddings_cache(embeddings, settings, cleanup)
+
+
+def wrap_embeddings_cache(
+    embeddings: Embeddings, settings: Settings, cleanup: list[Any] | None = None
+) -> Embeddings:
+    """Wrap *embeddings* in ``CachedEmbeddings`` per ``settings.embedding.cache``.
+
+    Falls back to the in-process tier alone when the shared backend is not
+    configured or its optional dependency is missing.
+    """
+    from ..adapters.embeddings.cached_embeddings import (
+        CachedEmbeddings,
+        EmbeddingCacheBackend,
+        PgEmbeddingCache,
+        RedisEmbeddingCache,
+    )
+
+    cfg = settings.embedding
+    backend: EmbeddingCacheBackend | None = None
+    try:
+        if cfg.cache == "redis" and settings.redis.url:
+            backend = RedisEmbeddingCache.from_url(
+                settings.redis.url, ttl_seconds=cfg.cache_ttl_seconds
+            )
+        elif cfg.cache == "postgres" and settings.db.url and "sqlite" not in settings.db.url:
+            from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+            engine = create_async_engine(settings.db.url, pool_size=2, max_overflow=2)
+            backend = PgEmbeddingCache(
+                async_sessionmaker(engine, expire_on_commit=False), engine=engine
+            )
+    except ImportError:
+        _log.warning("container.embedding_cache_backend_unavailable backend=%s", cfg.cache)
+
+    cached = CachedEmbeddings(
+        embeddings, max_entries=cfg.cache_max_entries, backend=backend
+    )
+    if backend is not None and cleanup is not None:
+        cleanup.append(cached)
+    _log.info(
+        "container.embedding_cache_enabled backend=%s shared=%s",
+        cfg.cache,
+        backend is not None,
+    )
+    return cached
+
+
+def _build_embeddings_adapter(settings: Settings) -> Embeddings | None:
+    """Build the provider embeddings adapter (uncached)."""
     provider = settings.embedding.provider
     api_key = settings.embedding.api_key or resolve_api_key(settings, provider)
 
@@ -154,6 +311,7 @@ def build_embeddings(settings: Settings) -> Embeddings | None:
             model=settings.embedding.model,
             api_key=api_key,
             dimensions=settings.embedding.dimensions,
+            max_concurrency=settings.embedding.max_concurrency,
         )
     if provider == "openai":
         from ..adapters.embeddings.openai_embeddings import OpenAIEmbeddings
@@ -166,13 +324,37 @@ def build_embeddings(settings: Settings) -> Embeddings | None:
     return None
 
 
+def build_http_pool(settings: Settings, cleanup: list[Any]) -> HttpClientPool:
+    """Build the shared HTTP client pool used by httpx-based adapters.
+
+    The pool is appended to ``cleanup`` so ``Container.close()`` closes
+    its connections.
+    """
+    cfg = settings.http
+    pool = HttpClientPool(
+        max_connections=cfg.max_connections,
+        max_connections_per_host=cfg.max_connections_per_host,
+        max_keepalive_connections=cfg.max_keepalive_connections,
+        keepalive_expiry=cfg.keepalive_expiry_seconds,
+        timeout=cfg.timeout_seconds,
+        connect_timeout=cfg.connect_timeout_seconds,
+        http2=cfg.http2,
+    )
+    cleanup.append(pool)
+    return pool
+
+
 def build_media(
     settings: Settings,
+    http: HttpClientPool | None = None,
+    cleanup: list[Any] | None = None,
 ) -> tuple[STT, TTS, ImageDescriber, OCRProcessor]:
     """Build media adapters (STT, TTS, ImageDescriber, OCR).
 
     Falls back to fake implementations when no API keys are configured
     or when the optional dependencies are not installed (ADR-051).
+    HTTP-based adapters share *http*'s connection pool.  The local
+    Whisper and OCR worker pools are registered in *cleanup*.
     """
     from ..adapters.media.fake_image_describer import FakeImageDescriber
     from ..adapters.media.fake_stt import FakeSTT
@@ -193,7 +375,17 @@ def build_media(
         try:
             from ..adapters.media.whisper_stt import WhisperSTT
 
-            stt = WhisperSTT()
+            stt_cfg = settings.stt
+            whisper = WhisperSTT(
+                model_size=stt_cfg.model_size,
+                device=stt_cfg.device,
+                compute_type=stt_cfg.compute_type,
+                replicas=stt_cfg.replicas,
+                cpu_threads=stt_cfg.cpu_threads,
+            )
+            if cleanup is not None:
+                cleanup.append(whisper)
+            stt = whisper
         except ImportError:
             stt = FakeSTT()
 
@@ -203,15 +395,23 @@ def build_media(
     if elevenlabs_key:
         from ..adapters.media.elevenlabs_tts import ElevenLabsTTS
 
-        tts = ElevenLabsTTS(api_key=elevenlabs_key)
+        tts = ElevenLabsTTS(api_key=elevenlabs_key, http=http)
     else:
         tts = FakeTTS()
 
     # Image describer: fake for now (real impl needs vision LLM, Sprint 9)
     image_describer: ImageDescriber = FakeImageDescriber()
 
-    # OCR: always available (graceful degradation via lazy imports)
-    ocr: OCRProcessor = OCRProcessorAdapter()
+    # OCR: always available (graceful degradation via lazy imports);
+    # page-parallel on a process pool created on first use
+    ocr_adapter = OCRProcessorAdapter(
+        workers=settings.ocr.workers,
+        page_range_size=settings.ocr.page_range_size,
+        ocr_lang=settings.ocr.lang,
+    )
+    if cleanup is not None and ocr_adapter.parallel:
+        cleanup.append(ocr_adapter)
+    ocr: OCRProcessor = ocr_adapter
 
     return stt, tts, image_describer, ocr
 
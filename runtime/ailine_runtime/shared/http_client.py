@@ -0,0 +1,217 @@
+"""Shared, container-managed HTTP client for httpx-based adapters.
+
+Creating an ``httpx.AsyncClient`` per call pays a fresh TCP + TLS
+handshake on every request; an audio-script export synthesizing dozens of
+TTS segments pays it dozens of times.  ``HttpClientPool`` owns one
+long-lived ``AsyncClient`` for the whole process:
+
+- keep-alive connections (HTTP/2 multiplexing when the ``h2`` package is
+  installed, HTTP/1.1 keep-alive otherwise);
+- a connection pool sized from ``AILINE_HTTP_*`` settings;
+- a per-host cap on concurrent requests so one slow upstream cannot take
+  every connection from the others;
+- pool-utilization metrics (in-flight requests per host, active/idle
+  connections, per-host latency) on ``/metrics``.
+
+The pool is built by the Container and closed from ``Container.close()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import time
+from collections.abc import AsyncIterator
+from typing import Any
+
+import httpx
+
+from .metrics import (
+    http_client_inflight,
+    http_client_request_duration,
+    http_client_requests_total,
+    http_pool_connections,
+)
+from .observability import get_logger
+
+_log = get_logger("ailine.shared.http_client")
+
+_DEFAULT_MAX_CONNECTIONS = 100
+_DEFAULT_MAX_CONNECTIONS_PER_HOST = 20
+_DEFAULT_MAX_KEEPALIVE = 20
+_DEFAULT_KEEPALIVE_EXPIRY_S = 30.0
+_DEFAULT_TIMEOUT_S = 30.0
+_DEFAULT_CONNECT_TIMEOUT_S = 5.0
+
+
+def http2_available() -> bool:
+    """Whether httpx can negotiate HTTP/2 (needs the optional ``h2`` package)."""
+    return importlib.util.find_spec("h2") is not None
+
+
+class HttpClientPool:
+    """One keep-alive ``httpx.AsyncClient`` shared by every HTTP adapter.
+
+    Args:
+        max_connections: Total connections across all hosts.
+        max_connections_per_host: Concurrent requests allowed per host;
+            further requests to that host wait for a slot.
+        max_keepalive_connections: Idle connections kept open for reuse.
+        keepalive_expiry: Seconds an idle connection is kept.
+        timeout: Default request timeout (adapters may override per call).
+        connect_timeout: Timeout for establishing a connection.
+        http2: Negotiate HTTP/2 when ``h2`` is installed.
+        transport: Base transport (tests/benchmarks); a pooled
+            ``httpx.AsyncHTTPTransport`` when omitted.
+    """
+
+    def __init__(
+        self,
+        *,
+        max_connections: int = _DEFAULT_MAX_CONNECTIONS,
+        max_connections_per_host: int = _DEFAULT_MAX_CONNECTIONS_PER_HOST,
+        max_keepalive_connections: int = _DEFAULT_MAX_KEEPALIVE,
+        keepalive_expiry: float = _DEFAULT_KEEPALIVE_EXPIRY_S,
+        timeout: float = _DEFAULT_TIMEOUT_S,
+        connect_timeout: float = _DEFAULT_CONNECT_TIMEOUT_S,
+        http2: bool = True,
+        transport: httpx.AsyncBaseTransport | None = None,
+    ) -> None:
+        self._http2 = http2 and http2_available()
+        if http2 and not self._http2:
+            _log.info("http_client.http2_unavailable", reason="h2 package not installed")
+        self._max_connections = max_connections
+        self._per_host = max_connections_per_host
+        self._host_slots: dict[str, asyncio.Semaphore] = {}
+        base = transport or httpx.AsyncHTTPTransport(
+            http2=self._http2,
+            limits=httpx.Limits(
+                max_connections=max_connections,
+                max_keepalive_connections=max_keepalive_connections,
+                keepalive_expiry=keepalive_expiry,
+            ),
+        )
+        self._transport = _InstrumentedTransport(base, self)
+        self._client = httpx.AsyncClient(
+            transport=self._transport,
+            timeout=httpx.Timeout(timeout, connect=connect_timeout),
+        )
+        http_pool_connections.set(max_connections, state="limit")
+        _log.info(
+            "http_client.pool_created",
+            max_connections=max_connections,
+            max_connections_per_host=max_connections_per_host,
+            http2=self._http2,
+        )
+
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """The shared client; do not close it, the Container owns it."""
+        return self._client
+
+    @property
+    def http2(self) -> bool:
+        """Whether HTTP/2 is negotiated."""
+        return self._http2
+
+    def stats(self) -> dict[str, Any]:
+        """Pool utilization snapshot (for health checks and tests)."""
+        active, idle = self._transport.connection_counts()
+        return {
+            "http2": self._http2,
+            "max_connections": self._max_connections,
+            "max_connections_per_host": self._per_host,
+            "active_connections": active,
+            "idle_connections": idle,
+            "inflight": {
+                labels["host"]: int(value)
+                for labels, value in http_client_inflight.collect()
+                if value and labels.get("host") in self._host_slots
+            },
+        }
+
+    def _slot(self, host: str) -> asyncio.Semaphore:
+        slot = self._host_slots.get(host)
+        if slot is None:
+            slot = self._host_slots[host] = asyncio.Semaphore(self._per_host)
+        return slot
+
+    async def dispose(self) -> None:
+        """Close every pooled connection (called by ``Container.close()``)."""
+        await self._client.aclose()
+        http_pool_connections.set(0, state="active")
+        http_pool_connections.set(0, state="idle")
+
+
+class _InstrumentedTransport(httpx.AsyncBaseTransport):
+    """Wraps the pooled transport with per-host slots and metrics.
+
+    A request holds its host slot (and counts as in flight) until its
+    response body is closed, which is when the connection returns to the
+    pool.
+    """
+
+    def __init__(self, inner: httpx.AsyncBaseTransport, pool: HttpClientPool) -> None:
+        self._inner = inner
+        self._pool = pool
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        host = request.url.host
+        slot = self._pool._slot(host)
+        await slot.acquire()
+        http_client_inflight.inc(host=host)
+        started = time.perf_counter()
+        try:
+            response = await self._inner.handle_async_request(request)
+        except BaseException:
+            self._finish(slot, host, started, status="error")
+            raise
+
+        def on_close() -> None:
+            self._finish(slot, host, started, status=str(response.status_code))
+
+        return httpx.Response(
+            status_code=response.status_code,
+            headers=response.headers,
+            stream=_ReleasingStream(response.stream, on_close),  # type: ignore[arg-type]
+            extensions=response.extensions,
+        )
+
+    def _finish(self, slot: asyncio.Semaphore, host: str, started: float, *, status: str) -> None:
+        slot.release()
+        http_client_inflight.dec(host=host)
+        http_client_requests_total.inc(host=host, status=status)
+        http_client_request_duration.observe(time.perf_counter() - started, host=host)
+        active, idle = self.connection_counts()
+        http_pool_connections.set(active, state="active")
+        http_pool_connections.set(idle, state="idle")
+
+    def connection_counts(self) -> tuple[int, int]:
+        """(active, idle) connections held by the underlying httpcore pool."""
+        connections = getattr(getattr(self._inner, "_pool", None), "connections", None) or []
+        idle = sum(1 for c in connections if c.is_idle())
+        return len(connections) - idle, idle
+
+    async def aclose(self) -> None:
+        await self._inner.aclose()
+
+
+class _ReleasingStream(httpx.AsyncByteStream):
+    """Response body that runs *on_close* exactly once when closed."""
+
+    def __init__(self, inner: Any, on_close: Any) -> None:
+        self._inner = inner
+        self._on_close = on_close
+        self._closed = False
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        async for chunk in self._inner:
+            yield chunk
+
+    async def aclose(self) -> None:
+        try:
+            await self._inner.aclose()
+        finally:
+            if not self._closed:
+                self._closed = True
+                self._on_close()
@@ -47,6 +47,50 @@ class Counter:
             return [(dict(k), v) for k, v in self._values.items()]
 
 
+class Gauge:
+    """Value that can go up and down, with label support.
+
+    Usage::
+
+        inflight = Gauge("http_client_inflight", "Requests in flight")
+        inflight.inc(host="api.example.com")
+        inflight.dec(host="api.example.com")
+    """
+
+    def __init__(self, name: str, help_text: str = "") -> None:
+        self.name = name
+        self.help_text = help_text
+        self._values: dict[tuple[tuple[str, str], ...], float] = {}
+        self._lock = threading.Lock()
+
+    def set(self, value: float, **labels: str) -> None:
+        """Set the gauge to *value* for the given label set."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, value: float = 1.0, **labels: str) -> None:
+        """Increase the gauge by *value* for the given label set."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + value
+
+    def dec(self, value: float = 1.0, **labels: str) -> None:
+        """Decrease the gauge by *value* for the given label set."""
+        self.inc(-value, **labels)
+
+    def get(self, **labels: str) -> float:
+        """Return the current value for the given label set."""
+        key = tuple(sorted(labels.items()))
+        with self._lock:
+            return self._values.get(key, 0.0)
+
+    def collect(self) -> list[tuple[dict[str, str], float]]:
+        """Return all label-set / value pairs for exposition."""
+        with self._lock:
+            return [(dict(k), v) for k, v in self._values.items()]
+
+
 class Histogram:
     """Track value distributions with configurable buckets.
 
@@ -126,11 +170,107 @@ llm_call_duration = Histogram(
     buckets=[0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0],
 )
 
+llm_hedged_requests_total = Counter(
+    "ailine_llm_hedged_requests_total",
+    "SmartRouter hedged requests by trigger (latency|error) and winner (primary|hedge|none).",
+)
+
 circuit_breaker_state = Counter(
     "ailine_circuit_breaker_state",
     "Circuit breaker state transitions.",
 )
 
+embedding_cache_requests_total = Counter(
+    "ailine_embedding_cache_requests_total",
+    "Embedding cache lookups by tier (memory|backend) and result (hit|miss).",
+)
+
+llm_cache_requests_total = Counter(
+    "ailine_llm_cache_requests_total",
+    "LLM response cache lookups by backend (memory|sqlite|redis) and result (hit|miss).",
+)
+
+rag_cache_requests_total = Counter(
+    "ailine_rag_cache_requests_total",
+    "RAG query cache lookups by tier (exact|semantic) and result (hit|miss).",
+)
+
+rag_cache_evictions_total = Counter(
+    "ailine_rag_cache_evictions_total",
+    "RAG query cache evictions by reason (ttl|size|invalidation).",
+)
+
+
+http_client_requests_total = Counter(
+    "ailine_http_client_requests_total",
+    "Outbound HTTP requests through the shared client pool by host and status.",
+)
+
+http_client_request_duration = Histogram(
+    "ailine_http_client_request_duration_seconds",
+    "Outbound HTTP request duration (including the response body) by host.",
+)
+
+http_client_inflight = Gauge(
+    "ailine_http_client_inflight_requests",
+    "Outbound HTTP requests currently in flight by host.",
+)
+
+http_pool_connections = Gauge(
+    "ailine_http_pool_connections",
+    "Connections held by the shared HTTP client pool by state (active|idle) "
+    "and limit (the configured maximum).",
+)
+
+ocr_pages_total = Counter(
+    "ailine_ocr_pages_total",
+    "Document pages extracted by page-parallel OCR, by method (text|ocr|empty).",
+)
+
+stt_pool_workers = Gauge(
+    "ailine_stt_pool_workers",
+    "Local STT worker pool replicas by state (loaded|busy) and limit "
+    "(the configured replica count).",
+)
+
+tts_time_to_first_audio = Histogram(
+    "ailine_tts_time_to_first_audio_seconds",
+    "Streaming TTS: time from request to the first audio segment being ready.",
+    buckets=[0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0],
+)
+
+tts_segment_cache_requests_total = Counter(
+    "ailine_tts_segment_cache_requests_total",
+    "Streaming TTS segment cache lookups by result (hit|miss).",
+)
+
+sse_queue_depth = Gauge(
+    "ailine_sse_queue_depth",
+    "Events buffered for delivery across all open plan SSE streams.",
+)
+
+sse_streams_open = Gauge(
+    "ailine_sse_streams_open",
+    "Plan SSE streams currently connected.",
+)
+
+sse_events_shed_total = Counter(
+    "ailine_sse_events_shed_total",
+    "SSE events not delivered under back-pressure by reason (coalesced|dropped) "
+    "and event type.",
+)
+
+replay_flush_events = Histogram(
+    "ailine_replay_flush_events",
+    "Events written to the Redis replay store per batched flush.",
+    buckets=[1, 2, 5, 10, 25, 50, 100, 250, 500],
+)
+
+replay_flush_duration = Histogram(
+    "ailine_replay_flush_duration_seconds",
+    "Latency of one batched Redis replay store flush (single pipeline).",
+    buckets=[0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0],
+)
 
 # ---------------------------------------------------------------------------
 # Prometheus text format exposition
@@ -152,7 +292,20 @@ def render_metrics() -> str:
     """
     lines: list[str] = []
 
-    for counter in (http_requests_total, llm_calls_total, circuit_breaker_state):
+    for counter in (
+        http_requests_total,
+        llm_calls_total,
+        llm_hedged_requests_total,
+        circuit_breaker_state,
+        embedding_cache_requests_total,
+        llm_cache_requests_total,
+        rag_cache_requests_total,
+        rag_cache_evictions_total,
+        http_client_requests_total,
+        tts_segment_cache_requests_total,
+        ocr_pages_total,
+        sse_events_shed_total,
+    ):
         lines.append(f"# HELP {counter.name} {counter.help_text}")
         lines.append(f"# TYPE {counter.name} counter")
         for labels, value in counter.collect():
@@ -161,7 +314,27 @@ def render_metrics() -> str:
             lines.append(f"{counter.name}{lbl} {value}")
         lines.append("")
 
-    for histogram in (http_request_duration, llm_call_duration):
+    for gauge in (
+        http_client_inflight,
+        http_pool_connections,
+        stt_pool_workers,
+        sse_queue_depth,
+        sse_streams_open,
+    ):
+        lines.append(f"# HELP {gauge.name} {gauge.help_text}")
+        lines.append(f"# TYPE {gauge.name} gauge")
+        for labels, value in gauge.collect():
+            lines.append(f"{gauge.name}{_format_labels(labels)} {value}")
+        lines.append("")
+
+    for histogram in (
+        http_request_duration,
+        llm_call_duration,
+        http_client_request_duration,
+        tts_time_to_first_audio,
+        replay_flush_events,
+        replay_flush_duration,
+    ):
         lines.append(f"# HELP {histogram.name} {histogram.help_text}")
         lines.append(f"# TYPE {histogram.name} histogram")
         for labels, data in histogram.collect():
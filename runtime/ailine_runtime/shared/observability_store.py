@@ -39,6 +39,22 @@ _COST_PER_1K_OUTPUT: dict[str, float] = {
     "default": 0.015,
 }
 
+# Price of prompt-cache reads/writes relative to regular input tokens,
+# by model family prefix: (read factor, write factor)
+_CACHE_PRICE_FACTORS: dict[str, tuple[float, float]] = {
+    "claude": (0.1, 1.25),
+    "gpt": (0.5, 1.0),
+    "gemini": (0.25, 1.0),
+    "default": (0.5, 1.0),
+}
+
+
+def _cache_price_factors(model: str) -> tuple[float, float]:
+    for prefix, factors in _CACHE_PRICE_FACTORS.items():
+        if model.startswith(prefix):
+            return factors
+    return _CACHE_PRICE_FACTORS["default"]
+
 
 class ObservabilityStore:
     """In-memory store for observability dashboard data.
@@ -53,6 +69,8 @@ class ObservabilityStore:
             "input_tokens": 0,
             "output_tokens": 0,
             "total_tokens": 0,
+            "cached_input_tokens": 0,
+            "cache_write_tokens": 0,
         }
         self._provider_status: dict[str, Any] = {
             "name": "unknown",
@@ -83,12 +101,22 @@ class ObservabilityStore:
         input_tokens: int = 0,
         output_tokens: int = 0,
         model: str = "default",
+        *,
+        cached_input_tokens: int = 0,
+        cache_write_tokens: int = 0,
     ) -> None:
-        """Record token usage for cost estimation."""
+        """Record token usage for cost estimation.
+
+        ``input_tokens`` is the whole prompt; ``cached_input_tokens`` and
+        ``cache_write_tokens`` are the parts of it read from / written to
+        the provider's prompt cache.
+        """
         with self._lock:
             self._token_usage["input_tokens"] += input_tokens
             self._token_usage["output_tokens"] += output_tokens
             self._token_usage["total_tokens"] += input_tokens + output_tokens
+            self._token_usage["cached_input_tokens"] += cached_input_tokens
+            self._token_usage["cache_write_tokens"] += cache_write_tokens
             self._cost_model = model
 
     def get_token_stats(self) -> dict[str, Any]:
@@ -96,9 +124,15 @@ class ObservabilityStore:
         with self._lock:
             inp = self._token_usage["input_tokens"]
             out = self._token_usage["output_tokens"]
+            cached = self._token_usage["cached_input_tokens"]
+            written = self._token_usage["cache_write_tokens"]
             model = self._cost_model
 
-            input_cost = (inp / 1000) * _COST_PER_1K_INPUT.get(
+            read_factor, write_factor = _cache_price_factors(model)
+            billed_input = (
+                max(0, inp - cached - written) + cached * read_factor + written * write_factor
+            )
+            input_cost = (billed_input / 1000) * _COST_PER_1K_INPUT.get(
                 model, _COST_PER_1K_INPUT["default"]
             )
             output_cost = (out / 1000) * _COST_PER_1K_OUTPUT.get(
@@ -109,6 +143,9 @@ class ObservabilityStore:
                 "input_tokens": inp,
                 "output_tokens": out,
                 "total_tokens": inp + out,
+                "cached_input_tokens": cached,
+                "cache_write_tokens": written,
+                "cache_hit_ratio": round(cached / inp, 4) if inp else 0.0,
                 "estimated_cost_usd": round(input_cost + output_cost, 4),
                 "cost_breakdown": {
                     "input_cost_usd": round(input_cost, 4),
@@ -1,13 +1,24 @@
-"""In-memory progress store for student mastery tracking.
+"""Progress store for student mastery tracking.
 
-Simple dict-based storage for hackathon MVP. Production would use DB.
+Two backends behind the ``ProgressBackend`` protocol:
+- ``ProgressStore``: in-memory.  Records are indexed by
+  (teacher_id, student_id, standard_code) and by student_id, and each
+  teacher's dashboard aggregates (mastery distribution, per-student and
+  per-standard counters) are updated on write, so reads cost
+  O(result size).  Lost on restart.
+- ``SqlProgressStore`` (``adapters/db/progress_store.py``): the
+  ``learner_progress`` / ``parent_students`` tables; selected with
+  ``AILINE_PROGRESS_STORE=db``.
 """
 
 from __future__ import annotations
 
+import logging
 import threading
 from collections import defaultdict
+from dataclasses import dataclass, field
 from datetime import UTC, datetime
+from typing import TYPE_CHECKING, Protocol
 
 from uuid_utils import uuid7
 
@@ -19,27 +30,95 @@ from ..domain.entities.progress import (
     StudentSummary,
 )
 
+if TYPE_CHECKING:
+    from .config import Settings
+
+logger = logging.getLogger("ailine.shared.progress_store")
+
+# Summary counter field per mastery level (NOT_STARTED is not counted)
+_LEVEL_COUNTERS: dict[MasteryLevel, str] = {
+    MasteryLevel.MASTERED: "mastered_count",
+    MasteryLevel.PROFICIENT: "proficient_count",
+    MasteryLevel.DEVELOPING: "developing_count",
+}
+
+
+def _empty_distribution() -> dict[str, int]:
+    return {level.value: 0 for level in MasteryLevel}
+
+
+def _count_level(
+    summary: StudentSummary | StandardSummary, level: MasteryLevel, delta: int
+) -> None:
+    counter = _LEVEL_COUNTERS.get(level)
+    if counter is not None:
+        setattr(summary, counter, getattr(summary, counter) + delta)
+
+
+class ProgressBackend(Protocol):
+    """Storage for learner progress (in-memory or database)."""
+
+    async def link_parent_student(self, parent_id: str, student_id: str) -> None: ...
+
+    async def is_parent_linked(self, parent_id: str, student_id: str) -> bool: ...
+
+    async def record_progress(
+        self,
+        teacher_id: str,
+        student_id: str,
+        student_name: str,
+        standard_code: str,
+        standard_description: str,
+        mastery_level: MasteryLevel,
+        notes: str = "",
+    ) -> LearnerProgress: ...
+
+    async def get_dashboard(self, teacher_id: str) -> ClassProgressSummary: ...
+
+    async def get_student(
+        self, teacher_id: str, student_id: str
+    ) -> list[LearnerProgress]: ...
+
+    async def get_student_all_teachers(self, student_id: str) -> list[LearnerProgress]: ...
+
+    async def close(self) -> None: ...
+
+
+@dataclass
+class _ClassAggregate:
+    """Dashboard state of one teacher, maintained on every write."""
+
+    distribution: dict[str, int] = field(default_factory=_empty_distribution)
+    students: dict[str, StudentSummary] = field(default_factory=dict)
+    standards: dict[str, StandardSummary] = field(default_factory=dict)
+
 
 class ProgressStore:
     """Thread-safe in-memory store for learner progress."""
 
     def __init__(self) -> None:
-        self._records: dict[str, list[LearnerProgress]] = defaultdict(list)
+        # Composite index: teacher_id -> student_id -> standard_code -> record
+        self._records: dict[str, dict[str, dict[str, LearnerProgress]]] = defaultdict(
+            lambda: defaultdict(dict)
+        )
+        # Reverse index: student_id -> records across all teachers
+        self._by_student: dict[str, list[LearnerProgress]] = defaultdict(list)
+        self._aggregates: dict[str, _ClassAggregate] = defaultdict(_ClassAggregate)
         self._lock = threading.Lock()
         # Parent-student linkage: parent_id -> set of student_ids
         self._parent_links: dict[str, set[str]] = defaultdict(set)
 
-    def link_parent_student(self, parent_id: str, student_id: str) -> None:
+    async def link_parent_student(self, parent_id: str, student_id: str) -> None:
         """Register a parent-student linkage for access control."""
         with self._lock:
             self._parent_links[parent_id].add(student_id)
 
-    def is_parent_linked(self, parent_id: str, student_id: str) -> bool:
+    async def is_parent_linked(self, parent_id: str, student_id: str) -> bool:
         """Check if a parent is linked to a specific student."""
         with self._lock:
             return student_id in self._parent_links.get(parent_id, set())
 
-    def record_progress(
+    async def record_progress(
         self,
         teacher_id: str,
         student_id: str,
@@ -50,17 +129,15 @@ class ProgressStore:
         notes: str = "",
     ) -> LearnerProgress:
         """Record or update a student's mastery on a standard."""
+        level = MasteryLevel(mastery_level)
         with self._lock:
-            existing = None
-            for r in self._records[teacher_id]:
-                if r.student_id == student_id and r.standard_code == standard_code:
-                    existing = r
-                    break
-
+            by_standard = self._records[teacher_id][student_id]
+            existing = by_standard.get(standard_code)
             now = datetime.now(UTC).isoformat()
 
             if existing:
-                existing.mastery_level = mastery_level
+                self._aggregate(teacher_id, existing, -1)
+                existing.mastery_level = level
                 existing.session_count += 1
                 existing.last_activity = now
                 existing.notes = notes or existing.notes
@@ -68,6 +145,7 @@ class ProgressStore:
                 existing.standard_description = (
                     standard_description or existing.standard_description
                 )
+                self._aggregate(teacher_id, existing, +1)
                 return existing
 
             progress = LearnerProgress(
@@ -77,102 +155,97 @@ class ProgressStore:
                 teacher_id=teacher_id,
                 standard_code=standard_code,
                 standard_description=standard_description,
-                mastery_level=mastery_level,
+                mastery_level=level,
                 session_count=1,
                 last_activity=now,
                 created_at=now,
                 notes=notes,
             )
-            self._records[teacher_id].append(progress)
+            by_standard[standard_code] = progress
+            self._by_student[student_id].append(progress)
+            self._aggregate(teacher_id, progress, +1, new=True)
             return progress
 
-    def get_dashboard(self, teacher_id: str) -> ClassProgressSummary:
-        """Build aggregated class progress summary."""
-        records = self._records.get(teacher_id, [])
-
-        students: dict[str, StudentSummary] = {}
-        standards: dict[str, StandardSummary] = {}
-        mastery_dist = {
-            "not_started": 0,
-            "developing": 0,
-            "proficient": 0,
-            "mastered": 0,
-        }
-
-        for r in records:
-            mastery_dist[r.mastery_level.value] = (
-                mastery_dist.get(r.mastery_level.value, 0) + 1
+    async def get_dashboard(self, teacher_id: str) -> ClassProgressSummary:
+        """Class progress summary, copied from the maintained aggregates."""
+        with self._lock:
+            agg = self._aggregates.get(teacher_id)
+            if agg is None:
+                return ClassProgressSummary(teacher_id=teacher_id)
+            return ClassProgressSummary(
+                teacher_id=teacher_id,
+                total_students=len(agg.students),
+                total_standards=len(agg.standards),
+                mastery_distribution=dict(agg.distribution),
+                students=[s.model_copy() for s in agg.students.values()],
+                standards=[s.model_copy() for s in agg.standards.values()],
             )
 
-            # Student summary
-            if r.student_id not in students:
-                students[r.student_id] = StudentSummary(
-                    student_id=r.student_id,
-                    student_name=r.student_name,
-                )
-            s = students[r.student_id]
-            s.standards_count += 1
-            if r.mastery_level == MasteryLevel.MASTERED:
-                s.mastered_count += 1
-            elif r.mastery_level == MasteryLevel.PROFICIENT:
-                s.proficient_count += 1
-            elif r.mastery_level == MasteryLevel.DEVELOPING:
-                s.developing_count += 1
-            if r.last_activity and (
-                s.last_activity is None or r.last_activity > s.last_activity
-            ):
-                s.last_activity = r.last_activity
-
-            # Standard summary
-            if r.standard_code not in standards:
-                standards[r.standard_code] = StandardSummary(
-                    standard_code=r.standard_code,
-                    standard_description=r.standard_description,
-                )
-            st = standards[r.standard_code]
-            st.student_count += 1
-            if r.mastery_level == MasteryLevel.MASTERED:
-                st.mastered_count += 1
-            elif r.mastery_level == MasteryLevel.PROFICIENT:
-                st.proficient_count += 1
-            elif r.mastery_level == MasteryLevel.DEVELOPING:
-                st.developing_count += 1
-
-        return ClassProgressSummary(
-            teacher_id=teacher_id,
-            total_students=len(students),
-            total_standards=len(standards),
-            mastery_distribution=mastery_dist,
-            students=list(students.values()),
-            standards=list(standards.values()),
-        )
-
-    def get_student(self, teacher_id: str, student_id: str) -> list[LearnerProgress]:
+    async def get_student(self, teacher_id: str, student_id: str) -> list[LearnerProgress]:
         """Get all progress records for a specific student under a teacher."""
-        return [
-            r for r in self._records.get(teacher_id, []) if r.student_id == student_id
-        ]
+        with self._lock:
+            students = self._records.get(teacher_id)
+            if students is None or student_id not in students:
+                return []
+            return list(students[student_id].values())
 
-    def get_student_all_teachers(self, student_id: str) -> list[LearnerProgress]:
+    async def get_student_all_teachers(self, student_id: str) -> list[LearnerProgress]:
         """Get all progress records for a student across all teachers.
 
         Used for student self-view and parent view where the teacher_id
         is not known (the student may have records from multiple teachers).
         """
         with self._lock:
-            results = []
-            for records in self._records.values():
-                for r in records:
-                    if r.student_id == student_id:
-                        results.append(r)
-            return results
+            return list(self._by_student.get(student_id, ()))
 
+    async def close(self) -> None:
+        """Nothing to release (protocol symmetry with SqlProgressStore)."""
 
-_store: ProgressStore | None = None
+    def _aggregate(
+        self, teacher_id: str, record: LearnerProgress, sign: int, *, new: bool = False
+    ) -> None:
+        """Add (+1) or remove (-1) *record*'s level from the teacher's aggregates.
+
+        Adding also refreshes names and last activity; ``new`` counts the
+        record in its student's and standard's totals (call under lock).
+        """
+        agg = self._aggregates[teacher_id]
+        level = record.mastery_level
+        agg.distribution[level.value] += sign
+
+        student = agg.students.get(record.student_id)
+        if student is None:
+            student = agg.students[record.student_id] = StudentSummary(
+                student_id=record.student_id, student_name=record.student_name
+            )
+        standard = agg.standards.get(record.standard_code)
+        if standard is None:
+            standard = agg.standards[record.standard_code] = StandardSummary(
+                standard_code=record.standard_code,
+                standard_description=record.standard_description,
+            )
+        _count_level(student, level, sign)
+        _count_level(standard, level, sign)
+        if sign < 0:
+            return
+        if new:
+            student.standards_count += 1
+            standard.student_count += 1
+        student.student_name = record.student_name or student.student_name
+        standard.standard_description = (
+            record.standard_description or standard.standard_description
+        )
+        if record.last_activity and (
+            student.last_activity is None or record.last_activity > student.last_activity
+        ):
+            student.last_activity = record.last_activity
+
+
+_store: ProgressBackend | None = None
 _store_lock = threading.Lock()
 
 
-def get_progress_store() -> ProgressStore:
+def get_progress_store() -> ProgressBackend:
     """Get or create the singleton progress store."""
     global _store
     if _store is None:
@@ -180,3 +253,32 @@ def get_progress_store() -> ProgressStore:
             if _store is None:
                 _store = ProgressStore()
     return _store
+
+
+def set_progress_store(store: ProgressBackend) -> None:
+    """Install *store* as the singleton (app startup wiring)."""
+    global _store
+    _store = store
+
+
+def is_progress_store_set() -> bool:
+    """Whether a progress store has already been created or installed."""
+    return _store is not None
+
+
+def build_progress_store(settings: Settings) -> ProgressBackend:
+    """Build the progress store selected by ``settings.progress``.
+
+    ``db`` stores progress in ``settings.db.url`` (Postgres or SQLite);
+    anything else, or a missing database driver, gives the in-memory store.
+    """
+    if settings.progress.store == "db" and settings.db.url:
+        try:
+            from ..adapters.db.progress_store import SqlProgressStore
+
+            return SqlProgressStore.from_url(settings.db.url)
+        except ImportError:
+            logger.warning(
+                "progress_store.db_unavailable url_scheme=%s", settings.db.url.split(":")[0]
+            )
+    return ProgressStore()
@@ -1,19 +1,31 @@
-"""In-memory trace store for pipeline run traces.
+"""Trace store for pipeline run traces.
 
 Stores RunTrace objects keyed by run_id with automatic TTL eviction.
-Thread-safe for concurrent async access.
+
+Two backends behind the ``TraceBackend`` protocol:
+- ``TraceStore``: in-memory, bounded.  Runs are kept in last-touched
+  order (an OrderedDict, plus one per teacher), so TTL/LRU eviction pops
+  from the front and ``list_recent`` walks from the back -- no scans or
+  sorts.  Lost on restart.
+- ``SqlTraceStore`` (``adapters/db/trace_store.py``): Postgres/SQLite
+  tables with batched NodeTrace writes; selected with
+  ``AILINE_TRACE_STORE=db``.
 """
 
 from __future__ import annotations
 
-import asyncio
 import logging
+import threading
 import time
+from collections import OrderedDict
 from datetime import UTC, datetime
-from typing import Any
+from typing import TYPE_CHECKING, Any, Protocol
 
 from ..domain.entities.trace import NodeTrace, RunTrace
 
+if TYPE_CHECKING:
+    from .config import Settings
+
 logger = logging.getLogger("ailine.shared.trace_store")
 
 # Default TTL: 1 hour
@@ -22,10 +34,43 @@ _DEFAULT_TTL_SECONDS = 3600
 _MAX_ENTRIES = 500
 
 
+class TraceBackend(Protocol):
+    """Storage for run traces (in-memory or database)."""
+
+    async def get(self, run_id: str, *, teacher_id: str) -> RunTrace | None: ...
+
+    async def get_or_create(self, run_id: str, *, teacher_id: str = "") -> RunTrace: ...
+
+    async def append_node(
+        self, run_id: str, node: NodeTrace, *, teacher_id: str = ""
+    ) -> None: ...
+
+    async def update_run(
+        self, run_id: str, *, teacher_id: str = "", **kwargs: Any
+    ) -> None: ...
+
+    async def list_recent(
+        self,
+        limit: int = 20,
+        *,
+        teacher_id: str | None = None,
+        status: str | None = None,
+        offset: int = 0,
+    ) -> list[RunTrace]: ...
+
+    async def count(
+        self, *, teacher_id: str | None = None, status: str | None = None
+    ) -> int: ...
+
+    async def close(self) -> None: ...
+
+
 class TraceStore:
     """In-memory store for pipeline run traces.
 
-    Not persistent across restarts; suitable for MVP/demo.
+    Not persistent across restarts; suitable for MVP/demo.  Every
+    operation is synchronous under the hood (no awaits), so it is atomic
+    on the event loop without a lock.
     """
 
     def __init__(
@@ -34,10 +79,11 @@ class TraceStore:
         max_entries: int = _MAX_ENTRIES,
     ) -> None:
         self._traces: dict[str, RunTrace] = {}
-        self._timestamps: dict[str, float] = {}
+        # run_id -> last touch, least recently touched first
+        self._timestamps: OrderedDict[str, float] = OrderedDict()
+        self._by_teacher: dict[str, OrderedDict[str, None]] = {}
         self._ttl = ttl_seconds
         self._max_entries = max_entries
-        self._lock = asyncio.Lock()
 
     async def get(
         self, run_id: str, *, teacher_id: str
@@ -47,14 +93,13 @@ class TraceStore:
         Only returns the trace if it belongs to the given teacher
         (tenant isolation). *teacher_id* is required.
         """
-        async with self._lock:
-            self._evict_expired()
-            trace = self._traces.get(run_id)
-            if trace is None:
-                return None
-            if trace.teacher_id != teacher_id:
-                return None
-            return trace
+        self._evict_expired()
+        trace = self._traces.get(run_id)
+        if trace is None:
+            return None
+        if trace.teacher_id != teacher_id:
+            return None
+        return trace
 
     async def get_or_create(self, run_id: str, *, teacher_id: str = "") -> RunTrace:
         """Get existing trace or create a new empty one.
@@ -62,19 +107,24 @@ class TraceStore:
         When *teacher_id* is provided, it is stored on the trace for
         tenant isolation filtering in subsequent lookups.
         """
-        async with self._lock:
-            self._evict_expired()
-            if run_id not in self._traces:
-                self._traces[run_id] = RunTrace(
-                    run_id=run_id,
-                    teacher_id=teacher_id,
-                    created_at=datetime.now(UTC).isoformat(),
-                )
-                self._timestamps[run_id] = time.monotonic()
-                self._enforce_capacity()
-            elif teacher_id and not self._traces[run_id].teacher_id:
-                self._traces[run_id].teacher_id = teacher_id
-            return self._traces[run_id]
+        self._evict_expired()
+        trace = self._traces.get(run_id)
+        if trace is None:
+            trace = RunTrace(
+                run_id=run_id,
+                teacher_id=teacher_id,
+                created_at=datetime.now(UTC).isoformat(),
+            )
+            self._traces[run_id] = trace
+            self._by_teacher.setdefault(teacher_id, OrderedDict())[run_id] = None
+            self._timestamps[run_id] = time.monotonic()
+            self._enforce_capacity()
+        elif teacher_id and not trace.teacher_id:
+            self._unindex(run_id, trace.teacher_id)
+            trace.teacher_id = teacher_id
+            self._by_teacher.setdefault(teacher_id, OrderedDict())[run_id] = None
+            self._touch(run_id, trace)
+        return trace
 
     async def append_node(
         self, run_id: str, node: NodeTrace, *, teacher_id: str = ""
@@ -89,24 +139,23 @@ class TraceStore:
         When *teacher_id* is provided, validates it matches the stored
         trace (tenant isolation).
         """
-        async with self._lock:
-            if run_id not in self._traces:
-                logger.warning(
-                    "append_node called for non-existent run_id=%s — ignored",
-                    run_id,
-                )
-                return
-            trace = self._traces[run_id]
-            if teacher_id and trace.teacher_id and trace.teacher_id != teacher_id:
-                logger.warning(
-                    "append_node tenant mismatch run_id=%s expected=%s got=%s — ignored",
-                    run_id,
-                    trace.teacher_id,
-                    teacher_id,
-                )
-                return
-            trace.nodes.append(node)
-            self._timestamps[run_id] = time.monotonic()
+        trace = self._traces.get(run_id)
+        if trace is None:
+            logger.warning(
+                "append_node called for non-existent run_id=%s — ignored",
+                run_id,
+            )
+            return
+        if teacher_id and trace.teacher_id and trace.teacher_id != teacher_id:
+            logger.warning(
+                "append_node tenant mismatch run_id=%s expected=%s got=%s — ignored",
+                run_id,
+                trace.teacher_id,
+                teacher_id,
+            )
+            return
+        trace.nodes.append(node)
+        self._touch(run_id, trace)
 
     async def update_run(
         self, run_id: str, *, teacher_id: str = "", **kwargs: Any
@@ -119,26 +168,25 @@ class TraceStore:
         When *teacher_id* is provided, validates it matches the stored
         trace (tenant isolation).
         """
-        async with self._lock:
-            if run_id not in self._traces:
-                logger.warning(
-                    "update_run called for non-existent run_id=%s — ignored",
-                    run_id,
-                )
-                return
-            trace = self._traces[run_id]
-            if teacher_id and trace.teacher_id and trace.teacher_id != teacher_id:
-                logger.warning(
-                    "update_run tenant mismatch run_id=%s expected=%s got=%s — ignored",
-                    run_id,
-                    trace.teacher_id,
-                    teacher_id,
-                )
-                return
-            for key, value in kwargs.items():
-                if hasattr(trace, key):
-                    setattr(trace, key, value)
-            self._timestamps[run_id] = time.monotonic()
+        trace = self._traces.get(run_id)
+        if trace is None:
+            logger.warning(
+                "update_run called for non-existent run_id=%s — ignored",
+                run_id,
+            )
+            return
+        if teacher_id and trace.teacher_id and trace.teacher_id != teacher_id:
+            logger.warning(
+                "update_run tenant mismatch run_id=%s expected=%s got=%s — ignored",
+                run_id,
+                trace.teacher_id,
+                teacher_id,
+            )
+            return
+        for key, value in kwargs.items():
+            if hasattr(trace, key):
+                setattr(trace, key, value)
+        self._touch(run_id, trace)
 
     async def list_recent(
         self,
@@ -146,6 +194,7 @@ class TraceStore:
         *,
         teacher_id: str | None = None,
         status: str | None = None,
+        offset: int = 0,
     ) -> list[RunTrace]:
         """List recent traces, newest first.
 
@@ -153,48 +202,84 @@ class TraceStore:
         that teacher (tenant isolation).
         When *status* is provided, only returns traces with that status
         (F-259: server-side filtering).
+        *offset* skips that many matching traces (pagination).
         """
-        async with self._lock:
-            self._evict_expired()
-            sorted_ids = sorted(
-                self._timestamps.keys(),
-                key=lambda rid: self._timestamps[rid],
-                reverse=True,
-            )
-            traces: list[RunTrace] = []
-            for rid in sorted_ids:
-                t = self._traces[rid]
-                if teacher_id is not None and t.teacher_id != teacher_id:
-                    continue
-                if status is not None and t.status != status:
-                    continue
-                traces.append(t)
-                if len(traces) >= limit:
-                    break
-            return traces
+        self._evict_expired()
+        traces: list[RunTrace] = []
+        skipped = 0
+        for trace in self._iter_recent(teacher_id):
+            if status is not None and trace.status != status:
+                continue
+            if skipped < offset:
+                skipped += 1
+                continue
+            traces.append(trace)
+            if len(traces) >= limit:
+                break
+        return traces
+
+    async def count(
+        self, *, teacher_id: str | None = None, status: str | None = None
+    ) -> int:
+        """Number of traces matching the ``list_recent`` filters."""
+        self._evict_expired()
+        if status is None:
+            if teacher_id is None:
+                return len(self._traces)
+            return len(self._by_teacher.get(teacher_id, ()))
+        return sum(1 for t in self._iter_recent(teacher_id) if t.status == status)
+
+    async def close(self) -> None:
+        """Nothing to release (protocol symmetry with SqlTraceStore)."""
+
+    def _iter_recent(self, teacher_id: str | None) -> Any:
+        """Traces newest first, optionally restricted to one teacher."""
+        if teacher_id is None:
+            return (self._traces[rid] for rid in reversed(self._timestamps))
+        run_ids = self._by_teacher.get(teacher_id)
+        if not run_ids:
+            return iter(())
+        return (self._traces[rid] for rid in reversed(run_ids))
+
+    def _touch(self, run_id: str, trace: RunTrace) -> None:
+        """Mark *run_id* as most recently used."""
+        self._timestamps[run_id] = time.monotonic()
+        self._timestamps.move_to_end(run_id)
+        self._by_teacher[trace.teacher_id].move_to_end(run_id)
+
+    def _unindex(self, run_id: str, teacher_id: str) -> None:
+        run_ids = self._by_teacher.get(teacher_id)
+        if run_ids is not None:
+            run_ids.pop(run_id, None)
+            if not run_ids:
+                del self._by_teacher[teacher_id]
+
+    def _remove(self, run_id: str) -> None:
+        trace = self._traces.pop(run_id)
+        del self._timestamps[run_id]
+        self._unindex(run_id, trace.teacher_id)
 
     def _evict_expired(self) -> None:
-        """Remove entries older than TTL (call under lock)."""
+        """Remove entries older than TTL, oldest first (stops at the first live one)."""
         now = time.monotonic()
-        expired = [rid for rid, ts in self._timestamps.items() if now - ts > self._ttl]
-        for rid in expired:
-            del self._traces[rid]
-            del self._timestamps[rid]
+        while self._timestamps:
+            run_id, ts = next(iter(self._timestamps.items()))
+            if now - ts <= self._ttl:
+                break
+            self._remove(run_id)
 
     def _enforce_capacity(self) -> None:
-        """Evict oldest entries if over capacity (call under lock)."""
+        """Evict least recently touched entries if over capacity."""
         while len(self._traces) > self._max_entries:
-            oldest_id = min(self._timestamps, key=lambda k: self._timestamps[k])
-            del self._traces[oldest_id]
-            del self._timestamps[oldest_id]
+            self._remove(next(iter(self._timestamps)))
 
 
 # Module-level singleton
-_store: TraceStore | None = None
-_store_lock = __import__("threading").Lock()
+_store: TraceBackend | None = None
+_store_lock = threading.Lock()
 
 
-def get_trace_store() -> TraceStore:
+def get_trace_store() -> TraceBackend:
     """Get or create the singleton trace store."""
     global _store
     if _store is None:
@@ -204,7 +289,40 @@ def get_trace_store() -> TraceStore:
     return _store
 
 
+def set_trace_store(store: TraceBackend) -> None:
+    """Install *store* as the singleton (app startup wiring)."""
+    global _store
+    _store = store
+
+
+def is_trace_store_set() -> bool:
+    """Whether a trace store has already been created or installed."""
+    return _store is not None
+
+
 def reset_trace_store() -> None:
     """Reset the singleton (for testing)."""
     global _store
     _store = None
+
+
+def build_trace_store(settings: Settings) -> TraceBackend:
+    """Build the trace store selected by ``settings.trace``.
+
+    ``db`` stores traces in ``settings.db.url`` (Postgres or SQLite);
+    anything else, or a missing database driver, gives the in-memory store.
+    """
+    cfg = settings.trace
+    if cfg.store == "db" and settings.db.url:
+        try:
+            from ..adapters.db.trace_store import SqlTraceStore
+
+            return SqlTraceStore.from_url(
+                settings.db.url,
+                ttl_seconds=cfg.db_ttl_seconds,
+                batch_window_ms=cfg.batch_window_ms,
+                batch_max_nodes=cfg.batch_max_nodes,
+            )
+        except ImportError:
+            logger.warning("trace_store.db_unavailable url_scheme=%s", settings.db.url.split(":")[0])
+    return TraceStore(ttl_seconds=cfg.ttl_seconds, max_entries=cfg.max_entries)
@@ -15,6 +15,7 @@ from typing import Any
 import structlog
 
 from ..domain.entities.tutor import TutorAgentSpec, TutorSession, TutorTurnOutput
+from ..domain.ports.llm import cache_breakpoint
 from .builder import load_tutor_spec
 
 logger = structlog.get_logger("ailine.tutoring.session")
@@ -135,21 +136,30 @@ async def tutor_chat_turn(
     history = _format_history(session)
     schema = TutorTurnOutput.model_json_schema()
 
+    # Persona + response contract form a per-tutor constant prefix, marked
+    # for provider-side prompt caching; only history and question vary.
     messages = [
+        cache_breakpoint(
+            {
+                "role": "system",
+                "content": (
+                    f"{spec.persona.system_prompt}\n\n"
+                    "## Contrato de resposta (obrigatório)\n"
+                    "Responda SOMENTE com um JSON válido seguindo o schema abaixo.\n"
+                    "Não inclua markdown fora do JSON.\n"
+                    f"schema: {json.dumps(schema, ensure_ascii=False)}\n"
+                ),
+            }
+        ),
         {
             "role": "user",
             "content": (
-                f"{spec.persona.system_prompt}\n\n"
-                "## Contrato de resposta (obrigatório)\n"
-                "Responda SOMENTE com um JSON válido seguindo o schema abaixo.\n"
-                "Não inclua markdown fora do JSON.\n"
-                f"schema: {json.dumps(schema, ensure_ascii=False)}\n\n"
                 "## Histórico (últimos turnos)\n"
                 f"{history}\n\n"
                 "## Pergunta atual do aluno\n"
                 f"{user_message}\n"
             ),
-        }
+        },
     ]
 
     full_text = await llm.generate(messages, temperature=0.7, max_tokens=2048)
@@ -0,0 +1,208 @@
+"""Benchmark event-loop lag of ChromaVectorStore: inline vs. executor modes.
+
+Standalone script that runs a concurrent workload (many clients issuing
+``search`` calls while a writer upserts batches) against
+``ChromaVectorStore`` and, in parallel, a ticker task that sleeps 1 ms in
+a loop and records how late it wakes up.  That lateness is the event-loop
+lag every SSE stream and WebSocket on the node would see.
+
+Modes compared:
+
+- ``inline``    -- legacy behavior, Chroma calls run on the event loop;
+- ``executor``  -- thread pool + write lock, no search coalescing;
+- ``coalesce``  -- thread pool + write lock + search coalescing.
+
+By default a real ephemeral ``chromadb`` client is used when installed;
+``--backend simulated`` swaps in a stand-in collection whose calls block
+for a fixed cost per query/record, which isolates the adapter's
+scheduling behavior from Chroma's own performance.
+
+Usage:
+    python runtime/scripts/bench_chroma_event_loop.py [--backend auto|chroma|simulated]
+        [--clients 64] [--searches 20] [--docs 5000] [--dims 384] [--workers 4]
+
+Examples:
+    # Default run (real Chroma when available)
+    python runtime/scripts/bench_chroma_event_loop.py
+
+    # Deterministic run without chromadb installed
+    python runtime/scripts/bench_chroma_event_loop.py --backend simulated
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import random
+import statistics
+import time
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+TICK_S = 0.001
+UPSERT_BATCH = 256
+# Simulated backend costs (seconds)
+SIM_QUERY_BASE = 0.004
+SIM_QUERY_PER_VECTOR = 0.0004
+SIM_WRITE_PER_RECORD = 0.00005
+
+# ---------------------------------------------------------------------------
+# Simulated Chroma collection
+# ---------------------------------------------------------------------------
+
+
+class _SimulatedCollection:
+    """Blocking stand-in for a Chroma collection (sleep-based cost model)."""
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.query_calls = 0
+
+    def upsert(self, *, ids: list[str], **_: Any) -> None:
+        time.sleep(SIM_WRITE_PER_RECORD * len(ids))
+
+    def delete(self, *, ids: list[str]) -> None:
+        time.sleep(SIM_WRITE_PER_RECORD * len(ids))
+
+    def query(self, *, query_embeddings: list[list[float]], n_results: int, **_: Any) -> dict[str, Any]:
+        self.query_calls += 1
+        time.sleep(SIM_QUERY_BASE + SIM_QUERY_PER_VECTOR * len(query_embeddings))
+        rows = range(len(query_embeddings))
+        return {
+            "ids": [[f"doc-{i}" for i in range(n_results)] for _ in rows],
+            "distances": [[0.1] * n_results for _ in rows],
+            "documents": [["text"] * n_results for _ in rows],
+            "metadatas": [[{}] * n_results for _ in rows],
+        }
+
+
+class _SimulatedClient:
+    def get_or_create_collection(self, *, name: str, **_: Any) -> _SimulatedCollection:
+        return _SimulatedCollection(name)
+
+
+def _make_client(backend: str) -> Any:
+    if backend == "simulated":
+        return _SimulatedClient()
+    try:
+        import chromadb
+    except ImportError:
+        if backend == "chroma":
+            raise
+        print("chromadb not installed; using the simulated backend\n")
+        return _SimulatedClient()
+    return chromadb.EphemeralClient()
+
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+async def _ticker(lags: list[float], stop: asyncio.Event) -> None:
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(TICK_S)
+        lags.append(time.perf_counter() - t0 - TICK_S)
+
+
+def _vectors(rng: random.Random, n: int, dims: int) -> list[list[float]]:
+    return [[rng.random() for _ in range(dims)] for _ in range(n)]
+
+
+async def _run_mode(mode: str, args: argparse.Namespace) -> None:
+    from ailine_runtime.adapters.vectorstores.chroma_store import ChromaVectorStore
+
+    rng = random.Random(args.seed)
+    store = ChromaVectorStore(
+        client=_make_client(args.backend),
+        collection_name=f"bench_{mode}",
+        executor_workers=0 if mode == "inline" else args.workers,
+        coalesce_window_ms=args.window_ms if mode == "coalesce" else 0.0,
+    )
+
+    # Seed the collection (not measured)
+    for start in range(0, args.docs, UPSERT_BATCH):
+        n = min(UPSERT_BATCH, args.docs - start)
+        await store.upsert(
+            ids=[f"seed-{start + i}" for i in range(n)],
+            embeddings=_vectors(rng, n, args.dims),
+            texts=["seed"] * n,
+            metadatas=[{"i": start + i} for i in range(n)],
+        )
+
+    queries = _vectors(rng, args.clients, args.dims)
+    writes = [_vectors(rng, UPSERT_BATCH, args.dims) for _ in range(4)]
+    latencies: list[float] = []
+
+    async def client(vec: list[float]) -> None:
+        for _ in range(args.searches):
+            t0 = time.perf_counter()
+            await store.search(query_embedding=vec, k=5)
+            latencies.append(time.perf_counter() - t0)
+
+    async def writer() -> None:
+        for w, batch in enumerate(writes):
+            await store.upsert(
+                ids=[f"w{w}-{i}" for i in range(len(batch))],
+                embeddings=batch,
+                texts=["write"] * len(batch),
+                metadatas=[{}] * len(batch),
+            )
+
+    lags: list[float] = []
+    stop = asyncio.Event()
+    ticker = asyncio.create_task(_ticker(lags, stop))
+    t0 = time.perf_counter()
+    await asyncio.gather(writer(), *(client(q) for q in queries))
+    wall = time.perf_counter() - t0
+    stop.set()
+    await ticker
+    await store.dispose()
+
+    lags.sort()
+    latencies.sort()
+    p99_lag = lags[int(0.99 * (len(lags) - 1))] if lags else 0.0
+    p99_lat = latencies[int(0.99 * (len(latencies) - 1))]
+    calls = getattr(store._collection, "query_calls", None)
+    print(
+        f"{mode:<10} {wall:>8.2f} {len(latencies) / wall:>9.0f} "
+        f"{statistics.median(latencies) * 1e3:>9.1f} {p99_lat * 1e3:>9.1f} "
+        f"{statistics.median(lags) * 1e3 if lags else 0.0:>9.2f} {p99_lag * 1e3:>9.2f} "
+        f"{(lags[-1] if lags else 0.0) * 1e3:>9.1f} {calls if calls is not None else '-':>8}"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=("auto", "chroma", "simulated"), default="auto")
+    parser.add_argument("--clients", type=int, default=64)
+    parser.add_argument("--searches", type=int, default=20)
+    parser.add_argument("--docs", type=int, default=5000)
+    parser.add_argument("--dims", type=int, default=384)
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--window-ms", type=float, default=2.0)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    from ailine_runtime.shared.observability import configure_logging
+
+    configure_logging(json_output=False, level="WARNING")
+    print(
+        f"{'mode':<10} {'wall s':>8} {'search/s':>9} {'p50 ms':>9} {'p99 ms':>9} "
+        f"{'lag p50':>9} {'lag p99':>9} {'lag max':>9} {'queries':>8}"
+    )
+    for mode in ("inline", "executor", "coalesce"):
+        asyncio.run(_run_mode(mode, args))
+
+
+if __name__ == "__main__":
+    main()
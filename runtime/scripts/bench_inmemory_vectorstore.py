@@ -0,0 +1,200 @@
+"""Benchmark InMemoryVectorStore search against the legacy dict-scan implementation.
+
+Standalone script that loads the same random corpus into the matrix-backed
+``InMemoryVectorStore`` and into a copy of the previous implementation
+(one ``_StoredChunk`` per row, per-query norms, full ``list.sort``), then
+reports per-query latency for unfiltered and tenant+filter searches.
+
+Usage:
+    python runtime/scripts/bench_inmemory_vectorstore.py [--sizes 10000,100000,1000000]
+        [--dim 128] [--queries 20] [--k 5] [--legacy-max-rows 1000000]
+
+Examples:
+    # Quick run
+    python runtime/scripts/bench_inmemory_vectorstore.py --sizes 10000 --queries 5
+
+    # Skip the (slow) legacy scan at 1M rows
+    python runtime/scripts/bench_inmemory_vectorstore.py --legacy-max-rows 100000
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from dataclasses import dataclass
+from typing import Any
+
+import numpy as np
+
+from ailine_runtime.adapters.vectorstores.inmemory_store import InMemoryVectorStore
+from ailine_runtime.domain.ports.vectorstore import VectorSearchResult
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+TENANTS = 10
+SUBJECTS = ("math", "science", "history", "art", "music", "geo", "pt", "en")
+LOAD_BATCH = 10_000
+
+# ---------------------------------------------------------------------------
+# Legacy implementation (pre-matrix), kept verbatim for comparison
+# ---------------------------------------------------------------------------
+
+
+@dataclass
+class _StoredChunk:
+    id: str
+    embedding: np.ndarray
+    text: str
+    metadata: dict[str, Any]
+    tenant_id: str = ""
+
+
+class LegacyInMemoryVectorStore:
+    def __init__(self) -> None:
+        self._store: dict[str, _StoredChunk] = {}
+
+    async def upsert(
+        self,
+        *,
+        ids: list[str],
+        embeddings: list[list[float]],
+        texts: list[str],
+        metadatas: list[dict[str, Any]],
+        tenant_id: str | None = None,
+    ) -> None:
+        for i, doc_id in enumerate(ids):
+            self._store[doc_id] = _StoredChunk(
+                id=doc_id,
+                embedding=np.array(embeddings[i], dtype=np.float32),
+                text=texts[i],
+                metadata=dict(metadatas[i]),
+                tenant_id=tenant_id or "",
+            )
+
+    async def search(
+        self,
+        *,
+        query_embedding: list[float],
+        k: int = 5,
+        filters: dict[str, Any] | None = None,
+        tenant_id: str | None = None,
+    ) -> list[VectorSearchResult]:
+        query_vec = np.array(query_embedding, dtype=np.float32)
+        query_norm = float(np.linalg.norm(query_vec))
+        if query_norm == 0:
+            return []
+        scored: list[tuple[float, _StoredChunk]] = []
+        for chunk in self._store.values():
+            if tenant_id is not None and chunk.tenant_id != tenant_id:
+                continue
+            if filters and not all(
+                key in chunk.metadata and chunk.metadata[key] == value
+                for key, value in filters.items()
+            ):
+                continue
+            chunk_norm = float(np.linalg.norm(chunk.embedding))
+            if chunk_norm == 0:
+                continue
+            similarity = float(
+                np.dot(query_vec, chunk.embedding) / (query_norm * chunk_norm)
+            )
+            scored.append((similarity, chunk))
+        scored.sort(key=lambda pair: pair[0], reverse=True)
+        return [
+            VectorSearchResult(
+                id=chunk.id, score=score, text=chunk.text, metadata=dict(chunk.metadata)
+            )
+            for score, chunk in scored[:k]
+        ]
+
+
+# ---------------------------------------------------------------------------
+# Helpers
+# ---------------------------------------------------------------------------
+
+
+async def _load(store: Any, rows: int, dim: int, seed: int) -> float:
+    """Insert *rows* random chunks spread over TENANTS tenants; return seconds."""
+    rng = np.random.default_rng(seed)
+    t0 = time.perf_counter()
+    for start in range(0, rows, LOAD_BATCH):
+        n = min(LOAD_BATCH, rows - start)
+        vecs = rng.standard_normal((n, dim), dtype=np.float32).tolist()
+        tenant = f"tenant-{(start // LOAD_BATCH) % TENANTS}"
+        await store.upsert(
+            ids=[f"chunk-{start + i}" for i in range(n)],
+            embeddings=vecs,
+            texts=[""] * n,
+            metadatas=[{"subject": SUBJECTS[(start + i) % len(SUBJECTS)]} for i in range(n)],
+            tenant_id=tenant,
+        )
+    return time.perf_counter() - t0
+
+
+async def _time_queries(
+    store: Any, queries: list[list[float]], k: int, **kwargs: Any
+) -> list[float]:
+    latencies: list[float] = []
+    for q in queries:
+        t0 = time.perf_counter()
+        await store.search(query_embedding=q, k=k, **kwargs)
+        latencies.append((time.perf_counter() - t0) * 1000)
+    return latencies
+
+
+def _fmt(latencies: list[float]) -> str:
+    if not latencies:
+        return "        -"
+    return f"{statistics.median(latencies):9.3f}"
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+async def _run(args: argparse.Namespace) -> None:
+    sizes = [int(s) for s in args.sizes.split(",") if s]
+    rng = np.random.default_rng(0)
+    queries = rng.standard_normal((args.queries, args.dim), dtype=np.float32).tolist()
+    scoped = {"tenant_id": "tenant-0", "filters": {"subject": "math"}}
+
+    print(f"dim={args.dim} k={args.k} queries={args.queries} (p50 ms per query)")
+    print(f"{'rows':>9} {'impl':>7} {'load s':>8} {'all':>9} {'scoped':>9}")
+    for rows in sizes:
+        matrix = InMemoryVectorStore(initial_capacity=rows)
+        load = await _load(matrix, rows, args.dim, seed=rows)
+        new_all = await _time_queries(matrix, queries, args.k)
+        new_scoped = await _time_queries(matrix, queries, args.k, **scoped)
+        print(f"{rows:>9} {'matrix':>7} {load:8.2f} {_fmt(new_all)} {_fmt(new_scoped)}")
+        del matrix
+
+        if rows > args.legacy_max_rows:
+            print(f"{rows:>9} {'legacy':>7}   (skipped, rows > --legacy-max-rows)")
+            continue
+        legacy = LegacyInMemoryVectorStore()
+        load = await _load(legacy, rows, args.dim, seed=rows)
+        old_all = await _time_queries(legacy, queries, args.k)
+        old_scoped = await _time_queries(legacy, queries, args.k, **scoped)
+        print(f"{rows:>9} {'legacy':>7} {load:8.2f} {_fmt(old_all)} {_fmt(old_scoped)}")
+        speedup = statistics.median(old_all) / max(statistics.median(new_all), 1e-9)
+        print(f"{rows:>9} {'speedup':>7} {'':>8} {speedup:8.1f}x")
+        del legacy
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="10000,100000,1000000")
+    parser.add_argument("--dim", type=int, default=128)
+    parser.add_argument("--queries", type=int, default=20)
+    parser.add_argument("--k", type=int, default=5)
+    parser.add_argument("--legacy-max-rows", type=int, default=1_000_000)
+    asyncio.run(_run(parser.parse_args()))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,171 @@
+"""Benchmark the local materials store: inverted index vs. full scan.
+
+Standalone script that fills a temporary ``AILINE_LOCAL_STORE`` with
+synthetic materials (Zipf-distributed vocabulary, a few paragraphs each)
+and measures, per corpus size:
+
+- ``add_material`` throughput (file write + incremental index update);
+- cold open of the index from disk (what a new worker pays once);
+- ``search_materials`` latency through the memory-mapped BM25 index;
+- the same queries through the legacy glob + JSON-parse + substring scan
+  (skipped above ``--legacy-max`` materials, where it takes minutes).
+
+Usage:
+    python runtime/scripts/bench_materials_index.py [--sizes 1000,10000,100000]
+        [--queries 50] [--legacy-max 10000] [--seed 0]
+
+Examples:
+    # Default sweep
+    python runtime/scripts/bench_materials_index.py
+
+    # Quick run
+    python runtime/scripts/bench_materials_index.py --sizes 1000 --queries 10
+"""
+
+from __future__ import annotations
+
+import argparse
+import itertools
+import os
+import random
+import tempfile
+import time
+from pathlib import Path
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+VOCAB_SIZE = 20_000
+TEACHERS = 50
+SUBJECTS = ("Matemática", "Ciências", "História", "Geografia", "Português")
+PARAGRAPHS = (2, 5)
+WORDS_PER_PARAGRAPH = (30, 90)
+
+# ---------------------------------------------------------------------------
+# Corpus generation
+# ---------------------------------------------------------------------------
+
+
+def _vocabulary(rng: random.Random) -> tuple[list[str], list[float]]:
+    letters = "abcdefghijklmnopqrstuvwxyz"
+    words = ["".join(rng.choices(letters, k=rng.randint(4, 10))) for _ in range(VOCAB_SIZE)]
+    cum_weights = list(itertools.accumulate(1.0 / (rank + 1) for rank in range(VOCAB_SIZE)))
+    return words, cum_weights
+
+
+def _document(rng: random.Random, words: list[str], cum_weights: list[float]) -> str:
+    paragraphs = []
+    for _ in range(rng.randint(*PARAGRAPHS)):
+        n = rng.randint(*WORDS_PER_PARAGRAPH)
+        paragraphs.append(" ".join(rng.choices(words, cum_weights=cum_weights, k=n)) + ".")
+    return "\n\n".join(paragraphs)
+
+
+# ---------------------------------------------------------------------------
+# Legacy scan (pre-index search_materials, kept for comparison)
+# ---------------------------------------------------------------------------
+
+
+def _legacy_search(query: str, *, k: int, teacher_id: str | None) -> list[dict[str, Any]]:
+    from ailine_runtime.materials.store import _chunk_text, _tokens, iter_materials
+
+    q_tokens = _tokens(query)
+    scored: list[dict[str, Any]] = []
+    for m in iter_materials(teacher_id=teacher_id):
+        for idx, ch in enumerate(_chunk_text(m.content)):
+            ch_low = ch.lower()
+            score = sum(1 for t in q_tokens if t in ch_low)
+            if score > 0:
+                scored.append({"score": score, "material_id": m.material_id, "chunk_index": idx})
+    scored.sort(key=lambda x: x["score"], reverse=True)
+    return scored[:k]
+
+
+# ---------------------------------------------------------------------------
+# Benchmark
+# ---------------------------------------------------------------------------
+
+
+def _bench_size(size: int, n_queries: int, legacy_max: int, seed: int) -> None:
+    from ailine_runtime.materials import store
+
+    rng = random.Random(seed)
+    words, cum_weights = _vocabulary(rng)
+    with tempfile.TemporaryDirectory(prefix="ailine-bench-") as tmp:
+        os.environ["AILINE_LOCAL_STORE"] = tmp
+
+        t0 = time.perf_counter()
+        for i in range(size):
+            store.add_material(
+                teacher_id=f"teacher-{i % TEACHERS}",
+                subject=SUBJECTS[i % len(SUBJECTS)],
+                title=f"Material {i}",
+                content=_document(rng, words, cum_weights),
+                tags=[f"tag{i % 7}"],
+            )
+        add_s = time.perf_counter() - t0
+
+        index = store.get_material_index()
+        # Cold open: a new process mapping the on-disk index
+        store._INDEXES.clear()
+        t0 = time.perf_counter()
+        index = store.get_material_index()
+        chunks = index.chunk_count
+        open_s = time.perf_counter() - t0
+
+        queries = [
+            " ".join(rng.choices(words[50:2000], k=rng.randint(1, 3))) for _ in range(n_queries)
+        ]
+        teachers = [f"teacher-{rng.randrange(TEACHERS)}" for _ in range(n_queries)]
+
+        t0 = time.perf_counter()
+        for q, teacher in zip(queries, teachers, strict=True):
+            store.search_materials(query=q, k=5, teacher_id=teacher)
+        index_ms = (time.perf_counter() - t0) / n_queries * 1e3
+
+        t0 = time.perf_counter()
+        for q in queries:
+            store.search_materials(query=q, k=5)
+        index_all_ms = (time.perf_counter() - t0) / n_queries * 1e3
+
+        legacy = "skipped"
+        if size <= legacy_max:
+            sample = queries[: max(1, n_queries // 5)]
+            t0 = time.perf_counter()
+            for q in sample:
+                _legacy_search(q, k=5, teacher_id=None)
+            legacy = f"{(time.perf_counter() - t0) / len(sample) * 1e3:10.1f}"
+
+        disk = sum(f.stat().st_size for f in (Path(tmp) / "index").iterdir()) / 1e6
+        print(
+            f"{size:>8} {chunks:>8} {size / add_s:>9.0f} {open_s * 1e3:>9.1f} "
+            f"{index_ms:>10.2f} {index_all_ms:>10.2f} {legacy:>10} {disk:>8.1f}"
+        )
+        store._INDEXES.clear()
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sizes", default="1000,10000,100000")
+    parser.add_argument("--queries", type=int, default=50)
+    parser.add_argument("--legacy-max", type=int, default=10_000)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    print(
+        f"{'mats':>8} {'chunks':>8} {'adds/s':>9} {'open ms':>9} "
+        f"{'q ms (t)':>10} {'q ms (all)':>10} {'scan ms':>10} {'idx MB':>8}"
+    )
+    for size in (int(s) for s in args.sizes.split(",") if s):
+        _bench_size(size, args.queries, args.legacy_max, args.seed)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,145 @@
+"""Benchmark RedisReplayStore writes: write-through vs. batched flushes.
+
+Standalone script that runs ``--runs`` concurrent plan runs, each
+appending ``--events`` SSE events (a mix of stage lifecycle and progress
+ticks, with the pipeline yielding between them) and a terminal event to
+the Redis replay store.  Reports throughput, per-append latency, the
+number of pipelines sent to Redis and the flush size / latency
+distribution recorded by the store's metrics.
+
+Modes compared:
+
+- ``through`` -- ``batch_window_ms=0``: every append is its own flush
+  (one round trip per event, like the previous MULTI per event);
+- ``batched`` -- appends buffered for ``--window-ms`` or up to
+  ``--max-events`` per run, all pending runs written in one pipeline.
+
+Usage:
+    python runtime/scripts/bench_replay_writes.py [--redis-url URL | --fake]
+        [--runs 300] [--events 60] [--window-ms 5] [--max-events 64]
+
+Examples:
+    # Against a local Redis (database 15 is used and left with TTL'd keys)
+    python runtime/scripts/bench_replay_writes.py --redis-url redis://localhost:6379/15
+
+    # Without a Redis server (fakeredis over TCP; no real network cost)
+    python runtime/scripts/bench_replay_writes.py --fake
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import socket
+import statistics
+import threading
+import time
+import uuid
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+async def _run(store: Any, run_id: str, args: argparse.Namespace, latencies: list[float]) -> None:
+    from ailine_runtime.api.streaming.events import SSEEventEmitter
+
+    emitter = SSEEventEmitter(run_id)
+
+    async def append(event: Any) -> None:
+        t0 = time.perf_counter()
+        await store.append(run_id, event.seq, event.to_sse_data())
+        latencies.append(time.perf_counter() - t0)
+
+    await append(emitter.run_start())
+    for i in range(args.events):
+        if i % 10 == 0:
+            await append(emitter.stage_start(f"stage-{i // 10}"))
+        else:
+            await append(emitter.stage_progress(f"stage-{i // 10}", {"pct": i}))
+        await asyncio.sleep(0)  # the node awaits its LLM between events
+    await append(emitter.run_complete({"score": 90}))
+    await store.mark_terminal(run_id, "completed")
+
+
+def _histogram_totals(histogram: Any) -> tuple[int, float]:
+    data = histogram.collect()
+    return sum(d["_count"] for _, d in data), sum(d["_sum"] for _, d in data)
+
+
+async def _bench(mode: str, url: str, args: argparse.Namespace) -> None:
+    from ailine_runtime.api.streaming.replay import RedisReplayStore, ReplayConfig
+    from ailine_runtime.shared.metrics import replay_flush_duration, replay_flush_events
+
+    config = ReplayConfig(
+        prefix=f"bench-{uuid.uuid4().hex[:8]}",
+        ttl_seconds=120,
+        batch_window_ms=0.0 if mode == "through" else args.window_ms,
+        batch_max_events=args.max_events,
+    )
+    store = RedisReplayStore(url, config)
+    flushes0, events0 = _histogram_totals(replay_flush_events)
+    _, seconds0 = _histogram_totals(replay_flush_duration)
+    latencies: list[float] = []
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(_run(store, f"run-{i}", args, latencies) for i in range(args.runs)))
+    wall = time.perf_counter() - t0
+    await store.close()
+
+    flushes1, events1 = _histogram_totals(replay_flush_events)
+    _, seconds1 = _histogram_totals(replay_flush_duration)
+    flushes = flushes1 - flushes0
+    written = events1 - events0
+    lat_ms = sorted(x * 1e3 for x in latencies)
+    p99 = lat_ms[min(len(lat_ms) - 1, int(len(lat_ms) * 0.99))]
+    print(
+        f"{mode:>8} {wall:>8.2f} {written / wall:>10.0f} {statistics.median(lat_ms):>9.3f} "
+        f"{p99:>9.3f} {flushes:>9} {written / max(flushes, 1):>9.1f} "
+        f"{(seconds1 - seconds0) / max(flushes, 1) * 1e3:>10.3f}"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def _start_fake_server() -> str:
+    from fakeredis import TcpFakeServer
+
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = TcpFakeServer(("127.0.0.1", port), server_type="redis")
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return f"redis://127.0.0.1:{port}/0"
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--redis-url", default="redis://localhost:6379/15")
+    parser.add_argument("--fake", action="store_true", help="use a fakeredis TCP server")
+    parser.add_argument("--runs", type=int, default=300)
+    parser.add_argument("--events", type=int, default=60, help="events per run")
+    parser.add_argument("--window-ms", type=float, default=5.0)
+    parser.add_argument("--max-events", type=int, default=64)
+    parser.add_argument("--modes", default="through,batched")
+    args = parser.parse_args()
+
+    from ailine_runtime.shared.observability import configure_logging
+
+    configure_logging(json_output=False, level="WARNING")
+    url = _start_fake_server() if args.fake else args.redis_url
+    print(f"{args.runs} runs x {args.events + 2} events, window {args.window_ms} ms, {url}\n")
+    print(
+        f"{'mode':>8} {'wall s':>8} {'events/s':>10} {'app p50':>9} {'app p99':>9} "
+        f"{'flushes':>9} {'ev/flush':>9} {'flush ms':>10}"
+    )
+    for mode in args.modes.split(","):
+        asyncio.run(_bench(mode, url, args))
+
+
+if __name__ == "__main__":
+    main()
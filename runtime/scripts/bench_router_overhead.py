@@ -0,0 +1,201 @@
+"""Benchmark SmartRouter per-call routing overhead: legacy vs. single-pass scorer.
+
+Standalone script that measures the CPU cost the router adds to every
+``generate``/``stream`` call -- feature extraction plus the token
+estimate -- for prompts of 1k, 10k and 100k characters.
+
+Variants compared:
+
+- ``legacy``     -- per-dimension scorers (four regex passes, stringified
+  content) and a full BPE encode of the joined conversation;
+- ``cold``       -- single-pass extractor, every message encoded once
+  (empty token cache);
+- ``warm``       -- same call repeated: per-message token counts served
+  from the content-digest cache;
+- ``on-loop``    -- what ``estimate_tokens_async`` keeps on the event loop
+  for a cold call (feature extraction + digests; the encode itself runs
+  in a worker thread above ``_OFFLOAD_MIN_CHARS``).
+
+The token counter is tiktoken's cl100k_base when it can be loaded;
+``--tokenizer regex`` (or ``auto`` without the encoding files, e.g.
+offline) substitutes a regex pre-tokenizer with a similar linear cost
+profile so the comparison still runs.
+
+Usage:
+    python runtime/scripts/bench_router_overhead.py [--tokenizer auto|tiktoken|regex]
+        [--sizes 1000 10000 100000] [--repeat 50]
+
+Examples:
+    # Default run
+    python runtime/scripts/bench_router_overhead.py
+
+    # Offline / without tiktoken encoding files
+    python runtime/scripts/bench_router_overhead.py --tokenizer regex
+"""
+
+from __future__ import annotations
+
+import argparse
+import random
+import re
+import statistics
+import time
+from collections.abc import Callable
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+WORDS = (
+    "plano", "aula", "fração", "frações", "alunos", "avaliação", "analisar", "compare", "rubric",
+    "BNCC", "scaffold", "inclusive", "leitura", "escrita", "matemática", "exercício", "objetivo",
+)
+_REGEX_PRETOKENIZER = re.compile(r"\w+|[^\w\s]+|\s+")
+
+# ---------------------------------------------------------------------------
+# Tokenizer selection
+# ---------------------------------------------------------------------------
+
+
+def _install_tokenizer(choice: str) -> str:
+    """Make ``token_counter.count_tokens`` usable; return the tokenizer name."""
+    from ailine_runtime.app import token_counter
+
+    if choice in ("auto", "tiktoken"):
+        try:
+            token_counter.count_tokens("warm up")
+            return "tiktoken cl100k_base"
+        except Exception:
+            if choice == "tiktoken":
+                raise
+            print("tiktoken encoding unavailable; using the regex stand-in tokenizer\n")
+
+    def count_tokens(text: str, *, encoding: str = "cl100k_base") -> int:
+        return len(_REGEX_PRETOKENIZER.findall(text)) if text else 0
+
+    token_counter.count_tokens = count_tokens  # type: ignore[assignment]
+    return "regex stand-in"
+
+
+# ---------------------------------------------------------------------------
+# Legacy implementation (pre single-pass), kept here as the baseline
+# ---------------------------------------------------------------------------
+
+_LEGACY_SIGNALS = None
+
+
+def _legacy_signals() -> list[re.Pattern[str]]:
+    global _LEGACY_SIGNALS
+    if _LEGACY_SIGNALS is None:
+        from ailine_runtime.adapters.llm.routing_types import _COMPLEXITY_CATEGORIES
+
+        _LEGACY_SIGNALS = [re.compile(alts, re.IGNORECASE) for _, alts in _COMPLEXITY_CATEGORIES]
+    return _LEGACY_SIGNALS
+
+
+def _legacy_route(messages: list[dict[str, Any]], kwargs: dict[str, Any]) -> tuple[float, ...]:
+    from ailine_runtime.adapters.llm.routing_types import (
+        score_history,
+        score_structured,
+        score_tools,
+    )
+    from ailine_runtime.app.token_counter import count_tokens
+
+    total_chars = sum(len(str(m.get("content", ""))) for m in messages)
+    last = str(messages[-1].get("content", ""))
+    matches = sum(1 for pat in _legacy_signals() if pat.search(last))
+    tokens = max(1, count_tokens(" ".join(str(m.get("content", "")) for m in messages)))
+    return (
+        total_chars,
+        score_structured(kwargs),
+        score_tools(kwargs),
+        score_history(messages),
+        matches,
+        tokens,
+    )
+
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+def _text(rng: random.Random, chars: int) -> str:
+    parts: list[str] = []
+    size = 0
+    while size < chars:
+        word = rng.choice(WORDS)
+        parts.append(word)
+        size += len(word) + 1
+    return " ".join(parts)[:chars]
+
+
+def _conversation(rng: random.Random, chars: int) -> list[dict[str, Any]]:
+    """System prompt + history + a fresh user turn totalling *chars*."""
+    system = _text(rng, chars // 2)
+    history = [
+        {"role": "user" if i % 2 == 0 else "assistant", "content": _text(rng, chars // 8)}
+        for i in range(3)
+    ]
+    last = {"role": "user", "content": _text(rng, chars - chars // 2 - 3 * (chars // 8))}
+    return [{"role": "system", "content": system}, *history, last]
+
+
+def _time_us(fn: Callable[[], Any], repeat: int, setup: Callable[[], Any] | None = None) -> float:
+    samples: list[float] = []
+    for _ in range(repeat):
+        if setup is not None:
+            setup()
+        t0 = time.perf_counter()
+        fn()
+        samples.append((time.perf_counter() - t0) * 1e6)
+    return statistics.median(samples)
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--tokenizer", choices=("auto", "tiktoken", "regex"), default="auto")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1_000, 10_000, 100_000])
+    parser.add_argument("--repeat", type=int, default=50)
+    parser.add_argument("--seed", type=int, default=0)
+    args = parser.parse_args()
+
+    tokenizer = _install_tokenizer(args.tokenizer)
+
+    from ailine_runtime.adapters.llm import routing_types
+
+    rng = random.Random(args.seed)
+    kwargs: dict[str, Any] = {"tools": [{"name": "search"}]}
+
+    def clear_cache() -> None:
+        routing_types._token_cache.clear()
+
+    print(f"tokenizer: {tokenizer}, median of {args.repeat} calls (µs per call)\n")
+    print(f"{'chars':>8} {'legacy':>10} {'cold':>10} {'warm':>10} {'on-loop':>10} {'speedup':>8}")
+    for chars in args.sizes:
+        messages = _conversation(rng, chars)
+
+        def new_route(msgs: list[dict[str, Any]] = messages) -> None:
+            routing_types.extract_route_features(msgs, kwargs)
+            routing_types.estimate_tokens(msgs)
+
+        def on_loop(msgs: list[dict[str, Any]] = messages) -> None:
+            routing_types.extract_route_features(msgs, kwargs)
+            routing_types._split_cached(msgs)
+
+        legacy = _time_us(lambda msgs=messages: _legacy_route(msgs, kwargs), args.repeat)
+        cold = _time_us(new_route, args.repeat, setup=clear_cache)
+        new_route()
+        warm = _time_us(new_route, args.repeat)
+        loop = _time_us(on_loop, args.repeat, setup=clear_cache)
+        print(f"{chars:>8} {legacy:>10.1f} {cold:>10.1f} {warm:>10.1f} {loop:>10.1f} {legacy / warm:>7.1f}x")
+
+
+if __name__ == "__main__":
+    main()
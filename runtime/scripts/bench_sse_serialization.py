@@ -0,0 +1,154 @@
+"""Benchmark SSE event throughput per core: emitter -> channel -> replay store.
+
+Standalone script that pushes ``--events`` events of one run through the
+whole delivery path on a single event loop (one core): the emitter
+creates the event, the pipeline publishes it to the client ``SSEChannel``
+and the replay ``SSEChannel``, the client side serializes it for the SSE
+frame and the replay writer serializes it again for the replay store.
+
+Paths compared:
+
+- ``legacy`` -- the previous envelope: ``json.dumps(model_dump())`` per
+  consumer and a ``"{seq}|{payload}"`` replay member;
+- ``fast``   -- ``SSEEvent.to_sse_data`` as shipped: one cached encode
+  (orjson + per-run envelope prefix) shared by both consumers, the
+  envelope stored verbatim.
+
+The replay store is in-memory by default; ``--redis-url`` appends to a
+``RedisReplayStore`` instead (then Redis round trips dominate).
+
+Usage:
+    python runtime/scripts/bench_sse_serialization.py [--events 100000]
+        [--payload-keys 8] [--redis-url URL]
+
+Examples:
+    # Default run (in-memory replay store)
+    python runtime/scripts/bench_sse_serialization.py
+
+    # Larger payloads
+    python runtime/scripts/bench_sse_serialization.py --payload-keys 64
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Paths
+# ---------------------------------------------------------------------------
+
+
+class _LegacyEmitter:
+    """The previous emitter + envelope serialization."""
+
+    def __init__(self, run_id: str) -> None:
+        self.run_id = run_id
+        self.seq = 0
+
+    def stage_progress(self, stage: str, payload: dict[str, Any]) -> Any:
+        from ailine_runtime.api.streaming.events import SSEEvent, SSEEventType
+
+        self.seq += 1
+        return SSEEvent(
+            run_id=self.run_id,
+            seq=self.seq,
+            type=SSEEventType.STAGE_PROGRESS,
+            stage=stage,
+            payload=payload,
+        )
+
+
+def _legacy_data(event: Any) -> str:
+    return json.dumps(event.model_dump(), ensure_ascii=False)
+
+
+def _fast_data(event: Any) -> str:
+    data: str = event.to_sse_data()
+    return data
+
+
+async def _run(path: str, args: argparse.Namespace) -> tuple[float, int]:
+    from ailine_runtime.api.streaming.channel import SSEChannel
+    from ailine_runtime.api.streaming.events import SSEEventEmitter
+    from ailine_runtime.api.streaming.replay import (
+        InMemoryReplayStore,
+        RedisReplayStore,
+        ReplayConfig,
+    )
+
+    run_id = "bench-run"
+    emitter: Any = _LegacyEmitter(run_id) if path == "legacy" else SSEEventEmitter(run_id)
+    encode = _legacy_data if path == "legacy" else _fast_data
+    config = ReplayConfig(keep_last=args.events + 1, prefix=f"bench-{path}")
+    store: Any = (
+        RedisReplayStore(args.redis_url, config) if args.redis_url else InMemoryReplayStore(config)
+    )
+    client = SSEChannel(run_id, capacity=args.events + 1)
+    replay = SSEChannel(run_id, capacity=args.events + 1)
+    payload = {f"key_{i}": f"valor número {i}" for i in range(args.payload_keys)}
+    delivered = 0
+
+    async def client_side() -> None:
+        nonlocal delivered
+        async for event in client:
+            frame = {"id": str(event.seq), "data": encode(event)}
+            delivered += len(frame["data"])
+
+    async def replay_side() -> None:
+        async for event in replay:
+            data = encode(event)
+            if path == "legacy":
+                data = f"{event.seq}|{data}"  # the old ZSET member
+            await store.append(run_id, event.seq, data)
+
+    t0 = time.perf_counter()
+    consumers = asyncio.gather(client_side(), replay_side())
+    for i in range(args.events):
+        event = emitter.stage_progress("planner", {**payload, "i": i})
+        client.publish(event)
+        replay.publish(event)
+        if i % 256 == 255:
+            await asyncio.sleep(0)  # let the consumers drain
+    client.close()
+    replay.close()
+    await consumers
+    elapsed = time.perf_counter() - t0
+    await store.close()
+    return elapsed, delivered
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--events", type=int, default=100_000)
+    parser.add_argument("--payload-keys", type=int, default=8)
+    parser.add_argument("--redis-url", default="")
+    parser.add_argument("--paths", default="legacy,fast")
+    args = parser.parse_args()
+
+    from ailine_runtime.shared.observability import configure_logging
+
+    configure_logging(json_output=False, level="WARNING")
+    print(
+        f"{args.events} events, {args.payload_keys}-key payload, "
+        f"replay store: {args.redis_url or 'in-memory'}\n"
+    )
+    print(f"{'path':>8} {'seconds':>9} {'events/s':>11} {'us/event':>9} {'MB sent':>9}")
+    for path in args.paths.split(","):
+        elapsed, delivered = asyncio.run(_run(path, args))
+        print(
+            f"{path:>8} {elapsed:>9.2f} {args.events / elapsed:>11.0f} "
+            f"{elapsed / args.events * 1e6:>9.2f} {delivered / 1e6:>9.1f}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,189 @@
+"""Load-test plan SSE delivery: concurrent streams and event-loop lag.
+
+Standalone script that runs ``--streams`` concurrent plan runs in one
+event loop, each a pipeline emitting lifecycle events and bursts of
+``stage.progress`` into a per-run buffer drained by a client that takes
+``--client-ms`` per event.  A probe task sleeps 5 ms in a loop and
+records how late it wakes up -- the event-loop lag every other request
+on the worker sees.
+
+Delivery modes:
+
+- ``queue`` -- the previous design: ``asyncio.Queue(maxsize=500)`` fed
+  with ``put_nowait`` (events dropped on ``QueueFull``), drained with
+  ``wait_for(queue.get(), 1.0)`` plus a disconnect poll per event;
+- ``channel`` -- ``SSEChannel``: progress coalesced per stage under
+  pressure, lifecycle/terminal events never dropped, no polling.
+
+Usage:
+    python runtime/scripts/bench_sse_streams.py [--streams 500] [--stages 6]
+        [--progress 200] [--client-ms 2] [--modes queue,channel]
+
+Examples:
+    # Default run (500 streams, both modes)
+    python runtime/scripts/bench_sse_streams.py
+
+    # Faster clients, fewer progress updates
+    python runtime/scripts/bench_sse_streams.py --client-ms 0.5 --progress 50
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import contextlib
+import statistics
+import time
+from typing import Any
+
+_LIFECYCLE = {"run.started", "run.completed", "stage.started", "stage.completed"}
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+async def _pipeline(emitter: Any, publish: Any, args: argparse.Namespace) -> None:
+    """Emit a run: per stage, start + progress bursts + complete."""
+    publish(emitter.run_start())
+    for s in range(args.stages):
+        stage = f"stage-{s}"
+        publish(emitter.stage_start(stage))
+        for i in range(args.progress):
+            publish(emitter.stage_progress(stage, {"pct": i}))
+            if i % 25 == 24:
+                await asyncio.sleep(0.001)  # the node awaits an LLM chunk
+        publish(emitter.stage_complete(stage))
+    publish(emitter.run_complete({"score": 90}))
+
+
+async def _queue_stream(run_id: str, args: argparse.Namespace) -> dict[str, int]:
+    from ailine_runtime.api.streaming.events import SSEEventEmitter
+
+    emitter = SSEEventEmitter(run_id)
+    queue: asyncio.Queue[dict[str, str] | None] = asyncio.Queue(maxsize=500)
+    sent: list[str] = []
+
+    def publish(event: Any) -> None:
+        with contextlib.suppress(asyncio.QueueFull):
+            queue.put_nowait({"data": event.to_sse_data(), "type": event.type.value})
+
+    async def run() -> None:
+        await _pipeline(emitter, publish, args)
+        await queue.put(None)
+
+    async def is_disconnected() -> bool:
+        await asyncio.sleep(0)  # stands in for Request.is_disconnected()
+        return False
+
+    task = asyncio.create_task(run())
+    while True:
+        if await is_disconnected():
+            break
+        try:
+            item = await asyncio.wait_for(queue.get(), timeout=1.0)
+        except TimeoutError:
+            continue
+        if item is None:
+            break
+        sent.append(item["type"])
+        await asyncio.sleep(args.client_ms / 1000.0)
+    await task
+    return _summary(sent, emitter.seq, args)
+
+
+async def _channel_stream(run_id: str, args: argparse.Namespace) -> dict[str, int]:
+    from ailine_runtime.api.streaming.channel import SSEChannel
+    from ailine_runtime.api.streaming.events import SSEEventEmitter
+
+    emitter = SSEEventEmitter(run_id)
+    channel = SSEChannel(run_id)
+    sent: list[str] = []
+
+    async def run() -> None:
+        try:
+            await _pipeline(emitter, channel.publish, args)
+        finally:
+            channel.close()
+
+    task = asyncio.create_task(run())
+    async for event in channel:
+        event.to_sse_data()
+        sent.append(event.type.value)
+        await asyncio.sleep(args.client_ms / 1000.0)
+    await task
+    return _summary(sent, emitter.seq, args)
+
+
+def _summary(sent: list[str], emitted: int, args: argparse.Namespace) -> dict[str, int]:
+    expected_lifecycle = 2 + 2 * args.stages
+    return {
+        "emitted": emitted,
+        "delivered": len(sent),
+        "lifecycle_lost": expected_lifecycle - sum(t in _LIFECYCLE for t in sent),
+        "terminal": int(bool(sent) and sent[-1] == "run.completed"),
+    }
+
+
+async def _probe_lag(stop: asyncio.Event, samples: list[float]) -> None:
+    interval = 0.005
+    while not stop.is_set():
+        t0 = time.perf_counter()
+        await asyncio.sleep(interval)
+        samples.append(time.perf_counter() - t0 - interval)
+
+
+async def _run(mode: str, args: argparse.Namespace) -> None:
+    stream = _queue_stream if mode == "queue" else _channel_stream
+    stop = asyncio.Event()
+    lag: list[float] = []
+    probe = asyncio.create_task(_probe_lag(stop, lag))
+    t0 = time.perf_counter()
+    results = await asyncio.gather(*(stream(f"run-{i}", args) for i in range(args.streams)))
+    wall = time.perf_counter() - t0
+    stop.set()
+    await probe
+
+    lag_ms = sorted(x * 1e3 for x in lag)
+    p99 = lag_ms[min(len(lag_ms) - 1, int(len(lag_ms) * 0.99))]
+    delivered = sum(r["delivered"] for r in results)
+    emitted = sum(r["emitted"] for r in results)
+    print(
+        f"{mode:>8} {wall:>8.2f} {statistics.median(lag_ms):>8.1f} {p99:>8.1f} "
+        f"{lag_ms[-1]:>8.1f} {delivered:>10} {emitted - delivered:>8} "
+        f"{sum(r['lifecycle_lost'] for r in results):>9} "
+        f"{sum(r['terminal'] for r in results):>5}/{args.streams}"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--streams", type=int, default=500)
+    parser.add_argument("--stages", type=int, default=6)
+    parser.add_argument("--progress", type=int, default=200, help="progress events per stage")
+    parser.add_argument("--client-ms", type=float, default=2.0, help="client time per event")
+    parser.add_argument("--modes", default="queue,channel")
+    args = parser.parse_args()
+
+    from ailine_runtime.shared.observability import configure_logging
+
+    configure_logging(json_output=False, level="WARNING")
+    print(
+        f"{args.streams} streams, {args.stages} stages x {args.progress} progress events, "
+        f"client {args.client_ms} ms/event\n"
+    )
+    print(
+        f"{'mode':>8} {'wall s':>8} {'lag p50':>8} {'lag p99':>8} {'lag max':>8} "
+        f"{'delivered':>10} {'shed':>8} {'lc lost':>9} {'terminal':>9}"
+    )
+    for mode in args.modes.split(","):
+        asyncio.run(_run(mode, args))
+
+
+if __name__ == "__main__":
+    main()
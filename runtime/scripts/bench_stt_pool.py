@@ -0,0 +1,149 @@
+"""Benchmark local STT: worker-pool replicas and segment streaming.
+
+Standalone script that submits concurrent uploads to ``WhisperSTT`` and
+reports upload latency, throughput and time to first segment for each
+replica count.
+
+Backends:
+
+- ``fake`` -- replicas are a stand-in model whose segments each block a
+  worker thread for ``--segment-ms`` (like CTranslate2, the sleep
+  releases the GIL), so the pool's scheduling is measured without model
+  weights;
+- ``tiny`` -- real faster-whisper ``tiny`` replicas decoding a generated
+  WAV (or ``--audio``).  Needs ``faster-whisper`` and the model download.
+
+Usage:
+    python runtime/scripts/bench_stt_pool.py [--backend fake|tiny] [--uploads 8]
+        [--replicas 1,2,4] [--segments 6] [--segment-ms 50] [--audio FILE]
+
+Examples:
+    # Default run (fake model)
+    python runtime/scripts/bench_stt_pool.py
+
+    # Real tiny model on a lesson recording
+    python runtime/scripts/bench_stt_pool.py --backend tiny --audio aula.wav --replicas 1,2
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import io
+import math
+import statistics
+import struct
+import time
+import wave
+from pathlib import Path
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+class _Segment:
+    def __init__(self, i: int) -> None:
+        self.start, self.end, self.text = float(i), float(i + 1), f" segmento {i}"
+
+
+class FakeWhisperModel:
+    """Model replica that blocks *segment_s* per decoded segment."""
+
+    def __init__(self, segments: int, segment_s: float) -> None:
+        self.segments = segments
+        self.segment_s = segment_s
+
+    def transcribe(self, source: Any, language: str = "pt") -> tuple[Any, None]:
+        def generate() -> Any:
+            for i in range(self.segments):
+                time.sleep(self.segment_s)
+                yield _Segment(i)
+
+        return generate(), None
+
+
+def _tone_wav(seconds: float = 8.0, rate: int = 16_000) -> bytes:
+    """Mono 16-bit WAV with a modulated tone (stand-in for speech)."""
+    frames = b"".join(
+        struct.pack("<h", int(8000 * math.sin(2 * math.pi * 220 * t / rate) * math.sin(t / rate)))
+        for t in range(int(seconds * rate))
+    )
+    buf = io.BytesIO()
+    with wave.open(buf, "wb") as w:
+        w.setnchannels(1)
+        w.setsampwidth(2)
+        w.setframerate(rate)
+        w.writeframes(frames)
+    return buf.getvalue()
+
+
+def _build_stt(replicas: int, args: argparse.Namespace) -> Any:
+    from ailine_runtime.adapters.media.whisper_stt import WhisperSTT
+
+    if args.backend == "tiny":
+        return WhisperSTT(model_size="tiny", replicas=replicas, cpu_threads=args.cpu_threads)
+    stt = WhisperSTT(replicas=replicas)
+    stt._load_model = lambda: FakeWhisperModel(args.segments, args.segment_ms / 1000.0)  # type: ignore[method-assign]
+    return stt
+
+
+async def _run(replicas: int, audio: bytes, args: argparse.Namespace) -> None:
+    stt = _build_stt(replicas, args)
+    stt._ensure_model()  # exclude first load from the timings
+    latencies: list[float] = []
+    first_segment: list[float] = []
+
+    async def one() -> None:
+        t0 = time.perf_counter()
+        first: float | None = None
+        async for _segment in stt.transcribe_stream(audio, language="pt"):
+            if first is None:
+                first = time.perf_counter() - t0
+        latencies.append(time.perf_counter() - t0)
+        first_segment.append(first if first is not None else latencies[-1])
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(args.uploads)))
+    wall = time.perf_counter() - t0
+    await stt.dispose()
+
+    print(
+        f"{replicas:>8} {wall:>8.2f} {args.uploads / wall:>10.2f} "
+        f"{statistics.median(latencies) * 1e3:>9.0f} {max(latencies) * 1e3:>9.0f} "
+        f"{statistics.median(first_segment) * 1e3:>11.0f}"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--backend", choices=("fake", "tiny"), default="fake")
+    parser.add_argument("--uploads", type=int, default=8)
+    parser.add_argument("--replicas", default="1,2,4")
+    parser.add_argument("--segments", type=int, default=6, help="fake backend only")
+    parser.add_argument("--segment-ms", type=float, default=50.0, help="fake backend only")
+    parser.add_argument("--cpu-threads", type=int, default=0, help="tiny backend only")
+    parser.add_argument("--audio", type=Path, default=None)
+    args = parser.parse_args()
+
+    from ailine_runtime.shared.observability import configure_logging
+
+    configure_logging(json_output=False, level="WARNING")
+    audio = args.audio.read_bytes() if args.audio else _tone_wav()
+    print(f"backend {args.backend}, {args.uploads} concurrent uploads, {len(audio)} bytes each\n")
+    print(
+        f"{'replicas':>8} {'wall s':>8} {'uploads/s':>10} {'p50 ms':>9} {'max ms':>9} "
+        f"{'first seg ms':>11}"
+    )
+    for replicas in (int(r) for r in args.replicas.split(",")):
+        asyncio.run(_run(replicas, audio, args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Benchmark per-segment TTS latency: client-per-call vs. shared HTTP pool.
+
+Standalone script that synthesizes an audio-script's worth of segments
+through ``ElevenLabsTTS`` against a local stub server and reports the
+per-segment latency distribution.
+
+Modes compared:
+
+- ``per-call``  -- legacy behavior, a new ``httpx.AsyncClient`` (and so a
+  new connection) for every segment;
+- ``pooled``    -- the adapter on the container's ``HttpClientPool``,
+  reusing keep-alive connections.
+
+The stub speaks plain HTTP/1.1 on localhost, so there is no real TLS.
+``--handshake-ms`` makes it stall every *new* connection before serving
+it, modelling the TCP + TLS setup a real upstream costs (~2-3 RTTs).
+``--service-ms`` is the per-request synthesis time.
+
+Usage:
+    python runtime/scripts/bench_tts_http_pool.py [--segments 40] [--concurrency 4]
+        [--handshake-ms 60] [--service-ms 20]
+
+Examples:
+    # Default run
+    python runtime/scripts/bench_tts_http_pool.py
+
+    # Sequential export, far-away upstream
+    python runtime/scripts/bench_tts_http_pool.py --concurrency 1 --handshake-ms 150
+"""
+
+from __future__ import annotations
+
+import argparse
+import asyncio
+import statistics
+import time
+from typing import Any
+
+# ---------------------------------------------------------------------------
+# Configuration
+# ---------------------------------------------------------------------------
+
+AUDIO = b"\xff\xfb" + b"\x00" * 16_000  # ~16 KB of "mp3" per segment
+
+# ---------------------------------------------------------------------------
+# Stub server
+# ---------------------------------------------------------------------------
+
+
+class StubServer:
+    """HTTP/1.1 keep-alive stub with a per-connection setup delay."""
+
+    def __init__(self, handshake_s: float, service_s: float) -> None:
+        self.handshake_s = handshake_s
+        self.service_s = service_s
+        self.connections = 0
+        self._server: asyncio.Server | None = None
+
+    async def start(self) -> str:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}/v1"
+
+    async def stop(self) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        await asyncio.sleep(self.handshake_s)
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                await asyncio.sleep(self.service_s)
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: audio/mpeg\r\n"
+                    + f"Content-Length: {len(AUDIO)}\r\n\r\n".encode()
+                    + AUDIO
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+# ---------------------------------------------------------------------------
+# Workload
+# ---------------------------------------------------------------------------
+
+
+class _PerCallTTS:
+    """The pre-pool adapter: one ``AsyncClient`` per segment."""
+
+    def __init__(self, base_url: str) -> None:
+        self._url = f"{base_url}/text-to-speech/voice"
+
+    async def synthesize(self, text: str) -> bytes:
+        import httpx
+
+        async with httpx.AsyncClient(timeout=30.0) as client:
+            response = await client.post(self._url, json={"text": text})
+            response.raise_for_status()
+            return response.content
+
+
+async def _run_mode(mode: str, args: argparse.Namespace) -> None:
+    from ailine_runtime.adapters.media.elevenlabs_tts import ElevenLabsTTS
+    from ailine_runtime.shared.http_client import HttpClientPool
+
+    server = StubServer(args.handshake_ms / 1000.0, args.service_ms / 1000.0)
+    base_url = await server.start()
+    pool: HttpClientPool | None = None
+    tts: Any
+    if mode == "pooled":
+        pool = HttpClientPool(max_connections_per_host=args.concurrency, http2=False)
+        tts = ElevenLabsTTS(api_key="bench", voice_id="voice", http=pool, base_url=base_url)
+    else:
+        tts = _PerCallTTS(base_url)
+
+    segments = [f"Segmento {i} do roteiro de áudio." for i in range(args.segments)]
+    latencies: list[float] = []
+    sem = asyncio.Semaphore(args.concurrency)
+
+    async def one(text: str) -> None:
+        async with sem:
+            t0 = time.perf_counter()
+            await tts.synthesize(text)
+            latencies.append(time.perf_counter() - t0)
+
+    t0 = time.perf_counter()
+    await asyncio.gather(*(one(s) for s in segments))
+    wall = time.perf_counter() - t0
+    if pool is not None:
+        await pool.dispose()
+    await server.stop()
+
+    latencies.sort()
+    p95 = latencies[int(0.95 * (len(latencies) - 1))]
+    print(
+        f"{mode:<10} {wall:>8.2f} {statistics.median(latencies) * 1e3:>9.1f} "
+        f"{p95 * 1e3:>9.1f} {statistics.mean(latencies) * 1e3:>9.1f} {server.connections:>7}"
+    )
+
+
+# ---------------------------------------------------------------------------
+# Main
+# ---------------------------------------------------------------------------
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--segments", type=int, default=40)
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--handshake-ms", type=float, default=60.0)
+    parser.add_argument("--service-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    from ailine_runtime.shared.observability import configure_logging
+
+    configure_logging(json_output=False, level="WARNING")
+    print(
+        f"{args.segments} segments, concurrency {args.concurrency}, "
+        f"handshake {args.handshake_ms:.0f} ms, service {args.service_ms:.0f} ms\n"
+    )
+    print(f"{'mode':<10} {'wall s':>8} {'p50 ms':>9} {'p95 ms':>9} {'mean ms':>9} {'conns':>7}")
+    for mode in ("per-call", "pooled"):
+        asyncio.run(_run_mode(mode, args))
+
+
+if __name__ == "__main__":
+    main()
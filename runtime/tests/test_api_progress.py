@@ -401,18 +401,18 @@ async def test_get_student_all_teachers(client: AsyncClient) -> None:
 
     store = get_progress_store()
     # Record under two different teachers
-    store.record_progress(
+    await store.record_progress(
         teacher_id="t1", student_id="shared-student",
         student_name="Shared", standard_code="MA01",
         standard_description="Math", mastery_level=MasteryLevel.DEVELOPING,
     )
-    store.record_progress(
+    await store.record_progress(
         teacher_id="t2", student_id="shared-student",
         student_name="Shared", standard_code="SCI01",
         standard_description="Science", mastery_level=MasteryLevel.MASTERED,
     )
 
-    all_records = store.get_student_all_teachers("shared-student")
+    all_records = await store.get_student_all_teachers("shared-student")
     assert len(all_records) == 2
     codes = {r.standard_code for r in all_records}
     assert codes == {"MA01", "SCI01"}
@@ -0,0 +1,198 @@
+"""Tests for the content-addressed embedding cache.
+
+Covers:
+- CachedEmbeddings protocol conformance and key derivation.
+- LRU tier hits, eviction, and in-batch de-duplication.
+- Shared backend tier (dict-backed stand-in), including failure tolerance.
+- float32 byte encoding and hit/miss metrics.
+- Container wrapping via ``AILINE_EMBEDDING_CACHE``.
+"""
+
+from __future__ import annotations
+
+import sys
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pytest
+
+from ailine_runtime.adapters.embeddings.cached_embeddings import (
+    CachedEmbeddings,
+    EmbeddingCacheBackend,
+    decode_embedding,
+    encode_embedding,
+)
+from ailine_runtime.adapters.embeddings.fake_embeddings import FakeEmbeddings
+from ailine_runtime.domain.ports.embeddings import Embeddings
+from ailine_runtime.shared.config import EmbeddingConfig, Settings
+from ailine_runtime.shared.container_adapters import build_embeddings
+from ailine_runtime.shared.metrics import embedding_cache_requests_total, render_metrics
+
+# -- Helpers ------------------------------------------------------------------
+
+
+class CountingEmbeddings(FakeEmbeddings):
+    """FakeEmbeddings that records every text it is asked to embed."""
+
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.embedded: list[str] = []
+
+    async def embed_batch(self, texts: list[str]) -> list[list[float]]:
+        self.embedded.extend(texts)
+        return await super().embed_batch(texts)
+
+
+class DictBackend:
+    """In-memory stand-in for the Redis/Postgres tier."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, bytes] = {}
+        self.disposed = False
+
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        return [self.data.get(k) for k in keys]
+
+    async def set_many(self, items: dict[str, bytes]) -> None:
+        self.data.update(items)
+
+    async def dispose(self) -> None:
+        self.disposed = True
+
+
+class BrokenBackend(DictBackend):
+    async def get_many(self, keys: list[str]) -> list[bytes | None]:
+        raise ConnectionError("backend down")
+
+    async def set_many(self, items: dict[str, bytes]) -> None:
+        raise ConnectionError("backend down")
+
+
+@pytest.fixture
+def inner() -> CountingEmbeddings:
+    return CountingEmbeddings(dimensions=32)
+
+
+# -- Tests ----------------------------------------------------------------------
+
+
+class TestCachedEmbeddingsBasics:
+    def test_conforms_to_protocol(self, inner: CountingEmbeddings):
+        cached = CachedEmbeddings(inner)
+        assert isinstance(cached, Embeddings)
+        assert cached.dimensions == 32
+        assert cached.model_name == inner.model_name
+        assert isinstance(DictBackend(), EmbeddingCacheBackend)
+
+    def test_cache_key_includes_model_and_dimensions(self, inner: CountingEmbeddings):
+        key = CachedEmbeddings(inner).cache_key("hello")
+        other = CachedEmbeddings(FakeEmbeddings(dimensions=64)).cache_key("hello")
+        assert key.startswith(f"{inner.model_name}:32:")
+        assert key != other
+
+    def test_float32_roundtrip(self):
+        vec = [0.1, -0.5, 0.25]
+        data = encode_embedding(vec)
+        assert len(data) == 12
+        np.testing.assert_allclose(decode_embedding(data), vec, rtol=1e-6)
+
+
+class TestMemoryTier:
+    async def test_repeat_text_hits_cache(self, inner: CountingEmbeddings):
+        cached = CachedEmbeddings(inner)
+        first = await cached.embed_text("photosynthesis")
+        second = await cached.embed_text("photosynthesis")
+        assert inner.embedded == ["photosynthesis"]
+        np.testing.assert_allclose(first, second)
+        np.testing.assert_allclose(first, await inner.embed_text("photosynthesis"), rtol=1e-6)
+
+    async def test_batch_embeds_only_misses_in_order(self, inner: CountingEmbeddings):
+        cached = CachedEmbeddings(inner)
+        await cached.embed_batch(["a", "b"])
+        inner.embedded.clear()
+        result = await cached.embed_batch(["b", "c", "a", "c"])
+        assert inner.embedded == ["c"]
+        expected = await inner.embed_batch(["b", "c", "a", "c"])
+        for got, want in zip(result, expected, strict=True):
+            np.testing.assert_allclose(got, want, rtol=1e-6)
+
+    async def test_lru_eviction(self, inner: CountingEmbeddings):
+        cached = CachedEmbeddings(inner, max_entries=2)
+        await cached.embed_batch(["a", "b"])
+        await cached.embed_text("a")  # refresh "a"
+        await cached.embed_text("c")  # evicts "b"
+        inner.embedded.clear()
+        await cached.embed_batch(["a", "c", "b"])
+        assert inner.embedded == ["b"]
+
+    async def test_empty_batch(self, inner: CountingEmbeddings):
+        assert await CachedEmbeddings(inner).embed_batch([]) == []
+        assert inner.embedded == []
+
+
+class TestBackendTier:
+    async def test_backend_shared_between_instances(self, inner: CountingEmbeddings):
+        backend = DictBackend()
+        await CachedEmbeddings(inner, backend=backend).embed_batch(["x", "y"])
+        assert len(backend.data) == 2
+        assert all(len(v) == 32 * 4 for v in backend.data.values())
+
+        inner.embedded.clear()
+        fresh = CachedEmbeddings(inner, backend=backend)
+        await fresh.embed_batch(["x", "y", "z"])
+        assert inner.embedded == ["z"]
+
+    async def test_backend_failure_falls_back_to_inner(self, inner: CountingEmbeddings):
+        cached = CachedEmbeddings(inner, backend=BrokenBackend())
+        result = await cached.embed_batch(["x"])
+        assert len(result) == 1
+        assert inner.embedded == ["x"]
+
+    async def test_dispose_releases_backend(self, inner: CountingEmbeddings):
+        backend = DictBackend()
+        await CachedEmbeddings(inner, backend=backend).dispose()
+        assert backend.disposed
+
+
+class TestCacheMetrics:
+    async def test_hit_miss_counters(self, inner: CountingEmbeddings):
+        hits0 = embedding_cache_requests_total.get(tier="memory", result="hit")
+        misses0 = embedding_cache_requests_total.get(tier="memory", result="miss")
+        cached = CachedEmbeddings(inner)
+        await cached.embed_batch(["m1", "m2"])
+        await cached.embed_batch(["m1"])
+        assert embedding_cache_requests_total.get(tier="memory", result="miss") == misses0 + 2
+        assert embedding_cache_requests_total.get(tier="memory", result="hit") == hits0 + 1
+        assert "ailine_embedding_cache_requests_total" in render_metrics()
+
+
+class TestContainerWrapping:
+    def _settings(self, cache: str) -> Settings:
+        return Settings(
+            embedding=EmbeddingConfig(provider="openai", api_key="sk-test", cache=cache),
+        )
+
+    def test_cache_disabled_by_default(self):
+        with patch.dict(sys.modules, {"openai": MagicMock()}):
+            emb = build_embeddings(self._settings("none"))
+        assert type(emb).__name__ == "OpenAIEmbeddings"
+
+    def test_memory_cache_wraps_adapter(self):
+        cleanup: list = []
+        with patch.dict(sys.modules, {"openai": MagicMock()}):
+            emb = build_embeddings(self._settings("memory"), cleanup)
+        assert isinstance(emb, CachedEmbeddings)
+        assert type(emb.inner).__name__ == "OpenAIEmbeddings"
+        assert cleanup == []
+
+    def test_redis_cache_registers_cleanup(self):
+        mock_redis = MagicMock()
+        cleanup: list = []
+        with patch.dict(
+            sys.modules,
+            {"openai": MagicMock(), "redis": mock_redis, "redis.asyncio": mock_redis},
+        ):
+            emb = build_embeddings(self._settings("redis"), cleanup)
+        assert isinstance(emb, CachedEmbeddings)
+        assert cleanup == [emb]
+        mock_redis.Redis.from_url.assert_called_once()
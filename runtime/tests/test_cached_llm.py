@@ -0,0 +1,225 @@
+"""Tests for the LLM response cache.
+
+Covers:
+- CachedChatLLM protocol conformance and key derivation.
+- Deterministic-request detection and the per-call ``use_cache`` override.
+- Streaming replay from cache.
+- Memory and SQLite backends, failure tolerance and hit/miss metrics.
+- Container wrapping via ``AILINE_LLM_RESPONSE_CACHE``.
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator
+from typing import Any
+
+import pytest
+
+from ailine_runtime.adapters.llm.cached_llm import (
+    CachedChatLLM,
+    LLMCacheBackend,
+    MemoryLLMCache,
+    SQLiteLLMCache,
+)
+from ailine_runtime.adapters.llm.fake_llm import FakeChatLLM
+from ailine_runtime.domain.ports.llm import ChatLLM
+from ailine_runtime.shared.config import LLMConfig, Settings
+from ailine_runtime.shared.container_adapters import build_llm
+from ailine_runtime.shared.metrics import llm_cache_requests_total, render_metrics
+
+# -- Helpers ------------------------------------------------------------------
+
+
+class CountingLLM(FakeChatLLM):
+    """FakeChatLLM that counts provider calls and streams in two chunks."""
+
+    def __init__(self) -> None:
+        super().__init__(responses=["Olá, tudo bem?"])
+        self.calls = 0
+
+    async def generate(self, messages: list[dict[str, Any]], **kwargs: Any) -> str:
+        self.calls += 1
+        return await super().generate(messages, **kwargs)
+
+    async def stream(self, messages: list[dict[str, Any]], **kwargs: Any) -> AsyncIterator[str]:
+        self.calls += 1
+        yield "Olá, "
+        yield "tudo bem?"
+
+
+class FailingBackend:
+    name = "failing"
+
+    async def get(self, key: str) -> str | None:
+        raise ConnectionError("down")
+
+    async def set(self, key: str, value: str) -> None:
+        raise ConnectionError("down")
+
+    async def clear(self) -> None:
+        return None
+
+    async def dispose(self) -> None:
+        return None
+
+
+MESSAGES = [
+    {"role": "system", "content": "Traduza glossas."},
+    {"role": "user", "content": "OI TUDO-BEM"},
+]
+
+
+@pytest.fixture
+def inner() -> CountingLLM:
+    return CountingLLM()
+
+
+# -- Tests ----------------------------------------------------------------------
+
+
+class TestCachedChatLLMBasics:
+    def test_conforms_to_protocol(self, inner: CountingLLM):
+        cached = CachedChatLLM(inner)
+        assert isinstance(cached, ChatLLM)
+        assert isinstance(cached.backend, LLMCacheBackend)
+        assert cached.model_name == inner.model_name
+        assert cached.capabilities["response_cache"] == "memory"
+
+    def test_key_covers_request_parameters(self, inner: CountingLLM):
+        cached = CachedChatLLM(inner)
+        base = cached.cache_key(MESSAGES, temperature=0.3, max_tokens=256)
+        assert base == cached.cache_key(list(MESSAGES), temperature=0.3, max_tokens=256)
+        assert base != cached.cache_key(MESSAGES, temperature=0.3, max_tokens=512)
+        assert base != cached.cache_key(MESSAGES, temperature=0.0, max_tokens=256)
+        assert base != cached.cache_key(
+            MESSAGES, temperature=0.3, max_tokens=256, tools=[{"name": "rag_search"}]
+        )
+
+
+class TestDeterministicDetection:
+    async def test_low_temperature_is_cached(self, inner: CountingLLM):
+        cached = CachedChatLLM(inner)
+        first = await cached.generate(MESSAGES, temperature=0.3)
+        second = await cached.generate(MESSAGES, temperature=0.3)
+        assert first == second
+        assert inner.calls == 1
+
+    async def test_high_temperature_bypasses(self, inner: CountingLLM):
+        cached = CachedChatLLM(inner)
+        await cached.generate(MESSAGES, temperature=0.9)
+        await cached.generate(MESSAGES, temperature=0.9)
+        assert inner.calls == 2
+
+    async def test_use_cache_overrides(self, inner: CountingLLM):
+        cached = CachedChatLLM(inner)
+        await cached.generate(MESSAGES, temperature=0.0, use_cache=False)
+        await cached.generate(MESSAGES, temperature=0.0, use_cache=False)
+        assert inner.calls == 2
+
+        await cached.generate(MESSAGES, temperature=1.0, use_cache=True)
+        await cached.generate(MESSAGES, temperature=1.0, use_cache=True)
+        assert inner.calls == 3
+
+
+class TestStreamingReplay:
+    async def test_stream_cached_after_completion(self, inner: CountingLLM):
+        cached = CachedChatLLM(inner)
+        chunks = [c async for c in cached.stream(MESSAGES, temperature=0.2)]
+        assert chunks == ["Olá, ", "tudo bem?"]
+
+        replay = [c async for c in cached.stream(MESSAGES, temperature=0.2)]
+        assert "".join(replay) == "Olá, tudo bem?"
+        assert inner.calls == 1
+        # The same entry also serves generate()
+        assert await cached.generate(MESSAGES, temperature=0.2) == "Olá, tudo bem?"
+        assert inner.calls == 1
+
+    async def test_abandoned_stream_not_cached(self, inner: CountingLLM):
+        cached = CachedChatLLM(inner)
+        stream = cached.stream(MESSAGES, temperature=0.2)
+        assert await anext(stream) == "Olá, "
+        await stream.aclose()
+        assert len(cached.backend) == 0  # type: ignore[arg-type]
+
+
+class TestBackends:
+    async def test_memory_lru_eviction(self):
+        backend = MemoryLLMCache(max_entries=2)
+        await backend.set("a", "1")
+        await backend.set("b", "2")
+        await backend.get("a")
+        await backend.set("c", "3")
+        assert await backend.get("b") is None
+        assert await backend.get("a") == "1"
+
+    async def test_sqlite_persists_across_instances(self, inner: CountingLLM, tmp_path):
+        path = tmp_path / "cache" / "llm.sqlite3"
+        first = CachedChatLLM(inner, backend=SQLiteLLMCache(path))
+        await first.generate(MESSAGES, temperature=0.0)
+        await first.dispose()
+
+        second = CachedChatLLM(inner, backend=SQLiteLLMCache(path))
+        assert await second.generate(MESSAGES, temperature=0.0) == "Olá, tudo bem?"
+        assert inner.calls == 1
+        await second.clear()
+        assert await second.backend.get(second.cache_key(MESSAGES, temperature=0.0, max_tokens=4096)) is None
+        await second.dispose()
+
+    async def test_sqlite_ttl(self, tmp_path):
+        backend = SQLiteLLMCache(tmp_path / "llm.sqlite3", ttl_seconds=-1)
+        await backend.set("k", "v")
+        assert await backend.get("k") is None
+        await backend.dispose()
+
+    async def test_backend_failure_falls_back_to_inner(self, inner: CountingLLM):
+        cached = CachedChatLLM(inner, backend=FailingBackend())
+        assert await cached.generate(MESSAGES, temperature=0.0) == "Olá, tudo bem?"
+        assert inner.calls == 1
+
+
+class TestCacheMetrics:
+    async def test_hit_miss_counters(self, inner: CountingLLM):
+        cached = CachedChatLLM(inner)
+        hits0 = llm_cache_requests_total.get(backend="memory", result="hit")
+        misses0 = llm_cache_requests_total.get(backend="memory", result="miss")
+        await cached.generate(MESSAGES, temperature=0.0)
+        await cached.generate(MESSAGES, temperature=0.0)
+        assert llm_cache_requests_total.get(backend="memory", result="hit") == hits0 + 1
+        assert llm_cache_requests_total.get(backend="memory", result="miss") == misses0 + 1
+        assert "ailine_llm_cache_requests_total" in render_metrics()
+
+
+class TestContainerWrapping:
+    def test_cache_disabled_by_default(self):
+        llm = build_llm(Settings(llm=LLMConfig(provider="fake")))
+        assert isinstance(llm, FakeChatLLM)
+
+    def test_memory_cache_wraps_adapter(self):
+        cleanup: list[Any] = []
+        settings = Settings(llm=LLMConfig(provider="fake", response_cache="memory"))
+        llm = build_llm(settings, cleanup)
+        assert isinstance(llm, CachedChatLLM)
+        assert isinstance(llm.inner, FakeChatLLM)
+        assert cleanup == []
+
+    async def test_sqlite_cache_registers_cleanup(self, tmp_path):
+        cleanup: list[Any] = []
+        settings = Settings(
+            llm=LLMConfig(provider="fake", response_cache="sqlite"),
+            local_store=str(tmp_path),
+        )
+        llm = build_llm(settings, cleanup)
+        assert isinstance(llm, CachedChatLLM)
+        assert cleanup == [llm.backend]
+        await llm.generate(MESSAGES, temperature=0.0)
+        assert (tmp_path / "llm_cache.sqlite3").exists()
+        await llm.dispose()
+
+    async def test_gloss_translator_reuses_shared_cache(self):
+        from ailine_runtime.accessibility.gloss_translator import GlossToTextTranslator
+
+        inner = CountingLLM()
+        shared = CachedChatLLM(inner)
+        await GlossToTextTranslator(llm=shared).translate(["OI"])
+        await GlossToTextTranslator(llm=shared).translate(["OI"])
+        assert inner.calls == 1
@@ -5,6 +5,7 @@ Mocks chromadb to test CRUD operations without the real dependency.
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -178,6 +179,66 @@ class TestChromaVectorStoreSearch:
             assert results[0].metadata == {}
 
 
+class TestChromaVectorStoreSearchMany:
+    @pytest.mark.asyncio
+    async def test_search_many_single_query_call(self, mock_chromadb):
+        mock_module, _, mock_collection = mock_chromadb
+        mock_collection.query.return_value = {
+            "ids": [["id1"], ["id2", "id3"]],
+            "distances": [[0.1], [0.2, 0.4]],
+            "documents": [["one"], ["two", "three"]],
+            "metadatas": [[{}], [{}, {}]],
+        }
+        with patch.dict("sys.modules", {"chromadb": mock_module}):
+            from ailine_runtime.adapters.vectorstores.chroma_store import (
+                ChromaVectorStore,
+            )
+
+            store = ChromaVectorStore()
+            results = await store.search_many(
+                query_embeddings=[[0.1], [0.2]], k=2, tenant_id="t1"
+            )
+            mock_collection.query.assert_called_once()
+            call_kwargs = mock_collection.query.call_args.kwargs
+            assert call_kwargs["query_embeddings"] == [[0.1], [0.2]]
+            assert call_kwargs["where"] == {"_tenant_id": "t1"}
+            assert [r.id for r in results[0]] == ["id1"]
+            assert [r.id for r in results[1]] == ["id2", "id3"]
+            assert results[1][1].score == pytest.approx(0.6)
+
+    @pytest.mark.asyncio
+    async def test_search_many_empty_noop(self, mock_chromadb):
+        mock_module, _, mock_collection = mock_chromadb
+        with patch.dict("sys.modules", {"chromadb": mock_module}):
+            from ailine_runtime.adapters.vectorstores.chroma_store import (
+                ChromaVectorStore,
+            )
+
+            store = ChromaVectorStore()
+            assert await store.search_many(query_embeddings=[]) == []
+            mock_collection.query.assert_not_called()
+
+
+class TestChromaVectorStoreChunkHashes:
+    @pytest.mark.asyncio
+    async def test_chunk_hashes_scoped_to_material_and_tenant(self, mock_chromadb):
+        mock_module, _, mock_collection = mock_chromadb
+        mock_collection.get.return_value = {
+            "ids": ["m__chunk_0000", "m__chunk_0001"],
+            "metadatas": [{"chunk_hash": "h0"}, {}],
+        }
+        with patch.dict("sys.modules", {"chromadb": mock_module}):
+            from ailine_runtime.adapters.vectorstores.chroma_store import (
+                ChromaVectorStore,
+            )
+
+            store = ChromaVectorStore()
+            hashes = await store.chunk_hashes(material_id="m", tenant_id="t1")
+            assert hashes == {"m__chunk_0000": "h0", "m__chunk_0001": None}
+            where = mock_collection.get.call_args.kwargs["where"]
+            assert where == {"$and": [{"material_id": "m"}, {"_tenant_id": "t1"}]}
+
+
 class TestChromaVectorStoreDelete:
     @pytest.mark.asyncio
     async def test_delete_empty_noop(self, mock_chromadb):
@@ -223,3 +284,119 @@ class TestSanitizeMetadata:
             result = _sanitize_metadata({"nested": {"a": [1, 2, 3]}})
             assert isinstance(result["nested"], str)
             assert "1" in result["nested"]
+
+
+def _rows_for(query_embeddings, **_kwargs):
+    """Fake ``collection.query``: one hit per query, id echoing its vector."""
+    return {
+        "ids": [[f"hit-{q[0]}"] for q in query_embeddings],
+        "distances": [[0.25] for _ in query_embeddings],
+        "documents": [["doc"] for _ in query_embeddings],
+        "metadatas": [[{}] for _ in query_embeddings],
+    }
+
+
+class TestChromaVectorStoreExecutor:
+    @pytest.mark.asyncio
+    async def test_calls_run_on_dedicated_pool(self, mock_chromadb):
+        import threading
+
+        _, mock_client, mock_collection = mock_chromadb
+        threads: list[str] = []
+        mock_collection.upsert.side_effect = lambda **kw: threads.append(
+            threading.current_thread().name
+        )
+        from ailine_runtime.adapters.vectorstores.chroma_store import ChromaVectorStore
+
+        store = ChromaVectorStore(client=mock_client, collection_name="c1")
+        await store.upsert(ids=["a"], embeddings=[[0.1]], texts=["t"], metadatas=[{}])
+        inline = ChromaVectorStore(client=mock_client, executor_workers=0)
+        await inline.upsert(ids=["b"], embeddings=[[0.1]], texts=["t"], metadatas=[{}])
+        assert threads[0].startswith("chroma-c1")
+        assert threads[1] == threading.current_thread().name
+        await store.dispose()
+
+    @pytest.mark.asyncio
+    async def test_writes_are_serialized(self, mock_chromadb):
+        import threading
+        import time
+
+        _, mock_client, mock_collection = mock_chromadb
+        active = 0
+        peak = 0
+        guard = threading.Lock()
+
+        def slow_write(**_kwargs):
+            nonlocal active, peak
+            with guard:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.01)
+            with guard:
+                active -= 1
+
+        mock_collection.upsert.side_effect = slow_write
+        mock_collection.delete.side_effect = slow_write
+        from ailine_runtime.adapters.vectorstores.chroma_store import ChromaVectorStore
+
+        store = ChromaVectorStore(client=mock_client, executor_workers=4)
+        await asyncio.gather(
+            *(
+                store.upsert(ids=[str(i)], embeddings=[[0.1]], texts=["t"], metadatas=[{}])
+                for i in range(4)
+            ),
+            store.delete(ids=["0"]),
+        )
+        assert mock_collection.upsert.call_count == 4
+        assert peak == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_searches_are_coalesced(self, mock_chromadb):
+        _, mock_client, mock_collection = mock_chromadb
+        mock_collection.query.side_effect = _rows_for
+        from ailine_runtime.adapters.vectorstores.chroma_store import ChromaVectorStore
+
+        store = ChromaVectorStore(client=mock_client, coalesce_window_ms=20)
+        results = await asyncio.gather(
+            store.search(query_embedding=[1.0], k=3, tenant_id="t1"),
+            store.search(query_embedding=[2.0], k=3, tenant_id="t1"),
+            store.search(query_embedding=[3.0], k=3, tenant_id="t1"),
+            store.search(query_embedding=[4.0], k=3, tenant_id="t2"),
+        )
+        assert [r[0].id for r in results] == ["hit-1.0", "hit-2.0", "hit-3.0", "hit-4.0"]
+        assert results[0][0].score == pytest.approx(0.75)
+        assert mock_collection.query.call_count == 2
+        batched = mock_collection.query.call_args_list[0].kwargs
+        assert batched["query_embeddings"] == [[1.0], [2.0], [3.0]]
+        assert batched["where"] == {"_tenant_id": "t1"}
+
+    @pytest.mark.asyncio
+    async def test_coalesced_failure_reaches_every_caller(self, mock_chromadb):
+        _, mock_client, mock_collection = mock_chromadb
+        mock_collection.query.side_effect = RuntimeError("hnsw")
+        from ailine_runtime.adapters.vectorstores.chroma_store import ChromaVectorStore
+
+        store = ChromaVectorStore(client=mock_client)
+        results = await asyncio.gather(
+            store.search(query_embedding=[1.0]),
+            store.search(query_embedding=[2.0]),
+            return_exceptions=True,
+        )
+        assert all(isinstance(r, RuntimeError) for r in results)
+        assert mock_collection.query.call_count == 1
+
+    def test_container_builds_chroma_store(self, mock_chromadb):
+        from ailine_runtime.adapters.vectorstores.chroma_store import ChromaVectorStore
+        from ailine_runtime.shared.config import Settings, VectorStoreConfig
+        from ailine_runtime.shared.container_adapters import build_vectorstore
+
+        mock_module, _, _ = mock_chromadb
+        settings = Settings(
+            vectorstore=VectorStoreConfig(provider="chroma", chroma_executor_workers=2)
+        )
+        cleanup: list = []
+        with patch.dict("sys.modules", {"chromadb": mock_module}):
+            store = build_vectorstore(settings, cleanup)
+        assert isinstance(store, ChromaVectorStore)
+        assert cleanup == [store]
+        mock_module.EphemeralClient.assert_called_once()
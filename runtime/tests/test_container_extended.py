@@ -284,6 +284,16 @@ class TestBuildMedia:
         # because it does lazy import inside _ensure_model.
         assert type(stt).__name__ == "WhisperSTT"
 
+    def test_whisper_pool_from_settings_registered_for_cleanup(self):
+        from ailine_runtime.shared.config import STTConfig
+
+        cleanup: list = []
+        settings = Settings(stt=STTConfig(replicas=3, model_size="tiny"))
+        stt, _, _, _ = _build_media(settings, None, cleanup)
+        assert stt in cleanup
+        assert stt.stats()["replicas"] == 3
+        assert stt._model_size == "tiny"
+
     def test_fake_tts_when_no_key(self):
         settings = Settings()
         _, tts, _, _ = _build_media(settings)
@@ -118,12 +118,15 @@ class TestMetadata:
             "tutor_sessions",
             "curriculum_objectives",
             "run_events",
+            "run_traces",
+            "node_traces",
             "accessibility_profiles",
             "organizations",
             "users",
             "student_profiles",
             "teacher_students",
             "parent_students",
+            "learner_progress",
             "skills",
             "skill_versions",
             "skill_ratings",
@@ -12,6 +12,7 @@ Mocks google.genai SDK since it is not installed.
 
 from __future__ import annotations
 
+import asyncio
 import importlib
 import math
 import sys
@@ -241,6 +242,34 @@ class TestEmbedBatch:
 
         gem_mod._BATCH_LIMIT = original_limit
 
+    async def test_embed_batch_concurrency_bounded(self, gemini_env):
+        """Sub-batches run concurrently, capped by max_concurrency, order kept."""
+        gem_mod, _, _ = gemini_env
+        original_limit = gem_mod._BATCH_LIMIT
+        gem_mod._BATCH_LIMIT = 1
+        try:
+            emb = gem_mod.GeminiEmbeddings(api_key="k", dimensions=2, max_concurrency=2)
+            state = {"in_flight": 0, "peak": 0}
+
+            async def embed_content(*, model, contents, config):
+                state["in_flight"] += 1
+                state["peak"] = max(state["peak"], state["in_flight"])
+                await asyncio.sleep(0.01)
+                state["in_flight"] -= 1
+                m = MagicMock()
+                m.values = [float(contents[0]), 1.0]
+                resp = MagicMock()
+                resp.embeddings = [m]
+                return resp
+
+            emb._client.aio.models.embed_content = embed_content
+            result = await emb.embed_batch(["1", "2", "3", "4", "5"])
+        finally:
+            gem_mod._BATCH_LIMIT = original_limit
+
+        assert state["peak"] == 2
+        assert [round(v[0] / v[1]) for v in result] == [1, 2, 3, 4, 5]
+
     async def test_embed_batch_empty(self, gemini_env):
         gem_mod, _, _ = gemini_env
         emb = gem_mod.GeminiEmbeddings(api_key="k", dimensions=2)
@@ -0,0 +1,188 @@
+"""Tests for the shared, container-managed HTTP client pool.
+
+Covers:
+- Connection reuse against a local keep-alive stub server.
+- Per-host concurrency cap, in-flight gauge and request metrics.
+- ElevenLabsTTS requests through the shared pool.
+- Container wiring: pool built from settings, closed by ``close()``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+
+import httpx
+import pytest
+
+from ailine_runtime.adapters.media.elevenlabs_tts import ElevenLabsTTS
+from ailine_runtime.shared.config import HttpClientConfig, LLMConfig, RedisConfig, Settings
+from ailine_runtime.shared.container import Container
+from ailine_runtime.shared.http_client import HttpClientPool
+from ailine_runtime.shared.metrics import (
+    http_client_inflight,
+    http_client_requests_total,
+    render_metrics,
+)
+
+# -- Helpers ------------------------------------------------------------------
+
+
+class StubServer:
+    """Minimal HTTP/1.1 keep-alive server counting TCP connections."""
+
+    def __init__(self) -> None:
+        self.connections = 0
+        self.requests = 0
+        self._server: asyncio.Server | None = None
+
+    async def __aenter__(self) -> StubServer:
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+        return self
+
+    async def __aexit__(self, *exc: object) -> None:
+        assert self._server is not None
+        self._server.close()
+        await self._server.wait_closed()
+
+    @property
+    def url(self) -> str:
+        assert self._server is not None
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def _handle(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        self.connections += 1
+        try:
+            while True:
+                head = await reader.readuntil(b"\r\n\r\n")
+                length = 0
+                for line in head.split(b"\r\n"):
+                    if line.lower().startswith(b"content-length:"):
+                        length = int(line.split(b":", 1)[1])
+                if length:
+                    await reader.readexactly(length)
+                self.requests += 1
+                body = b"audio-bytes"
+                writer.write(
+                    b"HTTP/1.1 200 OK\r\nContent-Type: audio/mpeg\r\n"
+                    + f"Content-Length: {len(body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (asyncio.IncompleteReadError, ConnectionResetError):
+            pass
+        finally:
+            writer.close()
+
+
+def _mock_pool(handler, **kwargs) -> HttpClientPool:
+    return HttpClientPool(transport=httpx.MockTransport(handler), http2=False, **kwargs)
+
+
+# -- Tests ----------------------------------------------------------------------
+
+
+class TestConnectionReuse:
+    async def test_keepalive_reuses_one_connection(self):
+        async with StubServer() as server:
+            pool = HttpClientPool(http2=False)
+            for _ in range(5):
+                response = await pool.client.post(f"{server.url}/tts", json={"text": "oi"})
+                assert response.content == b"audio-bytes"
+            assert server.requests == 5
+            assert server.connections == 1
+            assert pool.stats()["idle_connections"] == 1
+            await pool.dispose()
+            assert pool.client.is_closed
+
+    async def test_http2_falls_back_without_h2(self, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr("ailine_runtime.shared.http_client.http2_available", lambda: False)
+        pool = HttpClientPool(http2=True)
+        assert pool.http2 is False
+        await pool.dispose()
+
+
+class TestPerHostLimit:
+    async def test_concurrency_capped_per_host(self):
+        active = {"a.test": 0, "b.test": 0}
+        peak = {"a.test": 0, "b.test": 0}
+
+        async def handler(request: httpx.Request) -> httpx.Response:
+            host = request.url.host
+            active[host] += 1
+            peak[host] = max(peak[host], active[host])
+            await asyncio.sleep(0.01)
+            active[host] -= 1
+            return httpx.Response(200, content=b"ok")
+
+        pool = _mock_pool(handler, max_connections_per_host=2)
+        await asyncio.gather(
+            *(pool.client.get("http://a.test/x") for _ in range(6)),
+            *(pool.client.get("http://b.test/x") for _ in range(6)),
+        )
+        assert peak == {"a.test": 2, "b.test": 2}
+        await pool.dispose()
+
+    async def test_metrics_and_inflight(self):
+        before = http_client_requests_total.get(host="metrics.test", status="200")
+        pool = _mock_pool(lambda request: httpx.Response(200, content=b"ok"))
+        async with pool.client.stream("GET", "http://metrics.test/x") as response:
+            assert http_client_inflight.get(host="metrics.test") == 1
+            await response.aread()
+        assert http_client_inflight.get(host="metrics.test") == 0
+        assert http_client_requests_total.get(host="metrics.test", status="200") == before + 1
+        text = render_metrics()
+        assert "ailine_http_client_inflight_requests" in text
+        assert "# TYPE ailine_http_pool_connections gauge" in text
+        await pool.dispose()
+
+    async def test_transport_error_releases_slot(self):
+        def handler(request: httpx.Request) -> httpx.Response:
+            raise httpx.ConnectError("refused")
+
+        pool = _mock_pool(handler, max_connections_per_host=1)
+        for _ in range(3):
+            with pytest.raises(httpx.ConnectError):
+                await pool.client.get("http://down.test/x")
+        assert http_client_inflight.get(host="down.test") == 0
+        await pool.dispose()
+
+
+class TestElevenLabsSharedPool:
+    async def test_synthesize_uses_shared_pool(self):
+        seen: list[httpx.Request] = []
+
+        def handler(request: httpx.Request) -> httpx.Response:
+            seen.append(request)
+            return httpx.Response(200, content=b"mp3")
+
+        pool = _mock_pool(handler)
+        tts = ElevenLabsTTS(api_key="k", voice_id="v1", http=pool)
+        assert await tts.synthesize("Olá") == b"mp3"
+        assert await tts.synthesize("Tchau") == b"mp3"
+        assert [r.url.path for r in seen] == ["/v1/text-to-speech/v1"] * 2
+        assert seen[0].headers["xi-api-key"] == "k"
+        assert json.loads(seen[0].content)["text"] == "Olá"
+
+        # The adapter never closes a pool it does not own
+        await tts.aclose()
+        assert not pool.client.is_closed
+        await pool.dispose()
+
+
+class TestContainerWiring:
+    async def test_pool_built_from_settings_and_closed(self):
+        settings = Settings(
+            llm=LLMConfig(provider="fake", api_key=""),
+            redis=RedisConfig(url=""),
+            http=HttpClientConfig(max_connections=7, max_connections_per_host=3, http2=False),
+        )
+        container = Container.build(settings)
+        assert container.http is not None
+        stats = (await container.health_check())["http"]
+        assert stats["max_connections"] == 7
+        assert stats["max_connections_per_host"] == 3
+
+        await container.close()
+        assert container.http.client.is_closed
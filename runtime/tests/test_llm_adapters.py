@@ -296,6 +296,296 @@ class TestGeminiConvertMessages:
         assert result[0]["role"] == "model"
 
 
+# ===========================================================================
+# Prompt Caching Tests
+# ===========================================================================
+
+
+@pytest.fixture
+def obs_store():
+    from ailine_runtime.shared.observability_store import (
+        get_observability_store,
+        reset_observability_store,
+    )
+
+    reset_observability_store()
+    yield get_observability_store()
+    reset_observability_store()
+
+
+def _usage(**fields):
+    usage = MagicMock()
+    for name, value in fields.items():
+        setattr(usage, name, value)
+    return usage
+
+
+class TestPromptCacheHelpers:
+    def test_breakpoint_defaults_to_system_prefix(self):
+        from ailine_runtime.adapters.llm._prompt_cache import breakpoint_indices
+
+        messages = [
+            {"role": "system", "content": "a"},
+            {"role": "system", "content": "b"},
+            {"role": "user", "content": "q"},
+        ]
+        assert breakpoint_indices(messages) == [1]
+        assert breakpoint_indices([{"role": "user", "content": "q"}]) == []
+
+    def test_explicit_breakpoints_win(self):
+        from ailine_runtime.adapters.llm._prompt_cache import (
+            breakpoint_indices,
+            strip_cache_marks,
+        )
+        from ailine_runtime.domain.ports.llm import cache_breakpoint
+
+        messages = [
+            {"role": "system", "content": "a"},
+            cache_breakpoint({"role": "user", "content": "doc"}),
+            {"role": "user", "content": "q"},
+        ]
+        assert breakpoint_indices(messages) == [1]
+        assert all("cache" not in m for m in strip_cache_marks(messages))
+        assert "cache" in messages[1]
+
+
+class TestAnthropicPromptCaching:
+    @pytest.mark.asyncio
+    async def test_system_blocks_marked_and_usage_reported(self, obs_store):
+        mock_client = AsyncMock()
+        mock_content = MagicMock()
+        mock_content.text = "ok"
+        mock_response = MagicMock()
+        mock_response.content = [mock_content]
+        mock_response.usage = _usage(
+            input_tokens=20,
+            output_tokens=5,
+            cache_read_input_tokens=900,
+            cache_creation_input_tokens=0,
+        )
+        mock_client.messages.create = AsyncMock(return_value=mock_response)
+
+        with patch(
+            "ailine_runtime.adapters.llm.anthropic_llm.AsyncAnthropic",
+            return_value=mock_client,
+        ):
+            from ailine_runtime.adapters.llm.anthropic_llm import AnthropicChatLLM
+
+            llm = AnthropicChatLLM(api_key="sk-test")
+            await llm.generate(
+                [
+                    {"role": "system", "content": "persona"},
+                    {"role": "user", "content": "Hi"},
+                ]
+            )
+
+        kwargs = mock_client.messages.create.call_args.kwargs
+        assert kwargs["system"] == [
+            {"type": "text", "text": "persona", "cache_control": {"type": "ephemeral"}}
+        ]
+        assert kwargs["messages"] == [{"role": "user", "content": "Hi"}]
+        stats = obs_store.get_token_stats()
+        assert stats["input_tokens"] == 920
+        assert stats["cached_input_tokens"] == 900
+
+    @pytest.mark.asyncio
+    async def test_user_breakpoint_and_opt_out(self):
+        from ailine_runtime.domain.ports.llm import cache_breakpoint
+
+        mock_client = AsyncMock()
+        mock_client.messages.create = AsyncMock(return_value=MagicMock(content=[]))
+        messages = [cache_breakpoint({"role": "user", "content": "long doc"})]
+
+        with patch(
+            "ailine_runtime.adapters.llm.anthropic_llm.AsyncAnthropic",
+            return_value=mock_client,
+        ):
+            from ailine_runtime.adapters.llm.anthropic_llm import AnthropicChatLLM
+
+            await AnthropicChatLLM(api_key="sk-test").generate(messages)
+            sent = mock_client.messages.create.call_args.kwargs["messages"][0]
+            assert sent["content"][0]["cache_control"] == {"type": "ephemeral"}
+            assert "cache" not in sent
+
+            await AnthropicChatLLM(api_key="sk-test", prompt_caching=False).generate(messages)
+            sent = mock_client.messages.create.call_args.kwargs["messages"][0]
+            assert sent == {"role": "user", "content": "long doc"}
+
+
+class TestOpenAIPromptCaching:
+    @pytest.fixture
+    def mock_openai(self):
+        mock_module = MagicMock()
+        mock_client = AsyncMock()
+        mock_module.AsyncOpenAI.return_value = mock_client
+        return mock_module, mock_client
+
+    @pytest.mark.asyncio
+    async def test_system_hoisted_with_cache_key(self, mock_openai, obs_store):
+        mock_module, mock_client = mock_openai
+        mock_response = MagicMock()
+        mock_response.choices = [MagicMock()]
+        mock_response.choices[0].message.content = "ok"
+        details = MagicMock(cached_tokens=1024)
+        mock_response.usage = _usage(
+            prompt_tokens=1100, completion_tokens=10, prompt_tokens_details=details
+        )
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_response)
+
+        with patch.dict("sys.modules", {"openai": mock_module}):
+            from ailine_runtime.adapters.llm.openai_llm import OpenAIChatLLM
+
+            llm = OpenAIChatLLM(api_key="sk-test")
+            await llm.generate(
+                [
+                    {"role": "user", "content": "Hi"},
+                    {"role": "system", "content": "persona"},
+                ]
+            )
+            first = mock_client.chat.completions.create.call_args.kwargs
+            await llm.generate(
+                [
+                    {"role": "system", "content": "persona"},
+                    {"role": "user", "content": "Other question"},
+                ]
+            )
+            second = mock_client.chat.completions.create.call_args.kwargs
+
+        assert [m["role"] for m in first["messages"]] == ["system", "user"]
+        assert first["prompt_cache_key"] == second["prompt_cache_key"]
+        stats = obs_store.get_token_stats()
+        assert stats["cached_input_tokens"] == 2048
+        assert stats["input_tokens"] == 2200
+
+    @pytest.mark.asyncio
+    async def test_stream_reports_final_usage_chunk(self, mock_openai, obs_store):
+        mock_module, mock_client = mock_openai
+        chunk = MagicMock()
+        chunk.usage = None
+        chunk.choices = [MagicMock()]
+        chunk.choices[0].delta.content = "Hello"
+        final = MagicMock()
+        final.choices = []
+        final.usage = _usage(
+            prompt_tokens=50,
+            completion_tokens=1,
+            prompt_tokens_details=MagicMock(cached_tokens=0),
+        )
+
+        async def mock_stream():
+            for c in [chunk, final]:
+                yield c
+
+        mock_client.chat.completions.create = AsyncMock(return_value=mock_stream())
+
+        with patch.dict("sys.modules", {"openai": mock_module}):
+            from ailine_runtime.adapters.llm.openai_llm import OpenAIChatLLM
+
+            llm = OpenAIChatLLM(api_key="sk-test")
+            chunks = [c async for c in llm.stream([{"role": "user", "content": "Hi"}])]
+
+        assert chunks == ["Hello"]
+        kwargs = mock_client.chat.completions.create.call_args.kwargs
+        assert kwargs["stream_options"] == {"include_usage": True}
+        assert obs_store.get_token_stats()["input_tokens"] == 50
+
+
+class TestGeminiPromptCaching:
+    @pytest.fixture
+    def mock_genai(self):
+        mock_google = MagicMock()
+        mock_genai = MagicMock()
+        mock_google.genai = mock_genai
+        mock_client = MagicMock()
+        mock_genai.Client.return_value = mock_client
+        mock_genai.types = MagicMock()
+        mock_client.aio.models.generate_content = AsyncMock(
+            return_value=MagicMock(text="ok")
+        )
+        cache = MagicMock()
+        cache.name = "cachedContents/abc"
+        mock_client.aio.caches.create = AsyncMock(return_value=cache)
+        return mock_google, mock_genai, mock_client
+
+    @pytest.mark.asyncio
+    async def test_large_prefix_cached_once(self, mock_genai):
+        mock_google, mock_genai_mod, mock_client = mock_genai
+        system = {"role": "system", "content": "x" * 400}
+
+        with patch.dict(
+            "sys.modules", {"google": mock_google, "google.genai": mock_genai_mod}
+        ):
+            from ailine_runtime.adapters.llm.gemini_llm import GeminiChatLLM
+
+            llm = GeminiChatLLM(api_key="gk-test", cache_min_tokens=100)
+            await llm.generate([system, {"role": "user", "content": "q1"}])
+            await llm.generate([system, {"role": "user", "content": "q2"}])
+
+        mock_client.aio.caches.create.assert_awaited_once()
+        assert llm._cache_locks == {}
+        config_kwargs = mock_genai_mod.types.GenerateContentConfig.call_args.kwargs
+        assert config_kwargs["cached_content"] == "cachedContents/abc"
+        contents = mock_client.aio.models.generate_content.call_args.kwargs["contents"]
+        assert contents == [{"role": "user", "parts": [{"text": "q2"}]}]
+
+    @pytest.mark.asyncio
+    async def test_small_prefix_uses_system_instruction(self, mock_genai):
+        mock_google, mock_genai_mod, mock_client = mock_genai
+
+        with patch.dict(
+            "sys.modules", {"google": mock_google, "google.genai": mock_genai_mod}
+        ):
+            from ailine_runtime.adapters.llm.gemini_llm import GeminiChatLLM
+
+            llm = GeminiChatLLM(api_key="gk-test")
+            await llm.generate(
+                [{"role": "system", "content": "persona"}, {"role": "user", "content": "q"}]
+            )
+
+        mock_client.aio.caches.create.assert_not_awaited()
+        config_kwargs = mock_genai_mod.types.GenerateContentConfig.call_args.kwargs
+        assert config_kwargs["system_instruction"] == "persona"
+
+    @pytest.mark.asyncio
+    async def test_cache_create_failure_falls_back(self, mock_genai):
+        mock_google, mock_genai_mod, mock_client = mock_genai
+        mock_client.aio.caches.create = AsyncMock(side_effect=RuntimeError("too small"))
+        system = {"role": "system", "content": "x" * 400}
+
+        with patch.dict(
+            "sys.modules", {"google": mock_google, "google.genai": mock_genai_mod}
+        ):
+            from ailine_runtime.adapters.llm.gemini_llm import GeminiChatLLM
+
+            llm = GeminiChatLLM(api_key="gk-test", cache_min_tokens=100)
+            assert await llm.generate([system, {"role": "user", "content": "q"}]) == "ok"
+            await llm.generate([system, {"role": "user", "content": "q"}])
+
+        # Negative-cached: creation is not retried on every call
+        mock_client.aio.caches.create.assert_awaited_once()
+        config_kwargs = mock_genai_mod.types.GenerateContentConfig.call_args.kwargs
+        assert config_kwargs["system_instruction"] == "x" * 400
+
+    @pytest.mark.asyncio
+    async def test_unnamed_cache_is_not_used(self, mock_genai):
+        mock_google, mock_genai_mod, mock_client = mock_genai
+        mock_client.aio.caches.create.return_value.name = None
+        system = {"role": "system", "content": "x" * 400}
+
+        with patch.dict(
+            "sys.modules", {"google": mock_google, "google.genai": mock_genai_mod}
+        ):
+            from ailine_runtime.adapters.llm.gemini_llm import GeminiChatLLM
+
+            llm = GeminiChatLLM(api_key="gk-test", cache_min_tokens=100)
+            assert await llm.generate([system, {"role": "user", "content": "q"}]) == "ok"
+
+        assert llm._caches == {}
+        config_kwargs = mock_genai_mod.types.GenerateContentConfig.call_args.kwargs
+        assert "cached_content" not in config_kwargs
+        assert config_kwargs["system_instruction"] == "x" * 400
+
+
 # ===========================================================================
 # Web Search Tests
 # ===========================================================================
@@ -2,16 +2,20 @@
 
 from __future__ import annotations
 
+import shutil
 from pathlib import Path
 
 import pytest
 
+from ailine_runtime.materials import index as index_mod
+from ailine_runtime.materials.index import MaterialIndex
 from ailine_runtime.materials.store import (
     Material,
     _chunk_text,
     _slug,
     _tokens,
     add_material,
+    get_material_index,
     iter_materials,
     load_material,
     search_materials,
@@ -293,3 +297,95 @@ class TestSearchMaterials:
         add_material(teacher_id="t1", subject="Math", title="T", content="content")
         results = search_materials(query="o a e de", teacher_id="t1")
         assert results == []
+
+
+class TestMaterialIndex:
+    @staticmethod
+    def _fresh_index(store_dir: Path):
+        """A second index instance over the same files (e.g. another process)."""
+        from ailine_runtime.materials.store import (
+            _iter_material_files,
+            _materials_dir,
+        )
+
+        materials_dir = _materials_dir().resolve()
+        return MaterialIndex(
+            store_dir / "index",
+            materials_dir,
+            tokenize=_tokens,
+            chunk=_chunk_text,
+            scan=_iter_material_files,
+        )
+
+    def test_bm25_ranks_more_relevant_chunk_first(self, store_dir):
+        add_material(teacher_id="t1", subject="Bio", title="Passing", content="Cells mentioned once.")
+        add_material(
+            teacher_id="t1",
+            subject="Bio",
+            title="Focused",
+            content="Cells cells cells: the cell membrane protects cells.",
+        )
+        results = search_materials(query="cells", teacher_id="t1")
+        assert [r["title"] for r in results] == ["Focused", "Passing"]
+        assert results[0]["score"] > results[1]["score"]
+
+    def test_index_persists_on_disk(self, store_dir):
+        m = add_material(teacher_id="t1", subject="Math", title="Frac", content="Fractions halves.")
+        index = self._fresh_index(store_dir)
+        [hit] = index.search("halves", teacher_id="t1")
+        assert hit.material.material_id == m.material_id
+        assert index.lookup(m.material_id).title == "Frac"
+
+    def test_builds_index_for_existing_files(self, store_dir):
+        m = add_material(teacher_id="t1", subject="Math", title="Old", content="Legacy decimals.")
+        shutil.rmtree(store_dir / "index")
+        index = self._fresh_index(store_dir)
+        assert [h.material.material_id for h in index.search("decimals")] == [m.material_id]
+
+    def test_reader_sees_writer_appends(self, store_dir):
+        reader = self._fresh_index(store_dir)
+        assert reader.search("geometry") == []
+        add_material(teacher_id="t1", subject="Math", title="Geo", content="Geometry shapes.")
+        assert len(reader.search("geometry")) == 1
+
+    def test_compaction_keeps_results(self, store_dir, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.setattr(index_mod, "_COMPACT_MIN_CHUNKS", 3)
+        ids = [
+            add_material(
+                teacher_id="t1" if i % 2 else "t2",
+                subject="Math",
+                title=f"M{i}",
+                content=f"Shared topic number{i} unique{i}.",
+            ).material_id
+            for i in range(10)
+        ]
+        index = get_material_index()
+        assert index.generation >= 2
+        assert index.chunk_count == 10
+        assert not list((store_dir / "index").glob("post-0.npy"))
+
+        hits = search_materials(query="unique7", teacher_id="t1")
+        assert [h["material_id"] for h in hits] == [ids[7]]
+        assert len(search_materials(query="shared topic", k=20)) == 10
+        assert len(search_materials(query="shared", teacher_id="t2", k=20)) == 5
+        # A fresh reader maps the compacted generation
+        assert len(self._fresh_index(store_dir).search("shared", k=20)) == 10
+
+    def test_load_material_respects_filters(self, store_dir):
+        m = add_material(teacher_id="t1", subject="Math", title="T", content="C")
+        assert load_material(m.material_id, teacher_id="t2") is None
+        assert load_material(m.material_id, subject="Science") is None
+        assert load_material(m.material_id, teacher_id="t1", subject="Math") is not None
+
+    def test_unknown_filter_values(self, store_dir):
+        add_material(teacher_id="t1", subject="Math", title="T", content="Fractions.")
+        assert search_materials(query="fractions", teacher_id="nobody") == []
+        assert search_materials(query="fractions", subject="Art") == []
+        assert search_materials(query="fractions", material_ids=["missing"]) == []
+
+    def test_relative_store_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch):
+        monkeypatch.chdir(tmp_path)
+        monkeypatch.setenv("AILINE_LOCAL_STORE", "rel_store")
+        m = add_material(teacher_id="t1", subject="Math", title="Rel", content="Relative paths.")
+        assert load_material(m.material_id) is not None
+        assert search_materials(query="relative")[0]["material_id"] == m.material_id
@@ -10,6 +10,7 @@ Covers:
 
 from __future__ import annotations
 
+import json
 import struct
 from io import BytesIO
 
@@ -368,6 +369,56 @@ class TestMediaTranscribeEndpoint:
         assert "en" in response.json()["text"]
 
 
+class TestMediaTranscribeStreamEndpoint:
+    @staticmethod
+    def _events(body: str) -> list[tuple[str, dict]]:
+        events = []
+        for block in body.replace("\r\n", "\n").strip().split("\n\n"):
+            fields = dict(line.split(": ", 1) for line in block.splitlines() if ": " in line)
+            events.append((fields["event"], json.loads(fields["data"])))
+        return events
+
+    async def test_streams_segments_then_done(self, app, client: AsyncClient):
+        from dataclasses import replace
+
+        app.state.container = replace(
+            app.state.container, stt=FakeSTT(responses=["Bom dia. Abram o livro."])
+        )
+        response = await client.post(
+            "/media/transcribe/stream",
+            files={"file": ("audio.wav", b"\x00" * 100, "audio/wav")},
+        )
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+        events = self._events(response.text)
+        assert [name for name, _ in events] == ["segment", "segment", "done"]
+        assert events[0][1] == {"index": 0, "start": 0.0, "end": 1.0, "text": "Bom dia."}
+        assert events[-1][1] == {"text": "Bom dia. Abram o livro.", "segments": 2}
+
+    async def test_non_streaming_adapter_single_segment(self, app, client: AsyncClient):
+        from dataclasses import replace
+
+        class PlainSTT:
+            async def transcribe(self, audio_bytes: bytes, *, language: str = "pt") -> str:
+                return "texto completo"
+
+        app.state.container = replace(app.state.container, stt=PlainSTT())
+        response = await client.post(
+            "/media/transcribe/stream",
+            files={"file": ("audio.wav", b"\x00" * 10, "audio/wav")},
+        )
+        events = self._events(response.text)
+        assert [name for name, _ in events] == ["segment", "done"]
+        assert events[0][1]["text"] == "texto completo"
+
+    async def test_empty_file(self, client: AsyncClient):
+        response = await client.post(
+            "/media/transcribe/stream",
+            files={"file": ("audio.wav", b"", "audio/wav")},
+        )
+        assert response.status_code == 400
+
+
 class TestMediaSynthesizeEndpoint:
     async def test_synthesize_success(self, client: AsyncClient):
         response = await client.post(
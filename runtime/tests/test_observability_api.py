@@ -260,6 +260,24 @@ class TestObservabilityStore:
         assert stats["estimated_cost_usd"] > 0
         assert stats["cost_breakdown"]["model"] == "claude-haiku-4-5"
 
+    def test_prompt_cache_tokens_discounted(self) -> None:
+        obs = get_observability_store()
+        obs.record_tokens(input_tokens=1000, output_tokens=0, model="claude-haiku-4-5")
+        uncached_cost = obs.get_token_stats()["estimated_cost_usd"]
+        reset_observability_store()
+
+        obs = get_observability_store()
+        obs.record_tokens(
+            input_tokens=1000,
+            output_tokens=0,
+            model="claude-haiku-4-5",
+            cached_input_tokens=800,
+        )
+        stats = obs.get_token_stats()
+        assert stats["cached_input_tokens"] == 800
+        assert stats["cache_hit_ratio"] == 0.8
+        assert stats["estimated_cost_usd"] < uncached_cost
+
     def test_provider_status(self) -> None:
         obs = get_observability_store()
         obs.update_provider_status("anthropic", "claude-opus-4-6", "healthy")
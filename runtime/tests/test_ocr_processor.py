@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
+import json
+import types
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 from unittest.mock import MagicMock, patch
 
 import pytest
 
 from ailine_runtime.adapters.media.ocr_processor import OCRProcessor
+from ailine_runtime.domain.ports.media import PagedOCRProcessor
+from ailine_runtime.shared.metrics import ocr_pages_total
 
 
 @pytest.fixture
@@ -118,3 +123,137 @@ class TestExtractImage:
         ):
             result = await ocr.extract_text(b"bad image", file_type="image")
             assert "falha" in result.lower() or "image" in result.lower()
+
+
+# -- Page-parallel extraction ---------------------------------------------------
+
+
+class _FakeImage:
+    def __init__(self, name: str) -> None:
+        self.image = name
+
+
+class _FakePage:
+    def __init__(self, spec: dict) -> None:
+        self.spec = spec
+        self.images = [_FakeImage(name) for name in spec.get("images", [])]
+
+    def extract_text(self) -> str:
+        return self.spec.get("text", "")
+
+
+def _fake_pypdf(readers: list[int]) -> types.ModuleType:
+    """pypdf stand-in whose "PDF" bytes are a JSON list of page specs.
+
+    *readers* records the page count of every reader opened, so tests can
+    check the size of the page ranges sent to workers.
+    """
+    module = types.ModuleType("pypdf")
+
+    class PdfReader:
+        def __init__(self, stream) -> None:
+            self.pages = [_FakePage(spec) for spec in json.loads(stream.getvalue())]
+            readers.append(len(self.pages))
+
+    class PdfWriter:
+        def __init__(self) -> None:
+            self._pages: list[dict] = []
+
+        def add_page(self, page: _FakePage) -> None:
+            self._pages.append(page.spec)
+
+        def write(self, buf) -> None:
+            buf.write(json.dumps(self._pages).encode())
+
+    module.PdfReader = PdfReader  # type: ignore[attr-defined]
+    module.PdfWriter = PdfWriter  # type: ignore[attr-defined]
+    return module
+
+
+@pytest.fixture
+def fake_libs():
+    readers: list[int] = []
+    tesseract = MagicMock()
+    tesseract.image_to_string.side_effect = lambda image, lang: f"ocr({image})\n"
+    with patch.dict(
+        "sys.modules",
+        {"pypdf": _fake_pypdf(readers), "pytesseract": tesseract, "PIL": MagicMock()},
+    ):
+        yield readers, tesseract
+
+
+def _pdf(specs: list[dict]) -> bytes:
+    return json.dumps(specs).encode()
+
+
+class TestPageParallel:
+    async def test_pages_in_order_with_ocr_fallback(self, fake_libs):
+        readers, tesseract = fake_libs
+        specs = [{"text": f"page {i}"} for i in range(7)]
+        specs[2] = {"text": "  ", "images": ["scan2"]}
+        specs[5] = {"images": ["scan5a", "scan5b"]}
+        ocr = OCRProcessor(page_range_size=2, executor=ThreadPoolExecutor(2))
+        assert isinstance(ocr, PagedOCRProcessor)
+
+        pages = [p async for p in ocr.iter_pages(_pdf(specs))]
+        assert [p.index for p in pages] == list(range(7))
+        assert pages[2].text == "ocr(scan2)" and pages[2].ocr
+        assert pages[5].text == "ocr(scan5a)\nocr(scan5b)"
+        assert not pages[0].ocr
+        # Only the pages without a text layer were OCR'd
+        assert tesseract.image_to_string.call_count == 3
+        # Full document once, then one reader per range of <= 2 pages
+        assert readers[0] == 7
+        assert readers[1:] == [2, 2, 2, 1]
+
+    async def test_extract_text_joins_pages(self, fake_libs):
+        specs = [{"text": "um"}, {"images": []}, {"text": "tres"}]
+        ocr = OCRProcessor(page_range_size=1, executor=ThreadPoolExecutor(2))
+        empty0 = ocr_pages_total.get(method="empty")
+        assert await ocr.extract_text(_pdf(specs), file_type="pdf") == "um\ntres"
+        assert ocr_pages_total.get(method="empty") == empty0 + 1
+
+    async def test_ranges_in_flight_bounded(self, fake_libs):
+        readers, _ = fake_libs
+        ocr = OCRProcessor(workers=2, page_range_size=1, executor=ThreadPoolExecutor(2))
+        stream = ocr.iter_pages(_pdf([{"text": str(i)} for i in range(20)]))
+        first = await anext(stream)
+        assert first.index == 0
+        # Only workers + 1 ranges were sliced ahead, not the whole document
+        assert len(readers) - 1 <= 3
+        await stream.aclose()
+
+    async def test_image_runs_on_pool(self, fake_libs):
+        _, tesseract = fake_libs
+        ocr = OCRProcessor(executor=ThreadPoolExecutor(1))
+        with patch.dict("sys.modules", {"PIL.Image": MagicMock()}):
+            pages = [p async for p in ocr.iter_pages(b"img", file_type="image")]
+        assert len(pages) == 1 and pages[0].ocr
+        assert pages[0].text.startswith("ocr(")
+        tesseract.image_to_string.assert_called_once()
+
+    async def test_image_failure_keeps_diagnostic(self, fake_libs):
+        """The pool path reports a failed image like the serial path."""
+        _, tesseract = fake_libs
+        tesseract.image_to_string.side_effect = OSError("corrupt")
+        ocr = OCRProcessor(executor=ThreadPoolExecutor(1))
+        with patch.dict("sys.modules", {"PIL.Image": MagicMock()}):
+            text = await ocr.extract_text(b"img", file_type="image")
+        assert text == "[Falha na extracao de texto da imagem]"
+
+    async def test_missing_pypdf(self):
+        ocr = OCRProcessor(executor=ThreadPoolExecutor(1))
+        with patch.dict("sys.modules", {"pypdf": None}):
+            assert [p async for p in ocr.iter_pages(b"pdf")] == []
+            assert "pypdf" in await ocr.extract_text(b"pdf", file_type="pdf")
+
+    async def test_process_pool_when_workers_set(self):
+        serial = OCRProcessor()
+        assert not serial.parallel
+
+        ocr = OCRProcessor(workers=2)
+        assert ocr.parallel
+        pool = ocr._pool()
+        assert isinstance(pool, ProcessPoolExecutor)
+        await ocr.dispose()
+        assert ocr._executor is None
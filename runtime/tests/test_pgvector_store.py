@@ -8,13 +8,26 @@ from __future__ import annotations
 from contextlib import asynccontextmanager
 from unittest.mock import AsyncMock, MagicMock
 
+import numpy as np
 import pytest
 
+from ailine_runtime.adapters.vectorstores.pgvector_codec import (
+    decode_vector_binary,
+    encode_vector_binary,
+    format_vector_text,
+    install_binary_vector_codec,
+    register_vector_codec,
+)
 from ailine_runtime.adapters.vectorstores.pgvector_store import (
     PgVectorStore,
     _json_dumps,
     _json_loads,
 )
+from ailine_runtime.domain.ports.vectorstore import (
+    BulkVectorStore,
+    LexicalSearch,
+    VectorRecord,
+)
 
 
 @asynccontextmanager
@@ -51,7 +64,7 @@ class TestPgVectorStoreEnsureTable:
     async def test_ensure_table_creates_extension_and_table(self, store, mock_session):
         await store.ensure_table()
         # 4 statements: CREATE EXTENSION, CREATE TABLE, HNSW INDEX, tenant_id INDEX
-        assert mock_session.execute.call_count == 4
+        assert mock_session.execute.call_count == 5
         assert mock_session.commit.call_count == 1
 
 
@@ -126,6 +139,113 @@ class TestPgVectorStoreSearch:
         assert results[0].metadata == {"k": "v"}
 
 
+class TestPgVectorStoreSearchMany:
+    @pytest.mark.asyncio
+    async def test_search_many_empty_noop(self, store, mock_session):
+        assert await store.search_many(query_embeddings=[]) == []
+        mock_session.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_search_many_single_round_trip(self, store, mock_session):
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = [
+            (1, "a", 0.9, "first", {"k": "v"}),
+            (2, "b", 0.8, "second", '{"k": "w"}'),
+            (2, "c", 0.7, "third", {}),
+        ]
+        mock_session.execute.return_value = mock_result
+
+        results = await store.search_many(
+            query_embeddings=[[0.1, 0.2, 0.3, 0.4], [0.5, 0.6, 0.7, 0.8], [0, 0, 0, 1]],
+            k=2,
+            filters={"subject": "math"},
+            tenant_id="t1",
+        )
+
+        mock_session.execute.assert_called_once()
+        sql = str(mock_session.execute.call_args[0][0])
+        params = mock_session.execute.call_args[0][1]
+        assert "LATERAL" in sql
+        assert "unnest" in sql
+        assert "tenant_id = :tenant_id" in sql
+        assert len(params["query_vecs"]) == 3
+        assert params["tenant_id"] == "t1"
+        assert "filter_json" in params
+        assert [r.id for r in results[0]] == ["a"]
+        assert [r.id for r in results[1]] == ["b", "c"]
+        assert results[1][0].metadata == {"k": "w"}
+        assert results[2] == []
+
+
+class TestPgVectorStoreBulkUpsert:
+    @pytest.fixture
+    def driver(self, mock_session):
+        """Wire session.connection() -> raw connection -> asyncpg driver mock."""
+        driver = AsyncMock()
+        raw = MagicMock()
+        raw.driver_connection = driver
+        conn = MagicMock()
+        conn.get_raw_connection = AsyncMock(return_value=raw)
+        mock_session.connection = AsyncMock(return_value=conn)
+        merge_result = MagicMock()
+        merge_result.rowcount = 3
+        mock_session.execute.return_value = merge_result
+        return driver
+
+    def test_satisfies_bulk_protocol(self, store):
+        assert isinstance(store, BulkVectorStore)
+
+    @staticmethod
+    def _records(n: int) -> list[VectorRecord]:
+        return [
+            VectorRecord(id=f"c{i}", embedding=[0.1, 0.2, 0.3, 0.4], text=f"t{i}", metadata={"i": i})
+            for i in range(n)
+        ]
+
+    @pytest.mark.asyncio
+    async def test_copies_in_batches_and_merges_once(self, store, mock_session, driver):
+        merged = await store.bulk_upsert(self._records(5), tenant_id="t1", batch_size=2)
+
+        assert merged == 3
+        assert driver.copy_records_to_table.await_count == 3  # 2 + 2 + 1
+        first = driver.copy_records_to_table.await_args_list[0]
+        assert len(first.kwargs["records"]) == 2
+        assert first.kwargs["records"][0][:2] == ("c0", "t1")
+        assert first.kwargs["records"][0][2] == "[0.1,0.2,0.3,0.4]"
+
+        statements = [str(c[0][0]) for c in mock_session.execute.call_args_list]
+        assert len(statements) == 2
+        assert "CREATE TEMP TABLE" in statements[0]
+        assert "ON COMMIT DROP" in statements[0]
+        assert "DISTINCT ON (id)" in statements[1]
+        assert "ON CONFLICT (id) DO UPDATE" in statements[1]
+        mock_session.commit.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_accepts_async_iterable(self, store, mock_session, driver):
+        async def gen():
+            for rec in self._records(3):
+                yield rec
+
+        await store.bulk_upsert(gen(), batch_size=10)
+        assert driver.copy_records_to_table.await_count == 1
+
+    @pytest.mark.asyncio
+    async def test_empty_stream_skips_merge(self, store, mock_session, driver):
+        assert await store.bulk_upsert([]) == 0
+        driver.copy_records_to_table.assert_not_awaited()
+        assert mock_session.execute.call_count == 1  # staging table only
+
+    @pytest.mark.asyncio
+    async def test_binary_mode_stages_vector_column(self, session_factory, mock_session, driver):
+        store = PgVectorStore(session_factory, table_name="test_chunks", dimensions=4, binary_vectors=True)
+        await store.bulk_upsert(self._records(1))
+        ddl = str(mock_session.execute.call_args_list[0][0][0])
+        assert "vector(4)" in ddl
+        record = driver.copy_records_to_table.await_args.kwargs["records"][0]
+        assert isinstance(record[2], np.ndarray)
+
+
 class TestPgVectorStoreDelete:
     @pytest.mark.asyncio
     async def test_delete_empty_noop(self, store, mock_session):
@@ -139,6 +259,60 @@ class TestPgVectorStoreDelete:
         mock_session.commit.assert_called_once()
 
 
+class TestPgVectorStoreChunkHashes:
+    @pytest.mark.asyncio
+    async def test_chunk_hashes_reads_ids_and_hash(self, store, mock_session):
+        result = MagicMock()
+        result.fetchall.return_value = [("m__chunk_0000", "h0"), ("m__chunk_0001", None)]
+        mock_session.execute.return_value = result
+
+        hashes = await store.chunk_hashes(material_id="m", tenant_id="t1")
+
+        assert hashes == {"m__chunk_0000": "h0", "m__chunk_0001": None}
+        stmt, params = mock_session.execute.call_args.args
+        assert "metadata->>'chunk_hash'" in str(stmt)
+        assert "embedding" not in str(stmt)
+        assert params["tenant_id"] == "t1"
+        assert '"material_id": "m"' in params["filter_json"]
+
+
+class TestPgVectorStoreLexicalSearch:
+    def test_satisfies_lexical_protocol(self, store):
+        assert isinstance(store, LexicalSearch)
+
+    @pytest.mark.asyncio
+    async def test_ensure_table_creates_fts_index(self, store, mock_session):
+        await store.ensure_table()
+        ddl = " ".join(str(c.args[0]) for c in mock_session.execute.call_args_list)
+        assert "USING gin (to_tsvector('simple', content))" in ddl
+
+    @pytest.mark.asyncio
+    async def test_builds_or_tsquery_with_tenant_filter(self, store, mock_session):
+        result = MagicMock()
+        result.fetchall.return_value = [("c1", 0.4, "EF04MA07 divisão", {"k": "v"})]
+        mock_session.execute.return_value = result
+
+        hits = await store.lexical_search(
+            query="EF04MA07: divisão, EF04MA07", k=3, filters={"k": "v"}, tenant_id="t1"
+        )
+
+        assert [(h.id, h.score) for h in hits] == [("c1", 0.4)]
+        stmt, params = mock_session.execute.call_args.args
+        sql = str(stmt)
+        assert "ts_rank_cd" in sql
+        assert "to_tsquery('simple', :tsquery)" in sql
+        assert "WHERE tenant_id = :tenant_id AND metadata @>" in sql
+        assert "AS jsonb) AND to_tsvector('simple', content) @@ q.query" in sql
+        assert params["tsquery"] == "ef04ma07 | divisão"
+        assert params["k"] == 3
+        assert params["tenant_id"] == "t1"
+
+    @pytest.mark.asyncio
+    async def test_query_without_terms_skips_db(self, store, mock_session):
+        assert await store.lexical_search(query="  ?! ") == []
+        mock_session.execute.assert_not_called()
+
+
 class TestJsonHelpers:
     def test_json_dumps(self):
         result = _json_dumps({"key": "value", "nested": [1, 2]})
@@ -152,3 +326,95 @@ class TestJsonHelpers:
     def test_json_loads_bytes(self):
         result = _json_loads(b'{"key": "value"}')
         assert result == {"key": "value"}
+
+
+class TestVectorCodec:
+    def test_text_format(self):
+        assert format_vector_text([0.5, -1.0, 2]) == "[0.5,-1.0,2]"
+
+    def test_binary_layout(self):
+        data = encode_vector_binary([1.0, -2.0])
+        # uint16 dim=2, uint16 reserved=0, then big-endian float32 values
+        assert data == b"\x00\x02\x00\x00" + np.array([1.0, -2.0], ">f4").tobytes()
+
+    def test_binary_roundtrip(self):
+        vec = np.random.default_rng(1).standard_normal(1536).astype(np.float32)
+        decoded = decode_vector_binary(encode_vector_binary(vec))
+        assert decoded.dtype == np.float32
+        np.testing.assert_array_equal(decoded, vec)
+
+    def test_binary_matches_pgvector_package(self):
+        pgvector = pytest.importorskip("pgvector")
+        vec = [0.25, -0.5, 3.0]
+        assert encode_vector_binary(vec) == pgvector.Vector(vec).to_binary()
+
+    def test_decode_rejects_bad_length(self):
+        with pytest.raises(ValueError, match="payload"):
+            decode_vector_binary(b"\x00\x03\x00\x00" + b"\x00" * 8)
+
+    def test_encode_rejects_matrix(self):
+        with pytest.raises(ValueError, match="1-d"):
+            encode_vector_binary([[1.0], [2.0]])
+
+    @pytest.mark.asyncio
+    async def test_register_vector_codec(self):
+        conn = AsyncMock()
+        await register_vector_codec(conn)
+        conn.set_type_codec.assert_awaited_once()
+        assert conn.set_type_codec.call_args.kwargs["format"] == "binary"
+
+    @pytest.mark.asyncio
+    async def test_register_vector_codec_missing_extension(self):
+        conn = AsyncMock()
+        conn.set_type_codec.side_effect = ValueError("unknown type: public.vector")
+        with pytest.raises(RuntimeError, match=r"public\.vector not found"):
+            await register_vector_codec(conn)
+
+    def test_install_skips_non_asyncpg_driver(self):
+        engine = MagicMock()
+        engine.dialect.driver = "aiosqlite"
+        assert install_binary_vector_codec(engine) is False
+
+    def test_install_on_asyncpg_engine(self):
+        pytest.importorskip("asyncpg")
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        engine = create_async_engine("postgresql+asyncpg://u:p@localhost/db")
+        assert install_binary_vector_codec(engine) is True
+
+
+class TestPgVectorStoreBinaryMode:
+    @pytest.fixture
+    def binary_store(self, session_factory):
+        return PgVectorStore(
+            session_factory, table_name="test_chunks", dimensions=4, binary_vectors=True
+        )
+
+    @pytest.mark.asyncio
+    async def test_upsert_binds_arrays(self, binary_store, mock_session):
+        await binary_store.upsert(
+            ids=["a"], embeddings=[[0.1, 0.2, 0.3, 0.4]], texts=["t"], metadatas=[{}]
+        )
+        params_list = mock_session.execute.call_args[0][1]
+        emb = params_list[0]["embedding"]
+        assert isinstance(emb, np.ndarray)
+        assert emb.dtype == np.float32
+
+    @pytest.mark.asyncio
+    async def test_search_many_uses_vector_array(self, binary_store, mock_session):
+        mock_result = MagicMock()
+        mock_result.fetchall.return_value = []
+        mock_session.execute.return_value = mock_result
+        await binary_store.search_many(query_embeddings=[[0.1, 0.2, 0.3, 0.4]])
+        sql = str(mock_session.execute.call_args[0][0])
+        params = mock_session.execute.call_args[0][1]
+        assert "AS vector[]" in sql
+        assert isinstance(params["query_vecs"][0], np.ndarray)
+
+    @pytest.mark.asyncio
+    async def test_text_mode_binds_literals(self, store, mock_session):
+        await store.upsert(
+            ids=["a"], embeddings=[[0.5, 0.0, 0.0, 1.0]], texts=["t"], metadatas=[{}]
+        )
+        params_list = mock_session.execute.call_args[0][1]
+        assert params_list[0]["embedding"] == "[0.5,0.0,0.0,1.0]"
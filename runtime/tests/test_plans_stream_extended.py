@@ -1,10 +1,9 @@
 """Extended tests for plans_stream.py -- covers error branches.
 
 Targets:
-- Lines 63-64: heartbeat loop asyncio.sleep + queue.put
-- Lines 165-166: client disconnection detection
-- Lines 170-171: TimeoutError on queue.get (continue loop)
-- Line 181: pipeline_task.cancel() when not done
+- Heartbeat loop asyncio.sleep + channel.publish
+- Client disconnection handling
+- pipeline_task.cancel() when not done
 """
 
 from __future__ import annotations
@@ -15,6 +14,7 @@ import json
 from typing import Any
 from unittest.mock import AsyncMock, MagicMock, patch
 
+from ailine_runtime.api.streaming.channel import SSEChannel
 from ailine_runtime.api.streaming.events import SSEEventEmitter, SSEEventType
 
 # ===========================================================================
@@ -24,33 +24,29 @@ from ailine_runtime.api.streaming.events import SSEEventEmitter, SSEEventType
 
 class TestHeartbeatLoop:
     async def test_heartbeat_pushes_events(self):
-        """_heartbeat_loop pushes heartbeat events into the queue (lines 63-64)."""
+        """_heartbeat_loop publishes heartbeat events to the channel."""
         from ailine_runtime.api.routers.plans_stream import _heartbeat_loop
 
         emitter = SSEEventEmitter("test-run")
-        queue: asyncio.Queue[dict[str, str] | None] = asyncio.Queue()
+        channel = SSEChannel("test-run")
 
         # Run heartbeat with a very short interval
         done_event = asyncio.Event()
-        task = asyncio.create_task(_heartbeat_loop(emitter, queue, done_event, interval=0.05))
+        task = asyncio.create_task(_heartbeat_loop(emitter, channel, done_event, interval=0.05))
 
-        # Wait for at least one heartbeat
-        await asyncio.sleep(0.15)
+        # Wait for heartbeats, reading them as a client would
+        events = []
+        for _ in range(2):
+            event = await asyncio.wait_for(channel.get(), timeout=1.0)
+            assert event is not None
+            events.append(event)
         task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
             await task
 
-        # Should have received at least one heartbeat event
-        events = []
-        while not queue.empty():
-            item = queue.get_nowait()
-            if item is not None:
-                events.append(item)
-
         assert len(events) >= 1
         for event in events:
-            assert "data" in event
-            parsed = json.loads(event["data"])
+            parsed = json.loads(event.to_sse_data())
             assert parsed["type"] == "heartbeat"
 
     async def test_heartbeat_stops_on_cancel(self):
@@ -58,10 +54,10 @@ class TestHeartbeatLoop:
         from ailine_runtime.api.routers.plans_stream import _heartbeat_loop
 
         emitter = SSEEventEmitter("test-run")
-        queue: asyncio.Queue[dict[str, str] | None] = asyncio.Queue()
+        channel = SSEChannel("test-run")
 
         done_event = asyncio.Event()
-        task = asyncio.create_task(_heartbeat_loop(emitter, queue, done_event, interval=0.5))
+        task = asyncio.create_task(_heartbeat_loop(emitter, channel, done_event, interval=0.5))
         await asyncio.sleep(0.05)
         task.cancel()
         with contextlib.suppress(asyncio.CancelledError):
@@ -78,14 +74,14 @@ class TestHeartbeatLoop:
 
 class TestRunPipelineError:
     async def test_pipeline_exception_emits_run_failed(self):
-        """When the pipeline raises, _run_pipeline puts a run.failed event (line 128-130)."""
+        """When the pipeline raises, _run_pipeline publishes a run.failed event."""
         from ailine_runtime.api.routers.plans_stream import PlanStreamIn, _run_pipeline
 
         body = PlanStreamIn(run_id="err-run", user_prompt="Boom test")
         settings = MagicMock()
         container = MagicMock()
         emitter = SSEEventEmitter("err-run")
-        queue: asyncio.Queue[dict[str, str] | None] = asyncio.Queue()
+        channel = SSEChannel("err-run")
 
         # Patch AgentDepsFactory.from_container to raise during pipeline
         mock_factory = MagicMock()
@@ -98,24 +94,15 @@ class TestRunPipelineError:
         ):
             done_event = asyncio.Event()
             await _run_pipeline(
-                body, "teacher-001", settings, container, emitter, queue, "idem_key", done_event
+                body, "teacher-001", settings, container, emitter, channel, "idem_key", done_event
             )
 
-        # Collect all events from queue
-        events = []
-        while not queue.empty():
-            item = queue.get_nowait()
-            if item is not None:
-                events.append(item)
-            else:
-                break  # sentinel
+        # The pipeline closed the channel, so iteration stops once drained
+        assert channel.closed
+        events = [event async for event in channel]
 
         # The run.failed event should be present
-        failed_events = [
-            json.loads(e["data"])
-            for e in events
-            if "data" in e and "run.failed" in e["data"]
-        ]
+        failed_events = [e for e in events if e.type == SSEEventType.RUN_FAILED]
         assert len(failed_events) >= 1
 
 
@@ -172,7 +159,7 @@ def _patch_build_and_deps():
 
 class TestEventGeneratorEdgeCases:
     def test_stream_timeout_loop_continues(self):
-        """When queue.get times out, the generator continues (lines 170-171)."""
+        """The generator waits on the channel until the pipeline finishes."""
         import os
 
         from fastapi.testclient import TestClient
@@ -195,7 +182,7 @@ class TestEventGeneratorEdgeCases:
         assert response.status_code == 200
 
     def test_stream_client_disconnect_handled(self):
-        """The event generator checks is_disconnected (lines 164-166)."""
+        """A run that fails fast still delivers run.started and run.failed."""
         import os
 
         from fastapi.testclient import TestClient
@@ -0,0 +1,163 @@
+"""Tests for the ProgressStore backends (in-memory and SqlProgressStore)."""
+
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+
+from ailine_runtime.domain.entities.progress import MasteryLevel
+from ailine_runtime.shared.progress_store import ProgressStore, build_progress_store
+
+
+@pytest.fixture(params=["memory", "sql"])
+def store(request):
+    """Each contract test runs against both backends."""
+    if request.param == "memory":
+        return ProgressStore()
+    from ailine_runtime.adapters.db.progress_store import SqlProgressStore
+
+    return SqlProgressStore(request.getfixturevalue("session_factory"))
+
+
+class TestProgressContract:
+    """Behaviour shared by both backends."""
+
+    async def test_record_and_update(self, store) -> None:
+        first = await store.record_progress(
+            "t1", "s1", "Alice", "C1", "Fractions", MasteryLevel.DEVELOPING, notes="n1"
+        )
+        assert first.session_count == 1
+        assert first.created_at.endswith("+00:00")
+        second = await store.record_progress(
+            "t1", "s1", "", "C1", "", MasteryLevel.MASTERED
+        )
+        assert second.progress_id == first.progress_id
+        assert second.session_count == 2
+        assert second.mastery_level == MasteryLevel.MASTERED
+        assert second.student_name == "Alice"
+        assert second.standard_description == "Fractions"
+        assert second.notes == "n1"
+
+    async def test_dashboard_follows_level_changes(self, store) -> None:
+        await store.record_progress("t1", "s1", "Alice", "C1", "Fractions", MasteryLevel.DEVELOPING)
+        await store.record_progress("t1", "s1", "Alice", "C2", "Decimals", MasteryLevel.PROFICIENT)
+        await store.record_progress("t1", "s2", "Bob", "C1", "Fractions", MasteryLevel.DEVELOPING)
+        await store.record_progress("t1", "s1", "Alice", "C1", "", MasteryLevel.MASTERED)
+        await store.record_progress("t2", "s3", "Cleo", "C9", "", MasteryLevel.MASTERED)
+
+        dashboard = await store.get_dashboard("t1")
+        assert dashboard.total_students == 2
+        assert dashboard.total_standards == 2
+        assert dashboard.mastery_distribution == {
+            "not_started": 0,
+            "developing": 1,
+            "proficient": 1,
+            "mastered": 1,
+        }
+        alice, bob = dashboard.students
+        assert (alice.student_id, bob.student_id) == ("s1", "s2")
+        assert alice.standards_count == 2
+        assert (alice.mastered_count, alice.proficient_count, alice.developing_count) == (1, 1, 0)
+        assert alice.last_activity is not None
+        c1, c2 = dashboard.standards
+        assert (c1.standard_code, c1.standard_description) == ("C1", "Fractions")
+        assert (c1.student_count, c1.mastered_count, c1.developing_count) == (2, 1, 1)
+        assert c2.proficient_count == 1
+
+    async def test_dashboard_is_a_snapshot(self, store) -> None:
+        await store.record_progress("t1", "s1", "Alice", "C1", "", MasteryLevel.DEVELOPING)
+        before = await store.get_dashboard("t1")
+        await store.record_progress("t1", "s1", "Alice", "C1", "", MasteryLevel.MASTERED)
+        assert before.mastery_distribution["developing"] == 1
+        assert before.students[0].developing_count == 1
+        assert (await store.get_dashboard("t1")).mastery_distribution["mastered"] == 1
+
+    async def test_dashboard_shows_latest_names(self, store) -> None:
+        await store.record_progress("t1", "s1", "Zoe", "C1", "Zeta", MasteryLevel.DEVELOPING)
+        await store.record_progress("t1", "s1", "Ana", "C2", "", MasteryLevel.DEVELOPING)
+        await store.record_progress("t1", "s2", "", "C1", "Alpha", MasteryLevel.DEVELOPING)
+        dashboard = await store.get_dashboard("t1")
+        assert [s.student_name for s in dashboard.students] == ["Ana", ""]
+        assert [s.standard_description for s in dashboard.standards] == ["Alpha", ""]
+
+    async def test_student_lookups(self, store) -> None:
+        await store.record_progress("t1", "s1", "Alice", "MA01", "", MasteryLevel.DEVELOPING)
+        await store.record_progress("t2", "s1", "Alice", "SCI01", "", MasteryLevel.MASTERED)
+        await store.record_progress("t1", "s2", "Bob", "MA01", "", MasteryLevel.PROFICIENT)
+
+        assert [r.standard_code for r in await store.get_student("t1", "s1")] == ["MA01"]
+        assert await store.get_student("t3", "s1") == []
+        everywhere = await store.get_student_all_teachers("s1")
+        assert [(r.teacher_id, r.standard_code) for r in everywhere] == [
+            ("t1", "MA01"),
+            ("t2", "SCI01"),
+        ]
+        assert await store.get_student_all_teachers("nobody") == []
+
+    async def test_parent_links(self, store) -> None:
+        await store.link_parent_student("parent-1", "student-1")
+        await store.link_parent_student("parent-1", "student-1")  # idempotent
+        assert await store.is_parent_linked("parent-1", "student-1") is True
+        assert await store.is_parent_linked("parent-1", "student-2") is False
+        assert await store.is_parent_linked("parent-2", "student-1") is False
+
+
+class TestInMemoryIndexes:
+    async def test_reads_do_not_create_entries(self) -> None:
+        store = ProgressStore()
+        assert await store.get_student("t1", "s1") == []
+        assert (await store.get_dashboard("t1")).total_students == 0
+        assert await store.get_student_all_teachers("s1") == []
+        assert not store._records
+        assert not store._aggregates
+        assert not store._by_student
+
+
+class TestSqlProgressStore:
+    async def test_survives_restart(self, session_factory) -> None:
+        from ailine_runtime.adapters.db.progress_store import SqlProgressStore
+
+        store = SqlProgressStore(session_factory)
+        await store.record_progress("t1", "s1", "Alice", "C1", "", MasteryLevel.PROFICIENT)
+        await store.link_parent_student("parent-1", "s1")
+        await store.close()
+
+        restarted = SqlProgressStore(session_factory)
+        records = await restarted.get_student("t1", "s1")
+        assert [r.mastery_level for r in records] == [MasteryLevel.PROFICIENT]
+        assert await restarted.is_parent_linked("parent-1", "s1") is True
+
+    async def test_concurrent_records_keep_every_session(self, tmp_path) -> None:
+        from ailine_runtime.adapters.db.progress_store import SqlProgressStore
+
+        store = SqlProgressStore.from_url(f"sqlite+aiosqlite:///{tmp_path / 'progress.db'}")
+        try:
+            await store.record_progress("t1", "s1", "Alice", "C1", "", MasteryLevel.DEVELOPING)
+            await asyncio.gather(
+                *(
+                    store.record_progress("t1", "s1", "", "C1", "", MasteryLevel.PROFICIENT)
+                    for _ in range(9)
+                )
+            )
+            (record,) = await store.get_student("t1", "s1")
+        finally:
+            await store.close()
+        assert record.session_count == 10
+        assert record.student_name == "Alice"
+
+
+class TestBuildProgressStore:
+    def test_memory_by_default(self) -> None:
+        from ailine_runtime.shared.config import Settings
+
+        assert isinstance(build_progress_store(Settings()), ProgressStore)
+
+    def test_db_backend(self) -> None:
+        from ailine_runtime.adapters.db.progress_store import SqlProgressStore
+        from ailine_runtime.shared.config import DatabaseConfig, ProgressConfig, Settings
+
+        settings = Settings(
+            db=DatabaseConfig(url="sqlite+aiosqlite://"), progress=ProgressConfig(store="db")
+        )
+        assert isinstance(build_progress_store(settings), SqlProgressStore)
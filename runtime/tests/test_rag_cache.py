@@ -0,0 +1,204 @@
+"""Tests for the tenant-scoped RAG query-result cache.
+
+Covers:
+- Query normalization and the exact tier (embedding call skipped).
+- Scoping by tenant and retrieval parameters.
+- Semantic tier reuse above the cosine threshold.
+- TTL and LRU eviction, hit-ratio stats and metrics.
+- Invalidation by IngestionService writes and by bus events.
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from ailine_runtime.adapters.embeddings.fake_embeddings import FakeEmbeddings
+from ailine_runtime.adapters.events.inmemory_bus import InMemoryEventBus
+from ailine_runtime.adapters.vectorstores.inmemory_store import InMemoryVectorStore
+from ailine_runtime.app.services.ingestion import (
+    EVENT_INGESTION_COMPLETED,
+    ChunkingConfig,
+    IngestionService,
+)
+from ailine_runtime.app.services.rag import RAGResult, RAGService
+from ailine_runtime.app.services.rag_cache import RAGQueryCache, cache_scope, normalize_query
+from ailine_runtime.shared.metrics import rag_cache_requests_total, render_metrics
+
+# -- Helpers ------------------------------------------------------------------
+
+
+class CountingEmbeddings(FakeEmbeddings):
+    """FakeEmbeddings that counts calls and can alias texts to one vector."""
+
+    def __init__(self, aliases: dict[str, str] | None = None) -> None:
+        super().__init__(dimensions=32)
+        self.calls = 0
+        self._aliases = aliases or {}
+
+    async def embed_text(self, text: str) -> list[float]:
+        self.calls += 1
+        return await super().embed_text(self._aliases.get(text, text))
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _result(text: str = "q") -> RAGResult:
+    return RAGResult(query=text, results=[], total_candidates=0)
+
+
+@pytest.fixture
+def embeddings() -> CountingEmbeddings:
+    return CountingEmbeddings(aliases={"what is a fraction": "o que é fração"})
+
+
+@pytest.fixture
+async def setup(embeddings: CountingEmbeddings):
+    store = InMemoryVectorStore()
+    cache = RAGQueryCache(semantic=True, semantic_threshold=0.99)
+    ingestion = IngestionService(
+        embeddings=FakeEmbeddings(dimensions=32),
+        vector_store=store,
+        chunking=ChunkingConfig(chunk_size=50, chunk_overlap=10),
+        query_cache=cache,
+    )
+    await ingestion.ingest(
+        text="Fração representa partes de um inteiro", material_id="m1", tenant_id="t1"
+    )
+    rag = RAGService(
+        embeddings=embeddings, vector_store=store, similarity_threshold=0.0, cache=cache
+    )
+    return rag, cache, ingestion
+
+
+# -- Tests ----------------------------------------------------------------------
+
+
+class TestCacheUnit:
+    def test_normalize_query(self):
+        assert normalize_query("  O que é   FRAÇÃO? ") == "o que é fração"
+        assert normalize_query("o que é fração") == "o que é fração"
+
+    def test_scope_includes_tenant_and_params(self):
+        assert cache_scope("t1", k=5) != cache_scope("t2", k=5)
+        assert cache_scope("t1", k=5) != cache_scope("t1", k=6)
+        assert cache_scope("t1", k=5, filters={"a": 1}) == cache_scope("t1", filters={"a": 1}, k=5)
+
+    def test_ttl_expiry(self):
+        clock = FakeClock()
+        cache = RAGQueryCache(ttl_seconds=10, clock=clock)
+        scope = cache_scope("t1")
+        cache.put(scope, "q", _result())
+        clock.now = 9.9
+        assert cache.get_exact(scope, "q") is not None
+        clock.now = 10.0
+        assert cache.get_exact(scope, "q") is None
+        assert cache.stats().size == 0
+
+    def test_lru_eviction(self):
+        cache = RAGQueryCache(max_entries=2)
+        scope = cache_scope("t1")
+        cache.put(scope, "a", _result("a"))
+        cache.put(scope, "b", _result("b"))
+        cache.get_exact(scope, "a")  # refresh "a"
+        cache.put(scope, "c", _result("c"))  # evicts "b"
+        assert cache.get_exact(scope, "b") is None
+        assert cache.get_exact(scope, "a") is not None
+        assert cache.stats().size == 2
+
+    def test_invalidate_is_tenant_scoped(self):
+        cache = RAGQueryCache()
+        cache.put(cache_scope("t1"), "q", _result())
+        cache.put(cache_scope("t2"), "q", _result())
+        cache.put(cache_scope(None), "q", _result())
+        assert cache.invalidate("t1") == 2  # t1 and the cross-tenant entry
+        assert cache.get_exact(cache_scope("t2"), "q") is not None
+        assert cache.invalidate(None) == 1
+
+    def test_put_skipped_after_concurrent_invalidation(self):
+        cache = RAGQueryCache()
+        generation = cache.generation
+        cache.invalidate("t1")
+        cache.put(cache_scope("t1"), "q", _result(), generation=generation)
+        assert cache.stats().size == 0
+
+    def test_hit_ratio(self):
+        cache = RAGQueryCache()
+        scope = cache_scope("t1")
+        cache.put(scope, "q", _result())
+        cache.get_exact(scope, "q")
+        cache.get_exact(scope, "other")
+        stats = cache.stats()
+        assert (stats.exact_hits, stats.misses) == (1, 1)
+        assert stats.hit_ratio == 0.5
+
+
+class TestRAGServiceCache:
+    async def test_exact_hit_skips_embedding(self, setup, embeddings: CountingEmbeddings):
+        rag, _, _ = setup
+        first = await rag.query(text="O que é fração?", tenant_id="t1")
+        assert first.cache_tier is None
+        assert embeddings.calls == 1
+
+        second = await rag.query(text="o que é  fração", tenant_id="t1")
+        assert embeddings.calls == 1
+        assert second.cache_tier == "exact"
+        assert second.query == "o que é  fração"
+        assert [r.id for r in second.results] == [r.id for r in first.results]
+        assert "cache" in second.stage_timings_ms
+
+    async def test_scoped_by_tenant_and_k(self, setup, embeddings: CountingEmbeddings):
+        rag, _, _ = setup
+        await rag.query(text="fração", tenant_id="t1")
+        assert (await rag.query(text="fração", tenant_id="t2")).cache_tier is None
+        assert (await rag.query(text="fração", tenant_id="t1", k=2)).cache_tier is None
+        assert (await rag.query(text="fração", tenant_id="t1")).cache_tier == "exact"
+
+    async def test_semantic_hit(self, setup, embeddings: CountingEmbeddings):
+        rag, cache, _ = setup
+        await rag.query(text="o que é fração", tenant_id="t1")
+        result = await rag.query(text="what is a fraction", tenant_id="t1")
+        assert result.cache_tier == "semantic"
+        assert cache.stats().semantic_hits == 1
+        unrelated = await rag.query(text="fotossíntese", tenant_id="t1")
+        assert unrelated.cache_tier is None
+
+    async def test_ingestion_invalidates_tenant(self, setup):
+        rag, _, ingestion = setup
+        await rag.query(text="fração", tenant_id="t1")
+        await rag.query(text="fração", tenant_id="t2")
+
+        await ingestion.ingest(text="Frações equivalentes", material_id="m2", tenant_id="t1")
+        assert (await rag.query(text="fração", tenant_id="t1")).cache_tier is None
+        assert (await rag.query(text="fração", tenant_id="t2")).cache_tier == "exact"
+
+        await ingestion.update_material(text="x", material_id="m2", tenant_id="t2")
+        assert (await rag.query(text="fração", tenant_id="t2")).cache_tier is None
+
+    async def test_use_cache_false_bypasses(self, setup, embeddings: CountingEmbeddings):
+        rag, cache, _ = setup
+        await rag.query(text="fração", tenant_id="t1", use_cache=False)
+        await rag.query(text="fração", tenant_id="t1", use_cache=False)
+        assert embeddings.calls == 2
+        assert cache.stats().size == 0
+
+    async def test_bus_event_invalidates(self, setup):
+        rag, cache, _ = setup
+        bus = InMemoryEventBus()
+        await cache.subscribe(bus, EVENT_INGESTION_COMPLETED)
+        await rag.query(text="fração", tenant_id="t1")
+        await bus.publish(EVENT_INGESTION_COMPLETED, {"material_id": "m9", "tenant_id": "t1"})
+        assert cache.stats().size == 0
+
+    async def test_metrics(self, setup):
+        rag, _, _ = setup
+        hits0 = rag_cache_requests_total.get(tier="exact", result="hit")
+        await rag.query(text="metrics probe", tenant_id="t1")
+        await rag.query(text="metrics probe", tenant_id="t1")
+        assert rag_cache_requests_total.get(tier="exact", result="hit") == hits0 + 1
+        assert "ailine_rag_cache_requests_total" in render_metrics()
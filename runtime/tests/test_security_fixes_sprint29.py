@@ -70,11 +70,11 @@ def _reset_auth_store() -> None:
 class TestParentProgressIDOR:
     """F-399: Verify parent can only see linked students' progress."""
 
-    def test_parent_without_linkage_denied(self) -> None:
+    async def test_parent_without_linkage_denied(self) -> None:
         """A parent with no linkage to a student is denied access."""
         store = ProgressStore()
         # Record some progress for student-1 by teacher-1
-        store.record_progress(
+        await store.record_progress(
             teacher_id="teacher-1",
             student_id="student-1",
             student_name="Student One",
@@ -83,29 +83,29 @@ class TestParentProgressIDOR:
             mastery_level="developing",
         )
         # Parent-99 is NOT linked to student-1
-        assert store.is_parent_linked("parent-99", "student-1") is False
+        assert (await store.is_parent_linked("parent-99", "student-1")) is False
 
-    def test_parent_with_linkage_allowed(self) -> None:
+    async def test_parent_with_linkage_allowed(self) -> None:
         """A parent linked to a student can see their progress."""
         store = ProgressStore()
-        store.link_parent_student("parent-1", "student-1")
-        assert store.is_parent_linked("parent-1", "student-1") is True
+        await store.link_parent_student("parent-1", "student-1")
+        assert (await store.is_parent_linked("parent-1", "student-1")) is True
 
-    def test_parent_cannot_see_unlinked_student(self) -> None:
+    async def test_parent_cannot_see_unlinked_student(self) -> None:
         """Even if a parent is linked to one student, they cannot see another."""
         store = ProgressStore()
-        store.link_parent_student("parent-1", "student-1")
+        await store.link_parent_student("parent-1", "student-1")
         # Parent-1 is linked to student-1 but NOT to student-2
-        assert store.is_parent_linked("parent-1", "student-1") is True
-        assert store.is_parent_linked("parent-1", "student-2") is False
+        assert (await store.is_parent_linked("parent-1", "student-1")) is True
+        assert (await store.is_parent_linked("parent-1", "student-2")) is False
 
-    def test_multiple_parents_can_link_same_student(self) -> None:
+    async def test_multiple_parents_can_link_same_student(self) -> None:
         """Multiple parents can be linked to the same student."""
         store = ProgressStore()
-        store.link_parent_student("parent-1", "student-1")
-        store.link_parent_student("parent-2", "student-1")
-        assert store.is_parent_linked("parent-1", "student-1") is True
-        assert store.is_parent_linked("parent-2", "student-1") is True
+        await store.link_parent_student("parent-1", "student-1")
+        await store.link_parent_student("parent-2", "student-1")
+        assert (await store.is_parent_linked("parent-1", "student-1")) is True
+        assert (await store.is_parent_linked("parent-2", "student-1")) is True
 
 
 # ---------------------------------------------------------------------------
@@ -9,15 +9,33 @@ Covers:
 - Score breakdown per dimension
 - RouteMetrics telemetry and ring buffer
 - Fallback chain logging
+- Hedged requests and latency-aware failover
+- Single-pass feature extraction and cached token estimates
 """
 
 from __future__ import annotations
 
-from typing import Any
+import asyncio
+import random
+import re
+import threading
+from typing import Any, ClassVar
 
 import pytest
 
+from ailine_runtime.adapters.llm import routing_types
 from ailine_runtime.adapters.llm.fake_llm import FakeChatLLM
+from ailine_runtime.adapters.llm.routing_types import (
+    estimate_tokens,
+    estimate_tokens_async,
+    extract_route_features,
+    latency_percentile,
+    score_history,
+    score_intent,
+    score_structured,
+    score_tokens,
+    score_tools,
+)
 from ailine_runtime.adapters.llm.smart_router import (
     DEFAULT_METRICS_CAPACITY,
     TIER_CHEAP_MAX,
@@ -36,6 +54,7 @@ from ailine_runtime.adapters.llm.smart_router import (
     SmartRouterConfig,
     compute_route,
 )
+from ailine_runtime.shared.metrics import llm_hedged_requests_total
 
 # ---------------------------------------------------------------------------
 # Fixtures
@@ -748,3 +767,215 @@ class TestConfigCacheTtlRemoved:
             metrics_capacity=50,
         )
         assert config.metrics_capacity == 50
+
+
+# ---------------------------------------------------------------------------
+# Hedged requests + latency-aware failover
+# ---------------------------------------------------------------------------
+
+
+class SlowLLM(FakeChatLLM):
+    """FakeChatLLM with a configurable delay/failure that records cancellation."""
+
+    def __init__(self, model: str, *, delay: float = 0.0, fail: bool = False) -> None:
+        super().__init__(model=model, responses=[f"{model} response"])
+        self.delay = delay
+        self.fail = fail
+        self.calls = 0
+        self.cancelled = 0
+
+    async def generate(self, messages: list[dict[str, Any]], **kwargs: Any) -> str:
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        if self.fail:
+            raise RuntimeError(f"{self.model_name} unavailable")
+        return await super().generate(messages, **kwargs)
+
+
+async def _one_token(messages: list[dict[str, Any]]) -> int:
+    return 1
+
+
+class TestHedging:
+    """Tests for hedged generate calls and degraded-provider skipping."""
+
+    @pytest.fixture(autouse=True)
+    def _no_tiktoken(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(
+            "ailine_runtime.adapters.llm.smart_router.estimate_tokens_async", _one_token
+        )
+
+    @staticmethod
+    def _router(cheap: SlowLLM, middle: SlowLLM, **overrides: Any) -> SmartRouterAdapter:
+        options: dict[str, Any] = {"hedge": True, "hedge_min_samples": 3, **overrides}
+        config = SmartRouterConfig(cheap_provider=cheap, middle_provider=middle, **options)
+        return SmartRouterAdapter(config)
+
+    @staticmethod
+    async def _warm_up(router: SmartRouterAdapter, n: int = 3) -> None:
+        for _ in range(n):
+            await router.generate([_user_msg("Oi")])
+
+    def test_latency_percentile(self):
+        samples = [float(i) for i in range(1, 101)]
+        assert latency_percentile(samples, 0.95) == 95.0
+        assert latency_percentile(samples, 0.5) == 50.0
+        assert latency_percentile([7.0], 0.95) == 7.0
+
+    @pytest.mark.asyncio
+    async def test_disabled_by_default(self):
+        cheap, middle = SlowLLM("cheap", delay=0.05), SlowLLM("middle")
+        router = SmartRouterAdapter(SmartRouterConfig(cheap_provider=cheap, middle_provider=middle))
+        assert await router.generate([_user_msg("Oi")]) == "cheap response"
+        assert middle.calls == 0
+
+    @pytest.mark.asyncio
+    async def test_no_hedge_without_latency_history(self):
+        cheap, middle = SlowLLM("cheap", delay=0.02), SlowLLM("middle")
+        router = self._router(cheap, middle)
+        assert await router.generate([_user_msg("Oi")]) == "cheap response"
+        assert middle.calls == 0
+        assert router.get_recent_metrics()[-1].hedged is False
+
+    @pytest.mark.asyncio
+    async def test_slow_provider_is_hedged_and_loser_cancelled(self):
+        cheap, middle = SlowLLM("cheap"), SlowLLM("middle")
+        router = self._router(cheap, middle)
+        await self._warm_up(router)
+        before = llm_hedged_requests_total.get(trigger="latency", winner="hedge")
+
+        cheap.delay = 1.0
+        result = await router.generate([_user_msg("Oi")])
+        await asyncio.sleep(0)
+
+        assert result == "middle response"
+        assert cheap.cancelled == 1
+        m = router.get_recent_metrics()[-1]
+        assert (m.hedged, m.provider_name, m.is_fallback, m.tier) == (True, "middle", True, "cheap")
+        assert llm_hedged_requests_total.get(trigger="latency", winner="hedge") == before + 1
+
+    @pytest.mark.asyncio
+    async def test_first_provider_still_wins_if_faster(self):
+        cheap, middle = SlowLLM("cheap"), SlowLLM("middle", delay=1.0)
+        router = self._router(cheap, middle)
+        await self._warm_up(router)
+
+        cheap.delay = 0.05
+        assert await router.generate([_user_msg("Oi")]) == "cheap response"
+        await asyncio.sleep(0)
+        assert middle.calls == 1
+        assert middle.cancelled == 1
+        assert router.get_recent_metrics()[-1].provider_name == "cheap"
+
+    @pytest.mark.asyncio
+    async def test_error_fails_over_immediately(self):
+        cheap, middle = SlowLLM("cheap", fail=True), SlowLLM("middle")
+        router = self._router(cheap, middle)
+        assert await router.generate([_user_msg("Oi")]) == "middle response"
+        assert router.get_recent_metrics()[-1].hedged is True
+
+    @pytest.mark.asyncio
+    async def test_all_providers_failing_raises_first_error(self):
+        cheap, middle = SlowLLM("cheap", fail=True), SlowLLM("middle", fail=True)
+        router = self._router(cheap, middle)
+        with pytest.raises(RuntimeError, match="cheap unavailable"):
+            await router.generate([_user_msg("Oi")])
+        assert router.get_recent_metrics() == []
+
+    @pytest.mark.asyncio
+    async def test_degraded_provider_is_skipped_until_probe(self):
+        cheap, middle = SlowLLM("cheap", delay=0.03), SlowLLM("middle")
+        router = self._router(cheap, middle, hedge=False, degraded_latency_ms=10.0)
+        await router.generate([_user_msg("Oi")])
+        assert router.get_provider_latency()["cheap"] >= 10.0
+
+        assert await router.generate([_user_msg("Oi")]) == "middle response"
+        assert cheap.calls == 1
+        assert router.get_recent_metrics()[-1].is_fallback is True
+
+        # Once the probe interval elapses the degraded provider gets a request
+        router._config.degraded_probe_interval_s = 0.0
+        cheap.delay = 0.0
+        await router.generate([_user_msg("Oi")])
+        assert cheap.calls == 2
+
+
+# ---------------------------------------------------------------------------
+# Single-pass feature extraction + token estimate cache
+# ---------------------------------------------------------------------------
+
+
+class TestSinglePassScoring:
+    """The combined extractor must match the per-dimension scorers."""
+
+    SAMPLES: ClassVar[list[list[dict[str, Any]]]] = [
+        [],
+        [_user_msg("Oi")],
+        [_user_msg("Analyze and compare this detailed rubric for students with ADHD")],
+        [_user_msg("x" * 3000), _user_msg("avaliar o currículo BNCC")],
+        [{"role": "system", "content": "s" * 9000}, _user_msg("oi")],
+        [{"role": "user", "content": [{"type": "text", "text": "multi-step scaffold"}]}],
+        [_user_msg(f"turn {i}") for i in range(12)],
+    ]
+
+    @pytest.mark.parametrize("messages", SAMPLES)
+    def test_matches_individual_scorers(self, messages: list[dict[str, Any]]):
+        kwargs = {"tools": [{"name": "t"}], "json_mode": True}
+        assert extract_route_features(messages, kwargs) == RouteFeatures(
+            token_score=score_tokens(messages),
+            structured_score=score_structured(kwargs),
+            tool_score=score_tools(kwargs),
+            history_score=score_history(messages),
+            intent_score=score_intent(messages),
+        )
+
+    def test_combined_regex_matches_per_category_regexes(self):
+        reference = [re.compile(alts, re.IGNORECASE) for _, alts in routing_types._COMPLEXITY_CATEGORIES]
+        words = [w for _, alts in routing_types._COMPLEXITY_CATEGORIES for w in alts.split("|")]
+        words += ["the", "plano", "aula", "x", "-"]
+        rng = random.Random(13)
+        for _ in range(500):
+            text = rng.choice(["", " "]).join(rng.choice(words) for _ in range(rng.randint(0, 8)))
+            expected = sum(1 for pat in reference if pat.search(text))
+            assert routing_types._intent_matches(text) == expected, text
+
+
+class TestTokenEstimateCache:
+    @pytest.fixture(autouse=True)
+    def _fake_bpe(self, monkeypatch: pytest.MonkeyPatch) -> list[tuple[str, str]]:
+        calls: list[tuple[str, str]] = []
+
+        def count_tokens(text: str, *, encoding: str = "cl100k_base") -> int:
+            calls.append((text, threading.current_thread().name))
+            return len(text) // 4
+
+        monkeypatch.setattr("ailine_runtime.app.token_counter.count_tokens", count_tokens)
+        monkeypatch.setattr(routing_types, "_token_cache", routing_types.OrderedDict())
+        return calls
+
+    def test_per_message_counts_are_cached(self, _fake_bpe: list[tuple[str, str]]):
+        history = [_user_msg("a" * 400), _user_msg("b" * 40)]
+        assert estimate_tokens(history) == 110
+        assert len(_fake_bpe) == 2
+
+        assert estimate_tokens([*history, _user_msg("c" * 80)]) == 130
+        assert [text[0] for text, _ in _fake_bpe] == ["a", "b", "c"]
+
+    def test_minimum_of_one_token(self):
+        assert estimate_tokens([]) == 1
+        assert estimate_tokens([_user_msg("")]) == 1
+
+    async def test_large_uncached_text_is_encoded_off_loop(self, _fake_bpe: list[tuple[str, str]]):
+        loop_thread = threading.current_thread().name
+        await estimate_tokens_async([_user_msg("short")])
+        await estimate_tokens_async([_user_msg("y" * 10_000)])
+        assert _fake_bpe[0][1] == loop_thread
+        assert _fake_bpe[1][1] != loop_thread
+
+        # Cached now: no further encode
+        assert await estimate_tokens_async([_user_msg("y" * 10_000)]) == 2500
+        assert len(_fake_bpe) == 2
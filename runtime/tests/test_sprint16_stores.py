@@ -5,6 +5,7 @@ Covers: ReviewStore (reviews + flags), ProgressStore (record, dashboard, student
 
 from __future__ import annotations
 
+import asyncio
 import threading
 
 from ailine_runtime.domain.entities.plan import ReviewStatus
@@ -156,9 +157,9 @@ class TestReviewStoreFlags:
 
 
 class TestProgressStoreRecord:
-    def test_record_new(self) -> None:
+    async def test_record_new(self) -> None:
         store = ProgressStore()
-        p = store.record_progress(
+        p = await store.record_progress(
             teacher_id="t1",
             student_id="s1",
             student_name="Alice",
@@ -173,9 +174,9 @@ class TestProgressStoreRecord:
         assert p.last_activity is not None
         assert p.progress_id  # non-empty UUID
 
-    def test_record_update_existing(self) -> None:
+    async def test_record_update_existing(self) -> None:
         store = ProgressStore()
-        first = store.record_progress(
+        first = await store.record_progress(
             teacher_id="t1",
             student_id="s1",
             student_name="Alice",
@@ -183,7 +184,7 @@ class TestProgressStoreRecord:
             standard_description="Fractions",
             mastery_level=MasteryLevel.DEVELOPING,
         )
-        second = store.record_progress(
+        second = await store.record_progress(
             teacher_id="t1",
             student_id="s1",
             student_name="Alice",
@@ -196,9 +197,9 @@ class TestProgressStoreRecord:
         assert second.mastery_level == MasteryLevel.PROFICIENT
         assert second.session_count == 2
 
-    def test_record_different_standards_are_separate(self) -> None:
+    async def test_record_different_standards_are_separate(self) -> None:
         store = ProgressStore()
-        store.record_progress(
+        await store.record_progress(
             teacher_id="t1",
             student_id="s1",
             student_name="Alice",
@@ -206,7 +207,7 @@ class TestProgressStoreRecord:
             standard_description="",
             mastery_level=MasteryLevel.DEVELOPING,
         )
-        store.record_progress(
+        await store.record_progress(
             teacher_id="t1",
             student_id="s1",
             student_name="Alice",
@@ -214,12 +215,12 @@ class TestProgressStoreRecord:
             standard_description="",
             mastery_level=MasteryLevel.MASTERED,
         )
-        records = store.get_student("t1", "s1")
+        records = await store.get_student("t1", "s1")
         assert len(records) == 2
 
-    def test_record_preserves_notes_on_update_if_empty(self) -> None:
+    async def test_record_preserves_notes_on_update_if_empty(self) -> None:
         store = ProgressStore()
-        store.record_progress(
+        await store.record_progress(
             teacher_id="t1",
             student_id="s1",
             student_name="Alice",
@@ -228,7 +229,7 @@ class TestProgressStoreRecord:
             mastery_level=MasteryLevel.DEVELOPING,
             notes="Initial note",
         )
-        updated = store.record_progress(
+        updated = await store.record_progress(
             teacher_id="t1",
             student_id="s1",
             student_name="Alice",
@@ -239,9 +240,9 @@ class TestProgressStoreRecord:
         )
         assert updated.notes == "Initial note"
 
-    def test_record_overwrites_notes_on_update(self) -> None:
+    async def test_record_overwrites_notes_on_update(self) -> None:
         store = ProgressStore()
-        store.record_progress(
+        await store.record_progress(
             teacher_id="t1",
             student_id="s1",
             student_name="Alice",
@@ -250,7 +251,7 @@ class TestProgressStoreRecord:
             mastery_level=MasteryLevel.DEVELOPING,
             notes="Old note",
         )
-        updated = store.record_progress(
+        updated = await store.record_progress(
             teacher_id="t1",
             student_id="s1",
             student_name="Alice",
@@ -263,40 +264,40 @@ class TestProgressStoreRecord:
 
 
 class TestProgressStoreDashboard:
-    def test_empty_dashboard(self) -> None:
+    async def test_empty_dashboard(self) -> None:
         store = ProgressStore()
-        dashboard = store.get_dashboard("t1")
+        dashboard = await store.get_dashboard("t1")
         assert dashboard.teacher_id == "t1"
         assert dashboard.total_students == 0
         assert dashboard.total_standards == 0
         assert dashboard.students == []
         assert dashboard.standards == []
 
-    def test_dashboard_aggregation(self) -> None:
+    async def test_dashboard_aggregation(self) -> None:
         store = ProgressStore()
-        store.record_progress(
+        await store.record_progress(
             "t1", "s1", "Alice", "C1", "Fractions", MasteryLevel.MASTERED
         )
-        store.record_progress(
+        await store.record_progress(
             "t1", "s1", "Alice", "C2", "Decimals", MasteryLevel.PROFICIENT
         )
-        store.record_progress(
+        await store.record_progress(
             "t1", "s2", "Bob", "C1", "Fractions", MasteryLevel.DEVELOPING
         )
 
-        dashboard = store.get_dashboard("t1")
+        dashboard = await store.get_dashboard("t1")
         assert dashboard.total_students == 2
         assert dashboard.total_standards == 2
         assert dashboard.mastery_distribution["mastered"] == 1
         assert dashboard.mastery_distribution["proficient"] == 1
         assert dashboard.mastery_distribution["developing"] == 1
 
-    def test_dashboard_student_summaries(self) -> None:
+    async def test_dashboard_student_summaries(self) -> None:
         store = ProgressStore()
-        store.record_progress("t1", "s1", "Alice", "C1", "", MasteryLevel.MASTERED)
-        store.record_progress("t1", "s1", "Alice", "C2", "", MasteryLevel.PROFICIENT)
+        await store.record_progress("t1", "s1", "Alice", "C1", "", MasteryLevel.MASTERED)
+        await store.record_progress("t1", "s1", "Alice", "C2", "", MasteryLevel.PROFICIENT)
 
-        dashboard = store.get_dashboard("t1")
+        dashboard = await store.get_dashboard("t1")
         assert len(dashboard.students) == 1
         alice = dashboard.students[0]
         assert alice.student_id == "s1"
@@ -305,16 +306,16 @@ class TestProgressStoreDashboard:
         assert alice.mastered_count == 1
         assert alice.proficient_count == 1
 
-    def test_dashboard_standard_summaries(self) -> None:
+    async def test_dashboard_standard_summaries(self) -> None:
         store = ProgressStore()
-        store.record_progress(
+        await store.record_progress(
             "t1", "s1", "Alice", "C1", "Fractions", MasteryLevel.MASTERED
         )
-        store.record_progress(
+        await store.record_progress(
             "t1", "s2", "Bob", "C1", "Fractions", MasteryLevel.DEVELOPING
         )
 
-        dashboard = store.get_dashboard("t1")
+        dashboard = await store.get_dashboard("t1")
         assert len(dashboard.standards) == 1
         std = dashboard.standards[0]
         assert std.standard_code == "C1"
@@ -322,39 +323,39 @@ class TestProgressStoreDashboard:
         assert std.mastered_count == 1
         assert std.developing_count == 1
 
-    def test_dashboard_isolation_between_teachers(self) -> None:
+    async def test_dashboard_isolation_between_teachers(self) -> None:
         store = ProgressStore()
-        store.record_progress("t1", "s1", "Alice", "C1", "", MasteryLevel.MASTERED)
-        store.record_progress("t2", "s2", "Bob", "C1", "", MasteryLevel.DEVELOPING)
+        await store.record_progress("t1", "s1", "Alice", "C1", "", MasteryLevel.MASTERED)
+        await store.record_progress("t2", "s2", "Bob", "C1", "", MasteryLevel.DEVELOPING)
 
-        d1 = store.get_dashboard("t1")
-        d2 = store.get_dashboard("t2")
+        d1 = await store.get_dashboard("t1")
+        d2 = await store.get_dashboard("t2")
         assert d1.total_students == 1
         assert d2.total_students == 1
 
 
 class TestProgressStoreGetStudent:
-    def test_get_student(self) -> None:
+    async def test_get_student(self) -> None:
         store = ProgressStore()
-        store.record_progress("t1", "s1", "Alice", "C1", "", MasteryLevel.MASTERED)
-        store.record_progress("t1", "s1", "Alice", "C2", "", MasteryLevel.DEVELOPING)
-        store.record_progress("t1", "s2", "Bob", "C1", "", MasteryLevel.PROFICIENT)
+        await store.record_progress("t1", "s1", "Alice", "C1", "", MasteryLevel.MASTERED)
+        await store.record_progress("t1", "s1", "Alice", "C2", "", MasteryLevel.DEVELOPING)
+        await store.record_progress("t1", "s2", "Bob", "C1", "", MasteryLevel.PROFICIENT)
 
-        records = store.get_student("t1", "s1")
+        records = await store.get_student("t1", "s1")
         assert len(records) == 2
         assert all(r.student_id == "s1" for r in records)
 
-    def test_get_student_empty(self) -> None:
+    async def test_get_student_empty(self) -> None:
         store = ProgressStore()
-        assert store.get_student("t1", "nonexistent") == []
+        assert await store.get_student("t1", "nonexistent") == []
 
-    def test_get_student_teacher_isolation(self) -> None:
+    async def test_get_student_teacher_isolation(self) -> None:
         store = ProgressStore()
-        store.record_progress("t1", "s1", "Alice", "C1", "", MasteryLevel.MASTERED)
-        store.record_progress("t2", "s1", "Alice", "C1", "", MasteryLevel.DEVELOPING)
+        await store.record_progress("t1", "s1", "Alice", "C1", "", MasteryLevel.MASTERED)
+        await store.record_progress("t2", "s1", "Alice", "C1", "", MasteryLevel.DEVELOPING)
 
-        t1_records = store.get_student("t1", "s1")
-        t2_records = store.get_student("t2", "s1")
+        t1_records = await store.get_student("t1", "s1")
+        t2_records = await store.get_student("t2", "s1")
         assert len(t1_records) == 1
         assert t1_records[0].mastery_level == MasteryLevel.MASTERED
         assert len(t2_records) == 1
@@ -367,20 +368,22 @@ class TestProgressStoreGetStudent:
 
 
 class TestProgressStoreThreadSafety:
-    def test_concurrent_writes(self) -> None:
+    async def test_concurrent_writes(self) -> None:
         store = ProgressStore()
         errors: list[Exception] = []
 
         def writer(student_id: str) -> None:
             try:
                 for i in range(20):
-                    store.record_progress(
-                        teacher_id="t1",
-                        student_id=student_id,
-                        student_name=f"Student {student_id}",
-                        standard_code=f"C{i}",
-                        standard_description="",
-                        mastery_level=MasteryLevel.DEVELOPING,
+                    asyncio.run(
+                        store.record_progress(
+                            teacher_id="t1",
+                            student_id=student_id,
+                            student_name=f"Student {student_id}",
+                            standard_code=f"C{i}",
+                            standard_description="",
+                            mastery_level=MasteryLevel.DEVELOPING,
+                        )
                     )
             except Exception as exc:
                 errors.append(exc)
@@ -392,7 +395,7 @@ class TestProgressStoreThreadSafety:
             t.join()
 
         assert errors == []
-        dashboard = store.get_dashboard("t1")
+        dashboard = await store.get_dashboard("t1")
         assert dashboard.total_students == 5
         # Each student has 20 standards
         assert sum(s.standards_count for s in dashboard.students) == 100
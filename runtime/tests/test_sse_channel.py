@@ -0,0 +1,247 @@
+"""Tests for the per-run SSE delivery channel.
+
+Covers:
+- In-order delivery; close drains before ending the stream.
+- Progress coalescing under pressure (latest per stage, seq stays monotonic).
+- Lifecycle and terminal events never shed; heartbeats dropped while busy.
+- Detach on disconnect: buffer discarded, reader woken, publishes ignored.
+- Queue depth / shed metrics, and 500 concurrent slow-client streams.
+- ``/plans/generate/stream`` delivering a progress-heavy run through the channel.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import json
+import os
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+from ailine_runtime.api.streaming.channel import SSEChannel
+from ailine_runtime.api.streaming.events import SSEEvent, SSEEventEmitter, SSEEventType
+from ailine_runtime.shared.metrics import (
+    render_metrics,
+    sse_events_shed_total,
+    sse_queue_depth,
+)
+
+# -- Helpers ------------------------------------------------------------------
+
+
+async def _collect(channel: SSEChannel) -> list[SSEEvent]:
+    channel.close()
+    return [event async for event in channel]
+
+
+def _run_of_progress(emitter: SSEEventEmitter, channel: SSEChannel, updates: int) -> None:
+    channel.publish(emitter.run_start())
+    for stage in ("planner", "executor"):
+        channel.publish(emitter.stage_start(stage))
+        for i in range(updates):
+            channel.publish(emitter.stage_progress(stage, {"pct": i}))
+        channel.publish(emitter.stage_complete(stage))
+    channel.publish(emitter.run_complete({}))
+
+
+# -- Tests ----------------------------------------------------------------------
+
+
+class TestDelivery:
+    async def test_in_order_without_pressure(self):
+        emitter = SSEEventEmitter("r1")
+        channel = SSEChannel("r1", capacity=100)
+        _run_of_progress(emitter, channel, updates=5)
+        events = await _collect(channel)
+        assert [e.seq for e in events] == list(range(1, emitter.seq + 1))
+        assert channel.stats()["coalesced"] == 0
+
+    async def test_reader_waits_for_events(self):
+        channel = SSEChannel("r1")
+        emitter = SSEEventEmitter("r1")
+        reader = asyncio.create_task(channel.get())
+        await asyncio.sleep(0)
+        assert not reader.done()
+        channel.publish(emitter.run_start())
+        event = await asyncio.wait_for(reader, timeout=1.0)
+        assert event is not None and event.type == SSEEventType.RUN_START
+
+    async def test_close_drains_then_ends(self):
+        channel = SSEChannel("r1")
+        emitter = SSEEventEmitter("r1")
+        channel.publish(emitter.run_start())
+        channel.close()
+        channel.publish(emitter.run_complete({}))  # ignored after close
+        assert [e.type for e in [e async for e in channel]] == [SSEEventType.RUN_START]
+        assert await channel.get() is None
+
+
+class TestBackPressure:
+    async def test_progress_coalesced_to_latest_per_stage(self):
+        emitter = SSEEventEmitter("r1")
+        channel = SSEChannel("r1", capacity=4)
+        before = sse_events_shed_total.get(reason="coalesced", type="stage.progress")
+        _run_of_progress(emitter, channel, updates=50)
+        events = await _collect(channel)
+
+        seqs = [e.seq for e in events]
+        assert seqs == sorted(seqs)
+        for stage in ("planner", "executor"):
+            progress = [
+                e for e in events if e.stage == stage and e.type == SSEEventType.STAGE_PROGRESS
+            ]
+            assert progress[-1].payload == {"pct": 49}
+        shed = channel.stats()["coalesced"]
+        assert shed > 0
+        assert len(events) == emitter.seq - shed
+        after = sse_events_shed_total.get(reason="coalesced", type="stage.progress")
+        assert after == before + shed
+
+    async def test_lifecycle_and_terminal_never_shed(self):
+        emitter = SSEEventEmitter("r1")
+        channel = SSEChannel("r1", capacity=1)
+        for i in range(20):
+            channel.publish(emitter.emit(SSEEventType.TOOL_START, "executor", {"i": i}))
+            channel.publish(emitter.stage_progress("executor", {"i": i}))
+        channel.publish(emitter.run_failed("boom", stage="pipeline"))
+        events = await _collect(channel)
+        assert sum(e.type == SSEEventType.TOOL_START for e in events) == 20
+        assert events[-1].type == SSEEventType.RUN_FAILED
+        # Buffer growth beyond capacity is the unsheddable events plus
+        # one pending progress per stage.
+        assert channel.stats()["peak_depth"] <= 20 + 1 + 1
+
+    async def test_heartbeat_dropped_only_while_busy(self):
+        emitter = SSEEventEmitter("r1")
+        channel = SSEChannel("r1")
+        channel.publish(emitter.heartbeat())
+        channel.publish(emitter.heartbeat())
+        assert channel.depth == 1
+        assert channel.stats()["dropped"] == 1
+        events = await _collect(channel)
+        assert [e.type for e in events] == [SSEEventType.HEARTBEAT]
+
+
+class TestDetach:
+    async def test_detach_discards_and_wakes_reader(self):
+        baseline = sse_queue_depth.get()
+        emitter = SSEEventEmitter("r1")
+        channel = SSEChannel("r1")
+        reader = asyncio.create_task(channel.get())
+        await asyncio.sleep(0)
+        channel.detach()
+        assert await asyncio.wait_for(reader, timeout=1.0) is None
+
+        channel.publish(emitter.run_start())
+        assert channel.depth == 0
+        assert sse_queue_depth.get() == baseline
+
+    async def test_detach_releases_buffered_depth(self):
+        baseline = sse_queue_depth.get()
+        emitter = SSEEventEmitter("r1")
+        channel = SSEChannel("r1")
+        _run_of_progress(emitter, channel, updates=10)
+        await channel.get()  # the gauge is synced as the client reads
+        assert sse_queue_depth.get() == baseline + channel.depth
+        channel.detach()
+        assert sse_queue_depth.get() == baseline
+        assert await channel.get() is None
+
+
+class TestMetricsAndLoad:
+    def test_metrics_rendered(self):
+        text = render_metrics()
+        assert "# TYPE ailine_sse_queue_depth gauge" in text
+        assert "# TYPE ailine_sse_streams_open gauge" in text
+        assert "# TYPE ailine_sse_events_shed_total counter" in text
+
+    async def test_500_concurrent_slow_streams(self):
+        baseline = sse_queue_depth.get()
+        streams = 500
+
+        async def producer(emitter: SSEEventEmitter, channel: SSEChannel) -> None:
+            channel.publish(emitter.run_start())
+            for stage in ("planner", "executor"):
+                channel.publish(emitter.stage_start(stage))
+                for i in range(40):
+                    channel.publish(emitter.stage_progress(stage, {"pct": i}))
+                    if i % 10 == 0:
+                        await asyncio.sleep(0)
+                channel.publish(emitter.stage_complete(stage))
+            channel.publish(emitter.run_complete({}))
+            channel.close()
+
+        async def consumer(channel: SSEChannel) -> list[str]:
+            types = []
+            async for event in channel:
+                event.to_sse_data()
+                types.append(event.type.value)
+                await asyncio.sleep(0.001)  # slow client
+            return types
+
+        pairs = [
+            (SSEEventEmitter(f"r{i}"), SSEChannel(f"r{i}", capacity=8)) for i in range(streams)
+        ]
+        results = await asyncio.gather(
+            *(consumer(c) for _, c in pairs), *(producer(e, c) for e, c in pairs)
+        )
+        for types in results[:streams]:
+            assert types[0] == "run.started"
+            assert types[-1] == "run.completed"
+            assert types.count("stage.completed") == 2
+        # capacity + the six lifecycle events + one pending progress per stage
+        assert all(c.stats()["peak_depth"] <= 8 + 6 + 2 for _, c in pairs)
+        assert sse_queue_depth.get() == baseline
+
+
+class TestStreamEndpoint:
+    def test_progress_heavy_run_delivers_lifecycle(self):
+        from fastapi.testclient import TestClient
+
+        from ailine_runtime.api.app import create_app
+        from ailine_runtime.shared.config import Settings
+
+        async def _ainvoke(init_state: dict, config: dict | None = None) -> dict:
+            configurable = (config or {}).get("configurable", {})
+            emitter = configurable["sse_emitter"]
+            writer = configurable["stream_writer"]
+            writer(emitter.emit(SSEEventType.STAGE_START, "planner"))
+            for i in range(2000):
+                writer(emitter.stage_progress("planner", {"pct": i}))
+            writer(emitter.emit(SSEEventType.STAGE_COMPLETE, "planner"))
+            return {"final": {"parsed": {"score": 90}}}
+
+        workflow = MagicMock()
+        workflow.ainvoke = _ainvoke
+        factory = MagicMock()
+        factory.from_container = MagicMock(return_value=MagicMock())
+
+        os.environ["AILINE_DEV_MODE"] = "true"
+        app = create_app(Settings(anthropic_api_key="", openai_api_key="", google_api_key=""))
+        with (
+            patch(
+                "ailine_runtime.api.routers.plans_stream.build_plan_workflow",
+                return_value=workflow,
+            ),
+            patch("ailine_runtime.api.routers.plans_stream.AgentDepsFactory", factory),
+            TestClient(app) as client,
+        ):
+            response = client.post(
+                "/plans/generate/stream",
+                json={"run_id": "progress-heavy", "user_prompt": "Many updates"},
+                headers={"X-Teacher-ID": "teacher-test"},
+            )
+
+        assert response.status_code == 200
+        events: list[dict[str, Any]] = [
+            json.loads(line[len("data:") :])
+            for line in response.text.splitlines()
+            if line.startswith("data:")
+        ]
+        types = [e["type"] for e in events]
+        assert types[0] == "run.started"
+        assert types[-1] == "run.completed"
+        assert "stage.started" in types and "stage.completed" in types
+        progress = [e for e in events if e["type"] == "stage.progress"]
+        assert progress[-1]["payload"] == {"pct": 1999}
+        seqs = [e["seq"] for e in events]
+        assert seqs == sorted(seqs)
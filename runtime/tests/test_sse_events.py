@@ -170,6 +170,60 @@ class TestSSEEvent:
         assert data["payload"]["metadata"]["nested"]["deep"] is True
 
 
+class TestSSEEventSerialization:
+    """Fast encoding path: compact envelope, cached, pydantic fallback."""
+
+    def test_matches_pydantic_serialization(self) -> None:
+        emitter = SSEEventEmitter('run-"quoted"')
+        event = emitter.stage_progress("planner", {"msg": "ção", "n": [1, 2.5, None]})
+        assert json.loads(event.to_sse_data()) == json.loads(event.model_dump_json())
+
+    def test_compact_envelope_in_field_order(self) -> None:
+        event = SSEEventEmitter("r1").emit(SSEEventType.STAGE_START, "planner")
+        data = event.to_sse_data()
+        assert data.startswith('{"run_id":"r1","seq":1,"ts":"')
+        assert data.endswith('"type":"stage.started","stage":"planner","payload":{}}')
+
+    def test_encoded_once(self) -> None:
+        event = SSEEventEmitter("r1").run_start({"prompt": "p"})
+        assert event.to_sse_data() is event.to_sse_data()
+
+    def test_cache_does_not_affect_equality(self) -> None:
+        event = SSEEventEmitter("r1").run_start()
+        event.to_sse_data()
+        assert SSEEvent(**event.model_dump()) == event
+
+    def test_assignment_and_copy_invalidate_cache(self) -> None:
+        event = SSEEventEmitter("r1").run_start()
+        event.to_sse_data()
+        copied = event.model_copy(update={"seq": 7})
+        assert json.loads(copied.to_sse_data())["seq"] == 7
+        event.stage = "other"
+        assert json.loads(event.to_sse_data())["stage"] == "other"
+
+    def test_ts_is_json_escaped(self) -> None:
+        ts = 'not-iso "quoted" \\ts'
+        event = SSEEvent(run_id="r1", seq=1, ts=ts, type=SSEEventType.HEARTBEAT, stage="x")
+        assert json.loads(event.to_sse_data())["ts"] == ts
+
+    def test_unsupported_payload_values_fall_back_to_pydantic(self) -> None:
+        event = SSEEventEmitter("r1").emit(
+            SSEEventType.TOOL_COMPLETE, "executor", {"tags": {"a"}, "big": 2**70}
+        )
+        data = json.loads(event.to_sse_data())
+        assert data["payload"] == {"tags": ["a"], "big": 2**70}
+
+    def test_emitter_accepts_string_event_type(self) -> None:
+        event = SSEEventEmitter("r1").emit("stage.progress", "planner")  # type: ignore[arg-type]
+        assert event.type is SSEEventType.STAGE_PROGRESS
+
+    def test_emitter_copies_payload(self) -> None:
+        payload = {"step": 1}
+        event = SSEEventEmitter("r1").stage_progress("planner", payload)
+        payload["step"] = 2
+        assert json.loads(event.to_sse_data())["payload"] == {"step": 1}
+
+
 # ---------------------------------------------------------------------------
 # SSEEventEmitter
 # ---------------------------------------------------------------------------
@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import asyncio
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
@@ -98,6 +99,29 @@ class TestInMemoryReplayStore:
         await store.mark_terminal("run-1", "completed")
         assert await store.is_terminal("run-1") is True
 
+    @pytest.mark.asyncio
+    async def test_terminal_run_expires_after_ttl(self):
+        store = InMemoryReplayStore(ReplayConfig(ttl_seconds=0))
+        await store.bind_owner("run-1", "teacher-1")
+        await store.append("run-1", 1, '{"a":1}')
+        await store.mark_terminal("run-1", "completed")
+        assert [e async for e in store.tail("run-1")] == [(1, '{"a":1}')]
+        assert store._signals == {}
+
+        await store.bind_owner("run-2", "teacher-1")
+        assert await store.owner("run-1") is None
+        assert await store.replay("run-1") == []
+        assert await store.is_terminal("run-1") is False
+        assert store._expiry == {}
+
+    @pytest.mark.asyncio
+    async def test_live_run_is_kept(self, store):
+        await store.bind_owner("run-1", "teacher-1")
+        await store.mark_terminal("run-2", "completed")
+        assert await store.owner("run-1") == "teacher-1"
+        assert await store.owner("run-2") is None
+        assert await store.is_terminal("run-2") is True
+
 
 # ---------------------------------------------------------------------------
 # RedisReplayStore unit tests (mocked Redis dependency)
@@ -116,12 +140,11 @@ class TestRedisReplayStore:
         pipeline itself, and execute() is async.
         """
         redis = AsyncMock()
+        redis.script_load.return_value = "flush-sha"
         # pipeline() is sync -- returns a pipeline object, not a coroutine
         pipeline = MagicMock()
-        pipeline.zadd = MagicMock(return_value=pipeline)
-        pipeline.zremrangebyrank = MagicMock(return_value=pipeline)
-        pipeline.expire = MagicMock(return_value=pipeline)
-        pipeline.execute = AsyncMock(return_value=[1, 0, True, True])
+        pipeline.evalsha = MagicMock(return_value=pipeline)
+        pipeline.execute = AsyncMock(return_value=[1])
         redis.pipeline = MagicMock(return_value=pipeline)
         return redis
 
@@ -129,15 +152,10 @@ class TestRedisReplayStore:
     def store(self, mock_redis):
         """Create a RedisReplayStore with injected mock Redis client.
 
-        We bypass __init__ (which does a real redis import) and manually
-        set the internal attributes to avoid needing redis installed.
+        ``from_client`` bypasses __init__ (which does a real redis import).
         """
         config = ReplayConfig(keep_last=50, ttl_seconds=120, prefix="test")
-        s = object.__new__(RedisReplayStore)
-        s._redis = mock_redis
-        s._config = config
-        s._prefix = config.prefix
-        return s
+        return RedisReplayStore.from_client(mock_redis, config)
 
     def test_key_generation(self, store):
         """Verify key format: {prefix}:{run_id}:{suffix}."""
@@ -169,36 +187,49 @@ class TestRedisReplayStore:
         assert isinstance(result, int)
 
     async def test_append(self, store, mock_redis):
-        """append() uses a pipeline with zadd, zremrangebyrank, and expire calls."""
+        """append() buffers; flush() writes one script call per run in a pipeline."""
         await store.append("run-1", 5, '{"type":"stage.started"}')
+        mock_redis.pipeline.assert_not_called()
+
+        await store.flush()
 
         pipeline = mock_redis.pipeline.return_value
-        mock_redis.pipeline.assert_called_once_with(transaction=True)
-        pipeline.zadd.assert_called_once_with(
-            "test:run-1:events",
-            {'5|{"type":"stage.started"}': 5.0},
-        )
-        pipeline.zremrangebyrank.assert_called_once_with(
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        mock_redis.script_load.assert_awaited_once()
+        pipeline.evalsha.assert_called_once_with(
+            "flush-sha",
+            2,
             "test:run-1:events",
-            0,
-            -51,  # -(keep_last + 1)
+            "test:run-1:seq",
+            50,  # keep_last
+            120,  # ttl
+            "test:run-1:notify",
+            5,  # last seq (notification)
+            5,
+            '5|{"type":"stage.started"}',
         )
-        # Two expire calls: events key and seq key
-        assert pipeline.expire.call_count == 2
-        expire_calls = pipeline.expire.call_args_list
-        assert expire_calls[0].args == ("test:run-1:events", 120)
-        assert expire_calls[1].args == ("test:run-1:seq", 120)
         pipeline.execute.assert_awaited_once()
 
     async def test_append_member_format(self, store, mock_redis):
         """Verify the ZSET member is formatted as '{seq}|{payload}'."""
         await store.append("run-x", 99, '{"data":"hello"}')
+        await store.flush()
 
         pipeline = mock_redis.pipeline.return_value
-        zadd_args = pipeline.zadd.call_args
-        mapping = zadd_args.args[1]
-        assert '99|{"data":"hello"}' in mapping
-        assert mapping['99|{"data":"hello"}'] == 99.0
+        args = pipeline.evalsha.call_args.args
+        assert args[-2:] == (99, '99|{"data":"hello"}')
+
+    async def test_append_stores_event_envelope_verbatim(self, store, mock_redis):
+        """Serialized events already embed their seq: no "{seq}|" re-wrapping."""
+        envelope = '{"run_id":"r","seq":4,"type":"stage.started"}'
+        await store.append("run-x", 4, envelope)
+        await store.flush()
+
+        args = mock_redis.pipeline.return_value.evalsha.call_args.args
+        assert args[-2:] == (4, envelope)
+
+        mock_redis.zrange.return_value = [(envelope, 4.0)]
+        assert await store.replay("run-x") == [(4, envelope)]
 
     async def test_replay_all(self, store, mock_redis):
         """replay() without after_seq calls zrange and parses members."""
@@ -387,3 +418,197 @@ class TestRedisReplayStore:
                     sys.modules.pop(k, None)
                 else:
                     sys.modules[k] = v
+
+
+# ---------------------------------------------------------------------------
+# RedisReplayStore write-behind batching
+# ---------------------------------------------------------------------------
+
+
+class TestRedisReplayBatching:
+    @pytest.fixture()
+    def mock_redis(self):
+        redis = AsyncMock()
+        redis.script_load.return_value = "flush-sha"
+        redis.set.return_value = True
+        pipeline = MagicMock()
+        pipeline.evalsha = MagicMock(return_value=pipeline)
+        pipeline.execute = AsyncMock(return_value=[1])
+        redis.pipeline = MagicMock(return_value=pipeline)
+        return redis
+
+    def _store(self, mock_redis, **overrides):
+        config = ReplayConfig(prefix="test", **overrides)
+        return RedisReplayStore.from_client(mock_redis, config)
+
+    async def test_window_batches_runs_into_one_pipeline(self, mock_redis):
+        store = self._store(mock_redis, batch_window_ms=10)
+        for seq in range(1, 4):
+            await store.append("run-a", seq, "{}")
+        await store.append("run-b", 1, "{}")
+        mock_redis.pipeline.assert_not_called()
+
+        await asyncio.sleep(0.05)
+
+        mock_redis.pipeline.assert_called_once_with(transaction=False)
+        pipeline = mock_redis.pipeline.return_value
+        assert pipeline.evalsha.call_count == 2  # one script call per run
+        run_a = pipeline.evalsha.call_args_list[0].args
+        assert run_a[2] == "test:run-a:events"
+        assert run_a[7] == 3  # notification carries the last seq
+        assert run_a[8:] == (1, "1|{}", 2, "2|{}", 3, "3|{}")
+        pipeline.execute.assert_awaited_once()
+
+    async def test_full_buffer_flushes_immediately(self, mock_redis):
+        store = self._store(mock_redis, batch_window_ms=60_000, batch_max_events=3)
+        for seq in range(1, 4):
+            await store.append("run-a", seq, "{}")
+        mock_redis.pipeline.return_value.execute.assert_awaited_once()
+
+    async def test_zero_window_writes_through(self, mock_redis):
+        store = self._store(mock_redis, batch_window_ms=0)
+        await store.append("run-a", 1, "{}")
+        await store.append("run-a", 2, "{}")
+        assert mock_redis.pipeline.return_value.execute.await_count == 2
+
+    async def test_mark_terminal_flushes_first(self, mock_redis):
+        store = self._store(mock_redis, batch_window_ms=60_000)
+        order: list[str] = []
+        mock_redis.pipeline.return_value.execute.side_effect = lambda: order.append("flush")
+        mock_redis.set.side_effect = lambda *a, **k: order.append("terminal") or True
+
+        await store.append("run-a", 7, '{"type":"run.completed"}')
+        assert await store.mark_terminal("run-a", "completed") is True
+        assert order == ["flush", "terminal"]
+
+    async def test_replay_flushes_pending_run(self, mock_redis):
+        store = self._store(mock_redis, batch_window_ms=60_000)
+        mock_redis.zrange.return_value = [("1|{}", 1.0)]
+        await store.append("run-a", 1, "{}")
+        assert await store.replay("run-a") == [(1, "{}")]
+        mock_redis.pipeline.return_value.execute.assert_awaited_once()
+
+    async def test_mark_terminal_and_replay_wait_for_inflight_flush(self, mock_redis):
+        store = self._store(mock_redis, batch_window_ms=60_000)
+        order: list[str] = []
+        release = asyncio.Event()
+
+        async def slow_execute() -> None:
+            await release.wait()
+            order.append("flush")
+
+        mock_redis.pipeline.return_value.execute.side_effect = slow_execute
+        mock_redis.set.side_effect = lambda *a, **k: order.append("terminal") or True
+        mock_redis.zrange.side_effect = lambda *a, **k: order.append("read") or []
+
+        await store.append("run-a", 1, "{}")
+        inflight = asyncio.create_task(store.flush())
+        await asyncio.sleep(0)
+        assert store._pending == {}  # batch taken, write in flight
+        reader = asyncio.create_task(store.replay("run-a"))
+        terminal = asyncio.create_task(store.mark_terminal("run-a", "completed"))
+        await asyncio.sleep(0.01)
+        assert order == []
+
+        release.set()
+        await asyncio.gather(inflight, reader, terminal)
+        assert order[0] == "flush"
+        assert sorted(order[1:]) == ["read", "terminal"]
+
+    async def test_reloads_script_after_noscript(self, mock_redis):
+        from redis.exceptions import NoScriptError
+
+        store = self._store(mock_redis, batch_window_ms=0)
+        pipeline = mock_redis.pipeline.return_value
+        pipeline.execute.side_effect = [NoScriptError("NOSCRIPT"), [1]]
+        await store.append("run-a", 1, "{}")
+        assert mock_redis.script_load.await_count == 2
+        assert pipeline.execute.await_count == 2
+
+    async def test_transient_pipeline_error_is_retried(self, mock_redis):
+        store = self._store(mock_redis, batch_window_ms=60_000)
+        pipeline = mock_redis.pipeline.return_value
+        pipeline.execute.side_effect = [ConnectionError("blip"), [1]]
+        await store.append("run-a", 1, "{}")
+        assert await store.mark_terminal("run-a", "completed") is True
+        assert pipeline.execute.await_count == 2
+        assert store._pending == {}
+        mock_redis.set.assert_awaited_once()
+
+    async def test_failed_flush_keeps_batch_ahead_of_newer_events(self, mock_redis):
+        store = self._store(mock_redis, batch_window_ms=60_000)
+        pipeline = mock_redis.pipeline.return_value
+        await store.append("run-a", 1, "{}")
+        await store.append("run-a", 2, "{}")
+
+        async def failing_execute() -> None:
+            if pipeline.execute.await_count == 1:
+                # Events appended while the write is in flight
+                store._pending["run-a"] = [(3, "{}")]
+                store._pending["run-b"] = [(1, "{}")]
+            raise TimeoutError("redis timeout")
+
+        pipeline.execute.side_effect = failing_execute
+        with pytest.raises(TimeoutError):
+            await store.flush()
+        assert pipeline.execute.await_count == 3  # retried with backoff
+        assert store._pending == {
+            "run-a": [(1, "{}"), (2, "{}"), (3, "{}")],
+            "run-b": [(1, "{}")],
+        }
+
+    async def test_failed_flush_is_written_by_the_next_one(self, mock_redis):
+        store = self._store(mock_redis, batch_window_ms=60_000)
+        pipeline = mock_redis.pipeline.return_value
+        pipeline.execute.side_effect = ConnectionError("down")
+        await store.append("run-a", 1, "{}")
+        with pytest.raises(ConnectionError):
+            await store.mark_terminal("run-a", "completed")
+        mock_redis.set.assert_not_awaited()
+
+        pipeline.execute.side_effect = None
+        pipeline.evalsha.reset_mock()
+        assert await store.mark_terminal("run-a", "completed") is True
+        assert pipeline.evalsha.call_args.args[8:] == (1, "1|{}")
+        assert store._pending == {}
+
+    async def test_flush_metrics(self, mock_redis):
+        from ailine_runtime.shared.metrics import replay_flush_duration, replay_flush_events
+
+        def _count(histogram) -> int:
+            return sum(data["_count"] for _, data in histogram.collect())
+
+        def _sum(histogram) -> float:
+            return sum(data["_sum"] for _, data in histogram.collect())
+
+        flushes, events = _count(replay_flush_events), _sum(replay_flush_events)
+        durations = _count(replay_flush_duration)
+        store = self._store(mock_redis, batch_window_ms=60_000)
+        for seq in range(1, 6):
+            await store.append("run-a", seq, "{}")
+        await store.flush()
+        await store.flush()  # nothing pending: not recorded
+        assert _count(replay_flush_events) == flushes + 1
+        assert _sum(replay_flush_events) == events + 5
+        assert _count(replay_flush_duration) == durations + 1
+
+    async def test_flush_script_against_fakeredis(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        pytest.importorskip("lupa")
+        client = fakeredis.FakeAsyncRedis(decode_responses=True)
+        store = RedisReplayStore.from_client(
+            client, ReplayConfig(prefix="lua", keep_last=3, ttl_seconds=60)
+        )
+        pubsub = client.pubsub()
+        await pubsub.subscribe("lua:run-1:notify")
+        await pubsub.get_message(timeout=1.0)  # subscribe confirmation
+        for seq in range(1, 6):
+            await store.append("run-1", seq, f'{{"seq":{seq}}}')
+        await store.flush()
+
+        assert [seq for seq, _ in await store.replay("run-1")] == [3, 4, 5]
+        assert 0 < await client.ttl("lua:run-1:events") <= 60
+        message = await pubsub.get_message(ignore_subscribe_messages=True, timeout=1.0)
+        assert message is not None and message["data"] == "5"
+        await pubsub.aclose()
+        await store.close()
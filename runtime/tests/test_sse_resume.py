@@ -0,0 +1,414 @@
+"""Tests for resumable plan streams and cross-node fan-out (ADR-054).
+
+Covers:
+- ``tail()`` on the in-memory store: backfill, live follow, terminal, idle.
+- ``persist_events``: terminal marker set after the terminal event.
+- ``GET /plans/runs/{run_id}/events``: Last-Event-ID / after_seq resume,
+  tenant isolation.
+- Redis replay store shared by two nodes (fakeredis), and a multi-process
+  harness: the pipeline runs in a subprocess (node A) while this process
+  (node B) follows it through the endpoint.  Uses ``AILINE_TEST_REDIS_URL``
+  when set, otherwise a fakeredis TCP server.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import json
+import os
+import socket
+import subprocess
+import sys
+import threading
+import uuid
+from typing import Any
+from unittest.mock import MagicMock, patch
+
+import pytest
+from fastapi.testclient import TestClient
+
+from ailine_runtime.api.streaming.channel import SSEChannel
+from ailine_runtime.api.streaming.events import SSEEventEmitter, SSEEventType
+from ailine_runtime.api.streaming.replay import (
+    InMemoryReplayStore,
+    RedisReplayStore,
+    ReplayConfig,
+    persist_events,
+)
+from ailine_runtime.shared.config import RedisConfig, Settings, SSEConfig
+
+_AUTH = {"X-Teacher-ID": "teacher-test"}
+
+# -- Helpers ------------------------------------------------------------------
+
+
+def _settings(**kwargs: Any) -> Settings:
+    os.environ["AILINE_DEV_MODE"] = "true"
+    return Settings(anthropic_api_key="", openai_api_key="", google_api_key="", **kwargs)
+
+
+def _parse_sse(raw: str) -> list[tuple[int, dict[str, Any]]]:
+    """(id, data) pairs of an SSE response body."""
+    events: list[tuple[int, dict[str, Any]]] = []
+    event_id = -1
+    for line in raw.splitlines():
+        if line.startswith("id:"):
+            event_id = int(line[len("id:") :].strip())
+        elif line.startswith("data:"):
+            events.append((event_id, json.loads(line[len("data:") :])))
+    return events
+
+
+def _mock_workflow() -> MagicMock:
+    async def _ainvoke(init_state: dict, config: dict | None = None) -> dict:
+        configurable = (config or {}).get("configurable", {})
+        emitter = configurable["sse_emitter"]
+        writer = configurable["stream_writer"]
+        for stage in ("planner", "executor"):
+            writer(emitter.stage_start(stage))
+            writer(emitter.stage_complete(stage))
+        return {"final": {"parsed": {"score": 88}}}
+
+    workflow = MagicMock()
+    workflow.ainvoke = _ainvoke
+    return workflow
+
+
+@contextlib.contextmanager
+def _patched_pipeline():
+    factory = MagicMock()
+    factory.from_container = MagicMock(return_value=MagicMock())
+    with (
+        patch(
+            "ailine_runtime.api.routers.plans_stream.build_plan_workflow",
+            return_value=_mock_workflow(),
+        ),
+        patch("ailine_runtime.api.routers.plans_stream.AgentDepsFactory", factory),
+    ):
+        yield
+
+
+async def _drain(store: Any, run_id: str, after_seq: int | None = None) -> list[int]:
+    return [seq async for seq, _ in store.tail(run_id, after_seq, idle_timeout=5.0)]
+
+
+# -- In-memory tail -------------------------------------------------------------
+
+
+class TestInMemoryTail:
+    async def test_backfill_then_follow_until_terminal(self):
+        store = InMemoryReplayStore()
+        await store.append("r1", 1, '{"seq":1}')
+        reader = asyncio.create_task(_drain(store, "r1"))
+        await asyncio.sleep(0)
+        for seq in (2, 3):
+            await store.append("r1", seq, f'{{"seq":{seq}}}')
+            await asyncio.sleep(0)
+        await store.mark_terminal("r1", "completed")
+        assert await asyncio.wait_for(reader, timeout=1.0) == [1, 2, 3]
+
+    async def test_resume_after_seq(self):
+        store = InMemoryReplayStore()
+        for seq in range(1, 6):
+            await store.append("r1", seq, "{}")
+        await store.mark_terminal("r1", "completed")
+        assert await _drain(store, "r1", after_seq=3) == [4, 5]
+
+    async def test_idle_timeout_ends_tail(self):
+        store = InMemoryReplayStore()
+        await store.append("r1", 1, "{}")
+        seqs = [seq async for seq, _ in store.tail("r1", idle_timeout=0.05)]
+        assert seqs == [1]
+
+    async def test_owner(self):
+        store = InMemoryReplayStore()
+        assert await store.owner("r1") is None
+        await store.bind_owner("r1", "teacher-a")
+        assert await store.owner("r1") == "teacher-a"
+
+    async def test_run_id_cannot_be_taken_over(self):
+        store = InMemoryReplayStore()
+        assert await store.bind_owner("r1", "teacher-a") is True
+        await store.append("r1", 1, "{}")
+        assert await store.bind_owner("r1", "teacher-b") is False
+        assert await store.owner("r1") == "teacher-a"
+        assert await store.replay("r1") == [(1, "{}")]
+
+    async def test_reclaiming_own_run_id_starts_fresh(self):
+        store = InMemoryReplayStore()
+        await store.bind_owner("r1", "teacher-a")
+        await store.append("r1", 1, "{}")
+        await store.mark_terminal("r1", "completed")
+        assert await store.bind_owner("r1", "teacher-a") is True
+        assert await store.replay("r1") == []
+        assert await store.is_terminal("r1") is False
+
+
+class TestPersistEvents:
+    async def test_marks_terminal_after_terminal_event(self):
+        store = InMemoryReplayStore()
+        emitter = SSEEventEmitter("r1")
+        channel = SSEChannel("r1")
+        writer = asyncio.create_task(persist_events(store, "r1", channel))
+        channel.publish(emitter.run_start())
+        channel.publish(emitter.run_failed("boom", stage="pipeline"))
+        channel.close()
+        await writer
+
+        stored = await store.replay("r1")
+        assert [json.loads(p)["type"] for _, p in stored] == ["run.started", "run.failed"]
+        assert await store.is_terminal("r1")
+
+    async def test_store_errors_do_not_stop_the_writer(self):
+        store = InMemoryReplayStore()
+        emitter = SSEEventEmitter("r1")
+        channel = SSEChannel("r1")
+        calls = 0
+        original = store.append
+
+        async def flaky_append(run_id: str, seq: int, payload: str) -> None:
+            nonlocal calls
+            calls += 1
+            if calls == 1:
+                raise ConnectionError("redis down")
+            await original(run_id, seq, payload)
+
+        store.append = flaky_append  # type: ignore[method-assign]
+        channel.publish(emitter.run_start())
+        channel.publish(emitter.run_complete({}))
+        channel.close()
+        await persist_events(store, "r1", channel)
+        assert [seq for seq, _ in await store.replay("r1")] == [2]
+        assert await store.is_terminal("r1")
+
+
+# -- Resume endpoint --------------------------------------------------------------
+
+
+class TestResumeEndpoint:
+    def test_resume_with_last_event_id(self):
+        from ailine_runtime.api.app import create_app
+
+        app = create_app(_settings())
+        with _patched_pipeline(), TestClient(app) as client:
+            live = client.post(
+                "/plans/generate/stream",
+                json={"run_id": "resume-1", "user_prompt": "Resume me"},
+                headers=_AUTH,
+            )
+            resumed = client.get(
+                "/plans/runs/resume-1/events", headers={**_AUTH, "Last-Event-ID": "2"}
+            )
+            by_query = client.get("/plans/runs/resume-1/events?after_seq=4", headers=_AUTH)
+
+        live_events = _parse_sse(live.text)
+        assert [i for i, e in live_events] == [e["seq"] for _, e in live_events]
+        resumed_events = _parse_sse(resumed.text)
+        assert resumed.status_code == 200
+        assert [e["seq"] for _, e in resumed_events] == [
+            e["seq"] for _, e in live_events if e["seq"] > 2 and e["type"] != "heartbeat"
+        ]
+        assert resumed_events[-1][1]["type"] == SSEEventType.RUN_COMPLETE
+        assert all(e["seq"] > 4 for _, e in _parse_sse(by_query.text))
+
+    def test_other_tenant_and_unknown_run_are_not_found(self):
+        from ailine_runtime.api.app import create_app
+
+        app = create_app(_settings())
+        with _patched_pipeline(), TestClient(app) as client:
+            client.post(
+                "/plans/generate/stream",
+                json={"run_id": "resume-2", "user_prompt": "Mine"},
+                headers=_AUTH,
+            )
+            other = client.get(
+                "/plans/runs/resume-2/events", headers={"X-Teacher-ID": "teacher-other"}
+            )
+            unknown = client.get("/plans/runs/no-such-run/events", headers=_AUTH)
+
+        assert other.status_code == 404
+        assert unknown.status_code == 404
+
+    def test_same_run_id_from_another_teacher_is_rejected(self):
+        from ailine_runtime.api.app import create_app
+
+        app = create_app(_settings())
+        with _patched_pipeline(), TestClient(app) as client:
+            mine = client.post(
+                "/plans/generate/stream",
+                json={"run_id": "resume-4", "user_prompt": "Mine"},
+                headers=_AUTH,
+            )
+            theirs = client.post(
+                "/plans/generate/stream",
+                json={"run_id": "resume-4", "user_prompt": "Theirs"},
+                headers={"X-Teacher-ID": "teacher-other"},
+            )
+            resumed = client.get("/plans/runs/resume-4/events", headers=_AUTH)
+            other = client.get(
+                "/plans/runs/resume-4/events", headers={"X-Teacher-ID": "teacher-other"}
+            )
+
+        assert theirs.status_code == 409
+        assert other.status_code == 404
+        assert [e for _, e in _parse_sse(resumed.text)] == [
+            e for _, e in _parse_sse(mine.text) if e["type"] != "heartbeat"
+        ]
+        assert "Theirs" not in resumed.text
+
+    def test_replay_store_error_is_unavailable(self):
+        from ailine_runtime.api.app import create_app
+
+        app = create_app(_settings())
+        with TestClient(app) as client:
+            broken = MagicMock()
+            broken.owner.side_effect = ConnectionError("redis down")
+            app.state.replay_store = broken
+            resp = client.get("/plans/runs/resume-3/events", headers=_AUTH)
+
+        assert resp.status_code == 503
+
+
+# -- Redis: shared store across nodes ---------------------------------------------
+
+
+class TestRedisSharedStore:
+    async def test_node_b_follows_node_a(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        config = ReplayConfig(prefix=f"test-{uuid.uuid4().hex}")
+        node_a = RedisReplayStore.from_client(
+            fakeredis.FakeAsyncRedis(server=server, decode_responses=True), config
+        )
+        node_b = RedisReplayStore.from_client(
+            fakeredis.FakeAsyncRedis(server=server, decode_responses=True), config
+        )
+
+        reader = asyncio.create_task(_drain(node_b, "run-x"))
+        await asyncio.sleep(0.05)
+        emitter = SSEEventEmitter("run-x")
+        channel = SSEChannel("run-x")
+        writer = asyncio.create_task(persist_events(node_a, "run-x", channel))
+        channel.publish(emitter.run_start())
+        channel.publish(emitter.stage_start("planner"))
+        await asyncio.sleep(0.05)
+        channel.publish(emitter.run_complete({}))
+        channel.close()
+        await writer
+
+        assert await asyncio.wait_for(reader, timeout=5.0) == [1, 2, 3]
+        assert await _drain(node_b, "run-x", after_seq=1) == [2, 3]
+
+    async def test_owner_claim_is_shared_across_nodes(self):
+        fakeredis = pytest.importorskip("fakeredis")
+        server = fakeredis.FakeServer()
+        config = ReplayConfig(prefix=f"test-{uuid.uuid4().hex}", batch_window_ms=0)
+        node_a = RedisReplayStore.from_client(
+            fakeredis.FakeAsyncRedis(server=server, decode_responses=True), config
+        )
+        node_b = RedisReplayStore.from_client(
+            fakeredis.FakeAsyncRedis(server=server, decode_responses=True), config
+        )
+
+        assert await node_a.bind_owner("run-y", "teacher-a") is True
+        await node_a.append("run-y", 1, "{}")
+        await node_a.mark_terminal("run-y", "completed")
+        assert await node_b.bind_owner("run-y", "teacher-b") is False
+        assert await node_b.owner("run-y") == "teacher-a"
+        assert await node_b.replay("run-y") == [(1, "{}")]
+
+        assert await node_b.bind_owner("run-y", "teacher-a") is True
+        assert await node_a.replay("run-y") == []
+        assert await node_a.is_terminal("run-y") is False
+
+
+# -- Multi-process harness -------------------------------------------------------
+
+_NODE_A = """
+import asyncio
+import sys
+
+from ailine_runtime.api.streaming.channel import SSEChannel
+from ailine_runtime.api.streaming.events import SSEEventEmitter
+from ailine_runtime.api.streaming.replay import RedisReplayStore, persist_events
+
+
+async def main(url: str, run_id: str, teacher_id: str) -> None:
+    store = RedisReplayStore(url)
+    await store.bind_owner(run_id, teacher_id)
+    emitter = SSEEventEmitter(run_id)
+    channel = SSEChannel(run_id)
+    writer = asyncio.create_task(persist_events(store, run_id, channel))
+    channel.publish(emitter.run_start())
+    await asyncio.sleep(0.05)
+    print("started", flush=True)
+    for stage in ("planner", "executor", "validate"):
+        channel.publish(emitter.stage_start(stage))
+        await asyncio.sleep(0.1)
+        channel.publish(emitter.stage_complete(stage))
+    channel.publish(emitter.run_complete({"score": 90}))
+    channel.close()
+    await writer
+    await store.close()
+
+
+asyncio.run(main(*sys.argv[1:4]))
+"""
+
+
+@pytest.fixture(scope="module")
+def redis_url():
+    url = os.getenv("AILINE_TEST_REDIS_URL")
+    if url:
+        yield url
+        return
+    pytest.importorskip("redis")
+    fakeredis = pytest.importorskip("fakeredis")
+    server_cls = getattr(fakeredis, "TcpFakeServer", None)
+    if server_cls is None:
+        pytest.skip("fakeredis without TcpFakeServer")
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+    server = server_cls(("127.0.0.1", port), server_type="redis")
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"redis://127.0.0.1:{port}/0"
+    server.shutdown()
+    server.server_close()
+
+
+class TestMultiProcess:
+    def test_run_on_node_a_watched_from_node_b(self, redis_url: str):
+        from ailine_runtime.api.app import create_app
+
+        run_id = f"xnode-{uuid.uuid4().hex[:12]}"
+        app = create_app(
+            _settings(sse=SSEConfig(replay="redis"), redis=RedisConfig(url=redis_url))
+        )
+        node_a = subprocess.Popen(
+            [sys.executable, "-c", _NODE_A, redis_url, run_id, "teacher-test"],
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        try:
+            assert node_a.stdout is not None
+            assert node_a.stdout.readline().strip() == "started"
+            with TestClient(app) as client:
+                # Joins mid-run on node B and follows it to the end
+                live = client.get(f"/plans/runs/{run_id}/events", headers=_AUTH)
+                resumed = client.get(
+                    f"/plans/runs/{run_id}/events", headers={**_AUTH, "Last-Event-ID": "3"}
+                )
+            assert node_a.wait(timeout=30) == 0
+        finally:
+            if node_a.poll() is None:
+                node_a.kill()
+
+        assert live.status_code == 200
+        events = _parse_sse(live.text)
+        assert [seq for seq, _ in events] == list(range(1, 9))
+        assert events[0][1]["type"] == "run.started"
+        assert events[-1][1]["type"] == "run.completed"
+        assert [seq for seq, _ in _parse_sse(resumed.text)] == list(range(4, 9))
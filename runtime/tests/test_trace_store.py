@@ -1,12 +1,16 @@
-"""Tests for the in-memory TraceStore."""
+"""Tests for the TraceStore backends (in-memory and SqlTraceStore)."""
 
 from __future__ import annotations
 
+import asyncio
+from unittest.mock import AsyncMock
+
 import pytest
 
 from ailine_runtime.domain.entities.trace import NodeTrace, RouteRationale
 from ailine_runtime.shared.trace_store import (
     TraceStore,
+    build_trace_store,
     get_trace_store,
     reset_trace_store,
 )
@@ -198,3 +202,262 @@ class TestSingleton:
         s1 = get_trace_store()
         s2 = get_trace_store()
         assert s1 is s2
+
+
+class TestIndexedEviction:
+    """Recency order, per-teacher index and pagination of the in-memory store."""
+
+    @pytest.mark.asyncio
+    async def test_touch_protects_from_capacity_eviction(self) -> None:
+        store = TraceStore(max_entries=2)
+        await store.get_or_create("run-1")
+        await store.get_or_create("run-2")
+        await store.update_run("run-1", status="completed")  # run-2 is now oldest
+        await store.get_or_create("run-3")
+        assert await store.get("run-2", teacher_id="") is None
+        assert await store.get("run-1", teacher_id="") is not None
+
+    @pytest.mark.asyncio
+    async def test_list_recent_per_teacher_newest_first(self) -> None:
+        store = TraceStore()
+        for i in range(6):
+            await store.get_or_create(f"run-{i}", teacher_id=f"t-{i % 2}")
+        await store.update_run("run-0", status="completed")
+        recent = await store.list_recent(teacher_id="t-0")
+        assert [t.run_id for t in recent] == ["run-0", "run-4", "run-2"]
+        page = await store.list_recent(limit=1, teacher_id="t-0", offset=1)
+        assert [t.run_id for t in page] == ["run-4"]
+        assert await store.count(teacher_id="t-0") == 3
+        assert await store.count(teacher_id="t-0", status="running") == 2
+        assert await store.list_recent(teacher_id="nobody") == []
+
+    @pytest.mark.asyncio
+    async def test_owner_assigned_later_is_indexed(self) -> None:
+        store = TraceStore()
+        await store.get_or_create("run-1")
+        await store.get_or_create("run-1", teacher_id="t-1")
+        assert [t.run_id for t in await store.list_recent(teacher_id="t-1")] == ["run-1"]
+        assert await store.list_recent(teacher_id="") == []
+
+    @pytest.mark.asyncio
+    async def test_evicted_runs_leave_the_teacher_index(self) -> None:
+        store = TraceStore(max_entries=1)
+        await store.get_or_create("run-1", teacher_id="t-1")
+        await store.get_or_create("run-2", teacher_id="t-2")
+        assert await store.count(teacher_id="t-1") == 0
+        assert store._by_teacher.keys() == {"t-2"}
+
+
+class TestSqlTraceStore:
+    """SqlTraceStore against aiosqlite (same contract, durable)."""
+
+    @pytest.fixture
+    def sql_store(self, session_factory):
+        from ailine_runtime.adapters.db.trace_store import SqlTraceStore
+
+        return SqlTraceStore(session_factory, batch_window_ms=1000.0)
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, sql_store) -> None:
+        created = await sql_store.get_or_create("run-1", teacher_id="t-1")
+        assert created.status == "running"
+        assert created.created_at.endswith("+00:00")
+        await sql_store.append_node(
+            "run-1",
+            NodeTrace(
+                node="planner",
+                time_ms=12.5,
+                route_rationale=RouteRationale(tier="primary", weighted_scores={"token": 0.5}),
+            ),
+        )
+        await sql_store.append_node("run-1", NodeTrace(node="executor"))
+        await sql_store.update_run(
+            "run-1", status="completed", final_score=90, scorecard={"k": 1}, bogus=1
+        )
+        trace = await sql_store.get("run-1", teacher_id="t-1")
+        assert trace is not None
+        assert trace.status == "completed"
+        assert trace.final_score == 90
+        assert trace.scorecard == {"k": 1}
+        assert [n.node for n in trace.nodes] == ["planner", "executor"]
+        assert trace.nodes[0].route_rationale is not None
+        assert trace.nodes[0].route_rationale.tier == "primary"
+
+    @pytest.mark.asyncio
+    async def test_nodes_are_batched_until_flush(self, sql_store, session_factory) -> None:
+        from sqlalchemy import func, select
+
+        from ailine_runtime.adapters.db.models import NodeTraceRow
+
+        await sql_store.get_or_create("run-1", teacher_id="t-1")
+        for i in range(3):
+            await sql_store.append_node("run-1", NodeTrace(node=f"n{i}"), teacher_id="t-1")
+
+        async def stored() -> int:
+            async with session_factory() as session:
+                return (await session.execute(select(func.count(NodeTraceRow.id)))).scalar_one()
+
+        assert await stored() == 0
+        await sql_store.flush()
+        assert await stored() == 3
+
+    @pytest.mark.asyncio
+    async def test_survives_restart(self, sql_store, session_factory) -> None:
+        from ailine_runtime.adapters.db.trace_store import SqlTraceStore
+
+        await sql_store.get_or_create("run-1", teacher_id="t-1")
+        await sql_store.append_node("run-1", NodeTrace(node="planner"))
+        await sql_store.close()
+
+        restarted = SqlTraceStore(session_factory)
+        trace = await restarted.get("run-1", teacher_id="t-1")
+        assert trace is not None
+        assert [n.node for n in trace.nodes] == ["planner"]
+
+    @pytest.mark.asyncio
+    async def test_tenant_isolation_and_no_implicit_creation(self, sql_store) -> None:
+        await sql_store.get_or_create("run-1", teacher_id="t-1")
+        await sql_store.update_run("run-1", teacher_id="t-2", status="failed")
+        await sql_store.append_node("run-1", NodeTrace(node="x"), teacher_id="t-2")
+        await sql_store.append_node("ghost", NodeTrace(node="x"))
+        await sql_store.update_run("ghost", status="completed")
+
+        assert await sql_store.get("run-1", teacher_id="t-2") is None
+        trace = await sql_store.get("run-1", teacher_id="t-1")
+        assert trace is not None
+        assert trace.status == "running"
+        assert trace.nodes == []
+        assert await sql_store.get("ghost", teacher_id="") is None
+
+    @pytest.mark.asyncio
+    async def test_list_recent_and_count(self, sql_store) -> None:
+        for i in range(5):
+            await sql_store.get_or_create(f"run-{i}", teacher_id="t-1")
+        await sql_store.get_or_create("other", teacher_id="t-2")
+        await sql_store.update_run("run-1", status="completed")
+
+        recent = await sql_store.list_recent(limit=3, teacher_id="t-1")
+        assert [t.run_id for t in recent] == ["run-1", "run-4", "run-3"]
+        page = await sql_store.list_recent(limit=2, teacher_id="t-1", offset=3)
+        assert [t.run_id for t in page] == ["run-2", "run-0"]
+        completed = await sql_store.list_recent(teacher_id="t-1", status="completed")
+        assert [t.run_id for t in completed] == ["run-1"]
+        assert await sql_store.count(teacher_id="t-1") == 5
+        assert await sql_store.count(teacher_id="t-1", status="running") == 4
+        assert await sql_store.count() == 6
+
+    @pytest.mark.asyncio
+    async def test_expired_runs_hidden_and_purged(self, session_factory) -> None:
+        from ailine_runtime.adapters.db.trace_store import SqlTraceStore
+
+        store = SqlTraceStore(session_factory, ttl_seconds=0, batch_window_ms=0)
+        await store.get_or_create("run-1", teacher_id="t-1")
+        await store.append_node("run-1", NodeTrace(node="planner"))
+        assert await store.get("run-1", teacher_id="t-1") is None
+        assert await store.list_recent(teacher_id="t-1") == []
+
+        store._last_purge = 0.0
+        await store.get_or_create("run-2", teacher_id="t-1")  # triggers the purge
+        fresh = SqlTraceStore(session_factory)
+        assert await fresh.count() == 1
+        assert await fresh.get("run-1", teacher_id="t-1") is None
+
+
+class _FlakySessions:
+    """Session factory whose next *failures* commits raise a DB error."""
+
+    def __init__(self, factory) -> None:
+        self._factory = factory
+        self.failures = 0
+        self.gate: asyncio.Event | None = None
+
+    def __call__(self):
+        from sqlalchemy.exc import OperationalError
+
+        session = self._factory()
+        commit = session.commit
+        if self.failures:
+            self.failures -= 1
+            session.commit = AsyncMock(side_effect=OperationalError("COMMIT", {}, OSError("db down")))
+        elif self.gate is not None:
+            gate = self.gate
+
+            async def gated_commit() -> None:
+                await gate.wait()
+                await commit()
+
+            session.commit = gated_commit
+        return session
+
+
+class TestSqlTraceStoreFlushFailures:
+    @pytest.fixture
+    def sessions(self, session_factory):
+        return _FlakySessions(session_factory)
+
+    @pytest.fixture
+    async def sql_store(self, sessions):
+        from ailine_runtime.adapters.db.trace_store import SqlTraceStore
+
+        store = SqlTraceStore(sessions, batch_window_ms=1000.0)
+        await store.get_or_create("run-1", teacher_id="t-1")
+        return store
+
+    @pytest.mark.asyncio
+    async def test_transient_failure_is_retried(self, sql_store, sessions) -> None:
+        await sql_store.append_node("run-1", NodeTrace(node="planner"))
+        sessions.failures = 1
+        await sql_store.flush()
+        assert sql_store._pending == {}
+        trace = await sql_store.get("run-1", teacher_id="t-1")
+        assert trace is not None
+        assert [n.node for n in trace.nodes] == ["planner"]
+
+    @pytest.mark.asyncio
+    async def test_failed_flush_keeps_the_batch(self, sql_store, sessions) -> None:
+        from sqlalchemy.exc import OperationalError
+
+        await sql_store.append_node("run-1", NodeTrace(node="planner"))
+        sessions.failures = 3
+        with pytest.raises(OperationalError):
+            await sql_store.flush()
+        await sql_store.append_node("run-1", NodeTrace(node="executor"))
+
+        trace = await sql_store.get("run-1", teacher_id="t-1")
+        assert trace is not None
+        assert [n.node for n in trace.nodes] == ["planner", "executor"]
+
+    @pytest.mark.asyncio
+    async def test_read_waits_for_inflight_flush(self, sql_store, sessions) -> None:
+        await sql_store.append_node("run-1", NodeTrace(node="planner"))
+        release = sessions.gate = asyncio.Event()
+        inflight = asyncio.create_task(sql_store.flush())
+        await asyncio.sleep(0.01)
+        sessions.gate = None
+        assert sql_store._pending == {}  # batch taken, write in flight
+        reader = asyncio.create_task(sql_store.get("run-1", teacher_id="t-1"))
+        await asyncio.sleep(0.01)
+        assert not reader.done()
+
+        release.set()
+        await inflight
+        trace = await reader
+        assert trace is not None
+        assert [n.node for n in trace.nodes] == ["planner"]
+
+
+class TestBuildTraceStore:
+    def test_memory_by_default(self) -> None:
+        from ailine_runtime.shared.config import Settings
+
+        store = build_trace_store(Settings())
+        assert isinstance(store, TraceStore)
+
+    def test_db_backend(self) -> None:
+        from ailine_runtime.adapters.db.trace_store import SqlTraceStore
+        from ailine_runtime.shared.config import DatabaseConfig, Settings, TraceConfig
+
+        settings = Settings(
+            db=DatabaseConfig(url="sqlite+aiosqlite://"), trace=TraceConfig(store="db")
+        )
+        assert isinstance(build_trace_store(settings), SqlTraceStore)
@@ -0,0 +1,235 @@
+"""Tests for streaming, segmented TTS synthesis.
+
+Covers:
+- Sentence/line segmentation and overlong-sentence splitting.
+- In-order delivery with bounded concurrent synthesis and cancellation.
+- Content-addressed segment cache: keys, byte-bounded LRU, metrics.
+- WAV segment merging into one playable stream.
+- ``stream=true`` on ``/v1/tts/synthesize`` and ``/media/synthesize``.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import struct
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from fastapi import FastAPI
+from httpx import ASGITransport, AsyncClient
+
+from ailine_runtime.adapters.media.fake_tts import FakeTTS
+from ailine_runtime.app.services.tts_stream import (
+    StreamingSynthesizer,
+    TTSSegmentCache,
+    audio_byte_stream,
+    build_streaming_synthesizer,
+    reset_tts_segment_cache,
+    split_segments,
+)
+from ailine_runtime.shared.config import TTSConfig
+from ailine_runtime.shared.metrics import (
+    render_metrics,
+    tts_segment_cache_requests_total,
+    tts_time_to_first_audio,
+)
+
+# -- Helpers ------------------------------------------------------------------
+
+
+class RecordingTTS:
+    """TTS whose latency shrinks with position, so later segments finish first."""
+
+    voice_id = "voice-a"
+    model_id = "model-x"
+
+    def __init__(self, delays: dict[str, float] | None = None) -> None:
+        self.delays = delays or {}
+        self.calls: list[str] = []
+        self.active = 0
+        self.peak = 0
+
+    async def synthesize(self, text: str, *, locale: str = "pt-BR", speed: float = 1.0) -> bytes:
+        self.calls.append(text)
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        try:
+            await asyncio.sleep(self.delays.get(text, 0.0))
+        finally:
+            self.active -= 1
+        return f"<{text}>".encode()
+
+
+@pytest.fixture(autouse=True)
+def _fresh_cache():
+    reset_tts_segment_cache()
+    yield
+    reset_tts_segment_cache()
+
+
+async def _collect(stream: Any) -> list[bytes]:
+    return [chunk async for chunk in stream]
+
+
+# -- Tests ----------------------------------------------------------------------
+
+
+class TestSplitSegments:
+    def test_sentences_and_lines(self):
+        text = "Olá, turma! Hoje: frações.\nPausa\n\nPasso 1. Leia o texto?"
+        assert split_segments(text) == [
+            "Olá, turma!",
+            "Hoje:",
+            "frações.",
+            "Pausa",
+            "Passo 1.",
+            "Leia o texto?",
+        ]
+
+    def test_overlong_sentence_split_at_comma_or_space(self):
+        text = "um, dois, três, quatro, cinco, seis, sete"
+        segments = split_segments(text, max_chars=12)
+        assert all(len(s) <= 12 for s in segments)
+        assert " ".join(segments) == text
+
+    def test_empty_text(self):
+        assert split_segments("  \n ") == []
+
+
+class TestStreamingSynthesizer:
+    async def test_in_order_despite_out_of_order_completion(self):
+        tts = RecordingTTS({"Um.": 0.05, "Dois.": 0.02, "Três.": 0.0})
+        synth = StreamingSynthesizer(tts, max_concurrency=3)
+        chunks = await _collect(synth.stream("Um. Dois. Três."))
+        assert chunks == [b"<Um.>", b"<Dois.>", b"<Tr\xc3\xaas.>"]
+        assert tts.peak == 3
+
+    async def test_concurrency_bounded(self):
+        tts = RecordingTTS({f"S{i}.": 0.01 for i in range(8)})
+        synth = StreamingSynthesizer(tts, max_concurrency=2)
+        await _collect(synth.stream(" ".join(f"S{i}." for i in range(8))))
+        assert tts.peak == 2
+
+    async def test_lookahead_bounds_work_ahead_of_consumer(self):
+        tts = RecordingTTS()
+        synth = StreamingSynthesizer(tts, max_concurrency=2, max_lookahead=3)
+        stream = synth.stream(" ".join(f"S{i}." for i in range(20)))
+        assert await anext(stream) == b"<S0.>"
+        await asyncio.sleep(0.05)  # slow reader: synthesis must not run on
+        assert tts.calls == ["S0.", "S1.", "S2."]
+        assert await anext(stream) == b"<S1.>"
+        await asyncio.sleep(0.05)
+        assert tts.calls[-1] == "S3."
+        rest = await _collect(stream)
+        assert len(rest) == 18
+        assert len(tts.calls) == 20
+
+    async def test_close_cancels_pending_segments(self):
+        tts = RecordingTTS({"Lento.": 5.0})
+        synth = StreamingSynthesizer(tts, max_concurrency=4)
+        stream = synth.stream("Rápido. Lento. Lento.")
+        assert await anext(stream) == "<Rápido.>".encode()
+        await asyncio.wait_for(stream.aclose(), timeout=1.0)
+        assert tts.active == 0
+
+    async def test_time_to_first_audio_observed(self):
+        before = sum(d["_count"] for _, d in tts_time_to_first_audio.collect())
+        await _collect(StreamingSynthesizer(RecordingTTS()).stream("Oi."))
+        after = sum(d["_count"] for _, d in tts_time_to_first_audio.collect())
+        assert after == before + 1
+        assert "ailine_tts_time_to_first_audio_seconds_bucket" in render_metrics()
+
+
+class TestSegmentCache:
+    async def test_repeated_phrases_skip_synthesis(self):
+        tts = RecordingTTS()
+        synth = StreamingSynthesizer(tts, cache=TTSSegmentCache())
+        hits0 = tts_segment_cache_requests_total.get(result="hit")
+        await _collect(synth.stream("Passo 1. Pausa\nPasso 2. Pausa"))
+        assert tts.calls.count("Pausa") == 1
+        await _collect(synth.stream("Pausa"))
+        assert tts.calls.count("Pausa") == 1
+        assert tts_segment_cache_requests_total.get(result="hit") == hits0 + 1
+
+    def test_key_covers_voice_model_locale_speed(self):
+        base = {"voice": "v", "model": "m", "locale": "pt-BR", "speed": 1.0, "text": "Oi"}
+        key = TTSSegmentCache.key(**base)
+        for field, value in (("voice", "w"), ("model", "n"), ("locale", "en"), ("speed", 1.5)):
+            assert TTSSegmentCache.key(**{**base, field: value}) != key
+
+    def test_lru_bounded_in_bytes(self):
+        cache = TTSSegmentCache(max_bytes=10)
+        cache.put("a", b"12345")
+        cache.put("b", b"12345")
+        cache.get("a")
+        cache.put("c", b"12345")
+        assert cache.get("b") is None
+        assert cache.get("a") == b"12345"
+        assert cache.size_bytes == 10
+        cache.put("huge", b"x" * 11)
+        assert len(cache) == 2
+
+    def test_disabled_by_zero_budget(self):
+        synth = build_streaming_synthesizer(FakeTTS(), TTSConfig(segment_cache_max_bytes=0))
+        assert synth._cache is None
+
+
+class TestAudioByteStream:
+    async def test_wav_segments_merged(self):
+        synth = StreamingSynthesizer(FakeTTS(), max_concurrency=2)
+        media_type, body = await audio_byte_stream(synth.stream("Um. Dois."))
+        audio = b"".join(await _collect(body))
+        single = await FakeTTS().synthesize("Um.")
+        assert media_type == "audio/wav"
+        assert audio[:4] == b"RIFF" and audio[8:12] == b"WAVE"
+        assert struct.unpack_from("<I", audio, 40)[0] == 0xFFFFFFFF
+        # One 44-byte header followed by both segments' PCM data
+        assert len(audio) == 44 + 2 * (len(single) - 44)
+
+    async def test_non_wav_passed_through(self):
+        media_type, body = await audio_byte_stream(
+            StreamingSynthesizer(RecordingTTS()).stream("A. B.")
+        )
+        assert media_type == "audio/mpeg"
+        assert b"".join(await _collect(body)) == b"<A.><B.>"
+
+
+class TestStreamingEndpoints:
+    @staticmethod
+    def _app(router: Any, prefix: str, auth: Any) -> FastAPI:
+        app = FastAPI()
+        container = MagicMock()
+        container.tts = FakeTTS()
+        app.state.container = container
+        app.dependency_overrides[auth] = lambda: "teacher-test-1"
+        app.include_router(router, prefix=prefix)
+        return app
+
+    async def test_v1_tts_stream(self):
+        from ailine_runtime.api.routers.tts import router
+        from ailine_runtime.app.authz import require_teacher_or_admin
+
+        app = self._app(router, "/v1/tts", require_teacher_or_admin)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            resp = await client.post(
+                "/v1/tts/synthesize",
+                json={"text": "Olá. Tudo bem?", "language": "pt-BR", "stream": True},
+            )
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "audio/wav"
+        assert "content-length" not in resp.headers
+        assert resp.content[:4] == b"RIFF"
+
+    async def test_media_stream(self):
+        from ailine_runtime.api.routers.media import router
+        from ailine_runtime.app.authz import require_authenticated
+
+        app = self._app(router, "/media", require_authenticated)
+        async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
+            resp = await client.post(
+                "/media/synthesize", json={"text": "Pausa\nPasso 1.", "stream": True}
+            )
+        assert resp.status_code == 200
+        assert resp.headers["content-type"] == "audio/wav"
+        assert resp.content[:4] == b"RIFF"
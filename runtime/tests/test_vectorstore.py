@@ -3,22 +3,34 @@
 Covers:
 - InMemoryVectorStore: upsert, search, delete, filters, edge cases.
 - IngestionService: chunking, end-to-end pipeline with FakeEmbeddings.
-- RAGService: query, filtering, threshold behavior.
+- RAGService: query, filtering, threshold behavior, hybrid RRF retrieval.
 """
 
 from __future__ import annotations
 
+import asyncio
+
+import numpy as np
 import pytest
 
 from ailine_runtime.adapters.embeddings.fake_embeddings import FakeEmbeddings
+from ailine_runtime.adapters.events.inmemory_bus import InMemoryEventBus
 from ailine_runtime.adapters.vectorstores.inmemory_store import InMemoryVectorStore
 from ailine_runtime.app.services.ingestion import (
     ChunkingConfig,
     IngestionService,
+    PipelineConfig,
+    _window_count,
     chunk_text,
 )
-from ailine_runtime.app.services.rag import RAGService
-from ailine_runtime.domain.ports.vectorstore import VectorSearchResult, VectorStore
+from ailine_runtime.app.services.rag import RAGService, reciprocal_rank_fusion
+from ailine_runtime.domain.ports.vectorstore import (
+    BulkVectorStore,
+    LexicalSearch,
+    VectorRecord,
+    VectorSearchResult,
+    VectorStore,
+)
 
 # =============================================================================
 # InMemoryVectorStore tests
@@ -293,6 +305,165 @@ class TestStoreClear:
         assert store.count == 0
 
 
+class TestMatrixLayout:
+    """Matrix-backed storage: top-k, row reuse, indexes, dimension checks."""
+
+    async def test_top_k_matches_brute_force(self, store: InMemoryVectorStore):
+        rng = np.random.default_rng(7)
+        vecs = rng.standard_normal((500, 16)).astype(np.float32)
+        await store.upsert(
+            ids=[f"c{i}" for i in range(500)],
+            embeddings=vecs.tolist(),
+            texts=[f"t{i}" for i in range(500)],
+            metadatas=[{} for _ in range(500)],
+        )
+        query = rng.standard_normal(16).astype(np.float32)
+        results = await store.search(query_embedding=query.tolist(), k=10)
+
+        normed = vecs / np.linalg.norm(vecs, axis=1, keepdims=True)
+        expected = np.argsort(-(normed @ (query / np.linalg.norm(query))))[:10]
+        assert [r.id for r in results] == [f"c{i}" for i in expected]
+
+    async def test_matrix_grows_beyond_initial_capacity(self):
+        store = InMemoryVectorStore(initial_capacity=2)
+        await store.upsert(
+            ids=[f"c{i}" for i in range(5)],
+            embeddings=[[1.0, float(i)] for i in range(5)],
+            texts=["x"] * 5,
+            metadatas=[{}] * 5,
+        )
+        assert store.count == 5
+        results = await store.search(query_embedding=[1.0, 0.0], k=5)
+        assert results[0].id == "c0"
+        assert len(results) == 5
+
+    async def test_deleted_row_is_reused(self, store: InMemoryVectorStore):
+        await store.upsert(
+            ids=["a", "b"],
+            embeddings=[[1, 0], [0, 1]],
+            texts=["a", "b"],
+            metadatas=[{"k": "a"}, {"k": "b"}],
+        )
+        await store.delete(ids=["a"])
+        await store.upsert(
+            ids=["c"], embeddings=[[1, 0]], texts=["c"], metadatas=[{"k": "c"}]
+        )
+        results = await store.search(query_embedding=[1, 0], k=10)
+        assert [r.id for r in results] == ["c", "b"]
+        assert await store.search(query_embedding=[1, 0], k=10, filters={"k": "a"}) == []
+
+    async def test_overwrite_moves_tenant_partition(self, store: InMemoryVectorStore):
+        await store.upsert(
+            ids=["a"], embeddings=[[1, 0]], texts=["a"], metadatas=[{}], tenant_id="t1"
+        )
+        await store.upsert(
+            ids=["a"], embeddings=[[1, 0]], texts=["a"], metadatas=[{}], tenant_id="t2"
+        )
+        assert await store.search(query_embedding=[1, 0], tenant_id="t1") == []
+        results = await store.search(query_embedding=[1, 0], tenant_id="t2")
+        assert [r.id for r in results] == ["a"]
+
+    async def test_tenant_and_filters_combined(self, store: InMemoryVectorStore):
+        await store.upsert(
+            ids=["a", "b"],
+            embeddings=[[1, 0], [1, 0]],
+            texts=["a", "b"],
+            metadatas=[{"subject": "math"}, {"subject": "art"}],
+            tenant_id="t1",
+        )
+        await store.upsert(
+            ids=["c"],
+            embeddings=[[1, 0]],
+            texts=["c"],
+            metadatas=[{"subject": "math"}],
+            tenant_id="t2",
+        )
+        results = await store.search(
+            query_embedding=[1, 0], k=10, filters={"subject": "math"}, tenant_id="t1"
+        )
+        assert [r.id for r in results] == ["a"]
+
+    async def test_unhashable_filter_value(self, store: InMemoryVectorStore):
+        await store.upsert(
+            ids=["a", "b"],
+            embeddings=[[1, 0], [1, 0]],
+            texts=["a", "b"],
+            metadatas=[{"tags": ["x", "y"]}, {"tags": ["z"]}],
+        )
+        results = await store.search(
+            query_embedding=[1, 0], k=10, filters={"tags": ["z"]}
+        )
+        assert [r.id for r in results] == ["b"]
+
+    async def test_dimension_mismatch_raises(self, store: InMemoryVectorStore):
+        await store.upsert(ids=["a"], embeddings=[[1, 0]], texts=["a"], metadatas=[{}])
+        with pytest.raises(ValueError, match="dimension"):
+            await store.upsert(
+                ids=["b"], embeddings=[[1, 0, 0]], texts=["b"], metadatas=[{}]
+            )
+        with pytest.raises(ValueError, match="dimension"):
+            await store.search(query_embedding=[1, 0, 0])
+
+    async def test_length_mismatch_raises(self, store: InMemoryVectorStore):
+        with pytest.raises(ValueError, match="same length"):
+            await store.upsert(
+                ids=["a", "b"], embeddings=[[1, 0]], texts=["a"], metadatas=[{}]
+            )
+
+
+class TestSearchMany:
+    """Batched multi-query search."""
+
+    async def test_matches_individual_searches(self, store: InMemoryVectorStore):
+        rng = np.random.default_rng(3)
+        vecs = rng.standard_normal((50, 8)).tolist()
+        await store.upsert(
+            ids=[f"c{i}" for i in range(50)],
+            embeddings=vecs,
+            texts=["t"] * 50,
+            metadatas=[{"g": i % 3} for i in range(50)],
+            tenant_id="t1",
+        )
+        queries = rng.standard_normal((4, 8)).tolist()
+        batched = await store.search_many(
+            query_embeddings=queries, k=5, filters={"g": 1}, tenant_id="t1"
+        )
+        assert len(batched) == 4
+        for query, results in zip(queries, batched, strict=True):
+            single = await store.search(
+                query_embedding=query, k=5, filters={"g": 1}, tenant_id="t1"
+            )
+            assert [r.id for r in results] == [r.id for r in single]
+
+    async def test_zero_query_yields_empty_slot(self, store: InMemoryVectorStore):
+        await store.upsert(ids=["a"], embeddings=[[1, 0]], texts=["a"], metadatas=[{}])
+        results = await store.search_many(query_embeddings=[[0, 0], [1, 0]], k=3)
+        assert results[0] == []
+        assert [r.id for r in results[1]] == ["a"]
+
+    async def test_empty_inputs(self, store: InMemoryVectorStore):
+        assert await store.search_many(query_embeddings=[]) == []
+        assert await store.search_many(query_embeddings=[[1, 0]]) == [[]]
+
+
+class TestBulkUpsert:
+    """Streaming bulk upsert."""
+
+    def test_satisfies_bulk_protocol(self, store: InMemoryVectorStore):
+        assert isinstance(store, BulkVectorStore)
+
+    async def test_bulk_upsert_from_async_iterable(self, store: InMemoryVectorStore):
+        async def gen():
+            for i in range(7):
+                yield VectorRecord(id=f"c{i}", embedding=[1.0, float(i)], text="x", metadata={})
+
+        written = await store.bulk_upsert(gen(), tenant_id="t1", batch_size=3)
+        assert written == 7
+        assert store.count == 7
+        results = await store.search(query_embedding=[1.0, 0.0], k=1, tenant_id="t1")
+        assert results[0].id == "c0"
+
+
 # =============================================================================
 # Chunking function tests
 # =============================================================================
@@ -460,6 +631,383 @@ class TestIngestionService:
         assert store.count == 1  # same IDs, upsert semantics
 
 
+class TestIngestionBulkPath:
+    """Large materials are routed to bulk_upsert."""
+
+    async def test_large_material_uses_bulk_upsert(
+        self, embeddings: FakeEmbeddings, store: InMemoryVectorStore, monkeypatch
+    ):
+        calls: list[str] = []
+        original = store.bulk_upsert
+
+        async def spy(records, **kwargs):
+            calls.append("bulk")
+            return await original(records, **kwargs)
+
+        monkeypatch.setattr(store, "bulk_upsert", spy)
+        service = IngestionService(
+            embeddings=embeddings,
+            vector_store=store,
+            chunking=ChunkingConfig(chunk_size=10, chunk_overlap=2),
+            bulk_threshold=3,
+        )
+        text = " ".join(f"w{i}" for i in range(100))
+        result = await service.ingest(text=text, material_id="big", tenant_id="t1")
+        assert calls == ["bulk"]
+        assert store.count == result.chunk_count
+
+    async def test_small_material_uses_upsert(
+        self, ingestion_service: IngestionService, store: InMemoryVectorStore, monkeypatch
+    ):
+        async def fail(*args, **kwargs):
+            raise AssertionError("bulk path should not be used")
+
+        monkeypatch.setattr(store, "bulk_upsert", fail)
+        await ingestion_service.ingest(text="short text", material_id="small")
+        assert store.count == 1
+
+    async def test_failed_merge_is_not_reported_complete(
+        self, embeddings: FakeEmbeddings, store: InMemoryVectorStore, monkeypatch
+    ):
+        async def merge_fails(records, **kwargs):
+            async for _ in records:
+                pass
+            raise ConnectionError("merge failed")
+
+        monkeypatch.setattr(store, "bulk_upsert", merge_fails)
+        bus = InMemoryEventBus()
+        progress: list[dict] = []
+
+        async def on_progress(data):
+            progress.append(data)
+
+        await bus.subscribe("ingestion.progress", on_progress)
+        service = IngestionService(
+            embeddings=embeddings,
+            vector_store=store,
+            chunking=ChunkingConfig(chunk_size=5, chunk_overlap=1),
+            bulk_threshold=3,
+            pipeline=PipelineConfig(embed_batch_size=4),
+            event_bus=bus,
+        )
+        text = " ".join(f"w{i}" for i in range(40))
+        with pytest.raises(ConnectionError, match="merge failed"):
+            await service.ingest(text=text, material_id="big")
+        assert progress
+        assert all(e["chunks_stored"] < e["chunks_total"] for e in progress)
+
+    async def test_bulk_progress_reaches_total_after_merge(
+        self, embeddings: FakeEmbeddings, store: InMemoryVectorStore
+    ):
+        bus = InMemoryEventBus()
+        progress: list[dict] = []
+
+        async def on_progress(data):
+            progress.append(data)
+
+        await bus.subscribe("ingestion.progress", on_progress)
+        service = IngestionService(
+            embeddings=embeddings,
+            vector_store=store,
+            chunking=ChunkingConfig(chunk_size=5, chunk_overlap=1),
+            bulk_threshold=3,
+            pipeline=PipelineConfig(embed_batch_size=4),
+            event_bus=bus,
+        )
+        text = " ".join(f"w{i}" for i in range(40))
+        result = await service.ingest(text=text, material_id="big")
+        stored = [e["chunks_stored"] for e in progress]
+        assert stored == sorted(stored)
+        assert stored[-1] == result.chunk_count == store.count
+
+
+class TestIngestionPipeline:
+    """Streaming pipeline: concurrency, ordering, progress events."""
+
+    def test_window_count_matches_chunk_text(self):
+        for n in (0, 1, 9, 10, 11, 18, 19, 57, 200):
+            text = " ".join(f"w{i}" for i in range(n))
+            assert _window_count(n, 10, 2) == len(chunk_text(text, chunk_size=10, chunk_overlap=2))
+
+    async def test_embed_batches_run_concurrently(self, store: InMemoryVectorStore):
+        class SlowEmbeddings(FakeEmbeddings):
+            in_flight = 0
+            peak = 0
+
+            async def embed_batch(self, texts):
+                SlowEmbeddings.in_flight += 1
+                SlowEmbeddings.peak = max(SlowEmbeddings.peak, SlowEmbeddings.in_flight)
+                await asyncio.sleep(0.01)
+                SlowEmbeddings.in_flight -= 1
+                return await super().embed_batch(texts)
+
+        service = IngestionService(
+            embeddings=SlowEmbeddings(dimensions=16),
+            vector_store=store,
+            chunking=ChunkingConfig(chunk_size=5, chunk_overlap=1),
+            pipeline=PipelineConfig(embed_batch_size=2, embed_concurrency=3, queue_size=2),
+        )
+        text = " ".join(f"w{i}" for i in range(80))
+        result = await service.ingest(text=text, material_id="conc")
+        assert SlowEmbeddings.peak == 3
+        assert store.count == result.chunk_count
+
+    async def test_chunks_stored_with_correct_index(
+        self, embeddings: FakeEmbeddings, store: InMemoryVectorStore
+    ):
+        service = IngestionService(
+            embeddings=embeddings,
+            vector_store=store,
+            chunking=ChunkingConfig(chunk_size=5, chunk_overlap=1),
+            pipeline=PipelineConfig(embed_batch_size=3, embed_concurrency=4),
+        )
+        text = " ".join(f"w{i}" for i in range(60))
+        chunks = chunk_text(text, chunk_size=5, chunk_overlap=1)
+        result = await service.ingest(text=text, material_id="ord")
+        for idx, chunk in enumerate(chunks):
+            vec = await embeddings.embed_text(chunk)
+            [hit] = await store.search(query_embedding=vec, k=1)
+            assert hit.id == result.chunk_ids[idx]
+            assert hit.metadata["chunk_index"] == idx
+            assert hit.metadata["chunk_count"] == len(chunks)
+
+    async def test_progress_events_published(
+        self, embeddings: FakeEmbeddings, store: InMemoryVectorStore
+    ):
+        bus = InMemoryEventBus()
+        progress: list[dict] = []
+        completed: list[dict] = []
+
+        async def on_progress(data):
+            progress.append(data)
+
+        async def on_completed(data):
+            completed.append(data)
+
+        await bus.subscribe("ingestion.progress", on_progress)
+        await bus.subscribe("ingestion.completed", on_completed)
+        service = IngestionService(
+            embeddings=embeddings,
+            vector_store=store,
+            chunking=ChunkingConfig(chunk_size=5, chunk_overlap=1),
+            pipeline=PipelineConfig(embed_batch_size=4),
+            event_bus=bus,
+        )
+        text = " ".join(f"w{i}" for i in range(40))
+        result = await service.ingest(text=text, material_id="ev", tenant_id="t1")
+
+        stored = [e["chunks_stored"] for e in progress]
+        assert stored == sorted(stored)
+        assert stored[-1] == result.chunk_count
+        assert all(e["chunks_total"] == result.chunk_count for e in progress)
+        assert completed == [
+            {"material_id": "ev", "tenant_id": "t1", "chunk_count": result.chunk_count}
+        ]
+
+    async def test_embedding_failure_propagates(self, store: InMemoryVectorStore):
+        class BrokenEmbeddings(FakeEmbeddings):
+            async def embed_batch(self, texts):
+                raise RuntimeError("embedding backend down")
+
+        service = IngestionService(
+            embeddings=BrokenEmbeddings(dimensions=16),
+            vector_store=store,
+            chunking=ChunkingConfig(chunk_size=5, chunk_overlap=1),
+            pipeline=PipelineConfig(embed_batch_size=1, queue_size=1),
+        )
+        text = " ".join(f"w{i}" for i in range(50))
+        with pytest.raises(RuntimeError, match="backend down"):
+            await service.ingest(text=text, material_id="broken")
+
+    async def test_event_bus_failure_does_not_fail_ingestion(
+        self, embeddings: FakeEmbeddings, store: InMemoryVectorStore
+    ):
+        class BrokenBus(InMemoryEventBus):
+            async def publish(self, event_type, data):
+                raise ConnectionError("bus down")
+
+        service = IngestionService(
+            embeddings=embeddings, vector_store=store, event_bus=BrokenBus()
+        )
+        result = await service.ingest(text="still stored", material_id="bus")
+        assert result.chunk_count == 1
+        assert store.count == 1
+
+
+class TestIngestPages:
+    """Streaming ingestion from per-page extraction."""
+
+    @staticmethod
+    async def _pages(texts: list[str], delay: float = 0.0):
+        for text in texts:
+            await asyncio.sleep(delay)
+            yield text
+
+    def _service(self, embeddings: FakeEmbeddings, store: InMemoryVectorStore) -> IngestionService:
+        return IngestionService(
+            embeddings=embeddings,
+            vector_store=store,
+            chunking=ChunkingConfig(chunk_size=7, chunk_overlap=2),
+            pipeline=PipelineConfig(embed_batch_size=2),
+        )
+
+    async def test_same_chunks_as_joined_text(self, embeddings: FakeEmbeddings):
+        pages = [" ".join(f"p{p}w{i}" for i in range(n)) for p, n in enumerate((5, 0, 13, 3, 9))]
+        whole, paged = InMemoryVectorStore(), InMemoryVectorStore()
+        expected = await self._service(embeddings, whole).ingest(
+            text="\n".join(pages), material_id="book"
+        )
+        result = await self._service(embeddings, paged).ingest_pages(
+            self._pages(pages), material_id="book"
+        )
+        assert result.chunk_ids == expected.chunk_ids
+        assert await paged.chunk_hashes(material_id="book") == await whole.chunk_hashes(
+            material_id="book"
+        )
+
+    async def test_window_boundaries_match_iter_windows(self):
+        from ailine_runtime.app.services.ingestion import _stream_windows
+
+        for n in (0, 1, 4, 5, 6, 7, 23):
+            words = [f"w{i}" for i in range(n)]
+            pages = [" ".join(words[i : i + 3]) for i in range(0, n, 3)]
+            streamed = [c async for c in _stream_windows(self._pages(pages), 5, 2)]
+            assert streamed == chunk_text(" ".join(words), chunk_size=5, chunk_overlap=2)
+
+    async def test_embedding_starts_before_last_page(self, store: InMemoryVectorStore):
+        events: list[str] = []
+
+        class Recording(FakeEmbeddings):
+            async def embed_batch(self, texts):
+                events.append("embed")
+                return await super().embed_batch(texts)
+
+        async def pages():
+            for i in range(4):
+                events.append(f"page{i}")
+                yield " ".join(f"w{i}x{j}" for j in range(20))
+                await asyncio.sleep(0.01)
+
+        await self._service(Recording(dimensions=16), store).ingest_pages(pages(), material_id="m")
+        assert events.index("embed") < events.index("page3")
+
+    async def test_empty_document(self, embeddings: FakeEmbeddings, store: InMemoryVectorStore):
+        result = await self._service(embeddings, store).ingest_pages(self._pages(["", " "]))
+        assert result.chunk_count == 0
+        assert store.count == 0
+
+    async def test_document_streams_ocr_pages(self, embeddings: FakeEmbeddings):
+        from ailine_runtime.domain.ports.media import PageText
+
+        texts = [" ".join(f"p{p}w{i}" for i in range(9)) for p in range(3)]
+
+        class PagedOCR:
+            async def extract_text(self, file_bytes, *, file_type="pdf"):
+                raise AssertionError("whole-document extraction used")
+
+            async def iter_pages(self, file_bytes, *, file_type="pdf"):
+                for i, text in enumerate(texts):
+                    yield PageText(index=i, text=text)
+
+        class WholeOCR:
+            async def extract_text(self, file_bytes, *, file_type="pdf"):
+                return "\n".join(texts)
+
+        paged, whole = InMemoryVectorStore(), InMemoryVectorStore()
+        streamed = await self._service(embeddings, paged).ingest_document(
+            PagedOCR(), b"%PDF", material_id="scan"
+        )
+        joined = await self._service(embeddings, whole).ingest_document(
+            WholeOCR(), b"%PDF", material_id="scan"
+        )
+        assert streamed.chunk_ids == joined.chunk_ids
+        assert await paged.chunk_hashes(material_id="scan") == await whole.chunk_hashes(
+            material_id="scan"
+        )
+
+
+class TestUpdateMaterial:
+    """Incremental re-ingestion via chunk hashes."""
+
+    @pytest.fixture
+    def counting(self) -> FakeEmbeddings:
+        class Counting(FakeEmbeddings):
+            def __init__(self) -> None:
+                super().__init__(dimensions=16)
+                self.embedded: list[str] = []
+
+            async def embed_batch(self, texts):
+                self.embedded.extend(texts)
+                return await super().embed_batch(texts)
+
+        return Counting()
+
+    @pytest.fixture
+    def service(self, counting: FakeEmbeddings, store: InMemoryVectorStore) -> IngestionService:
+        return IngestionService(
+            embeddings=counting,
+            vector_store=store,
+            chunking=ChunkingConfig(chunk_size=10, chunk_overlap=2),
+        )
+
+    @staticmethod
+    def _text(n: int, edit_at: int | None = None) -> str:
+        return " ".join("EDITED" if i == edit_at else f"w{i}" for i in range(n))
+
+    async def test_stores_chunk_hash(self, service: IngestionService, store: InMemoryVectorStore):
+        await service.ingest(text=self._text(30), material_id="m")
+        hashes = await store.chunk_hashes(material_id="m")
+        assert len(hashes) == 4
+        assert all(hashes.values())
+
+    async def test_unchanged_material_embeds_nothing(self, service, counting):
+        await service.ingest(text=self._text(30), material_id="m")
+        counting.embedded.clear()
+        diff = await service.update_material(text=self._text(30), material_id="m")
+        assert counting.embedded == []
+        assert diff.unchanged == diff.chunk_count == 4
+        assert diff.added == diff.updated == diff.deleted == []
+
+    async def test_single_edit_reembeds_touched_chunks(self, service, counting, store):
+        await service.ingest(text=self._text(30), material_id="m")
+        counting.embedded.clear()
+        diff = await service.update_material(text=self._text(30, edit_at=12), material_id="m")
+        # Word 12 sits only in the window starting at word 8 (chunk 1)
+        assert diff.updated == ["m__chunk_0001"]
+        assert diff.embedded == 1
+        assert len(counting.embedded) == 1
+        assert "EDITED" in counting.embedded[0]
+        assert store.count == 4
+
+    async def test_shorter_text_deletes_orphans(self, service, store):
+        await service.ingest(text=self._text(30), material_id="m")
+        diff = await service.update_material(text=self._text(12), material_id="m")
+        assert diff.chunk_count == 2
+        assert diff.deleted == ["m__chunk_0002", "m__chunk_0003"]
+        assert store.count == 2
+
+    async def test_new_material_and_empty_text(self, service, store):
+        diff = await service.update_material(text=self._text(20), material_id="new")
+        assert diff.added == ["new__chunk_0000", "new__chunk_0001", "new__chunk_0002"]
+        diff = await service.update_material(text="", material_id="new")
+        assert diff.chunk_count == 0
+        assert len(diff.deleted) == 3
+        assert store.count == 0
+
+    async def test_metadata_change_rewrites_chunks(self, service, counting):
+        await service.ingest(text=self._text(20), material_id="m", metadata={"subject": "math"})
+        counting.embedded.clear()
+        diff = await service.update_material(
+            text=self._text(20), material_id="m", metadata={"subject": "physics"}
+        )
+        assert len(diff.updated) == diff.chunk_count
+
+    async def test_inventory_is_tenant_scoped(self, service, store):
+        await service.ingest(text=self._text(30), material_id="m", tenant_id="t1")
+        assert len(await store.chunk_hashes(material_id="m", tenant_id="t1")) == 4
+        assert await store.chunk_hashes(material_id="m", tenant_id="t2") == {}
+
+
 # =============================================================================
 # RAGService tests
 # =============================================================================
@@ -592,6 +1140,18 @@ class TestRAGService:
         for r in result.results:
             assert "material_id" in r.metadata
 
+    async def test_query_many_matches_query(self, rag_service: RAGService):
+        texts = ["photosynthesis in plants", "quadratic formula"]
+        batched = await rag_service.query_many(texts=texts, k=2)
+        assert [r.query for r in batched] == texts
+        for text, result in zip(texts, batched, strict=True):
+            single = await rag_service.query(text=text, k=2)
+            assert [r.id for r in result.results] == [r.id for r in single.results]
+            assert result.total_candidates == single.total_candidates
+
+    async def test_query_many_empty(self, rag_service: RAGService):
+        assert await rag_service.query_many(texts=[]) == []
+
     async def test_query_filters_combined_with_threshold(
         self,
         embeddings: FakeEmbeddings,
@@ -610,3 +1170,138 @@ class TestRAGService:
         # Only t2's documents should appear
         for r in result.results:
             assert r.metadata["teacher_id"] == "t2"
+
+
+class TestLexicalSearch:
+    """BM25 lexical search on the in-memory store."""
+
+    async def _seed(self, store: InMemoryVectorStore) -> None:
+        await store.upsert(
+            ids=["a", "b", "c"],
+            embeddings=[[1.0, 0.0], [0.0, 1.0], [1.0, 1.0]],
+            texts=[
+                "Habilidade EF04MA07: resolver problemas de divisão",
+                "Frações equivalentes e divisão em partes iguais",
+                "Leitura e interpretação de textos narrativos",
+            ],
+            metadatas=[{"subject": "math"}, {"subject": "math"}, {"subject": "pt"}],
+            tenant_id="t1",
+        )
+
+    def test_satisfies_lexical_protocol(self, store: InMemoryVectorStore):
+        assert isinstance(store, LexicalSearch)
+
+    async def test_exact_code_ranks_first(self, store: InMemoryVectorStore):
+        await self._seed(store)
+        hits = await store.lexical_search(query="ef04ma07 divisão", k=3)
+        assert [h.id for h in hits] == ["a", "b"]
+        assert hits[0].score > hits[1].score
+        assert hits[0].metadata == {"subject": "math"}
+
+    async def test_filters_and_tenant(self, store: InMemoryVectorStore):
+        await self._seed(store)
+        assert await store.lexical_search(query="divisão", tenant_id="t2") == []
+        hits = await store.lexical_search(query="divisão leitura", filters={"subject": "pt"})
+        assert [h.id for h in hits] == ["c"]
+
+    async def test_index_follows_upsert_and_delete(self, store: InMemoryVectorStore):
+        await self._seed(store)
+        await store.upsert(
+            ids=["a"], embeddings=[[1.0, 0.0]], texts=["geometria plana"], metadatas=[{}]
+        )
+        assert await store.lexical_search(query="ef04ma07") == []
+        await store.delete(ids=["a"])
+        assert await store.lexical_search(query="geometria") == []
+        store.clear()
+        assert await store.lexical_search(query="divisão") == []
+
+
+class TestHybridRAG:
+    """Hybrid (dense + lexical) retrieval fused with RRF."""
+
+    def _result(self, doc_id: str) -> VectorSearchResult:
+        return VectorSearchResult(id=doc_id, score=0.0, text=doc_id, metadata={})
+
+    def test_rrf_rewards_agreement(self):
+        dense = [self._result("a"), self._result("b"), self._result("c")]
+        lexical = [self._result("c"), self._result("d")]
+        fused = reciprocal_rank_fusion([dense, lexical], k=60)
+        assert [r.id for r in fused] == ["c", "a", "b", "d"]  # b/d tie: first seen
+        assert all(0.0 < r.score <= 1.0 for r in fused)
+        assert reciprocal_rank_fusion([[self._result("x")]] * 2)[0].score == pytest.approx(1.0)
+        assert len(reciprocal_rank_fusion([dense, lexical], limit=2)) == 2
+        assert reciprocal_rank_fusion([[], []]) == []
+
+    async def test_lexical_hit_survives_dense_threshold(
+        self, embeddings: FakeEmbeddings, populated_store: InMemoryVectorStore
+    ):
+        service = RAGService(
+            embeddings=embeddings, vector_store=populated_store, similarity_threshold=0.999
+        )
+        dense = await service.query(text="quadratic formula")
+        assert dense.results == []
+        assert dense.mode == "dense"
+
+        hybrid = await service.query(text="quadratic formula", hybrid=True)
+        assert hybrid.mode == "hybrid"
+        assert [r.metadata["material_id"] for r in hybrid.results] == ["math-001"]
+        assert set(hybrid.stage_timings_ms) == {"embed", "dense", "lexical", "fusion", "total"}
+
+    async def test_hybrid_respects_k_and_filters(
+        self, embeddings: FakeEmbeddings, populated_store: InMemoryVectorStore
+    ):
+        service = RAGService(
+            embeddings=embeddings,
+            vector_store=populated_store,
+            similarity_threshold=0.0,
+            hybrid=True,
+            k_dense=10,
+            k_lexical=10,
+        )
+        result = await service.query(text="plants energy", k=2, filters={"teacher_id": "t1"})
+        assert 0 < len(result.results) <= 2
+        assert result.total_candidates >= len(result.results)
+        assert all(r.metadata["teacher_id"] == "t1" for r in result.results)
+
+    async def test_falls_back_to_dense_without_lexical_store(self, embeddings: FakeEmbeddings):
+        class DenseOnly:
+            def __init__(self, inner: InMemoryVectorStore) -> None:
+                self.upsert = inner.upsert
+                self.search = inner.search
+                self.search_many = inner.search_many
+                self.delete = inner.delete
+
+        service = RAGService(
+            embeddings=embeddings, vector_store=DenseOnly(InMemoryVectorStore()), hybrid=True
+        )
+        result = await service.query(text="anything")
+        assert result.mode == "dense"
+        assert "lexical" not in result.stage_timings_ms
+
+    async def test_query_many_hybrid_matches_query(self, rag_service: RAGService):
+        texts = ["photosynthesis plants", "surrender of Germany"]
+        batched = await rag_service.query_many(texts=texts, k=2, hybrid=True)
+        for text, result in zip(texts, batched, strict=True):
+            single = await rag_service.query(text=text, k=2, hybrid=True)
+            assert [r.id for r in result.results] == [r.id for r in single.results]
+            assert result.mode == "hybrid"
+            assert "lexical" in result.stage_timings_ms
+
+    async def test_diagnostics_record_stage_timings(
+        self, embeddings: FakeEmbeddings, populated_store: InMemoryVectorStore
+    ):
+        from ailine_runtime.shared.rag_diagnostics_store import RAGDiagnosticsStore
+
+        diagnostics = RAGDiagnosticsStore()
+        service = RAGService(
+            embeddings=embeddings,
+            vector_store=populated_store,
+            hybrid=True,
+            diagnostics_store=diagnostics,
+        )
+        await service.query(text="quadratic formula", run_id="run-1", tenant_id=None)
+        report = await diagnostics.get("run-1")
+        assert report is not None
+        assert report.retrieval_mode == "hybrid"
+        assert {"embed", "dense", "lexical", "fusion", "total"} <= set(report.stage_timings_ms)
+        assert report.top_k_returned == len(report.chunks) > 0
@@ -2,6 +2,10 @@
 
 from __future__ import annotations
 
+import asyncio
+import io
+import threading
+import time
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -15,8 +19,10 @@ def mock_faster_whisper():
 
     seg1 = MagicMock()
     seg1.text = "Ola"
+    seg1.start, seg1.end = 0.0, 1.2
     seg2 = MagicMock()
     seg2.text = "mundo"
+    seg2.start, seg2.end = 1.2, 2.0
     mock_model.transcribe.return_value = ([seg1, seg2], MagicMock())
 
     mock_module.WhisperModel.return_value = mock_model
@@ -104,8 +110,8 @@ class TestWhisperSTTTranscribe:
 
 
 class TestSyncTranscribe:
-    def test_temp_file_cleanup(self, mock_faster_whisper):
-        """Verify temp file is created and cleaned up."""
+    def test_decodes_from_memory(self, mock_faster_whisper):
+        """Audio is handed to the model as an in-memory file, no temp file."""
         mock_module, mock_model = mock_faster_whisper
         with patch.dict("sys.modules", {"faster_whisper": mock_module}):
             from ailine_runtime.adapters.media.whisper_stt import WhisperSTT
@@ -114,7 +120,110 @@ class TestSyncTranscribe:
             stt._ensure_model()
             result = stt._sync_transcribe(b"audio bytes", "pt")
             assert result == "Ola mundo"
-            # Verify transcribe was called with a file path
             mock_model.transcribe.assert_called_once()
-            call_args = mock_model.transcribe.call_args
-            assert call_args[0][0].endswith(".wav")
+            source = mock_model.transcribe.call_args[0][0]
+            assert isinstance(source, io.BytesIO)
+            assert source.getvalue() == b"audio bytes"
+
+
+class SlowModel:
+    """Model replica whose segments each take *delay* seconds to decode."""
+
+    def __init__(self, delay: float = 0.05, segments: int = 3) -> None:
+        self.delay = delay
+        self.segments = segments
+        self.decoded = 0
+
+    def transcribe(self, source, language="pt"):
+        def generate():
+            for i in range(self.segments):
+                time.sleep(self.delay)
+                self.decoded += 1
+                seg = MagicMock()
+                seg.start, seg.end, seg.text = float(i), float(i + 1), f" parte {i}"
+                yield seg
+
+        return generate(), MagicMock()
+
+
+def _pooled_stt(replicas: int, **model_kwargs):
+    from ailine_runtime.adapters.media.whisper_stt import WhisperSTT
+
+    models: list[SlowModel] = []
+    lock = threading.Lock()
+
+    def load() -> SlowModel:
+        with lock:
+            models.append(SlowModel(**model_kwargs))
+            return models[-1]
+
+    stt = WhisperSTT(replicas=replicas)
+    stt._load_model = load  # type: ignore[method-assign]
+    return stt, models
+
+
+class TestWorkerPool:
+    async def test_replicas_decode_concurrently(self):
+        stt, models = _pooled_stt(replicas=3, delay=0.05, segments=2)
+        started = time.perf_counter()
+        results = await asyncio.gather(*(stt.transcribe(b"a") for _ in range(3)))
+        elapsed = time.perf_counter() - started
+        assert results == ["parte 0  parte 1"] * 3
+        assert len(models) == 3
+        # Serialized on one model this would take 3 * 2 * 0.05 = 0.3 s
+        assert elapsed < 0.25
+        assert stt.stats() == {"replicas": 3, "loaded": 3, "busy": 0}
+        await stt.dispose()
+
+    async def test_replicas_capped(self):
+        stt, models = _pooled_stt(replicas=2, delay=0.01, segments=1)
+        await asyncio.gather(*(stt.transcribe(b"a") for _ in range(6)))
+        assert len(models) == 2
+        await stt.dispose()
+
+    def test_cpu_threads_forwarded(self, mock_faster_whisper):
+        mock_module, _ = mock_faster_whisper
+        with patch.dict("sys.modules", {"faster_whisper": mock_module}):
+            from ailine_runtime.adapters.media.whisper_stt import WhisperSTT
+
+            WhisperSTT(model_size="tiny", cpu_threads=2)._ensure_model()
+            mock_module.WhisperModel.assert_called_once_with(
+                "tiny", device="cpu", compute_type="int8", cpu_threads=2
+            )
+
+
+class TestTranscribeStream:
+    async def test_segments_yielded_as_decoded(self):
+        stt, _models = _pooled_stt(replicas=1, delay=0.1, segments=3)
+        started = time.perf_counter()
+        stream = stt.transcribe_stream(b"a")
+        first = await anext(stream)
+        # First segment arrives before the whole file is decoded
+        assert time.perf_counter() - started < 0.25
+        assert (first.start, first.end, first.text) == (0.0, 1.0, "parte 0")
+        rest = [seg.text async for seg in stream]
+        assert rest == ["parte 1", "parte 2"]
+        await stt.dispose()
+
+    async def test_close_stops_decoding(self):
+        stt, models = _pooled_stt(replicas=1, delay=0.05, segments=10)
+        stream = stt.transcribe_stream(b"a")
+        await anext(stream)
+        await stream.aclose()
+        await asyncio.sleep(0.2)
+        assert models[0].decoded < 10
+        assert stt.stats()["busy"] == 0
+        await stt.dispose()
+
+    async def test_decode_error_propagates(self):
+        stt, _models = _pooled_stt(replicas=1)
+
+        def broken(source, language="pt"):
+            raise RuntimeError("bad audio")
+
+        stt._ensure_model()
+        stt._model.transcribe = broken
+        with pytest.raises(RuntimeError, match="bad audio"):
+            [seg async for seg in stt.transcribe_stream(b"a")]
+        assert stt.stats()["busy"] == 0
+        await stt.dispose()